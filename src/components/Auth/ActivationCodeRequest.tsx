@@ -115,6 +115,7 @@ export const ActivationCodeRequest: React.FC<ActivationCodeRequestProps> = ({ on
             </div>
             <input
               id="full-name"
+              data-testid="activation-request-name"
               name="fullName"
               type="text"
               autoComplete="name"
@@ -136,6 +137,7 @@ export const ActivationCodeRequest: React.FC<ActivationCodeRequestProps> = ({ on
             </div>
             <input
               id="email-address"
+              data-testid="activation-request-email"
               name="email"
               type="email"
               autoComplete="email"
@@ -157,6 +159,7 @@ export const ActivationCodeRequest: React.FC<ActivationCodeRequestProps> = ({ on
             </div>
             <input
               id="company"
+              data-testid="activation-request-company"
               name="company"
               type="text"
               autoComplete="organization"
@@ -174,6 +177,7 @@ export const ActivationCodeRequest: React.FC<ActivationCodeRequestProps> = ({ on
           <button
             type="submit"
             disabled={loading}
+            data-testid="activation-request-submit"
             className="group relative w-full flex justify-center py-3 px-4 border border-transparent text-sm font-medium rounded-md text-white bg-blue-600 hover:bg-blue-700 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-blue-500 disabled:bg-blue-400"
           >
             {loading ? <Loader2 className="h-5 w-5 animate-spin" /> : 'Solicitar Código'}
@@ -184,6 +188,7 @@ export const ActivationCodeRequest: React.FC<ActivationCodeRequestProps> = ({ on
           <button 
             type="button" 
             onClick={onRequestComplete} 
+            data-testid="activation-request-back"
             className="text-blue-600 hover:text-blue-800 text-sm font-medium"
             disabled={loading}
           >
@@ -195,6 +200,7 @@ export const ActivationCodeRequest: React.FC<ActivationCodeRequestProps> = ({ on
           <button 
             type="button" 
             onClick={onBackToLogin} 
+            data-testid="activation-back-to-login"
             className="text-gray-500 hover:text-gray-700 text-sm font-medium"
             disabled={loading}
           >
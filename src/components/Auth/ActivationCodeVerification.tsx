@@ -62,7 +62,7 @@ export const ActivationCodeVerification: React.FC<ActivationCodeVerificationProp
       </div>
 
       {error && (
-        <div className="bg-red-100 border border-red-400 text-red-700 px-4 py-3 rounded relative" role="alert">
+        <div className="bg-red-100 border border-red-400 text-red-700 px-4 py-3 rounded relative" role="alert" data-testid="activation-error">
           <span className="block sm:inline">{error}</span>
         </div>
       )}
@@ -76,6 +76,7 @@ export const ActivationCodeVerification: React.FC<ActivationCodeVerificationProp
             </div>
             <input
               id="activation-code"
+              data-testid="activation-code"
               name="activationCode"
               type="text"
               required
@@ -93,6 +94,7 @@ export const ActivationCodeVerification: React.FC<ActivationCodeVerificationProp
           <button
             type="submit"
             disabled={loading}
+            data-testid="activation-verify"
             className="group relative w-full flex justify-center py-3 px-4 border border-transparent text-sm font-medium rounded-md text-white bg-blue-600 hover:bg-blue-700 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-blue-500 disabled:bg-blue-400"
           >
             {loading ? <Loader2 className="h-5 w-5 animate-spin" /> : 'Verificar Código'}
@@ -103,6 +105,7 @@ export const ActivationCodeVerification: React.FC<ActivationCodeVerificationProp
           <button 
             type="button" 
             onClick={onRequestCode} 
+            data-testid="activation-request-code"
             className="text-blue-600 hover:text-blue-800 text-sm font-medium"
             disabled={loading}
           >
@@ -114,6 +117,7 @@ export const ActivationCodeVerification: React.FC<ActivationCodeVerificationProp
           <button 
             type="button" 
             onClick={onBackToLogin} 
+            data-testid="activation-back-to-login"
             className="text-gray-500 hover:text-gray-700 text-sm font-medium"
             disabled={loading}
           >
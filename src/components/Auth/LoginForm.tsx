@@ -37,9 +37,9 @@ export const LoginForm: React.FC = () => {
     };
 
     return (
-        <form className="mt-8 space-y-6" onSubmit={handleLogin}>
+        <form className="mt-8 space-y-6" onSubmit={handleLogin} data-testid="login-form">
             {error && (
-                <div className="bg-red-100 border border-red-400 text-red-700 px-4 py-3 rounded relative" role="alert">
+                <div className="bg-red-100 border border-red-400 text-red-700 px-4 py-3 rounded relative" role="alert" data-testid="login-error">
                     <strong className="font-bold">Erro! </strong>
                     <span className="block sm:inline">{error.message}</span>
                 </div>
@@ -53,6 +53,7 @@ export const LoginForm: React.FC = () => {
                         </div>
                         <input
                             id="email-address"
+                            data-testid="login-email"
                             name="email"
                             type="email"
                             autoComplete="email"
@@ -72,6 +73,7 @@ export const LoginForm: React.FC = () => {
                         </div>
                         <input
                             id="password"
+                            data-testid="login-password"
                             name="password"
                             type="password"
                             autoComplete="current-password"
@@ -94,6 +96,7 @@ export const LoginForm: React.FC = () => {
                     <button 
                         type="button"
                         onClick={() => setShowResetModal(true)}
+                        data-testid="login-forgot-password"
                         className="font-medium text-blue-600 hover:text-blue-500"
                     >
                         Esqueceu sua senha?
@@ -105,6 +108,7 @@ export const LoginForm: React.FC = () => {
                 <button
                     type="submit"
                     disabled={loading}
+                    data-testid="login-submit"
                     className="group relative w-full flex justify-center py-3 px-4 border border-transparent text-sm font-medium rounded-md text-white bg-blue-600 hover:bg-blue-700 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-blue-500 disabled:bg-blue-400"
                 >
                     {loading ? <Loader2 className="h-5 w-5 animate-spin" /> : 'Entrar'}
@@ -139,6 +143,7 @@ export const LoginForm: React.FC = () => {
             <div className="text-center mt-4">
                 <Link 
                     to="/activation" 
+                    data-testid="login-signup-link"
                     className="text-blue-600 hover:text-blue-800 text-sm font-medium"
                 >
                     Não tem uma conta? Cadastre-se
@@ -171,6 +176,7 @@ export const LoginForm: React.FC = () => {
                         <div className="mb-4">
                             <input
                                 type="email"
+                                data-testid="login-reset-email"
                                 value={resetEmail}
                                 onChange={(e) => setResetEmail(e.target.value)}
                                 placeholder="Seu e-mail"
@@ -196,6 +202,7 @@ export const LoginForm: React.FC = () => {
                                     }
                                 }}
                                 disabled={!resetEmail || loading}
+                                data-testid="login-reset-send"
                                 className="flex-1 bg-blue-600 text-white py-2 px-4 rounded-md hover:bg-blue-700 disabled:bg-blue-400"
                             >
                                 {loading ? 'Enviando...' : 'Enviar'}
@@ -206,6 +213,7 @@ export const LoginForm: React.FC = () => {
                                     setResetMessage('');
                                     setResetEmail('');
                                 }}
+                                data-testid="login-reset-cancel"
                                 className="flex-1 bg-gray-300 text-gray-700 py-2 px-4 rounded-md hover:bg-gray-400"
                             >
                                 Cancelar
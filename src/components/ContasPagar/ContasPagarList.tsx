@@ -1,10 +1,13 @@
-import React, { useState, useEffect, useCallback } from 'react';
+import React, { useState, useEffect, useCallback, useMemo, useRef } from 'react';
 import { Plus, Filter, Trash2, CreditCard, Eye, FileText, Calendar, AlertTriangle, Menu, X, ChevronUp, ChevronDown, ChevronsUpDown, ArrowUpDown } from 'lucide-react';
 import { format, isAfter, isBefore, addDays } from 'date-fns';
 // Corrigir esta linha - remover duplicação
 // Remover TipoDocumento do import
 import { ContaPagar, Empresa, ContaContabil, ContaPagarStatus } from '../../types';
 import { supabase } from '../../lib/supabaseClient';
+import { QueryService } from '../../services/queryService';
+import { isRealtimeTable } from '../../lib/queryCache';
+import { subscribeRealtime } from '../../lib/realtimeSync';
 import { Modal } from '../ui/Modal';
 import { Spinner } from '../ui/Spinner';
 import { ConfirmModal } from '../ui/ConfirmModal';
@@ -13,6 +16,8 @@ import { ContaPagarForm } from './ContaPagarForm';
 import { ContaPagarDetails } from './ContaPagarDetails';
 import { BarcodeScanner } from './BarcodeScanner';
 import { useModal } from '../../hooks/useModal';
+import { useDebounce } from '../../hooks/useDebounce';
+import { useWindowedList } from '../../hooks/useWindowedList';
 import { useContaPagarStatus } from './hooks/useContaPagarStatus';
 import { applyDateMask, isValidDate, convertToISODate, convertFromISODate } from '../../utils/dateUtils';
 import { DatePicker } from '../ui/DatePicker';
@@ -38,6 +43,98 @@ const formatDateForDisplay = (dateString: string): Date => {
   return new Date(dateString + 'T00:00:00');
 };
 
+const PAGE_SIZE = 200;
+// Alturas fixas das linhas da tabela e dos cards (com o espaçamento) para a renderização em janela
+const TABLE_ROW_HEIGHT = 65;
+const CARD_HEIGHT = 500;
+const LIST_HEIGHT = 640;
+
+const CONTAS_COLUMNS = `
+  id,
+  user_id,
+  empresa_id,
+  fornecedor,
+  descricao,
+  valor,
+  data_vencimento,
+  data_pagamento,
+  status,
+  observacoes,
+  numero_documento,
+  foto_url,
+  foto_nome,
+  conta_contabil_id,
+  lancamento_gerado_id,
+  created_at,
+  updated_at
+`;
+
+// Campo de ordenação da tela -> coluna (ou campo calculado) no banco
+const COLUNAS_ORDENACAO: Record<string, string> = {
+  fornecedor: 'fornecedor',
+  descricao: 'descricao',
+  contaContabil: 'conta_contabil_rotulo',
+  vencimento: 'data_vencimento',
+  criado: 'created_at',
+  valor: 'valor',
+  status: 'status_prioridade'
+};
+
+const STATUS_PRIORIDADE: Record<string, number> = { 'pendente': 3, 'vencida': 2, 'paga': 1, 'cancelada': 0 };
+
+interface ContasPagarTotais {
+  quantidade: number;
+  grupos: number;
+  totalPendente: number;
+  totalVencidas: number;
+}
+
+interface ContaAgrupada {
+  id: string;
+  empresaId: string;
+  fornecedor: string;
+  descricao: string;
+  numeroDocumento?: string;
+  dataVencimento: string;
+  dataPagamento?: string;
+  createdAt: string;
+  valorTotal: number;
+  status: ContaPagarStatus;
+  contaContabilId?: string;
+}
+
+const TOTAIS_VAZIOS: ContasPagarTotais = { quantidade: 0, grupos: 0, totalPendente: 0, totalVencidas: 0 };
+
+const mapFoto = (foto: any, contaPagarId: string) => ({
+  id: foto.id,
+  contaPagarId,
+  fotoUrl: foto.foto_url,
+  fotoNome: foto.foto_nome,
+  ordem: foto.ordem,
+  createdAt: foto.created_at
+});
+
+const mapContaPagar = (item: any) => ({
+  id: item.id,
+  user_id: item.user_id,
+  empresaId: item.empresa_id,
+  fornecedor: item.fornecedor,
+  descricao: item.descricao,
+  valor: Number(item.valor),
+  dataVencimento: item.data_vencimento,
+  dataPagamento: item.data_pagamento,
+  status: item.status,
+  observacoes: item.observacoes,
+  numeroDocumento: item.numero_documento,
+  fotoUrl: item.foto_url, // Mantido para compatibilidade
+  fotoNome: item.foto_nome, // Mantido para compatibilidade
+  fotos: (item.conta_pagar_fotos || []).map((foto: any) => mapFoto(foto, item.id)),
+  contaContabilId: item.conta_contabil_id,
+  lancamentoGeradoId: item.lancamento_gerado_id,
+  createdAt: item.created_at,
+  updatedAt: item.updated_at
+});
+
 export const ContasPagarList: React.FC = () => {
   const [contas, setContas] = useState<ContaPagar[]>([]);
   const [empresas, setEmpresas] = useState<Empresa[]>([]);
@@ -51,7 +148,7 @@ export const ContasPagarList: React.FC = () => {
 
   const [filtroStatus, setFiltroStatus] = useState('');
   const [termoPesquisa, setTermoPesquisa] = useState('');
-  const [debouncedTermoPesquisa, setDebouncedTermoPesquisa] = useState('');
+  const termoDebounced = useDebounce(termoPesquisa.trim(), 300);
   const [filtroDataInicio, setFiltroDataInicio] = useState('');
   const [filtroDataFim, setFiltroDataFim] = useState('');
   
@@ -101,9 +198,9 @@ export const ContasPagarList: React.FC = () => {
   
   // Estados para o botão de ordenação móvel
   const [showMobileSortModal, setShowMobileSortModal] = useState(false);
-  const [totalCount, setTotalCount] = useState(0);
-  const [fetchLimit, setFetchLimit] = useState(1000);
-  const [serverSearching, setServerSearching] = useState(false);
+  const [totais, setTotais] = useState<ContasPagarTotais>(TOTAIS_VAZIOS);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [hasMore, setHasMore] = useState(false);
   const toDate = (value?: string) => {
     if (!value) return null;
     const d = new Date(value.includes('T') ? value : `${value}T00:00:00`);
@@ -114,146 +211,279 @@ export const ContasPagarList: React.FC = () => {
     return d ? format(d, pattern) : '-';
   };
 
+  // Próxima página já buscada em segundo plano
+  const prefetchRef = useRef<Promise<ContaPagar[]> | null>(null);
+  const offsetRef = useRef(0);
+  // Descarta respostas de uma consulta anterior à última troca de filtros
+  const geracaoRef = useRef(0);
+
+  // Empresas e plano de contas só servem para exibir nomes; vêm do cache compartilhado
   useEffect(() => {
-    const timer = setTimeout(() => {
-      setDebouncedTermoPesquisa(termoPesquisa);
-    }, 3000);
-    return () => clearTimeout(timer);
-  }, [termoPesquisa]);
+    let cancelado = false;
+    Promise.all([QueryService.getEmpresas(), QueryService.getContasContabeisAtivas()])
+      .then(([empresasData, contasContabeisData]) => {
+        if (cancelado) return;
+        setEmpresas(empresasData);
+        setContasContabeis(contasContabeisData);
+      })
+      .catch(err => console.error('Erro ao buscar empresas e contas contábeis:', err));
+    return () => { cancelado = true; };
+  }, []);
+
+  // Filtros da tela já no formato do banco; "hoje" no fuso do usuário
+  const filtros = useMemo(() => {
+    const termo = termoDebounced.replace(/[,()*%]/g, ' ').trim();
+    return {
+      status: filtroStatus,
+      inicio: filtroDataInicio ? formatDateForDatabase(filtroDataInicio) : '',
+      fim: filtroDataFim ? formatDateForDatabase(filtroDataFim) : '',
+      termo,
+      hoje: format(new Date(), 'yyyy-MM-dd')
+    };
+  }, [filtroStatus, filtroDataInicio, filtroDataFim, termoDebounced]);
+
+  const fetchPage = useCallback(async (offset: number): Promise<ContaPagar[]> => {
+    let query = supabase.from('contas_a_pagar').select(CONTAS_COLUMNS);
+
+    // Vencida = pendente com vencimento até hoje; pendente = ainda a vencer
+    if (filtros.status === 'vencida') {
+      query = query.eq('status', 'pendente').lte('data_vencimento', filtros.hoje);
+    } else if (filtros.status === 'pendente') {
+      query = query.eq('status', 'pendente').gt('data_vencimento', filtros.hoje);
+    } else if (filtros.status) {
+      query = query.eq('status', filtros.status);
+    }
+    if (filtros.inicio) query = query.gte('data_vencimento', filtros.inicio);
+    if (filtros.fim) query = query.lte('data_vencimento', filtros.fim);
+    if (filtros.termo) {
+      const t = filtros.termo;
+      query = query.or(`fornecedor.ilike.%${t}%,descricao.ilike.%${t}%,numero_documento.ilike.%${t}%,observacoes.ilike.%${t}%`);
+    }
+
+    const coluna = COLUNAS_ORDENACAO[campoOrdenacao];
+    query = coluna
+      ? query.order(coluna, { ascending: direcaoOrdenacao === 'asc' })
+      : query.order('created_at', { ascending: false });
+    // id desempata a ordenação para as páginas não se sobreporem
+    const { data, error: pageError } = await query
+      .order('id', { ascending: true })
+      .range(offset, offset + PAGE_SIZE - 1);
+    if (pageError) throw pageError;
+    return (data || []).map(mapContaPagar) as ContaPagar[];
+  }, [filtros, campoOrdenacao, direcaoOrdenacao]);
+
+  const fetchTotais = useCallback(async (): Promise<ContasPagarTotais> => {
+    const { data, error: totaisError } = await supabase.rpc('get_contas_pagar_totais', {
+      p_status: filtros.status || null,
+      p_inicio: filtros.inicio || null,
+      p_fim: filtros.fim || null,
+      p_termo: filtros.termo || null,
+      p_hoje: filtros.hoje
+    });
+    if (totaisError) throw totaisError;
+    const row = (data || [])[0];
+    return row ? {
+      quantidade: Number(row.quantidade) || 0,
+      grupos: Number(row.grupos) || 0,
+      totalPendente: Number(row.total_pendente) || 0,
+      totalVencidas: Number(row.total_vencidas) || 0
+    } : TOTAIS_VAZIOS;
+  }, [filtros]);
+
+  const prefetch = useCallback((offset: number, ultimaPagina: ContaPagar[]) => {
+    offsetRef.current = offset;
+    const temMais = ultimaPagina.length === PAGE_SIZE;
+    setHasMore(temMais);
+    prefetchRef.current = temMais ? fetchPage(offset) : null;
+    // Erros da pré-busca aparecem quando a página for de fato pedida
+    prefetchRef.current?.catch(() => undefined);
+  }, [fetchPage]);
 
   const fetchData = useCallback(async () => {
+    const geracao = ++geracaoRef.current;
     setLoading(true);
     setError(null);
-    setServerSearching(!!debouncedTermoPesquisa && debouncedTermoPesquisa.trim().length >= 2);
+    prefetchRef.current = null;
     try {
-      const baseQuery = supabase.from('contas_a_pagar').select(`
-          id,
-          user_id,
-          empresa_id,
-          fornecedor,
-          descricao,
-          valor,
-          data_vencimento,
-          data_pagamento,
-          status,
-          observacoes,
-          numero_documento,
-          foto_url,
-          foto_nome,
-          conta_contabil_id,
-          lancamento_gerado_id,
-          created_at,
-          updated_at,
-          conta_pagar_fotos(
-            id,
-            foto_url,
-            foto_nome,
-            ordem,
-            created_at
-          )
-        `, { count: 'exact' });
-
-      const term = (debouncedTermoPesquisa || '').trim();
-      const contasQuery = term.length >= 2
-        ? baseQuery.or(
-            `fornecedor.ilike.%${term}%,descricao.ilike.%${term}%,numero_documento.ilike.%${term}%,observacoes.ilike.%${term}%`
-          )
-        : baseQuery;
-
-      const [contasRes, empresasRes, contasContabeisRes] = await Promise.all([
-        contasQuery.order('created_at', { ascending: false }).range(0, fetchLimit - 1),
-        
-        supabase.from('empresas').select('id, razao_social'),
-        
-        supabase.from('contas_contabeis').select(`
-          id,
-          empresa_id,
-          codigo,
-          nome,
-          categoria,
-          tipo,
-          ativa
-        `).eq('ativa', true)
-      ]);
-
-      if (contasRes.error) throw contasRes.error;
-      if (empresasRes.error) throw empresasRes.error;
-      if (contasContabeisRes.error) throw contasContabeisRes.error;
-
-      // Mapear dados das contas incluindo as fotos
-      const contasData = (contasRes.data || []).map(item => ({
-        id: item.id,
-        user_id: item.user_id,
-        empresaId: item.empresa_id,
-        fornecedor: item.fornecedor,
-        descricao: item.descricao,
-        valor: item.valor,
-        dataVencimento: item.data_vencimento,
-        dataPagamento: item.data_pagamento,
-        status: item.status,
-        observacoes: item.observacoes,
-        numeroDocumento: item.numero_documento,
-        fotoUrl: item.foto_url, // Mantido para compatibilidade
-        fotoNome: item.foto_nome, // Mantido para compatibilidade
-        fotos: (item.conta_pagar_fotos || []).map(foto => ({
-          id: foto.id,
-          contaPagarId: item.id,
-          fotoUrl: foto.foto_url,
-          fotoNome: foto.foto_nome,
-          ordem: foto.ordem,
-          createdAt: foto.created_at
-        })),
-        contaContabilId: item.conta_contabil_id,
-        lancamentoGeradoId: item.lancamento_gerado_id,
-        createdAt: item.created_at,
-        updatedAt: item.updated_at
-      }));
-
-      const empresasData = (empresasRes.data || []).map(item => ({
-        id: item.id,
-        razaoSocial: item.razao_social,
-        user_id: '',
-        created_at: '',
-        cnpj: '',
-        regimeTributario: 'Simples Nacional' as const,
-        dataAbertura: '',
-        ativa: true
-      }));
-
-      const contasContabeisData = (contasContabeisRes.data || []).map(item => ({
-        id: item.id,
-        user_id: '',
-        created_at: '',
-        empresaId: item.empresa_id,
-        codigo: item.codigo,
-        nome: item.nome,
-        categoria: item.categoria,
-        subcategoria: null,
-        tipo: item.tipo,
-        ativa: item.ativa
-      }));
-
-      setContas(contasData);
-      setTotalCount(contasRes.count || 0);
-      setEmpresas(empresasData);
-      setContasContabeis(contasContabeisData);
+      const [rows, totaisData] = await Promise.all([fetchPage(0), fetchTotais()]);
+      if (geracao !== geracaoRef.current) return;
+      setContas(rows);
+      setTotais(totaisData);
+      prefetch(rows.length, rows);
     } catch (err: any) {
+      if (geracao !== geracaoRef.current) return;
       setError(err.message || 'Erro ao carregar dados');
       console.error('Erro ao buscar dados:', err);
     } finally {
-      setLoading(false);
+      if (geracao === geracaoRef.current) setLoading(false);
     }
-  }, [fetchLimit, debouncedTermoPesquisa]);
+  }, [fetchPage, fetchTotais, prefetch]);
+
+  const loadMore = useCallback(async () => {
+    if (loadingMore || !prefetchRef.current) return;
+    const geracao = geracaoRef.current;
+    const pending = prefetchRef.current;
+    prefetchRef.current = null;
+    setLoadingMore(true);
+    try {
+      const rows = await pending;
+      if (geracao !== geracaoRef.current) return;
+      // Contas inseridas no topo pelo Realtime empurram as páginas seguintes
+      setContas(prev => {
+        const carregadas = new Set(prev.map(c => c.id));
+        return [...prev, ...rows.filter(c => !carregadas.has(c.id))];
+      });
+      prefetch(offsetRef.current + rows.length, rows);
+    } catch (err: any) {
+      if (geracao !== geracaoRef.current) return;
+      // Mantém o offset para tentar de novo na próxima rolagem
+      prefetchRef.current = fetchPage(offsetRef.current);
+      prefetchRef.current.catch(() => undefined);
+      console.error('Erro ao carregar mais contas:', err);
+    } finally {
+      setLoadingMore(false);
+    }
+  }, [loadingMore, prefetch, fetchPage]);
 
   useEffect(() => {
     fetchData();
   }, [fetchData]);
 
+  // Lista atual, para os ajustes locais decidirem fora do setState
+  const contasRef = useRef(contas);
+  contasRef.current = contas;
+
+  // Mesmos filtros de fetchPage, aplicados a uma conta recebida fora da consulta
+  const correspondeAosFiltros = useCallback((conta: ContaPagar) => {
+    if (filtros.status === 'vencida') {
+      if (conta.status !== 'pendente' || conta.dataVencimento > filtros.hoje) return false;
+    } else if (filtros.status === 'pendente') {
+      if (conta.status !== 'pendente' || conta.dataVencimento <= filtros.hoje) return false;
+    } else if (filtros.status && conta.status !== filtros.status) {
+      return false;
+    }
+    if (filtros.inicio && conta.dataVencimento < filtros.inicio) return false;
+    if (filtros.fim && conta.dataVencimento > filtros.fim) return false;
+    if (filtros.termo) {
+      const termo = filtros.termo.toLowerCase();
+      return [conta.fornecedor, conta.descricao, conta.numeroDocumento, conta.observacoes]
+        .some(campo => campo?.toLowerCase().includes(termo));
+    }
+    return true;
+  }, [filtros]);
+
+  const atualizarTotais = useCallback(() => {
+    const geracao = geracaoRef.current;
+    fetchTotais()
+      .then(totaisData => {
+        if (geracao === geracaoRef.current) setTotais(totaisData);
+      })
+      .catch(err => console.error('Erro ao atualizar totais:', err));
+  }, [fetchTotais]);
+
+  // Linhas incluídas ou retiradas do que já foi carregado deslocam as páginas seguintes
+  const deslocarPaginas = useCallback((delta: number) => {
+    offsetRef.current += delta;
+    if (prefetchRef.current) {
+      prefetchRef.current = fetchPage(offsetRef.current);
+      prefetchRef.current.catch(() => undefined);
+    }
+  }, [fetchPage]);
+
+  // Troca uma conta alterada (ou retira uma excluída) sem recarregar a lista
+  const aplicarConta = useCallback((id: string, conta: ContaPagar | null) => {
+    if (contasRef.current.some(c => c.id === id)) {
+      if (conta && correspondeAosFiltros(conta)) {
+        setContas(prev => prev.map(c => (c.id === id ? { ...conta, fotos: c.fotos } : c)));
+      } else {
+        setContas(prev => prev.filter(c => c.id !== id));
+        deslocarPaginas(-1);
+      }
+    }
+    atualizarTotais();
+  }, [correspondeAosFiltros, deslocarPaginas, atualizarTotais]);
+
+  const inserirConta = useCallback((conta: ContaPagar) => {
+    if (contasRef.current.some(c => c.id === conta.id)) {
+      aplicarConta(conta.id, conta);
+      return;
+    }
+    // Só na ordem padrão (mais recentes primeiro) o lugar da conta nova é conhecido: o topo
+    if (!campoOrdenacao && correspondeAosFiltros(conta)) {
+      setContas(prev => [conta, ...prev]);
+      deslocarPaginas(1);
+    }
+    atualizarTotais();
+  }, [aplicarConta, campoOrdenacao, correspondeAosFiltros, deslocarPaginas, atualizarTotais]);
+
+  const recarregarConta = async (id: string) => {
+    const { data, error: contaError } = await supabase
+      .from('contas_a_pagar')
+      .select(CONTAS_COLUMNS)
+      .eq('id', id)
+      .maybeSingle();
+    if (contaError) {
+      console.error('Erro ao recarregar conta:', contaError);
+      return;
+    }
+    aplicarConta(id, data ? (mapContaPagar(data) as ContaPagar) : null);
+  };
+
+  // Mudanças feitas em outras abas ou por outros usuários da empresa
+  useEffect(() => {
+    const cancelarContas = subscribeRealtime('contas_a_pagar', ({ tipo, id, novo }) => {
+      const conta = novo ? (mapContaPagar(novo) as ContaPagar) : null;
+      if (tipo === 'INSERT' && conta) {
+        inserirConta(conta);
+      } else {
+        aplicarConta(id, conta);
+      }
+      if (conta) {
+        setViewingConta(atual => (atual && atual.id === id ? { ...conta, fotos: atual.fotos } : atual));
+      }
+    });
+    const cancelarFotos = subscribeRealtime('conta_pagar_fotos', ({ id, novo }) => {
+      setViewingConta(atual => {
+        if (!atual) return atual;
+        const anteriores = atual.fotos || [];
+        const fotos = anteriores.filter(f => f.id !== id);
+        if (novo && novo.conta_pagar_id === atual.id) {
+          fotos.push(mapFoto(novo, atual.id));
+          fotos.sort((a, b) => a.ordem - b.ordem);
+        } else if (fotos.length === anteriores.length) {
+          return atual;
+        }
+        return { ...atual, fotos };
+      });
+    });
+    return () => {
+      cancelarContas();
+      cancelarFotos();
+    };
+  }, [aplicarConta, inserirConta]);
+
   // Edição por modal removida
 
-  const handleView = (conta: ContaPagar) => {
+  const handleView = async (conta: ContaPagar) => {
     setViewingConta(conta);
     setShowDetailsModal(true);
+    // A lista não traz as fotos: só a conta aberta nos detalhes as busca
+    await carregarContaDetalhes(conta.id);
+  };
+
+  const carregarContaDetalhes = async (id: string) => {
+    const { data, error: detalhesError } = await supabase
+      .from('contas_a_pagar')
+      .select(`${CONTAS_COLUMNS}, conta_pagar_fotos(id, foto_url, foto_nome, ordem, created_at)`)
+      .eq('id', id)
+      .single();
+    if (detalhesError) {
+      console.error('Erro ao buscar detalhes da conta:', detalhesError);
+      return null;
+    }
+    const completa = mapContaPagar(data) as ContaPagar;
+    setViewingConta(atual => (atual && atual.id === id ? completa : atual));
+    return completa;
   };
 
   const handleDelete = async (id: string) => {
@@ -442,8 +672,8 @@ export const ContasPagarList: React.FC = () => {
       console.log('Conta a pagar excluída com sucesso');
       closeConfirm();
       
-      // Atualizar a lista após exclusão bem-sucedida
-      await fetchData();
+      // Retira a conta da lista sem recarregá-la
+      aplicarConta(id, null);
       
       // Mostrar confirmação de sucesso
       await showAlert({
@@ -621,7 +851,7 @@ export const ContasPagarList: React.FC = () => {
       setShowComprovanteModal(false);
       setContaParaPagar(null);
       setComprovanteFile(null);
-      fetchData();
+      recarregarConta(contaParaPagar.id);
     } catch (error: any) {
       console.error('Erro ao marcar conta como paga:', error);
       await showAlert({
@@ -699,11 +929,17 @@ export const ContasPagarList: React.FC = () => {
   const formatCurrency = (value: number) => 
     new Intl.NumberFormat('pt-BR', { style: 'currency', currency: 'BRL' }).format(value);
 
+  const empresasPorId = useMemo(() => new Map(empresas.map(e => [e.id, e.razaoSocial])), [empresas]);
+  const contasContabeisPorId = useMemo(() => new Map(contasContabeis.map(c => [c.id, c])), [contasContabeis]);
+
   const getEmpresaNome = (empresaId: string) => 
-    empresas.find(e => e.id === empresaId)?.razaoSocial || 'N/A';
+    empresasPorId.get(empresaId) || 'N/A';
+
+  // Referências de data calculadas uma vez por render, não por linha
+  const hoje = new Date();
+  const emSeteDias = addDays(hoje, 7);
 
   const getStatusColor = (status: string, dataVencimento: string) => {
-    const hoje = new Date();
     const vencimento = new Date(dataVencimento);
     
     switch (status) {
@@ -716,7 +952,7 @@ export const ContasPagarList: React.FC = () => {
       case 'pendente':
         if (isBefore(vencimento, hoje)) {
           return 'bg-red-100 text-red-800'; // Vencida
-        } else if (isBefore(vencimento, addDays(hoje, 7))) {
+        } else if (isBefore(vencimento, emSeteDias)) {
           return 'bg-yellow-100 text-yellow-800'; // Vence em breve
         }
         return 'bg-blue-100 text-blue-800';
@@ -726,7 +962,6 @@ export const ContasPagarList: React.FC = () => {
   };
 
   const getStatusText = (status: string, dataVencimento: string) => {
-    const hoje = new Date();
     const vencimento = new Date(dataVencimento);
     
     if (status === 'pendente' && isBefore(vencimento, hoje)) {
@@ -746,7 +981,7 @@ export const ContasPagarList: React.FC = () => {
   // Função para obter o nome da conta contábil
   const getContaContabilNome = (contaContabilId: string | null) => {
     if (!contaContabilId) return 'Não definida';
-    const conta = contasContabeis.find(c => c.id === contaContabilId);
+    const conta = contasContabeisPorId.get(contaContabilId);
     return conta ? `${conta.codigo} - ${conta.nome}` : 'Conta não encontrada';
   };
 
@@ -794,132 +1029,11 @@ export const ContasPagarList: React.FC = () => {
 
 
 
-  // Filtrar e ordenar contas
-  const contasFiltradas = contas.filter(conta => {
-    // Lógica corrigida para filtro de status
-    if (filtroStatus) {
-      const hoje = new Date();
-      const vencimento = formatDateForDisplay(conta.dataVencimento);
-      
-      if (filtroStatus === 'vencida') {
-        // Mostrar apenas contas pendentes que estão vencidas
-        if (!(conta.status === 'pendente' && isBefore(vencimento, hoje))) {
-          return false;
-        }
-      } else if (filtroStatus === 'pendente') {
-        // Mostrar apenas contas pendentes que NÃO estão vencidas
-        if (!(conta.status === 'pendente' && !isBefore(vencimento, hoje))) {
-          return false;
-        }
-      } else {
-        // Para outros status (paga, cancelada), usar comparação direta
-        if (conta.status !== filtroStatus) return false;
-      }
-    }
-    
-    // Filtro por período de datas
-    if (filtroDataInicio || filtroDataFim) {
-      const dataVencimento = formatDateForDisplay(conta.dataVencimento);
-      
-      if (filtroDataInicio) {
-        const dataInicio = new Date(filtroDataInicio);
-        if (isBefore(dataVencimento, dataInicio)) return false;
-      }
-      
-      if (filtroDataFim) {
-        const dataFim = new Date(filtroDataFim);
-        if (isAfter(dataVencimento, dataFim)) return false;
-      }
-    }
-    
-    // Filtro de pesquisa por texto
-  if (debouncedTermoPesquisa && !serverSearching) {
-      const termo = debouncedTermoPesquisa.toLowerCase();
-      const fornecedor = conta.fornecedor?.toLowerCase() || '';
-      const descricao = conta.descricao?.toLowerCase() || '';
-      const valor = conta.valor.toString();
-      const numeroDocumento = conta.numeroDocumento?.toLowerCase() || '';
-      const observacoes = conta.observacoes?.toLowerCase() || '';
-      const empresaNome = getEmpresaNome(conta.empresaId).toLowerCase();
-      const contaContabilNome = getContaContabilNome(conta.contaContabilId).toLowerCase();
-      
-      const matchesSearch = fornecedor.includes(termo) ||
-                           descricao.includes(termo) ||
-                           valor.includes(termo) ||
-                           numeroDocumento.includes(termo) ||
-                           observacoes.includes(termo) ||
-                           empresaNome.includes(termo) ||
-                           contaContabilNome.includes(termo);
-      
-      if (!matchesSearch) return false;
-    }
-    
-    return true;
-  }).sort((a, b) => {
-    if (!campoOrdenacao) return 0;
-    
-    let valorA: any;
-    let valorB: any;
-    
-    switch (campoOrdenacao) {
-      case 'fornecedor':
-        valorA = a.fornecedor?.toLowerCase() || '';
-        valorB = b.fornecedor?.toLowerCase() || '';
-        break;
-      case 'descricao':
-        valorA = a.descricao?.toLowerCase() || '';
-        valorB = b.descricao?.toLowerCase() || '';
-        break;
-      case 'contaContabil':
-        valorA = getContaContabilNome(a.contaContabilId).toLowerCase();
-        valorB = getContaContabilNome(b.contaContabilId).toLowerCase();
-        break;
-      case 'vencimento':
-        valorA = new Date(a.dataVencimento);
-        valorB = new Date(b.dataVencimento);
-        break;
-      case 'criado':
-        valorA = toDate(a.createdAt)?.getTime() ?? 0;
-        valorB = toDate(b.createdAt)?.getTime() ?? 0;
-        break;
-      case 'valor':
-        valorA = a.valor;
-        valorB = b.valor;
-        break;
-      case 'status':
-        // Ordenação por prioridade: pendente > vencida > paga
-        const statusPrioridade = { 'pendente': 3, 'vencida': 2, 'paga': 1, 'cancelada': 0 };
-        valorA = statusPrioridade[a.status as keyof typeof statusPrioridade] || 0;
-        valorB = statusPrioridade[b.status as keyof typeof statusPrioridade] || 0;
-        break;
-      default:
-        return 0;
-    }
-    
-    if (valorA < valorB) {
-      return direcaoOrdenacao === 'asc' ? -1 : 1;
-    }
-    if (valorA > valorB) {
-      return direcaoOrdenacao === 'asc' ? 1 : -1;
-    }
-    return 0;
-  });
-
-  const contasAgrupadas = (() => {
-    const groups = new Map<string, {
-      empresaId: string;
-      fornecedor: string;
-      descricao: string;
-      numeroDocumento?: string;
-      dataVencimento: string;
-      createdAt: string;
-      valorTotal: number;
-      status: ContaPagarStatus;
-      contaContabilId?: string;
-      id: string;
-    }>();
-
-    for (const c of contasFiltradas) {
+  // Filtros e ordenação já vêm aplicados do banco; aqui só agrupa por documento
+  const contasAgrupadas = useMemo(() => {
+    const groups = new Map<string, ContaAgrupada>();
+
+    for (const c of contas) {
       const key = c.numeroDocumento ? `${c.empresaId}|${c.numeroDocumento}` : c.id;
       const existing = groups.get(key);
       if (!existing) {
@@ -930,6 +1044,7 @@ export const ContasPagarList: React.FC = () => {
           descricao: c.descricao,
           numeroDocumento: c.numeroDocumento,
           dataVencimento: c.dataVencimento,
+          dataPagamento: c.dataPagamento,
           createdAt: c.createdAt,
           valorTotal: c.valor,
           status: c.status,
@@ -938,51 +1053,37 @@ export const ContasPagarList: React.FC = () => {
       } else {
         existing.valorTotal += c.valor;
         // status agregado: se algum pendente, pendente; senão se algum vencida, vencida; senão se todos pagos, paga; senão mantém
-        const order = (s: ContaPagarStatus) => (s === 'pendente' ? 3 : s === 'vencida' ? 2 : s === 'paga' ? 1 : 0);
-        if (order(c.status) > order(existing.status)) {
+        if ((STATUS_PRIORIDADE[c.status] ?? 0) > (STATUS_PRIORIDADE[existing.status] ?? 0)) {
           existing.status = c.status;
         }
-        // vencimento: manter o mais próximo (menor data)
-        if (new Date(c.dataVencimento) < new Date(existing.dataVencimento)) {
+        // vencimento: manter o mais próximo (menor data); datas ISO comparam como texto
+        if (c.dataVencimento < existing.dataVencimento) {
           existing.dataVencimento = c.dataVencimento;
         }
       }
     }
     return Array.from(groups.values());
-  })();
+  }, [contas]);
 
-  // Calcular totais
-  const totalPendente = contasFiltradas
-    .filter(c => c.status === 'pendente')
-    .reduce((sum, c) => sum + c.valor, 0);
-  
-  const totalVencidas = contasFiltradas
-    .filter(c => {
-      const hoje = new Date();
-      const vencimento = new Date(c.dataVencimento);
-      return c.status === 'pendente' && isBefore(vencimento, hoje);
-    })
-    .reduce((sum, c) => sum + c.valor, 0);
-
-  const fetchContas = async () => {
-    try {
-      setLoading(true);
-      let query = supabase
-        .from('contas_a_pagar')
-        .select(`
-          *,
-          empresas!inner(id, razao_social)
-        `)
-        .order('data_vencimento', { ascending: true });
-  
-      // ... rest of the query logic ...
-  } catch (error) {
-    console.error('Erro ao carregar contas:', error);
-    setError('Erro ao carregar contas a pagar');
-  } finally {
-    setLoading(false);
-  }
-};
+  const tabela = useWindowedList(contasAgrupadas.length, TABLE_ROW_HEIGHT, LIST_HEIGHT, 10, loadMore);
+  const cards = useWindowedList(contasAgrupadas.length, CARD_HEIGHT, LIST_HEIGHT, 2, loadMore);
+
+  // O spinner desmonta a área rolável: ela volta no topo, e as janelas também
+  const { reset: resetTabela } = tabela;
+  const { reset: resetCards } = cards;
+  useEffect(() => {
+    if (loading) {
+      resetTabela();
+      resetCards();
+    }
+  }, [loading, resetTabela, resetCards]);
+
+  // Primeira página menor que a área visível: não há rolagem para pedir a próxima
+  useEffect(() => {
+    if (!loading && hasMore && contasAgrupadas.length * TABLE_ROW_HEIGHT < LIST_HEIGHT) {
+      loadMore();
+    }
+  }, [loading, hasMore, contasAgrupadas.length, loadMore]);
 
   if (loading) {
     return (
@@ -1001,7 +1102,7 @@ export const ContasPagarList: React.FC = () => {
   }
 
   return (
-    <div className="w-full max-w-full min-w-0 space-y-3 sm:space-y-4 lg:space-y-6 px-1 xs:px-2 sm:px-4 lg:px-6 py-3 sm:py-4 lg:py-6 overflow-x-hidden overflow-y-visible">
+    <div className="w-full max-w-full min-w-0 space-y-3 sm:space-y-4 lg:space-y-6 px-1 xs:px-2 sm:px-4 lg:px-6 py-3 sm:py-4 lg:py-6 overflow-x-hidden overflow-y-visible" data-testid="contas-pagar-list">
       {/* Header Responsivo */}
       <div className="w-full flex flex-col gap-3 overflow-hidden">
         <div className="w-full min-w-0">
@@ -1018,6 +1119,7 @@ export const ContasPagarList: React.FC = () => {
           <div className="flex gap-2 w-full xs:flex-1">
             <button 
               onClick={handleAddNew} 
+              data-testid="contas-pagar-new"
               className="flex-1 bg-blue-600 text-white px-3 py-1.5 rounded-lg hover:bg-blue-700 flex items-center justify-center gap-1.5 touch-manipulation text-sm min-w-0"
             >
               <Plus className="h-3.5 w-3.5 flex-shrink-0" />
@@ -1036,7 +1138,7 @@ export const ContasPagarList: React.FC = () => {
             </div>
             <div className="min-w-0 flex-1 overflow-hidden">
               <p className="text-xs sm:text-sm font-medium text-gray-600 truncate">Total Pendente</p>
-              <p className="text-sm sm:text-lg lg:text-xl font-bold text-gray-900 truncate">{formatCurrency(totalPendente)}</p>
+              <p className="text-sm sm:text-lg lg:text-xl font-bold text-gray-900 truncate" data-testid="contas-pagar-total-pendente">{formatCurrency(totais.totalPendente)}</p>
             </div>
           </div>
         </div>
@@ -1048,7 +1150,7 @@ export const ContasPagarList: React.FC = () => {
             </div>
             <div className="min-w-0 flex-1 overflow-hidden">
               <p className="text-xs sm:text-sm font-medium text-gray-600 truncate">Vencidas</p>
-              <p className="text-sm sm:text-lg lg:text-xl font-bold text-gray-900 truncate">{formatCurrency(totalVencidas)}</p>
+              <p className="text-sm sm:text-lg lg:text-xl font-bold text-gray-900 truncate">{formatCurrency(totais.totalVencidas)}</p>
             </div>
           </div>
         </div>
@@ -1060,7 +1162,7 @@ export const ContasPagarList: React.FC = () => {
             </div>
             <div className="min-w-0 flex-1 overflow-hidden">
               <p className="text-xs sm:text-sm font-medium text-gray-600 truncate">Total de Contas</p>
-              <p className="text-sm sm:text-lg lg:text-xl font-bold text-gray-900 truncate">{contasAgrupadas.length}</p>
+              <p className="text-sm sm:text-lg lg:text-xl font-bold text-gray-900 truncate">{totais.grupos}</p>
             </div>
           </div>
         </div>
@@ -1084,6 +1186,7 @@ export const ContasPagarList: React.FC = () => {
             <input
               type="text"
               placeholder="Buscar por fornecedor, descrição..."
+              data-testid="contas-pagar-search"
               value={termoPesquisa}
               onChange={(e) => setTermoPesquisa(e.target.value)}
               className="w-full min-w-0 border border-gray-300 rounded-md px-3 py-2 focus:outline-none focus:ring-blue-500 focus:border-blue-500 text-sm"
@@ -1095,6 +1198,7 @@ export const ContasPagarList: React.FC = () => {
             <select 
               value={filtroStatus} 
               onChange={(e) => setFiltroStatus(e.target.value)}
+              data-testid="contas-pagar-status-filter"
               className="w-full min-w-0 border border-gray-300 rounded-md px-3 py-2 focus:outline-none focus:ring-blue-500 focus:border-blue-500 text-sm bg-white"
             >
               <option value="">Todos os status</option>
@@ -1152,9 +1256,14 @@ export const ContasPagarList: React.FC = () => {
       {/* Lista/Tabela Responsiva */}
       <div className="bg-white rounded-lg shadow-sm border border-gray-200">
         {/* Desktop: Tabela */}
-        <div className="hidden lg:block overflow-x-auto">
+        <div
+          className="hidden lg:block overflow-auto"
+          style={{ maxHeight: LIST_HEIGHT }}
+          onScroll={tabela.onScroll}
+          data-testid="contas-pagar-scroll"
+        >
           <table className="w-full text-sm min-w-[800px]">
-            <thead className="bg-gray-50">
+            <thead className="bg-gray-50 sticky top-0 z-10">
               <tr>
                 <th className="w-[15%] min-w-[120px]">
                   <button
@@ -1265,8 +1374,9 @@ export const ContasPagarList: React.FC = () => {
               </tr>
             </thead>
             <tbody>
-              {contasAgrupadas.map((conta, index) => (
-                <tr key={conta.id} className={index % 2 === 0 ? 'bg-white' : 'bg-gray-50'}>
+              {tabela.paddingTop > 0 && <tr style={{ height: tabela.paddingTop }} aria-hidden="true" />}
+              {contasAgrupadas.slice(tabela.start, tabela.end).map((conta, index) => (
+                <tr key={conta.id} className={(tabela.start + index) % 2 === 0 ? 'bg-white' : 'bg-gray-50'} style={{ height: TABLE_ROW_HEIGHT }} data-testid="contas-pagar-row" data-conta-id={conta.id}>
                   <td className="py-3 px-4 max-w-0">
                     <div className="overflow-hidden">
                       <p className="font-medium text-gray-900 truncate">{conta.fornecedor}</p>
@@ -1309,6 +1419,7 @@ export const ContasPagarList: React.FC = () => {
                     <div className="flex items-center justify-center gap-1 flex-nowrap">
                       <button 
                         onClick={() => handleView(conta)} 
+                        data-testid="contas-pagar-view"
                         className="p-1.5 text-gray-600 hover:text-blue-600 flex-shrink-0"
                         title="Ver detalhes"
                       >
@@ -1318,6 +1429,7 @@ export const ContasPagarList: React.FC = () => {
                       {conta.status === 'pendente' && (
                         <button 
                           onClick={() => handleMarkAsPaid(conta)}
+                          data-testid="contas-pagar-mark-paid"
                           disabled={payingContaId === conta.id}
                           className="p-1.5 text-gray-600 hover:text-green-600 disabled:opacity-50 flex-shrink-0"
                           title="Marcar como paga"
@@ -1327,6 +1439,7 @@ export const ContasPagarList: React.FC = () => {
                       )}
                       <button 
                         onClick={() => handleDelete(conta.id)} 
+                        data-testid="contas-pagar-delete"
                         className="p-1.5 text-gray-600 hover:text-red-600 flex-shrink-0"
                         title="Excluir"
                       >
@@ -1336,218 +1449,234 @@ export const ContasPagarList: React.FC = () => {
                   </td>
                 </tr>
               ))}
+              {tabela.paddingBottom > 0 && <tr style={{ height: tabela.paddingBottom }} aria-hidden="true" />}
             </tbody>
           </table>
         </div>
 
+        {/* Botão de Ordenação Móvel */}
+        <button
+          onClick={() => setShowMobileSortModal(true)}
+          className="lg:hidden fixed bottom-20 right-4 z-40 bg-blue-600 hover:bg-blue-700 text-white p-3 rounded-full shadow-lg hover:shadow-xl transition-all duration-200 transform hover:scale-105"
+          title="Ordenar lista"
+        >
+          <ArrowUpDown className="h-5 w-5" />
+        </button>
+
         {/* Mobile/Tablet: Cards Modernos */}
-        <div className="lg:hidden flex flex-col items-center space-y-3 px-1 sm:px-2 py-2 sm:py-4 sm:space-y-4 overflow-x-hidden relative">
-          {/* Botão de Ordenação Móvel */}
-          <button
-            onClick={() => setShowMobileSortModal(true)}
-            className="lg:hidden fixed bottom-20 right-4 z-40 bg-blue-600 hover:bg-blue-700 text-white p-3 rounded-full shadow-lg hover:shadow-xl transition-all duration-200 transform hover:scale-105"
-            title="Ordenar lista"
-          >
-            <ArrowUpDown className="h-5 w-5" />
-          </button>
-          {contasAgrupadas.map((conta) => {
-            const isVencida = conta.status === 'pendente' && isBefore(formatDateForDisplay(conta.dataVencimento), new Date());
-            const isProximaVencimento = conta.status === 'pendente' && isAfter(formatDateForDisplay(conta.dataVencimento), new Date()) && isBefore(formatDateForDisplay(conta.dataVencimento), addDays(new Date(), 7));
+        <div
+          className="lg:hidden px-1 sm:px-2 py-2 sm:py-4 overflow-y-auto overflow-x-hidden relative"
+          style={{ maxHeight: LIST_HEIGHT }}
+          onScroll={cards.onScroll}
+          data-testid="contas-pagar-cards-scroll"
+        >
+          <div style={{ height: cards.paddingTop }} aria-hidden="true" />
+          {contasAgrupadas.slice(cards.start, cards.end).map((conta) => {
+            const vencimento = formatDateForDisplay(conta.dataVencimento);
+            const isVencida = conta.status === 'pendente' && isBefore(vencimento, hoje);
+            const isProximaVencimento = conta.status === 'pendente' && isAfter(vencimento, hoje) && isBefore(vencimento, emSeteDias);
             
             return (
-              <div 
-                key={conta.id} 
-                className={`relative bg-white rounded-xl sm:rounded-2xl shadow-md sm:shadow-lg border transition-all duration-300 hover:shadow-lg sm:hover:shadow-xl hover:-translate-y-1 overflow-hidden w-full max-w-[310px] mx-auto ${
-                  isVencida ? 'border-red-200 bg-gradient-to-br from-red-50 to-white' :
-                  isProximaVencimento ? 'border-amber-200 bg-gradient-to-br from-amber-50 to-white' :
-                  conta.status === 'paga' ? 'border-green-200 bg-gradient-to-br from-green-50 to-white' :
-                  'border-gray-200 bg-gradient-to-br from-blue-50 to-white'
-                }`}
-                style={{ maxWidth: 'min(310px, calc(100vw - 8px))' }}
-              >
-                {/* Indicador de urgência */}
-                {isVencida && (
-                  <div className="absolute top-0 right-0 w-0 h-0 border-l-[30px] sm:border-l-[40px] border-l-transparent border-t-[30px] sm:border-t-[40px] border-t-red-500">
-                    <AlertTriangle className="absolute -top-6 sm:-top-8 -right-6 sm:-right-8 h-3 w-3 sm:h-4 sm:w-4 text-white transform rotate-45" />
-                  </div>
-                )}
-                {isProximaVencimento && (
-                  <div className="absolute top-0 right-0 w-0 h-0 border-l-[30px] sm:border-l-[40px] border-l-transparent border-t-[30px] sm:border-t-[40px] border-t-amber-500">
-                    <Calendar className="absolute -top-6 sm:-top-8 -right-6 sm:-right-8 h-3 w-3 sm:h-4 sm:w-4 text-white transform rotate-45" />
-                  </div>
-                )}
+              <div key={conta.id} className="pb-3 sm:pb-4" style={{ height: CARD_HEIGHT }}>
+                <div
+                  data-testid="contas-pagar-card"
+                  data-conta-id={conta.id}
+                  className={`relative h-full flex flex-col bg-white rounded-xl sm:rounded-2xl shadow-md sm:shadow-lg border transition-all duration-300 hover:shadow-lg sm:hover:shadow-xl hover:-translate-y-1 overflow-hidden w-full max-w-[310px] mx-auto ${
+                    isVencida ? 'border-red-200 bg-gradient-to-br from-red-50 to-white' :
+                    isProximaVencimento ? 'border-amber-200 bg-gradient-to-br from-amber-50 to-white' :
+                    conta.status === 'paga' ? 'border-green-200 bg-gradient-to-br from-green-50 to-white' :
+                    'border-gray-200 bg-gradient-to-br from-blue-50 to-white'
+                  }`}
+                  style={{ maxWidth: 'min(310px, calc(100vw - 8px))' }}
+                >
+                  {/* Indicador de urgência */}
+                  {isVencida && (
+                    <div className="absolute top-0 right-0 w-0 h-0 border-l-[30px] sm:border-l-[40px] border-l-transparent border-t-[30px] sm:border-t-[40px] border-t-red-500">
+                      <AlertTriangle className="absolute -top-6 sm:-top-8 -right-6 sm:-right-8 h-3 w-3 sm:h-4 sm:w-4 text-white transform rotate-45" />
+                    </div>
+                  )}
+                  {isProximaVencimento && (
+                    <div className="absolute top-0 right-0 w-0 h-0 border-l-[30px] sm:border-l-[40px] border-l-transparent border-t-[30px] sm:border-t-[40px] border-t-amber-500">
+                      <Calendar className="absolute -top-6 sm:-top-8 -right-6 sm:-right-8 h-3 w-3 sm:h-4 sm:w-4 text-white transform rotate-45" />
+                    </div>
+                  )}
                 
-                {/* Header do card com avatar */}
-                <div className="p-3 sm:p-5 pb-0">
-                  <div className="flex items-start justify-between mb-3 sm:mb-4">
-                    <div className="flex items-center space-x-2 sm:space-x-3 flex-1 min-w-0">
-                      {/* Avatar do fornecedor */}
-                      <div className={`w-10 h-10 sm:w-12 sm:h-12 rounded-full flex items-center justify-center text-white font-bold text-sm sm:text-lg shadow-md ${
-                        isVencida ? 'bg-gradient-to-br from-red-500 to-red-600' :
-                        isProximaVencimento ? 'bg-gradient-to-br from-amber-500 to-amber-600' :
-                        conta.status === 'paga' ? 'bg-gradient-to-br from-green-500 to-green-600' :
-                        'bg-gradient-to-br from-blue-500 to-blue-600'
-                      }`}>
-                        {conta.fornecedor.charAt(0).toUpperCase()}
-                      </div>
+                  {/* Header do card com avatar */}
+                  <div className="p-3 sm:p-5 pb-0">
+                    <div className="flex items-start justify-between mb-3 sm:mb-4">
+                      <div className="flex items-center space-x-2 sm:space-x-3 flex-1 min-w-0">
+                        {/* Avatar do fornecedor */}
+                        <div className={`w-10 h-10 sm:w-12 sm:h-12 rounded-full flex items-center justify-center text-white font-bold text-sm sm:text-lg shadow-md ${
+                          isVencida ? 'bg-gradient-to-br from-red-500 to-red-600' :
+                          isProximaVencimento ? 'bg-gradient-to-br from-amber-500 to-amber-600' :
+                          conta.status === 'paga' ? 'bg-gradient-to-br from-green-500 to-green-600' :
+                          'bg-gradient-to-br from-blue-500 to-blue-600'
+                        }`}>
+                          {conta.fornecedor.charAt(0).toUpperCase()}
+                        </div>
                       
-                      <div className="flex-1 min-w-0">
-                        <h3 className="text-base sm:text-lg font-bold text-gray-900 truncate mb-1">{conta.fornecedor}</h3>
-                        <p className="text-xs sm:text-sm text-gray-600 truncate flex items-center">
-                          <span className="w-1.5 h-1.5 sm:w-2 sm:h-2 bg-gray-400 rounded-full mr-1.5 sm:mr-2"></span>
-                          {getEmpresaNome(conta.empresaId)}
-                        </p>
+                        <div className="flex-1 min-w-0">
+                          <h3 className="text-base sm:text-lg font-bold text-gray-900 truncate mb-1">{conta.fornecedor}</h3>
+                          <p className="text-xs sm:text-sm text-gray-600 truncate flex items-center">
+                            <span className="w-1.5 h-1.5 sm:w-2 sm:h-2 bg-gray-400 rounded-full mr-1.5 sm:mr-2"></span>
+                            {getEmpresaNome(conta.empresaId)}
+                          </p>
+                        </div>
                       </div>
-                    </div>
                     
-                    {/* Status badge elegante */}
-                    <div className="flex flex-col items-end space-y-1 sm:space-y-2">
-                      <span className={`inline-flex items-center px-2 sm:px-3 py-1 sm:py-1.5 text-xs font-semibold rounded-full shadow-sm ${
-                        conta.status === 'paga' ? 'bg-green-100 text-green-800 border border-green-200' :
-                        isVencida ? 'bg-red-100 text-red-800 border border-red-200' :
-                        isProximaVencimento ? 'bg-amber-100 text-amber-800 border border-amber-200' :
-                        'bg-blue-100 text-blue-800 border border-blue-200'
-                      }`}>
-                        <span className={`w-1.5 h-1.5 sm:w-2 sm:h-2 rounded-full mr-1.5 sm:mr-2 ${
-                          conta.status === 'paga' ? 'bg-green-500' :
-                          isVencida ? 'bg-red-500' :
-                          isProximaVencimento ? 'bg-amber-500' :
-                          'bg-blue-500'
-                        }`}></span>
-                        <span className="hidden sm:inline">{getStatusText(conta.status, conta.dataVencimento)}</span>
-                        <span className="sm:hidden">{conta.status === 'paga' ? 'Paga' : isVencida ? 'Vencida' : 'Pendente'}</span>
-                      </span>
+                      {/* Status badge elegante */}
+                      <div className="flex flex-col items-end space-y-1 sm:space-y-2">
+                        <span className={`inline-flex items-center px-2 sm:px-3 py-1 sm:py-1.5 text-xs font-semibold rounded-full shadow-sm ${
+                          conta.status === 'paga' ? 'bg-green-100 text-green-800 border border-green-200' :
+                          isVencida ? 'bg-red-100 text-red-800 border border-red-200' :
+                          isProximaVencimento ? 'bg-amber-100 text-amber-800 border border-amber-200' :
+                          'bg-blue-100 text-blue-800 border border-blue-200'
+                        }`}>
+                          <span className={`w-1.5 h-1.5 sm:w-2 sm:h-2 rounded-full mr-1.5 sm:mr-2 ${
+                            conta.status === 'paga' ? 'bg-green-500' :
+                            isVencida ? 'bg-red-500' :
+                            isProximaVencimento ? 'bg-amber-500' :
+                            'bg-blue-500'
+                          }`}></span>
+                          <span className="hidden sm:inline">{getStatusText(conta.status, conta.dataVencimento)}</span>
+                          <span className="sm:hidden">{conta.status === 'paga' ? 'Paga' : isVencida ? 'Vencida' : 'Pendente'}</span>
+                        </span>
+                      </div>
                     </div>
                   </div>
-                </div>
                 
-                {/* Seção de informações principais */}
-                <div className="px-3 sm:px-5 pb-3 sm:pb-4">
-                  <div className="bg-white/70 backdrop-blur-sm rounded-lg sm:rounded-xl p-3 sm:p-4 mb-3 sm:mb-4 border border-white/50">
-                    <div className="mb-2 sm:mb-3">
-                      <label className="text-xs font-medium text-gray-500 uppercase tracking-wide">Descrição</label>
-                      <p className="text-xs sm:text-sm font-medium text-gray-900 mt-1 leading-relaxed line-clamp-2">{conta.descricao}</p>
-                    </div>
-                    
-                    {/* Blocos de informações principais - Vertical */}
-                    <div className="flex flex-col space-y-1 sm:space-y-2">
-                      <div className="bg-gradient-to-br from-gray-50 to-gray-100 rounded p-1 sm:p-1.5 border border-gray-200 w-full">
-                        <label className="text-xs font-medium text-gray-500 uppercase tracking-wide flex items-center">
-                          <Calendar className="w-2 h-2 sm:w-2.5 sm:h-2.5 mr-0.5" />
-                          <span className="text-xs">Vencimento</span>
-                        </label>
-                        <p className={`text-xs font-bold leading-tight ${
-                          isVencida ? 'text-red-600' :
-                          isProximaVencimento ? 'text-amber-600' :
-                          'text-gray-900'
-                        }`}>
-                          {format(formatDateForDisplay(conta.dataVencimento), 'dd/MM/yy')}
-                        </p>
-                        {isVencida && (
-                          <p className="text-xs text-red-500 font-medium leading-tight">Vencida</p>
-                        )}
-                        {isProximaVencimento && (
-                          <p className="text-xs text-amber-600 font-medium leading-tight">Próximo vencimento</p>
-                        )}
+                  {/* Seção de informações principais */}
+                  <div className="px-3 sm:px-5 pb-3 sm:pb-4">
+                    <div className="bg-white/70 backdrop-blur-sm rounded-lg sm:rounded-xl p-3 sm:p-4 mb-3 sm:mb-4 border border-white/50">
+                      <div className="mb-2 sm:mb-3">
+                        <label className="text-xs font-medium text-gray-500 uppercase tracking-wide">Descrição</label>
+                        <p className="text-xs sm:text-sm font-medium text-gray-900 mt-1 leading-relaxed line-clamp-2">{conta.descricao}</p>
                       </div>
+                    
+                      {/* Blocos de informações principais - Vertical */}
+                      <div className="flex flex-col space-y-1 sm:space-y-2">
+                        <div className="bg-gradient-to-br from-gray-50 to-gray-100 rounded p-1 sm:p-1.5 border border-gray-200 w-full">
+                          <label className="text-xs font-medium text-gray-500 uppercase tracking-wide flex items-center">
+                            <Calendar className="w-2 h-2 sm:w-2.5 sm:h-2.5 mr-0.5" />
+                            <span className="text-xs">Vencimento</span>
+                          </label>
+                          <p className={`text-xs font-bold leading-tight ${
+                            isVencida ? 'text-red-600' :
+                            isProximaVencimento ? 'text-amber-600' :
+                            'text-gray-900'
+                          }`}>
+                            {format(formatDateForDisplay(conta.dataVencimento), 'dd/MM/yy')}
+                          </p>
+                          {isVencida && (
+                            <p className="text-xs text-red-500 font-medium leading-tight">Vencida</p>
+                          )}
+                          {isProximaVencimento && (
+                            <p className="text-xs text-amber-600 font-medium leading-tight">Próximo vencimento</p>
+                          )}
+                        </div>
                       
-                      <div className="bg-gradient-to-br from-green-50 to-green-100 rounded p-1 sm:p-1.5 border border-green-200 w-full">
-                        <label className="text-xs font-medium text-gray-500 uppercase tracking-wide flex items-center">
-                          <span className="text-green-600 mr-0.5 text-xs">R$</span>
-                          <span className="text-xs">Valor</span>
-                        </label>
-                        <p className="text-xs font-bold text-green-700 leading-tight">{formatCurrency(conta.valor)}</p>
+                        <div className="bg-gradient-to-br from-green-50 to-green-100 rounded p-1 sm:p-1.5 border border-green-200 w-full">
+                          <label className="text-xs font-medium text-gray-500 uppercase tracking-wide flex items-center">
+                            <span className="text-green-600 mr-0.5 text-xs">R$</span>
+                            <span className="text-xs">Valor</span>
+                          </label>
+                          <p className="text-xs font-bold text-green-700 leading-tight">{formatCurrency(conta.valor)}</p>
+                        </div>
                       </div>
                     </div>
-                  </div>
                   
-                  {/* Informações secundárias - Compacto */}
-                  <div className="space-y-1">
-                    {conta.numeroDocumento && (
-                      <div 
-                        className="flex items-center justify-between py-1 px-1.5 bg-gray-50 rounded border border-gray-200 cursor-pointer hover:bg-gray-100 transition-colors duration-200"
-                        onClick={() => handleCopyCode(conta.numeroDocumento!)}
-                        title="Clique para copiar o código"
-                      >
-                        <span className="text-xs font-medium text-gray-500 uppercase tracking-wide flex items-center">
-                          <FileText className="w-2 h-2 mr-0.5" />
-                          <span className="text-xs">CÓD</span>
-                        </span>
-                        <span className={`text-xs font-medium truncate ml-1 transition-colors duration-200 ${
-                          copiedCode === conta.numeroDocumento 
-                            ? 'text-green-600' 
-                            : 'text-gray-900'
-                        }`}>
-                          {copiedCode === conta.numeroDocumento ? 'Copiado!' : conta.numeroDocumento}
-                        </span>
-                      </div>
-                    )}
+                    {/* Informações secundárias - Compacto */}
+                    <div className="space-y-1">
+                      {conta.numeroDocumento && (
+                        <div 
+                          className="flex items-center justify-between py-1 px-1.5 bg-gray-50 rounded border border-gray-200 cursor-pointer hover:bg-gray-100 transition-colors duration-200"
+                          onClick={() => handleCopyCode(conta.numeroDocumento!)}
+                          title="Clique para copiar o código"
+                        >
+                          <span className="text-xs font-medium text-gray-500 uppercase tracking-wide flex items-center">
+                            <FileText className="w-2 h-2 mr-0.5" />
+                            <span className="text-xs">CÓD</span>
+                          </span>
+                          <span className={`text-xs font-medium truncate ml-1 transition-colors duration-200 ${
+                            copiedCode === conta.numeroDocumento 
+                              ? 'text-green-600' 
+                              : 'text-gray-900'
+                          }`}>
+                            {copiedCode === conta.numeroDocumento ? 'Copiado!' : conta.numeroDocumento}
+                          </span>
+                        </div>
+                      )}
+                    
+                      {conta.status === 'paga' && conta.dataPagamento && (
+                        <div className="flex items-center justify-between py-1 px-1.5 bg-green-50 rounded border border-green-200">
+                          <span className="text-xs font-medium text-green-600 uppercase tracking-wide flex items-center">
+                            <Calendar className="w-2 h-2 mr-0.5" />
+                            <span className="text-xs">Pago</span>
+                          </span>
+                          <span className="text-xs font-bold text-green-700">{format(formatDateForDisplay(conta.dataPagamento), 'dd/MM/yy')}</span>
+                        </div>
+                      )}
                     
-                    {conta.status === 'paga' && conta.dataPagamento && (
-                      <div className="flex items-center justify-between py-1 px-1.5 bg-green-50 rounded border border-green-200">
-                        <span className="text-xs font-medium text-green-600 uppercase tracking-wide flex items-center">
-                          <Calendar className="w-2 h-2 mr-0.5" />
-                          <span className="text-xs">Pago</span>
+                      <div className="flex items-center justify-between py-1 px-1.5 bg-blue-50 rounded border border-blue-200">
+                        <span className="text-xs font-medium text-blue-600 uppercase tracking-wide">
+                          <span className="text-xs">Conta</span>
+                        </span>
+                        <span className="text-xs font-medium text-blue-800 truncate ml-1 max-w-[100px]" title={getContaContabilNome(conta.contaContabilId)}>
+                          {getContaContabilNome(conta.contaContabilId)}
                         </span>
-                        <span className="text-xs font-bold text-green-700">{format(formatDateForDisplay(conta.dataPagamento), 'dd/MM/yy')}</span>
                       </div>
-                    )}
-                    
-                    <div className="flex items-center justify-between py-1 px-1.5 bg-blue-50 rounded border border-blue-200">
-                      <span className="text-xs font-medium text-blue-600 uppercase tracking-wide">
-                        <span className="text-xs">Conta</span>
-                      </span>
-                      <span className="text-xs font-medium text-blue-800 truncate ml-1 max-w-[100px]" title={getContaContabilNome(conta.contaContabilId)}>
-                        {getContaContabilNome(conta.contaContabilId)}
-                      </span>
                     </div>
                   </div>
-                </div>
                 
-                {/* Divisor elegante - Compacto */}
-                <div className="mx-2 border-t border-gray-200"></div>
+                  {/* Divisor elegante - Compacto */}
+                  <div className="mx-2 mt-auto border-t border-gray-200"></div>
                 
-                {/* Botões de ação modernos */}
-                <div className="p-3 pt-2">
-                  <div className="flex items-center gap-2">
-                    <button 
-                      onClick={() => handleView(conta)} 
-                      className="flex-1 flex items-center justify-center gap-2 px-3 py-2 text-xs font-medium bg-gradient-to-r from-blue-500 to-blue-600 text-white rounded shadow-md hover:shadow-lg hover:from-blue-600 hover:to-blue-700 transition-all duration-200 transform hover:scale-105"
-                      title="Ver detalhes"
-                    >
-                      <Eye className="h-3 w-3" />
-                      <span className="text-xs">Ver</span>
-                    </button>
+                  {/* Botões de ação modernos */}
+                  <div className="p-3 pt-2">
+                    <div className="flex items-center gap-2">
+                      <button 
+                        onClick={() => handleView(conta)} 
+                        data-testid="contas-pagar-view"
+                        className="flex-1 flex items-center justify-center gap-2 px-3 py-2 text-xs font-medium bg-gradient-to-r from-blue-500 to-blue-600 text-white rounded shadow-md hover:shadow-lg hover:from-blue-600 hover:to-blue-700 transition-all duration-200 transform hover:scale-105"
+                        title="Ver detalhes"
+                      >
+                        <Eye className="h-3 w-3" />
+                        <span className="text-xs">Ver</span>
+                      </button>
                     
                     
                     
-                    {conta.status === 'pendente' && (
+                      {conta.status === 'pendente' && (
+                        <button 
+                          onClick={() => handleMarkAsPaid(conta)}
+                          data-testid="contas-pagar-mark-paid"
+                          disabled={payingContaId === conta.id}
+                          className="flex-1 flex items-center justify-center gap-2 px-3 py-2 text-xs font-medium bg-gradient-to-r from-green-500 to-green-600 text-white rounded shadow-md hover:shadow-lg hover:from-green-600 hover:to-green-700 disabled:opacity-50 disabled:cursor-not-allowed transition-all duration-200 transform hover:scale-105"
+                          title="Marcar como paga"
+                        >
+                          <CreditCard className="h-3 w-3" />
+                          <span className="text-xs">Pagar</span>
+                        </button>
+                      )}
+                    
                       <button 
-                        onClick={() => handleMarkAsPaid(conta)}
-                        disabled={payingContaId === conta.id}
-                        className="flex-1 flex items-center justify-center gap-2 px-3 py-2 text-xs font-medium bg-gradient-to-r from-green-500 to-green-600 text-white rounded shadow-md hover:shadow-lg hover:from-green-600 hover:to-green-700 disabled:opacity-50 disabled:cursor-not-allowed transition-all duration-200 transform hover:scale-105"
-                        title="Marcar como paga"
+                        onClick={() => handleDelete(conta.id)} 
+                        data-testid="contas-pagar-delete"
+                        className="flex-1 flex items-center justify-center gap-2 px-3 py-2 text-xs font-medium bg-gradient-to-r from-red-500 to-red-600 text-white rounded shadow-md hover:shadow-lg hover:from-red-600 hover:to-red-700 transition-all duration-200 transform hover:scale-105"
+                        title="Excluir"
                       >
-                        <CreditCard className="h-3 w-3" />
-                        <span className="text-xs">Pagar</span>
+                        <Trash2 className="h-3 w-3" />
+                        <span className="text-xs">Excluir</span>
                       </button>
-                    )}
-                    
-                    <button 
-                      onClick={() => handleDelete(conta.id)} 
-                      className="flex-1 flex items-center justify-center gap-2 px-3 py-2 text-xs font-medium bg-gradient-to-r from-red-500 to-red-600 text-white rounded shadow-md hover:shadow-lg hover:from-red-600 hover:to-red-700 transition-all duration-200 transform hover:scale-105"
-                      title="Excluir"
-                    >
-                      <Trash2 className="h-3 w-3" />
-                      <span className="text-xs">Excluir</span>
-                    </button>
+                    </div>
                   </div>
                 </div>
               </div>
             );
           })}
-          
-          {contasFiltradas.length === 0 && (
+          <div style={{ height: cards.paddingBottom }} aria-hidden="true" />
+
+          {contasAgrupadas.length === 0 && (
             <div className="p-8 text-center text-gray-500">
               <FileText className="h-12 w-12 mx-auto mb-4 text-gray-300" />
               <p>Nenhuma conta encontrada</p>
@@ -1555,16 +1684,21 @@ export const ContasPagarList: React.FC = () => {
             </div>
           )}
         </div>
+
+        {loadingMore && (
+          <div className="flex justify-center py-3 border-t border-gray-200"><Spinner size="sm" /></div>
+        )}
       </div>
 
       {/* Paginação / Carregar mais */}
       <div className="flex items-center justify-between mt-4">
         <div className="text-sm text-gray-600">
-          Mostrando {contas.length} de {totalCount} contas
+          Mostrando {contas.length} de {totais.quantidade} contas
         </div>
         <button
-          onClick={() => setFetchLimit(prev => Math.min(prev + 1000, (totalCount || prev) ))}
-          disabled={contas.length >= totalCount || loading}
+          onClick={loadMore}
+          data-testid="contas-pagar-load-more"
+          disabled={!hasMore || loadingMore || loading}
           className="px-3 py-2 bg-blue-600 text-white rounded-md hover:bg-blue-700 disabled:opacity-50 disabled:cursor-not-allowed text-sm"
         >
           Carregar mais
@@ -1583,7 +1717,8 @@ export const ContasPagarList: React.FC = () => {
         <ContaPagarForm 
           onSave={() => {
             setShowModal(false);
-            fetchData();
+            // Com o Realtime conectado, o próprio evento da gravação atualiza a lista
+            if (!isRealtimeTable('contas_a_pagar')) fetchData();
           }}
           onCancel={() => {
             setShowModal(false);
@@ -1602,10 +1737,11 @@ export const ContasPagarList: React.FC = () => {
       >
         {viewingConta && (
           <ContaPagarDetails 
-            conta={contas.find(c => c.id === viewingConta.id) || viewingConta}
+            conta={viewingConta}
             empresa={empresas.find(e => e.id === viewingConta.empresaId)}
-            onUpdate={() => {
-              fetchData();
+            onUpdate={async () => {
+              const conta = await carregarContaDetalhes(viewingConta.id);
+              if (conta) aplicarConta(conta.id, conta);
             }}
           />
         )}
@@ -1702,6 +1838,7 @@ export const ContasPagarList: React.FC = () => {
                         onChange={handleComprovanteFileChange}
                         className="hidden"
                         id="comprovante-file-input"
+                        data-testid="contas-pagar-comprovante-input"
                       />
                       <label
                         htmlFor="comprovante-file-input"
@@ -1735,6 +1872,7 @@ export const ContasPagarList: React.FC = () => {
                   <div className="flex flex-col gap-2 sm:gap-3 overflow-x-hidden">
                     <button
                       onClick={() => processPayment(comprovanteFile ? true : false)}
+                      data-testid="contas-pagar-confirm-payment"
                       disabled={uploadingComprovante || payingContaId === contaParaPagar.id}
                       className="w-full px-3 py-2 bg-blue-600 text-white rounded-lg hover:bg-blue-700 disabled:opacity-50 disabled:cursor-not-allowed text-xs sm:text-sm"
                     >
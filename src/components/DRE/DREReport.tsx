@@ -81,15 +81,20 @@ export const DREReport: React.FC = () => {
       return;
     }
 
-    const dreGerado = DREService.calcularDRE(
-      lancamentosRes.data as unknown as Lancamento[],
-      contasRes.data as unknown as ContaContabil[],
-      selectedEmpresa,
-      dataInicio,
-      dataFim
-    );
-    setDre(dreGerado);
-    setGenerating(false);
+    try {
+      const { periodos: [dreGerado] } = await DREService.calcularDREMultiPeriodoEmSegundoPlano(
+        lancamentosRes.data as unknown as Lancamento[],
+        contasRes.data as unknown as ContaContabil[],
+        selectedEmpresa,
+        [{ dataInicio, dataFim }]
+      );
+      setDre(dreGerado);
+    } catch (err) {
+      alert('Erro ao calcular o DRE.');
+      console.error(err);
+    } finally {
+      setGenerating(false);
+    }
   };
 
   const formatCurrency = (value: number) => new Intl.NumberFormat('pt-BR', { style: 'currency', currency: 'BRL' }).format(value);
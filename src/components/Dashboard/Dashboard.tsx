@@ -1,6 +1,7 @@
-import React, { useState, useEffect } from 'react';
-import { supabase } from '../../lib/supabaseClient';
+import React, { useState, useEffect, useRef } from 'react';
+import { subscribeQueries } from '../../lib/queryCache';
 import { DREService } from '../../services/dreService';
+import { QueryService } from '../../services/queryService';
 import { Lancamento, ContaContabil, DREPeriodo } from '../../types';
 import { DashboardCards } from './DashboardCards';
 import { RevenueChart } from './RevenueChart';
@@ -15,7 +16,7 @@ import { usePeriodFilter } from './hooks/usePeriodFilter';
 
 import { Spinner } from '../ui/Spinner';
 import { useCompany } from '../../contexts/CompanyContext';
-import { subYears, startOfYear, endOfYear, format } from 'date-fns';
+import { subYears, startOfYear, endOfYear } from 'date-fns';
 import RevenueEvolutionChart from './RevenueEvolutionChart';
 
 interface DashboardData {
@@ -33,6 +34,8 @@ export const Dashboard: React.FC = () => {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [showCompanySelector, setShowCompanySelector] = useState(false);
+  // Empresa dos dados na tela: trocar só o período não volta ao spinner
+  const empresaCarregadaRef = useRef<string | null>(null);
   
   // Hook para gerenciar filtros de período
   const {
@@ -44,7 +47,6 @@ export const Dashboard: React.FC = () => {
     handlePeriodChange,
     handleCustomDateChange,
     formatDateForAPI,
-    isDateInRange,
     getPeriodLabel,
   } = usePeriodFilter();
 
@@ -84,99 +86,36 @@ export const Dashboard: React.FC = () => {
       return;
     }
     
-    const fetchData = async () => {
-      setLoading(true);
+    // Troca de período durante o cálculo: o resultado antigo é descartado
+    let cancelado = false;
+    const fetchData = async (recarregando = false) => {
+      if (!recarregando) setLoading(true);
       setError(null);
       try {
+        // Só do início do período anterior ao fim do atual; o índice acumulado é
+        // montado sobre esse recorte e atende os dois períodos e o histórico mensal
         const minDate = formatDateForAPI(previousPeriodRange.startDate);
         const maxDate = formatDateForAPI(periodRange.endDate);
-        const lancamentosPromise = supabase.from('lancamentos').select(`
-          id,
-          user_id,
-          created_at,
-          empresaId:empresa_id,
-          contaId:conta_id,
-          data,
-          descricao,
-          valor,
-          tipo
-        `).eq('empresa_id', empresaId).gte('data', minDate).lte('data', maxDate);
-        
-        const contasPromise = supabase.from('contas_contabeis').select(`
-          id,
-          user_id,
-          created_at,
-          empresaId:empresa_id,
-          codigo,
-          nome,
-          categoria,
-          subcategoria,
-          tipo,
-          ativa
-        `).eq('empresa_id', empresaId);
-        
-        const [lancamentosRes, contasRes] = await Promise.all([lancamentosPromise, contasPromise]);
+        const [lancamentos, contas] = await Promise.all([
+          QueryService.getLancamentos(empresaId, minDate, maxDate),
+          QueryService.getContasContabeis(empresaId)
+        ]);
 
-        if (lancamentosRes.error) throw lancamentosRes.error;
-        if (contasRes.error) throw contasRes.error;
-
-        const lancamentos = lancamentosRes.data as unknown as Lancamento[];
-        const contas = contasRes.data as unknown as ContaContabil[];
-
-        // Calcular DRE baseado no período filtrado
-        const dreAtual = DREService.calcularDRE(
-          lancamentos, 
-          contas, 
-          empresaId, 
-          formatDateForAPI(periodRange.startDate), 
-          formatDateForAPI(periodRange.endDate)
-        );
-        
-        const dreAnterior = DREService.calcularDRE(
-          lancamentos, 
-          contas, 
-          empresaId, 
-          formatDateForAPI(previousPeriodRange.startDate), 
-          formatDateForAPI(previousPeriodRange.endDate)
+        // DRE do período, do período anterior e histórico mensal pelo índice acumulado
+        const { periodos, mensal: historicoMensal } = await DREService.calcularDREMultiPeriodoEmSegundoPlano(
+          lancamentos,
+          contas,
+          empresaId,
+          [
+            { dataInicio: formatDateForAPI(periodRange.startDate), dataFim: formatDateForAPI(periodRange.endDate) },
+            { dataInicio: formatDateForAPI(previousPeriodRange.startDate), dataFim: formatDateForAPI(previousPeriodRange.endDate) }
+          ],
+          { dataInicio: formatDateForAPI(periodRange.startDate), dataFim: formatDateForAPI(periodRange.endDate) }
         );
+        if (cancelado) return;
+        const [dreAtual, dreAnterior] = periodos;
 
-        // Histórico mensal baseado no período filtrado
-        const historicoMensal: DREPeriodo[] = [];
-        
-        // Filtrar lançamentos dentro do período selecionado
-        const lancamentosFiltrados = lancamentos.filter(lancamento => {
-          if (lancamento.empresaId !== empresaId) return false;
-          const dataLancamento = new Date(lancamento.data);
-          return isDateInRange(dataLancamento, periodRange);
-        });
-        
-        // Identificar meses únicos com lançamentos no período filtrado
-        const mesesComLancamentos = new Set<string>();
-        lancamentosFiltrados.forEach(lancamento => {
-          const dataLancamento = new Date(lancamento.data);
-          const chaveAnoMes = `${dataLancamento.getFullYear()}-${dataLancamento.getMonth()}`;
-          mesesComLancamentos.add(chaveAnoMes);
-        });
-        
-        console.log(`Meses com lançamentos no período filtrado: ${Array.from(mesesComLancamentos).length}`);
-        
-        // Processar cada mês com lançamentos
-        Array.from(mesesComLancamentos).sort().forEach(chaveAnoMes => {
-          const [ano, mes] = chaveAnoMes.split('-').map(Number);
-          const inicioMes = new Date(ano, mes, 1);
-          const fimMes = new Date(ano, mes + 1, 0);
-          
-          const dreMes = DREService.calcularDRE(
-            lancamentos, 
-            contas, 
-            empresaId, 
-            format(inicioMes, 'yyyy-MM-dd'), 
-            format(fimMes, 'yyyy-MM-dd')
-          );
-          
-          console.log(`Mês ${mes + 1}/${ano}: Receita: ${dreMes.receitaLiquida}, Margem: ${dreMes.margemLiquida}%`);
-          historicoMensal.push(dreMes);
-        });
+        console.log(`Meses com lançamentos no período filtrado: ${historicoMensal.length}`);
 
         setData({ 
           dreAtual, 
@@ -188,14 +127,22 @@ export const Dashboard: React.FC = () => {
         });
 
       } catch (err: any) {
+        if (cancelado) return;
         setError(err.message);
         console.error("Erro ao carregar dados do dashboard:", err);
       } finally {
-        setLoading(false);
+        if (!cancelado) setLoading(false);
       }
     };
 
-    fetchData();
+    fetchData(empresaCarregadaRef.current === empresaId);
+    empresaCarregadaRef.current = empresaId;
+    // Dados revalidados ou alterados em outra tela: recalcula sem voltar ao spinner
+    const cancelarInscricao = subscribeQueries(['lancamentos', 'contas_contabeis'], empresaId, () => fetchData(true));
+    return () => {
+      cancelado = true;
+      cancelarInscricao();
+    };
   }, [companiesLoading, companies, selectedCompany, periodRange, previousPeriodRange]);
 
   // Se está carregando empresas, mostrar spinner
@@ -240,7 +187,7 @@ export const Dashboard: React.FC = () => {
     return (
       <div className="flex items-center justify-center min-h-screen">
         <div className="text-center">
-          <h2 className="text-xl font-semibold text-red-600 mb-2">Erro ao carregar dados</h2>
+          <h2 className="text-xl font-semibold text-red-600 mb-2" data-testid="dashboard-error">Erro ao carregar dados</h2>
           <p className="text-gray-600">{error}</p>
         </div>
       </div>
@@ -251,7 +198,7 @@ export const Dashboard: React.FC = () => {
     return (
       <div className="flex items-center justify-center min-h-screen">
         <div className="text-center">
-          <h2 className="text-xl font-semibold text-gray-600 mb-2">Nenhum dado encontrado</h2>
+          <h2 className="text-xl font-semibold text-gray-600 mb-2" data-testid="dashboard-empty">Nenhum dado encontrado</h2>
           <p className="text-gray-500">Não há dados disponíveis para exibir no dashboard.</p>
         </div>
       </div>
@@ -271,12 +218,12 @@ export const Dashboard: React.FC = () => {
   );
 
   return (
-    <div className="space-y-6">
+    <div className="space-y-6" data-testid="dashboard">
       {/* Filtro de Período */}
       <div className="bg-white rounded-lg shadow-sm p-4 border border-gray-200">
         <div className="flex items-center justify-between mb-4">
           <h3 className="text-lg font-semibold text-gray-800">Filtros de Período</h3>
-          <span className="text-sm text-gray-600">Período atual: {getPeriodLabel()}</span>
+          <span className="text-sm text-gray-600" data-testid="dashboard-period-label">Período atual: {getPeriodLabel()}</span>
         </div>
         <PeriodFilter
           selectedPeriod={selectedPeriod}
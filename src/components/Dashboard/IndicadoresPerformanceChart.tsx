@@ -1,6 +1,8 @@
 import React, { useState, useEffect } from 'react';
 import Highcharts from 'highcharts';
 import HighchartsReact from 'highcharts-react-official';
+import { agregarPorIntervalo } from '../../workers/agregacao';
+import { colunasDe, gruposPorConta, paraDia } from '../../lib/lancamentosColunares';
 
 interface CustoCategoria {
   name: string;
@@ -81,27 +83,34 @@ const IndicadoresPerformanceChart: React.FC<IndicadoresPerformanceChartProps> =
 
   const calcularIndicadoresReais = () => {
     try {
-      // Filtrar lançamentos por período
-      const lancamentosFiltrados = lancamentos?.filter(lancamento => {
-        const dataLancamento = new Date(lancamento.data);
-        const inicio = new Date(startDate!);
-        const fim = new Date(endDate!);
-        return dataLancamento >= inicio && dataLancamento <= fim;
-      }) || [];
+      // Calcular custos por categoria baseado nos lançamentos reais: débitos do
+      // período, somados nas colunas dos lançamentos com um grupo por categoria
+      const categorias: string[] = [];
+      const grupoPorCategoria = new Map<string, number>();
+      const grupoPorId = new Map<string, number>();
+      (contasContabeis || []).forEach(conta => {
+        const categoria = conta.categoria || 'Outros';
+        if (!grupoPorCategoria.has(categoria)) {
+          grupoPorCategoria.set(categoria, categorias.length);
+          categorias.push(categoria);
+        }
+        grupoPorId.set(conta.id, grupoPorCategoria.get(categoria)!);
+      });
+
+      const colunares = colunasDe(lancamentos || []);
+      const { debitos } = agregarPorIntervalo(colunares, {
+        empresa: -1,
+        grupoPorConta: gruposPorConta(colunares, contaId => grupoPorId.get(contaId) ?? -1),
+        totalGrupos: categorias.length,
+        intervalos: Int32Array.of(paraDia(startDate!), paraDia(endDate!))
+      });
 
-      // Calcular custos por categoria baseado nos lançamentos reais
       const custosPorCategoria = new Map<string, number>();
       let totalCustos = 0;
-
-      lancamentosFiltrados.forEach(lancamento => {
-        if (lancamento.tipo === 'Débito') {
-          const conta = contasContabeis?.find(c => c.id === lancamento.contaId);
-          if (conta) {
-            const categoria = conta.categoria || 'Outros';
-            custosPorCategoria.set(categoria, (custosPorCategoria.get(categoria) || 0) + lancamento.valor);
-            totalCustos += lancamento.valor;
-          }
-        }
+      categorias.forEach((categoria, grupo) => {
+        if (debitos[grupo] === 0) return;
+        custosPorCategoria.set(categoria, debitos[grupo]);
+        totalCustos += debitos[grupo];
       });
 
       // Converter para formato do gráfico
@@ -52,6 +52,7 @@ export const PeriodFilter: React.FC<PeriodFilterProps> = ({
         <div className="relative">
           <button
             onClick={() => setIsOpen(!isOpen)}
+            data-testid="period-filter-toggle"
             className="flex items-center justify-between w-full px-4 py-2 text-sm font-medium text-gray-700 bg-white border border-gray-300 rounded-lg hover:bg-gray-50 focus:outline-none focus:ring-2 focus:ring-blue-500 focus:border-blue-500"
           >
             <div className="flex items-center gap-2">
@@ -67,6 +68,7 @@ export const PeriodFilter: React.FC<PeriodFilterProps> = ({
                 <button
                   key={option.value}
                   onClick={() => handlePeriodSelect(option.value)}
+                  data-testid={`period-option-${option.value}`}
                   className={`w-full px-4 py-2 text-sm text-left hover:bg-gray-50 first:rounded-t-lg last:rounded-b-lg ${
                     selectedPeriod === option.value ? 'bg-blue-50 text-blue-700' : 'text-gray-700'
                   }`}
@@ -88,6 +90,7 @@ export const PeriodFilter: React.FC<PeriodFilterProps> = ({
               <input
                 type="date"
                 value={customStartDate || ''}
+                data-testid="period-custom-start"
                 onChange={(e) => handleCustomDateChange('start', e.target.value)}
                 className="w-full px-3 py-2 text-sm border border-gray-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-blue-500 focus:border-blue-500"
               />
@@ -99,6 +102,7 @@ export const PeriodFilter: React.FC<PeriodFilterProps> = ({
               <input
                 type="date"
                 value={customEndDate || ''}
+                data-testid="period-custom-end"
                 onChange={(e) => handleCustomDateChange('end', e.target.value)}
                 className="w-full px-3 py-2 text-sm border border-gray-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-blue-500 focus:border-blue-500"
               />
@@ -1,7 +1,9 @@
-import React, { useState, useEffect, useCallback } from 'react';
+import React, { useState, useEffect, useCallback, useMemo, useRef } from 'react';
 import { Plus, Filter, Edit2, Trash2, DollarSign, X, Calendar } from 'lucide-react';
 import { Lancamento, Empresa, ContaContabil } from '../../types';
 import { supabase } from '../../lib/supabaseClient';
+import { isRealtimeTable } from '../../lib/queryCache';
+import { subscribeRealtime } from '../../lib/realtimeSync';
 import { Modal } from '../ui/Modal';
 import { Spinner } from '../ui/Spinner';
 import { LancamentoForm } from './LancamentoForm';
@@ -9,6 +11,56 @@ import { LancamentoForm } from './LancamentoForm';
 import { ConfirmModal } from '../ui/ConfirmModal';
 import { AlertModal } from '../ui/AlertModal';
 import { useModal } from '../../hooks/useModal';
+import { useDebounce } from '../../hooks/useDebounce';
+import { useWindowedList } from '../../hooks/useWindowedList';
+import { useCompany } from '../../contexts/CompanyContext';
+
+const PAGE_SIZE = 100;
+// Alturas fixas das linhas para a renderização em janela
+const TABLE_ROW_HEIGHT = 57;
+const CARD_HEIGHT = 148;
+const LIST_HEIGHT = 640;
+
+interface LancamentoCursor {
+  data: string;
+  id: string;
+}
+
+interface LancamentosPage {
+  rows: Lancamento[];
+  next: LancamentoCursor | null;
+}
+
+const TIPOS_LANCAMENTO: Lancamento['tipo'][] = ['Débito', 'Crédito'];
+
+// Pesquisa nos mesmos campos da busca em memória: descrição, valor, conta, empresa e tipo.
+// Devolve null quando o termo casa com o nome da empresa, comum a todas as linhas da lista
+function condicaoPesquisa(termo: string, empresaNome: string, contas: ContaContabil[]): string | null {
+  const minusculo = termo.toLowerCase();
+  if (empresaNome.toLowerCase().includes(minusculo)) return null;
+  // valor_texto: coluna gerada com o valor sem zeros à direita, como o toString() do número
+  const alternativas = [`descricao.ilike.%${termo}%`, `valor_texto.ilike.%${termo}%`];
+  const contasEncontradas = contas.filter(c => c.nome.toLowerCase().includes(minusculo)).map(c => c.id);
+  if (contasEncontradas.length > 0) alternativas.push(`conta_id.in.(${contasEncontradas.join(',')})`);
+  const tipos = TIPOS_LANCAMENTO.filter(t => t.toLowerCase().includes(minusculo));
+  if (tipos.length > 0) alternativas.push(`tipo.in.(${tipos.join(',')})`);
+  return `or(${alternativas.join(',')})`;
+}
+
+function correspondeAPesquisa(
+  lancamento: Lancamento,
+  termo: string,
+  empresaNome: string,
+  contas: ContaContabil[]
+): boolean {
+  const minusculo = termo.toLowerCase();
+  const contaNome = contas.find(c => c.id === lancamento.contaId)?.nome || '';
+  return empresaNome.toLowerCase().includes(minusculo) ||
+    !!lancamento.descricao?.toLowerCase().includes(minusculo) ||
+    lancamento.valor.toString().includes(minusculo) ||
+    contaNome.toLowerCase().includes(minusculo) ||
+    lancamento.tipo.toLowerCase().includes(minusculo);
+}
 
 interface LancamentosListProps {
   title?: string;
@@ -23,10 +75,12 @@ export const LancamentosList: React.FC<LancamentosListProps> = ({
   tipoFiltro,
   fixedTipo
 }) => {
+  const { companies, selectedCompany } = useCompany();
   const [lancamentos, setLancamentos] = useState<Lancamento[]>([]);
-  const [empresas, setEmpresas] = useState<Empresa[]>([]);
   const [contas, setContas] = useState<ContaContabil[]>([]);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [hasMore, setHasMore] = useState(false);
   const [error, setError] = useState<string | null>(null);
   const [showModal, setShowModal] = useState(false);
   const [editingLancamento, setEditingLancamento] = useState<Lancamento | null>(null);
@@ -36,78 +90,53 @@ export const LancamentosList: React.FC<LancamentosListProps> = ({
   const [filtroDataInicio, setFiltroDataInicio] = useState('');
   const [filtroDataFim, setFiltroDataFim] = useState('');
   const [termoPesquisa, setTermoPesquisa] = useState('');
+  const termoDebounced = useDebounce(termoPesquisa.trim(), 300);
 
-  const fetchData = useCallback(async () => {
-    setLoading(true);
-    setError(null);
-    try {
-      // Corrigir a query para mapear corretamente os campos
-      const lancamentosPromise = supabase.from('lancamentos').select(`
-        id,
-        user_id,
-        created_at,
-        empresa_id,
-        conta_id,
-        data,
-        descricao,
-        valor,
-        tipo
-      `).order('data', { ascending: false });
-      
-      const empresasPromise = supabase.from('empresas').select(`
-        id,
-        razao_social
-      `);
-      
-      const contasPromise = supabase.from('contas_contabeis').select(`
-        id,
-        user_id,
-        created_at,
-        empresa_id,
-        codigo,
-        nome,
-        categoria,
-        subcategoria,
-        tipo,
-        ativa
-      `);
-      
-      const [lancamentosRes, empresasRes, contasRes] = await Promise.all([
-        lancamentosPromise, 
-        empresasPromise, 
-        contasPromise
-      ]);
-
-      if (lancamentosRes.error) throw lancamentosRes.error;
-      if (empresasRes.error) throw empresasRes.error;
-      if (contasRes.error) throw contasRes.error;
-
-      // Mapear os dados corretamente
-      const lancamentosData = (lancamentosRes.data || []).map(item => ({
-        id: item.id,
-        user_id: item.user_id,
-        created_at: item.created_at,
-        empresaId: item.empresa_id,
-        contaId: item.conta_id,
-        data: item.data,
-        descricao: item.descricao,
-        valor: item.valor,
-        tipo: item.tipo
-      }));
-
-      const empresasData = (empresasRes.data || []).map(item => ({
-        id: item.id,
-        razaoSocial: item.razao_social,
-        // Adicionar outros campos necessários com valores padrão
-        user_id: '',
-        created_at: '',
-        cnpj: '',
-        regimeTributario: 'Simples Nacional' as const,
-        dataAbertura: '',
-        ativa: true
-      }));
-
-      const contasData = (contasRes.data || []).map(item => ({
+  // A lista mostra sempre uma empresa: a do filtro ou a selecionada no app
+  const empresaId = filtroEmpresa || selectedCompany || companies[0]?.id || '';
+  const empresaNome = companies.find(c => c.id === empresaId)?.razaoSocial || '';
+
+  const empresas = useMemo<Empresa[]>(() => companies.map(company => ({
+    id: company.id,
+    razaoSocial: company.razaoSocial,
+    // Adicionar outros campos necessários com valores padrão
+    user_id: '',
+    created_at: '',
+    cnpj: '',
+    regimeTributario: 'Simples Nacional' as const,
+    dataAbertura: '',
+    ativa: true
+  })), [companies]);
+
+  // Cursor da última linha carregada e próxima página já buscada em segundo plano
+  const cursorRef = useRef<LancamentoCursor | null>(null);
+  const prefetchRef = useRef<Promise<LancamentosPage> | null>(null);
+  // Descarta respostas de uma consulta anterior à última troca de filtros
+  const geracaoRef = useRef(0);
+  const contasRef = useRef<ContaContabil[]>([]);
+  contasRef.current = contas;
+
+  useEffect(() => {
+    if (!empresaId) return;
+    let cancelado = false;
+    supabase.from('contas_contabeis').select(`
+      id,
+      user_id,
+      created_at,
+      empresa_id,
+      codigo,
+      nome,
+      categoria,
+      subcategoria,
+      tipo,
+      ativa
+    `).eq('empresa_id', empresaId).then(({ data, error: contasError }) => {
+      if (cancelado) return;
+      if (contasError) {
+        setError(contasError.message);
+        return;
+      }
+      setContas((data || []).map(item => ({
         id: item.id,
         user_id: item.user_id,
         created_at: item.created_at,
@@ -118,22 +147,181 @@ export const LancamentosList: React.FC<LancamentosListProps> = ({
         subcategoria: item.subcategoria,
         tipo: item.tipo,
         ativa: item.ativa
-      }));
+      })));
+    });
+    return () => { cancelado = true; };
+  }, [empresaId]);
+
+  const fetchPage = useCallback(async (cursor: LancamentoCursor | null): Promise<LancamentosPage> => {
+    let query = supabase.from('lancamentos').select(`
+      id,
+      user_id,
+      created_at,
+      empresa_id,
+      conta_id,
+      data,
+      descricao,
+      valor,
+      tipo
+    `)
+      .eq('empresa_id', empresaId)
+      .order('data', { ascending: false })
+      .order('id', { ascending: false })
+      .limit(PAGE_SIZE);
+
+    if (filtroDataInicio) query = query.gte('data', filtroDataInicio);
+    if (filtroDataFim) query = query.lte('data', filtroDataFim);
+    if (tipoFiltro) query = query.eq('tipo', tipoFiltro);
+
+    const condicoes: string[] = [];
+    const termo = termoDebounced.replace(/[,()*%]/g, ' ').trim();
+    const pesquisa = termo ? condicaoPesquisa(termo, empresaNome, contasRef.current) : null;
+    if (pesquisa) condicoes.push(pesquisa);
+    // Keyset em (data, id): só linhas depois da última carregada, sem OFFSET
+    if (cursor) {
+      condicoes.push(`or(data.lt.${cursor.data},and(data.eq.${cursor.data},id.lt.${cursor.id}))`);
+    }
+    if (condicoes.length > 0) query = query.or(`and(${condicoes.join(',')})`);
+
+    const { data, error: pageError } = await query;
+    if (pageError) throw pageError;
 
-      setLancamentos(lancamentosData);
-      setEmpresas(empresasData);
-      setContas(contasData);
+    const rows = (data || []).map(item => ({
+      id: item.id,
+      user_id: item.user_id,
+      created_at: item.created_at,
+      empresaId: item.empresa_id,
+      contaId: item.conta_id,
+      data: item.data,
+      descricao: item.descricao,
+      valor: item.valor,
+      tipo: item.tipo
+    })) as Lancamento[];
+    const ultimo = rows[rows.length - 1];
+    return {
+      rows,
+      next: rows.length === PAGE_SIZE && ultimo ? { data: ultimo.data, id: ultimo.id } : null
+    };
+  }, [empresaId, empresaNome, filtroDataInicio, filtroDataFim, tipoFiltro, termoDebounced]);
+
+  const prefetch = useCallback((next: LancamentoCursor | null) => {
+    cursorRef.current = next;
+    setHasMore(next !== null);
+    prefetchRef.current = next ? fetchPage(next) : null;
+    // Erros da pré-busca aparecem quando a página for de fato pedida
+    prefetchRef.current?.catch(() => undefined);
+  }, [fetchPage]);
+
+  const fetchData = useCallback(async () => {
+    if (!empresaId) {
+      setLoading(false);
+      return;
+    }
+    const geracao = ++geracaoRef.current;
+    setLoading(true);
+    setError(null);
+    prefetchRef.current = null;
+    try {
+      const page = await fetchPage(null);
+      if (geracao !== geracaoRef.current) return;
+      setLancamentos(page.rows);
+      prefetch(page.next);
     } catch (err: any) {
+      if (geracao !== geracaoRef.current) return;
       setError(err.message || 'Erro desconhecido ao carregar dados');
       console.error("Erro ao buscar dados:", err);
     } finally {
-      setLoading(false);
+      if (geracao === geracaoRef.current) setLoading(false);
     }
-  }, []);
+  }, [empresaId, fetchPage, prefetch]);
+
+  const loadMore = useCallback(async () => {
+    if (loadingMore || !prefetchRef.current) return;
+    const geracao = geracaoRef.current;
+    const pending = prefetchRef.current;
+    prefetchRef.current = null;
+    setLoadingMore(true);
+    try {
+      const page = await pending;
+      if (geracao !== geracaoRef.current) return;
+      setLancamentos(prev => [...prev, ...page.rows]);
+      prefetch(page.next);
+    } catch (err: any) {
+      if (geracao !== geracaoRef.current) return;
+      // Mantém o cursor para tentar de novo na próxima rolagem
+      prefetch(cursorRef.current);
+      console.error("Erro ao carregar mais lançamentos:", err);
+    } finally {
+      setLoadingMore(false);
+    }
+  }, [loadingMore, prefetch]);
 
   useEffect(() => {
     fetchData();
   }, [fetchData]);
+
+  // Mesmos filtros de fetchPage, aplicados a um lançamento recebido pelo Realtime
+  const correspondeAosFiltros = useCallback((lancamento: Lancamento) => {
+    if (lancamento.empresaId !== empresaId) return false;
+    if (tipoFiltro && lancamento.tipo !== tipoFiltro) return false;
+    if (filtroDataInicio && lancamento.data < filtroDataInicio) return false;
+    if (filtroDataFim && lancamento.data > filtroDataFim) return false;
+    const termo = termoDebounced.replace(/[,()*%]/g, ' ').trim();
+    return !termo || correspondeAPesquisa(lancamento, termo, empresaNome, contasRef.current);
+  }, [empresaId, empresaNome, tipoFiltro, filtroDataInicio, filtroDataFim, termoDebounced]);
+
+  // Mudanças feitas em outras abas ou por outros usuários da empresa. O keyset
+  // não se desloca com linhas incluídas ou retiradas: basta ajustar o que já foi carregado
+  useEffect(() => {
+    return subscribeRealtime('lancamentos', ({ id, novo }) => {
+      setLancamentos(prev => {
+        const semAntigo = prev.filter(l => l.id !== id);
+        const lancamento: Lancamento | null = novo ? {
+          id: novo.id,
+          user_id: novo.user_id,
+          created_at: novo.created_at,
+          empresaId: novo.empresa_id,
+          contaId: novo.conta_id,
+          data: novo.data,
+          descricao: novo.descricao,
+          valor: Number(novo.valor),
+          tipo: novo.tipo
+        } : null;
+        if (!lancamento || !correspondeAosFiltros(lancamento)) {
+          return semAntigo.length === prev.length ? prev : semAntigo;
+        }
+        // Depois do cursor, o lançamento chega com a próxima página
+        const cursor = cursorRef.current;
+        const vemDepois = (l: LancamentoCursor, c: LancamentoCursor) =>
+          l.data < c.data || (l.data === c.data && l.id < c.id);
+        if (cursor && vemDepois(lancamento, cursor)) return semAntigo;
+        const posicao = semAntigo.findIndex(l => vemDepois(l, lancamento));
+        return posicao === -1
+          ? [...semAntigo, lancamento]
+          : [...semAntigo.slice(0, posicao), lancamento, ...semAntigo.slice(posicao)];
+      });
+    });
+  }, [correspondeAosFiltros]);
+
+  const tabela = useWindowedList(lancamentos.length, TABLE_ROW_HEIGHT, LIST_HEIGHT, 10, loadMore);
+  const cards = useWindowedList(lancamentos.length, CARD_HEIGHT, LIST_HEIGHT, 4, loadMore);
+
+  // O spinner desmonta a área rolável: ela volta no topo, e as janelas também
+  const { reset: resetTabela } = tabela;
+  const { reset: resetCards } = cards;
+  useEffect(() => {
+    if (loading) {
+      resetTabela();
+      resetCards();
+    }
+  }, [loading, resetTabela, resetCards]);
+
+  // Primeira página menor que a área visível: não há rolagem para pedir a próxima
+  useEffect(() => {
+    if (!loading && hasMore && lancamentos.length * TABLE_ROW_HEIGHT < LIST_HEIGHT) {
+      loadMore();
+    }
+  }, [loading, hasMore, lancamentos.length, loadMore]);
   
   const handleEdit = (lancamento: Lancamento) => {
     setEditingLancamento(lancamento);
@@ -325,39 +513,15 @@ export const LancamentosList: React.FC<LancamentosListProps> = ({
 
   const handleSave = () => {
     setShowModal(false);
-    fetchData();
+    // Com o Realtime conectado, o próprio evento da gravação atualiza a lista
+    if (!isRealtimeTable('lancamentos')) fetchData();
   };
 
   const formatCurrency = (value: number) => new Intl.NumberFormat('pt-BR', { style: 'currency', currency: 'BRL' }).format(value);
-  const getContaNome = (contaId: string) => contas.find(c => c.id === contaId)?.nome || 'N/A';
+  const contasPorId = useMemo(() => new Map(contas.map(c => [c.id, c.nome])), [contas]);
+  const getContaNome = (contaId: string) => contasPorId.get(contaId) || 'N/A';
   const getEmpresaNome = (empresaId: string) => empresas.find(e => e.id === empresaId)?.razaoSocial || 'N/A';
-
-  const lancamentosFiltrados = lancamentos.filter(l => {
-    if (filtroEmpresa && l.empresaId !== filtroEmpresa) return false;
-    if (filtroDataInicio && l.data < filtroDataInicio) return false;
-    if (filtroDataFim && l.data > filtroDataFim) return false;
-    if (tipoFiltro && l.tipo !== tipoFiltro) return false;
-    
-    // Filtro de pesquisa por texto
-    if (termoPesquisa) {
-      const termo = termoPesquisa.toLowerCase();
-      const descricao = l.descricao?.toLowerCase() || '';
-      const valor = l.valor.toString();
-      const contaNome = getContaNome(l.contaId).toLowerCase();
-      const empresaNome = getEmpresaNome(l.empresaId).toLowerCase();
-      const tipo = l.tipo.toLowerCase();
-      
-      const matchesSearch = descricao.includes(termo) ||
-                           valor.includes(termo) ||
-                           contaNome.includes(termo) ||
-                           empresaNome.includes(termo) ||
-                           tipo.includes(termo);
-      
-      if (!matchesSearch) return false;
-    }
-    
-    return true;
-  });
+  const empresaAtual = empresas.filter(e => e.id === empresaId);
 
   if (loading) return <div className="flex justify-center items-center h-64"><Spinner size="lg" /></div>;
   if (error) return (
@@ -422,11 +586,10 @@ export const LancamentosList: React.FC<LancamentosListProps> = ({
           <div>
             <label className="block text-sm font-medium text-gray-700 mb-1">Empresa</label>
             <select 
-              value={filtroEmpresa} 
+              value={empresaId} 
               onChange={e => setFiltroEmpresa(e.target.value)} 
               className="w-full border border-gray-300 rounded-lg px-3 py-2 text-sm sm:text-base focus:outline-none focus:ring-2 focus:ring-blue-500"
             >
-              <option value="">Todas as empresas</option>
               {empresas.map(e => (
                 <option key={e.id} value={e.id}>{e.razaoSocial}</option>
               ))}
@@ -464,9 +627,14 @@ export const LancamentosList: React.FC<LancamentosListProps> = ({
       {/* Lista/Tabela Responsiva */}
       <div className="bg-white rounded-lg shadow-sm border border-gray-200">
         {/* Desktop: Tabela */}
-        <div className="hidden lg:block overflow-x-auto">
+        <div
+          className="hidden lg:block overflow-auto"
+          style={{ maxHeight: LIST_HEIGHT }}
+          onScroll={tabela.onScroll}
+          data-testid="lancamentos-scroll"
+        >
           <table className="w-full">
-            <thead className="bg-gray-50">
+            <thead className="bg-gray-50 sticky top-0 z-10">
               <tr>
                 <th className="p-3 text-left text-xs font-medium text-gray-500 uppercase">Data</th>
                 <th className="p-3 text-left text-xs font-medium text-gray-500 uppercase">Empresa</th>
@@ -477,8 +645,9 @@ export const LancamentosList: React.FC<LancamentosListProps> = ({
               </tr>
             </thead>
             <tbody className="bg-white divide-y divide-gray-200">
-              {lancamentosFiltrados.map(l => (
-                <tr key={l.id} className="hover:bg-gray-50">
+              {tabela.paddingTop > 0 && <tr style={{ height: tabela.paddingTop }} aria-hidden="true" />}
+              {lancamentos.slice(tabela.start, tabela.end).map(l => (
+                <tr key={l.id} className="hover:bg-gray-50" style={{ height: TABLE_ROW_HEIGHT }}>
                   <td className="p-3 whitespace-nowrap text-sm">{new Date(l.data + 'T00:00:00').toLocaleDateString('pt-BR')}</td>
                   <td className="p-3 whitespace-nowrap text-sm">{getEmpresaNome(l.empresaId)}</td>
                   <td className="p-3 whitespace-nowrap text-sm">{getContaNome(l.contaId)}</td>
@@ -506,14 +675,24 @@ export const LancamentosList: React.FC<LancamentosListProps> = ({
                   </td>
                 </tr>
               ))}
+              {tabela.paddingBottom > 0 && <tr style={{ height: tabela.paddingBottom }} aria-hidden="true" />}
             </tbody>
           </table>
         </div>
 
         {/* Mobile/Tablet: Cards */}
-        <div className="lg:hidden divide-y divide-gray-200">
-          {lancamentosFiltrados.map((lancamento) => (
-            <div key={lancamento.id} className="p-4 hover:bg-gray-50 transition-colors">
+        <div
+          className="lg:hidden overflow-y-auto"
+          style={{ maxHeight: LIST_HEIGHT }}
+          onScroll={cards.onScroll}
+        >
+          <div style={{ height: cards.paddingTop }} aria-hidden="true" />
+          {lancamentos.slice(cards.start, cards.end).map((lancamento) => (
+            <div
+              key={lancamento.id}
+              className="p-4 border-b border-gray-200 overflow-hidden hover:bg-gray-50 transition-colors"
+              style={{ height: CARD_HEIGHT }}
+            >
               <div className="flex items-start justify-between mb-3">
                 <div className="flex-1 min-w-0">
                   <div className="flex items-center space-x-2 mb-2">
@@ -529,7 +708,7 @@ export const LancamentosList: React.FC<LancamentosListProps> = ({
                       {lancamento.tipo}
                     </span>
                   </div>
-                  <h3 className="text-sm font-medium text-gray-900 break-words mb-1">{lancamento.descricao}</h3>
+                  <h3 className="text-sm font-medium text-gray-900 truncate mb-1">{lancamento.descricao}</h3>
                   <div className="space-y-1">
                     <p className="text-xs text-gray-500">
                       <span className="font-medium">Empresa:</span> {getEmpresaNome(lancamento.empresaId)}
@@ -565,10 +744,15 @@ export const LancamentosList: React.FC<LancamentosListProps> = ({
               </div>
             </div>
           ))}
+          <div style={{ height: cards.paddingBottom }} aria-hidden="true" />
         </div>
 
+        {loadingMore && (
+          <div className="flex justify-center py-3 border-t border-gray-200"><Spinner size="sm" /></div>
+        )}
+
         {/* Estado vazio */}
-        {lancamentosFiltrados.length === 0 && (
+        {lancamentos.length === 0 && (
           <div className="text-center py-8 sm:py-12">
             <DollarSign className="h-8 w-8 sm:h-12 sm:w-12 text-gray-400 mx-auto mb-3 sm:mb-4" />
             <h3 className="text-base sm:text-lg font-medium text-gray-900 mb-2">Nenhum lançamento encontrado</h3>
@@ -585,7 +769,7 @@ export const LancamentosList: React.FC<LancamentosListProps> = ({
       >
         <LancamentoForm
           lancamento={editingLancamento}
-          empresas={empresas}
+          empresas={empresaAtual}
           contas={contas}
           fixedTipo={fixedTipo}
           onSave={handleSave}
@@ -28,6 +28,7 @@ export const HeaderCompanySelector: React.FC<HeaderCompanySelectorProps> = ({ on
       <Building2 className="h-4 w-4 text-gray-600" />
       <div className="relative">
         <select
+          data-testid="header-company-select"
           value={selectedCompany || ""}
           onChange={(e) => handleCompanyChange(e.target.value)}
           className="appearance-none bg-white border border-gray-300 rounded-md px-3 py-1 pr-8 text-sm focus:ring-2 focus:ring-blue-500 focus:border-transparent cursor-pointer hover:bg-gray-50 transition-colors"
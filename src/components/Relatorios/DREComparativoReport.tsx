@@ -1,9 +1,9 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import { ArrowLeft, Download, Calendar, TrendingUp, TrendingDown, Minus } from 'lucide-react';
 import { ComposedChart, Bar, Line, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer } from 'recharts';
-import { supabase } from '../../lib/supabaseClient';
 import { DREService } from '../../services/dreService';
-import { Lancamento, ContaContabil, DREPeriodo } from '../../types';
+import { subscribeQueries } from '../../lib/queryCache';
+import { DREPeriodo } from '../../types';
 import { Spinner } from '../ui/Spinner';
 import { format, subMonths, startOfMonth, endOfMonth, startOfYear, endOfYear, subYears } from 'date-fns';
 
@@ -14,6 +14,16 @@ interface DREComparativoReportProps {
 
 type PeriodType = 'monthly' | 'quarterly' | 'yearly';
 
+// Monthly totals fetched once for every period type: 5 years covers the
+// 12 months, 8 quarters and 5 years of the charts
+const WINDOW_YEARS = 5;
+
+interface ComparisonPeriod {
+  start: Date;
+  end: Date;
+  label: string;
+}
+
 interface ComparisonData {
   periodo: string;
   receitaBruta: number;
@@ -32,93 +42,52 @@ export const DREComparativoReport: React.FC<DREComparativoReportProps> = ({ empr
   const [comparisonData, setComparisonData] = useState<ComparisonData[]>([]);
   const [currentDRE, setCurrentDRE] = useState<DREPeriodo | null>(null);
   const [previousDRE, setPreviousDRE] = useState<DREPeriodo | null>(null);
+  // Company already on screen: switching the period type skips the spinner
+  const loadedCompanyRef = useRef<string | null>(null);
 
   useEffect(() => {
-    fetchDREData();
+    fetchDREData(loadedCompanyRef.current === empresaId);
+    loadedCompanyRef.current = empresaId;
+    // DRE revalidated or lancamentos changed on another screen: recompute without the spinner
+    return subscribeQueries(['get_dre'], empresaId, () => fetchDREData(true));
   }, [empresaId, periodType]);
 
-  const fetchDREData = async () => {
-    setLoading(true);
+  const fetchDREData = async (recarregando = false) => {
+    if (!recarregando) setLoading(true);
     try {
-      const [lancamentosRes, contasRes] = await Promise.all([
-        supabase.from('lancamentos').select(`
-          id,
-          user_id,
-          created_at,
-          empresaId:empresa_id,
-          contaId:conta_id,
-          data,
-          descricao,
-          valor,
-          tipo
-        `).eq('empresa_id', empresaId),
-        supabase.from('contas_contabeis').select(`
-          id,
-          user_id,
-          created_at,
-          empresaId:empresa_id,
-          codigo,
-          nome,
-          categoria,
-          subcategoria,
-          tipo,
-          ativa
-        `).eq('empresa_id', empresaId)
-      ]);
-
-      if (lancamentosRes.error) throw lancamentosRes.error;
-      if (contasRes.error) throw contasRes.error;
-
-      const lancamentos = lancamentosRes.data as unknown as Lancamento[];
-      const contas = contasRes.data as unknown as ContaContabil[];
-
-      // Calculate current and previous period DRE
+      const periods = buildPeriods(periodType);
       const today = new Date();
-      let currentStart: Date, currentEnd: Date, previousStart: Date, previousEnd: Date;
-
-      if (periodType === 'monthly') {
-        currentStart = startOfMonth(today);
-        currentEnd = endOfMonth(today);
-        previousStart = startOfMonth(subMonths(today, 1));
-        previousEnd = endOfMonth(subMonths(today, 1));
-      } else if (periodType === 'yearly') {
-        currentStart = startOfYear(today);
-        currentEnd = endOfYear(today);
-        previousStart = startOfYear(subYears(today, 1));
-        previousEnd = endOfYear(subYears(today, 1));
-      } else { // quarterly
-        const currentQuarter = Math.floor(today.getMonth() / 3);
-        currentStart = new Date(today.getFullYear(), currentQuarter * 3, 1);
-        currentEnd = new Date(today.getFullYear(), (currentQuarter + 1) * 3, 0);
-        
-        const prevQuarterDate = subMonths(currentStart, 3);
-        const prevQuarter = Math.floor(prevQuarterDate.getMonth() / 3);
-        previousStart = new Date(prevQuarterDate.getFullYear(), prevQuarter * 3, 1);
-        previousEnd = new Date(prevQuarterDate.getFullYear(), (prevQuarter + 1) * 3, 0);
-      }
 
-      const current = DREService.calcularDRE(
-        lancamentos, 
-        contas, 
-        empresaId, 
-        format(currentStart, 'yyyy-MM-dd'), 
-        format(currentEnd, 'yyyy-MM-dd')
-      );
-
-      const previous = DREService.calcularDRE(
-        lancamentos, 
-        contas, 
-        empresaId, 
-        format(previousStart, 'yyyy-MM-dd'), 
-        format(previousEnd, 'yyyy-MM-dd')
+      // Every period is answered from the prefix-sum index over the window's
+      // monthly totals; the current and previous periods are the last two
+      const dres = await DREService.buscarDREPeriodos(
+        empresaId,
+        format(startOfYear(subYears(today, WINDOW_YEARS - 1)), 'yyyy-MM-dd'),
+        format(endOfYear(today), 'yyyy-MM-dd'),
+        periods.map(period => ({
+          dataInicio: format(period.start, 'yyyy-MM-dd'),
+          dataFim: format(period.end, 'yyyy-MM-dd')
+        }))
       );
 
-      setCurrentDRE(current);
-      setPreviousDRE(previous);
+      setCurrentDRE(dres[dres.length - 1]);
+      setPreviousDRE(dres[dres.length - 2]);
 
       // Generate comparison data for charts
-      const data = generateComparisonData(lancamentos, contas, periodType);
-      setComparisonData(data);
+      setComparisonData(periods.map((period, i) => {
+        const dre = dres[i];
+        return {
+          periodo: period.label,
+          receitaBruta: dre.receitaBruta,
+          receitaLiquida: dre.receitaLiquida,
+          lucroBruto: dre.lucroBruto,
+          resultadoOperacional: dre.resultadoOperacional,
+          lucroLiquido: dre.lucroLiquido,
+          margemBruta: dre.margemBruta,
+          margemOperacional: dre.margemOperacional,
+          margemLiquida: dre.margemLiquida
+        };
+      }));
 
     } catch (error) {
       console.error('Erro ao carregar dados DRE:', error);
@@ -127,58 +96,31 @@ export const DREComparativoReport: React.FC<DREComparativoReportProps> = ({ empr
     }
   };
 
-  const generateComparisonData = (
-    lancamentos: Lancamento[], 
-    contas: ContaContabil[], 
-    type: PeriodType
-  ): ComparisonData[] => {
-    const data: ComparisonData[] = [];
+  // Calendar periods of the chart, oldest first; the last one is the current period
+  const buildPeriods = (type: PeriodType): ComparisonPeriod[] => {
+    const periods: ComparisonPeriod[] = [];
     const today = new Date();
-    const periods = type === 'monthly' ? 12 : type === 'quarterly' ? 8 : 5;
-
-    for (let i = periods - 1; i >= 0; i--) {
-      let start: Date, end: Date, label: string;
+    const count = type === 'monthly' ? 12 : type === 'quarterly' ? 8 : 5;
 
+    for (let i = count - 1; i >= 0; i--) {
       if (type === 'monthly') {
         const date = subMonths(today, i);
-        start = startOfMonth(date);
-        end = endOfMonth(date);
-        label = format(date, 'MMM/yy');
+        periods.push({ start: startOfMonth(date), end: endOfMonth(date), label: format(date, 'MMM/yy') });
       } else if (type === 'quarterly') {
         const quarterStart = subMonths(today, i * 3);
         const quarter = Math.floor(quarterStart.getMonth() / 3);
-        start = new Date(quarterStart.getFullYear(), quarter * 3, 1);
-        end = new Date(quarterStart.getFullYear(), (quarter + 1) * 3, 0);
-        label = `Q${quarter + 1}/${quarterStart.getFullYear()}`;
+        periods.push({
+          start: new Date(quarterStart.getFullYear(), quarter * 3, 1),
+          end: new Date(quarterStart.getFullYear(), (quarter + 1) * 3, 0),
+          label: `Q${quarter + 1}/${quarterStart.getFullYear()}`
+        });
       } else {
         const year = subYears(today, i);
-        start = startOfYear(year);
-        end = endOfYear(year);
-        label = format(year, 'yyyy');
+        periods.push({ start: startOfYear(year), end: endOfYear(year), label: format(year, 'yyyy') });
       }
-
-      const dre = DREService.calcularDRE(
-        lancamentos,
-        contas,
-        empresaId,
-        format(start, 'yyyy-MM-dd'),
-        format(end, 'yyyy-MM-dd')
-      );
-
-      data.push({
-        periodo: label,
-        receitaBruta: dre.receitaBruta,
-        receitaLiquida: dre.receitaLiquida,
-        lucroBruto: dre.lucroBruto,
-        resultadoOperacional: dre.resultadoOperacional,
-        lucroLiquido: dre.lucroLiquido,
-        margemBruta: dre.margemBruta,
-        margemOperacional: dre.margemOperacional,
-        margemLiquida: dre.margemLiquida
-      });
     }
 
-    return data;
+    return periods;
   };
 
   const calculateVariation = (current: number, previous: number) => {
@@ -4,9 +4,10 @@ import {
   ComposedChart, Bar, Line, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer,
   PieChart as RechartsPieChart, Pie, Cell, RadialBarChart, RadialBar
 } from 'recharts';
-import { supabase } from '../../lib/supabaseClient';
+import { subscribeQueries } from '../../lib/queryCache';
+import { QueryService } from '../../services/queryService';
 import { DREService } from '../../services/dreService';
-import { Lancamento, ContaContabil, DREPeriodo } from '../../types';
+import { DREPeriodo } from '../../types';
 import { Spinner } from '../ui/Spinner';
 import { format, subMonths, startOfMonth, endOfMonth, startOfYear, endOfYear } from 'date-fns';
 
@@ -52,43 +53,18 @@ export const DashboardAnalyticReport: React.FC<DashboardAnalyticReportProps> = (
 
   useEffect(() => {
     fetchAnalyticsData();
+    // Dados revalidados ou alterados em outra tela: recalcula sem voltar ao spinner
+    return subscribeQueries(['lancamentos', 'contas_contabeis'], empresaId, () => fetchAnalyticsData(true));
   }, [empresaId]);
 
-  const fetchAnalyticsData = async () => {
-    setLoading(true);
+  const fetchAnalyticsData = async (recarregando = false) => {
+    if (!recarregando) setLoading(true);
     try {
-      const [lancamentosRes, contasRes] = await Promise.all([
-        supabase.from('lancamentos').select(`
-          id,
-          user_id,
-          created_at,
-          empresaId:empresa_id,
-          contaId:conta_id,
-          data,
-          descricao,
-          valor,
-          tipo
-        `).eq('empresa_id', empresaId),
-        supabase.from('contas_contabeis').select(`
-          id,
-          user_id,
-          created_at,
-          empresaId:empresa_id,
-          codigo,
-          nome,
-          categoria,
-          subcategoria,
-          tipo,
-          ativa
-        `).eq('empresa_id', empresaId)
+      const [lancamentos, contas] = await Promise.all([
+        QueryService.getLancamentos(empresaId),
+        QueryService.getContasContabeis(empresaId)
       ]);
 
-      if (lancamentosRes.error) throw lancamentosRes.error;
-      if (contasRes.error) throw contasRes.error;
-
-      const lancamentos = lancamentosRes.data as unknown as Lancamento[];
-      const contas = contasRes.data as unknown as ContaContabil[];
-
       // Calculate current year DRE
       const currentYear = new Date();
       const currentStart = startOfYear(currentYear);
@@ -103,21 +79,22 @@ export const DashboardAnalyticReport: React.FC<DashboardAnalyticReportProps> = (
       const hasData = lancamentos.some((l) => l.empresaId === empresaId && l.data >= currentStartStr && l.data <= currentEndStr);
       setHasLancamentos(hasData);
 
-      const current = DREService.calcularDRE(
-        lancamentos,
-        contas,
-        empresaId,
-        currentStartStr,
-        currentEndStr
-      );
-
-      const previous = DREService.calcularDRE(
+      // Ano atual, ano anterior e os 12 meses da tendência numa única agregação, no worker
+      const meses = Array.from({ length: 12 }, (_, i) => subMonths(new Date(), 11 - i));
+      const { periodos } = await DREService.calcularDREMultiPeriodoEmSegundoPlano(
         lancamentos,
         contas,
         empresaId,
-        format(previousStart, 'yyyy-MM-dd'),
-        format(previousEnd, 'yyyy-MM-dd')
+        [
+          { dataInicio: currentStartStr, dataFim: currentEndStr },
+          { dataInicio: format(previousStart, 'yyyy-MM-dd'), dataFim: format(previousEnd, 'yyyy-MM-dd') },
+          ...meses.map(date => ({
+            dataInicio: format(startOfMonth(date), 'yyyy-MM-dd'),
+            dataFim: format(endOfMonth(date), 'yyyy-MM-dd')
+          }))
+        ]
       );
+      const [current, previous, ...mensais] = periodos;
 
       setCurrentDRE(current);
       setPreviousDRE(previous);
@@ -129,7 +106,7 @@ export const DashboardAnalyticReport: React.FC<DashboardAnalyticReportProps> = (
         const benchmarks = generateBenchmarkData(current);
         setBenchmarkData(benchmarks);
 
-        const trends = generateTrendData(lancamentos, contas);
+        const trends = generateTrendData(meses, mensais);
         setTrendData(trends);
       } else {
         setKpiData([]);
@@ -274,21 +251,11 @@ export const DashboardAnalyticReport: React.FC<DashboardAnalyticReportProps> = (
     ];
   };
 
-  const generateTrendData = (lancamentos: Lancamento[], contas: ContaContabil[]): TrendData[] => {
+  const generateTrendData = (meses: Date[], mensais: DREPeriodo[]): TrendData[] => {
     const data: TrendData[] = [];
     
-    for (let i = 11; i >= 0; i--) {
-      const date = subMonths(new Date(), i);
-      const start = startOfMonth(date);
-      const end = endOfMonth(date);
-
-      const dre = DREService.calcularDRE(
-        lancamentos,
-        contas,
-        empresaId,
-        format(start, 'yyyy-MM-dd'),
-        format(end, 'yyyy-MM-dd')
-      );
+    mensais.forEach((dre, i) => {
+      const date = meses[i];
 
       // Simplified calculations for demonstration
       const ativo = dre.receitaLiquida * 2.5;
@@ -307,7 +274,7 @@ export const DashboardAnalyticReport: React.FC<DashboardAnalyticReportProps> = (
         margemEBITDA: dre.receitaLiquida > 0 ? (ebitda / dre.receitaLiquida) * 100 : 0,
         liquidezCorrente: passivoCirculante > 0 ? ativoCirculante / passivoCirculante : 0
       });
-    }
+    });
 
     return data;
   };
@@ -1,9 +1,12 @@
 import React, { useState, useEffect } from 'react';
 import { ArrowLeft, Download, TrendingUp, TrendingDown, AlertTriangle, DollarSign } from 'lucide-react';
 import { AreaChart, Area, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer, BarChart, Bar, PieChart, Pie, Cell } from 'recharts';
-import { supabase } from '../../lib/supabaseClient';
+import { subscribeQueries } from '../../lib/queryCache';
+import { QueryService } from '../../services/queryService';
 import { Lancamento, ContaContabil } from '../../types';
 import { Spinner } from '../ui/Spinner';
+import { colunasDe, gruposPorConta, paraDia, ULTIMO_DIA } from '../../lib/lancamentosColunares';
+import { agregarEmSegundoPlano } from '../../lib/agregacaoWorker';
 import { format, startOfMonth, endOfMonth, subMonths, addMonths } from 'date-fns';
 
 interface FluxoCaixaReportProps {
@@ -44,61 +47,30 @@ export const FluxoCaixaReport: React.FC<FluxoCaixaReportProps> = ({ empresaId, o
 
   useEffect(() => {
     fetchCashFlowData();
+    // Dados revalidados ou alterados em outra tela: recalcula sem voltar ao spinner
+    return subscribeQueries(['lancamentos', 'contas_contabeis'], empresaId, () => fetchCashFlowData(true));
   }, [empresaId]);
 
-  const fetchCashFlowData = async () => {
-    setLoading(true);
+  const fetchCashFlowData = async (recarregando = false) => {
+    if (!recarregando) setLoading(true);
     try {
-      const [lancamentosRes, contasRes] = await Promise.all([
-        supabase.from('lancamentos').select(`
-          id,
-          user_id,
-          created_at,
-          empresaId:empresa_id,
-          contaId:conta_id,
-          data,
-          descricao,
-          valor,
-          tipo
-        `).eq('empresa_id', empresaId),
-        supabase.from('contas_contabeis').select(`
-          id,
-          user_id,
-          created_at,
-          empresaId:empresa_id,
-          codigo,
-          nome,
-          categoria,
-          subcategoria,
-          tipo,
-          ativa
-        `).eq('empresa_id', empresaId)
+      const [lancamentos, contas] = await Promise.all([
+        QueryService.getLancamentos(empresaId),
+        QueryService.getContasContabeis(empresaId)
       ]);
 
-      if (lancamentosRes.error) throw lancamentosRes.error;
-      if (contasRes.error) throw contasRes.error;
-
-      const lancamentos = lancamentosRes.data as unknown as Lancamento[];
-      const contas = contasRes.data as unknown as ContaContabil[];
-
-      // Generate cash flow data for the last 12 months
-      const cashFlow = generateCashFlowData(lancamentos, contas);
+      // Fluxo dos últimos 12 meses e análise por categoria, somados no worker
+      const { cashFlow, categories } = await aggregateCashFlow(lancamentos, contas);
       setCashFlowData(cashFlow);
-
-      // Generate category analysis
-      const categories = generateCategoryAnalysis(lancamentos, contas);
       setCategoryData(categories);
 
       // Generate projections for next 6 months
       const projections = generateProjections(cashFlow);
       setProjectionData(projections);
 
-      // Calculate current vs previous month
-      const thisMonth = calculateMonthlyFlow(lancamentos, contas, new Date());
-      const lastMonth = calculateMonthlyFlow(lancamentos, contas, subMonths(new Date(), 1));
-      
-      setCurrentSaldo(thisMonth);
-      setPreviousSaldo(lastMonth);
+      // Mês atual e anterior são os dois últimos da série
+      setCurrentSaldo(cashFlow[cashFlow.length - 1].saldo);
+      setPreviousSaldo(cashFlow[cashFlow.length - 2].saldo);
 
     } catch (error) {
       console.error('Erro ao carregar dados de fluxo de caixa:', error);
@@ -107,102 +79,78 @@ export const FluxoCaixaReport: React.FC<FluxoCaixaReportProps> = ({ empresaId, o
     }
   };
 
-  const generateCashFlowData = (lancamentos: Lancamento[], contas: ContaContabil[]): CashFlowData[] => {
-    const data: CashFlowData[] = [];
-    let saldoAcumulado = 0;
-
-    for (let i = 11; i >= 0; i--) {
-      const date = subMonths(new Date(), i);
-      const start = startOfMonth(date);
-      const end = endOfMonth(date);
-
-      const monthlyLancamentos = lancamentos.filter(l => {
-        const lancDate = new Date(l.data);
-        return lancDate >= start && lancDate <= end;
-      });
-
-      let entradas = 0;
-      let saidas = 0;
-
-      monthlyLancamentos.forEach(lancamento => {
-        const conta = contas.find(c => c.id === lancamento.contaId);
-        if (!conta) return;
-
-        const isReceita = ['Receita Bruta', 'Receitas Financeiras'].includes(conta.categoria);
-        
-        if (isReceita) {
-          if (lancamento.tipo === 'Crédito') {
-            entradas += lancamento.valor;
-          } else {
-            saidas += lancamento.valor;
-          }
-        } else {
-          if (lancamento.tipo === 'Débito') {
-            saidas += lancamento.valor;
-          } else {
-            entradas += lancamento.valor;
-          }
-        }
-      });
-
-      const saldo = entradas - saidas;
-      saldoAcumulado += saldo;
-
-      data.push({
-        periodo: format(date, 'MMM/yy'),
-        entradas,
-        saidas,
-        saldo,
-        saldoAcumulado
-      });
-    }
-
-    return data;
-  };
-
-  const generateCategoryAnalysis = (lancamentos: Lancamento[], contas: ContaContabil[]): CategoryFlow[] => {
-    const categoryMap: Record<string, { entradas: number; saidas: number }> = {};
+  // Entradas são os créditos e saídas os débitos dos lançamentos com conta conhecida,
+  // agrupados pela categoria da conta: os 12 meses do fluxo e os últimos 3 meses da
+  // análise por categoria saem de uma única agregação
+  const aggregateCashFlow = async (
+    lancamentos: Lancamento[],
+    contas: ContaContabil[]
+  ): Promise<{ cashFlow: CashFlowData[]; categories: CategoryFlow[] }> => {
     const colors = [
       '#3b82f6', '#10b981', '#f59e0b', '#ef4444', '#8b5cf6', 
       '#06b6d4', '#84cc16', '#f97316', '#ec4899', '#6b7280'
     ];
 
-    // Filter last 3 months for category analysis
-    const threeMonthsAgo = subMonths(new Date(), 3);
-    const recentLancamentos = lancamentos.filter(l => new Date(l.data) >= threeMonthsAgo);
-
-    recentLancamentos.forEach(lancamento => {
-      const conta = contas.find(c => c.id === lancamento.contaId);
-      if (!conta) return;
-
-      if (!categoryMap[conta.categoria]) {
-        categoryMap[conta.categoria] = { entradas: 0, saidas: 0 };
+    const categorias: string[] = [];
+    const grupoPorCategoria = new Map<string, number>();
+    const grupoPorId = new Map<string, number>();
+    contas.forEach(conta => {
+      if (!grupoPorCategoria.has(conta.categoria)) {
+        grupoPorCategoria.set(conta.categoria, categorias.length);
+        categorias.push(conta.categoria);
       }
+      grupoPorId.set(conta.id, grupoPorCategoria.get(conta.categoria)!);
+    });
+    const colunares = colunasDe(lancamentos);
+
+    const hoje = new Date();
+    const meses = Array.from({ length: 12 }, (_, i) => subMonths(hoje, 11 - i));
+    const intervalos = new Int32Array(2 * (meses.length + 1));
+    meses.forEach((date, k) => {
+      intervalos[2 * k] = paraDia(format(startOfMonth(date), 'yyyy-MM-dd'));
+      intervalos[2 * k + 1] = paraDia(format(endOfMonth(date), 'yyyy-MM-dd'));
+    });
+    // Último intervalo: dos últimos 3 meses em diante
+    const recentes = meses.length;
+    intervalos[2 * recentes] = paraDia(format(subMonths(hoje, 3), 'yyyy-MM-dd'));
+    intervalos[2 * recentes + 1] = ULTIMO_DIA;
+
+    const totalGrupos = categorias.length;
+    const { creditos, debitos } = await agregarEmSegundoPlano(colunares, {
+      empresa: -1,
+      grupoPorConta: gruposPorConta(colunares, contaId => grupoPorId.get(contaId) ?? -1),
+      totalGrupos,
+      intervalos
+    });
+    const somarGrupos = (somas: Float64Array, k: number) => {
+      let soma = 0;
+      for (let grupo = 0; grupo < totalGrupos; grupo++) soma += somas[k * totalGrupos + grupo];
+      return soma;
+    };
 
-      const isReceita = ['Receita Bruta', 'Receitas Financeiras'].includes(conta.categoria);
-      
-      if (isReceita) {
-        if (lancamento.tipo === 'Crédito') {
-          categoryMap[conta.categoria].entradas += lancamento.valor;
-        } else {
-          categoryMap[conta.categoria].saidas += lancamento.valor;
-        }
-      } else {
-        if (lancamento.tipo === 'Débito') {
-          categoryMap[conta.categoria].saidas += lancamento.valor;
-        } else {
-          categoryMap[conta.categoria].entradas += lancamento.valor;
-        }
-      }
+    let saldoAcumulado = 0;
+    const cashFlow = meses.map((date, k) => {
+      const entradas = somarGrupos(creditos, k);
+      const saidas = somarGrupos(debitos, k);
+      const saldo = entradas - saidas;
+      saldoAcumulado += saldo;
+      return { periodo: format(date, 'MMM/yy'), entradas, saidas, saldo, saldoAcumulado };
     });
 
-    return Object.entries(categoryMap).map(([categoria, values], index) => ({
-      categoria,
-      entradas: values.entradas,
-      saidas: values.saidas,
-      saldo: values.entradas - values.saidas,
-      color: colors[index % colors.length]
-    }));
+    const categories = categorias
+      .map((categoria, grupo) => ({
+        categoria,
+        entradas: creditos[recentes * totalGrupos + grupo],
+        saidas: debitos[recentes * totalGrupos + grupo]
+      }))
+      .filter(({ entradas, saidas }) => entradas !== 0 || saidas !== 0)
+      .map((values, index) => ({
+        ...values,
+        saldo: values.entradas - values.saidas,
+        color: colors[index % colors.length]
+      }));
+
+    return { cashFlow, categories };
   };
 
   const generateProjections = (historicalData: CashFlowData[]): ProjectionData[] => {
@@ -228,42 +176,6 @@ export const FluxoCaixaReport: React.FC<FluxoCaixaReportProps> = ({ empresaId, o
     return projections;
   };
 
-  const calculateMonthlyFlow = (lancamentos: Lancamento[], contas: ContaContabil[], date: Date): number => {
-    const start = startOfMonth(date);
-    const end = endOfMonth(date);
-
-    const monthlyLancamentos = lancamentos.filter(l => {
-      const lancDate = new Date(l.data);
-      return lancDate >= start && lancDate <= end;
-    });
-
-    let entradas = 0;
-    let saidas = 0;
-
-    monthlyLancamentos.forEach(lancamento => {
-      const conta = contas.find(c => c.id === lancamento.contaId);
-      if (!conta) return;
-
-      const isReceita = ['Receita Bruta', 'Receitas Financeiras'].includes(conta.categoria);
-      
-      if (isReceita) {
-        if (lancamento.tipo === 'Crédito') {
-          entradas += lancamento.valor;
-        } else {
-          saidas += lancamento.valor;
-        }
-      } else {
-        if (lancamento.tipo === 'Débito') {
-          saidas += lancamento.valor;
-        } else {
-          entradas += lancamento.valor;
-        }
-      }
-    });
-
-    return entradas - saidas;
-  };
-
   const formatCurrency = (value: number) => {
     return new Intl.NumberFormat('pt-BR', {
       style: 'currency',
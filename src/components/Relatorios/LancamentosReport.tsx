@@ -1,6 +1,7 @@
 import React, { useState, useEffect, useMemo } from 'react';
 import { ArrowLeft, Download, Filter, Search, Calendar, FileText, Eye } from 'lucide-react';
-import { supabase } from '../../lib/supabaseClient';
+import { subscribeQueries } from '../../lib/queryCache';
+import { QueryService } from '../../services/queryService';
 import { Lancamento, ContaContabil, ContaCategoria } from '../../types';
 import { Spinner } from '../ui/Spinner';
 import { format, startOfMonth, endOfMonth, startOfYear, endOfYear } from 'date-fns';
@@ -56,6 +57,8 @@ export const LancamentosReport: React.FC<LancamentosReportProps> = ({ empresaId,
 
   useEffect(() => {
     fetchData();
+    // Dados revalidados ou alterados em outra tela: recarrega sem voltar ao spinner
+    return subscribeQueries(['lancamentos', 'contas_contabeis'], empresaId, () => fetchData(true));
   }, [empresaId]);
 
   useEffect(() => {
@@ -79,49 +82,14 @@ export const LancamentosReport: React.FC<LancamentosReportProps> = ({ empresaId,
     }
   }, [filters.conta, contasFiltradasPorCategoria]);
 
-  const fetchData = async () => {
-    setLoading(true);
+  const fetchData = async (recarregando = false) => {
+    if (!recarregando) setLoading(true);
     try {
-      const [lancamentosRes, contasRes] = await Promise.all([
-        supabase
-          .from('lancamentos')
-          .select(`
-            id,
-            user_id,
-            created_at,
-            empresaId:empresa_id,
-            contaId:conta_id,
-            data,
-            descricao,
-            valor,
-            tipo
-          `)
-          .eq('empresa_id', empresaId)
-          .order('data', { ascending: false }),
-        supabase
-          .from('contas_contabeis')
-          .select(`
-            id,
-            user_id,
-            created_at,
-            empresaId:empresa_id,
-            codigo,
-            nome,
-            categoria,
-            subcategoria,
-            tipo,
-            ativa
-          `)
-          .eq('empresa_id', empresaId)
-          .order('codigo')
+      const [lancamentosData, contasData] = await Promise.all([
+        QueryService.getLancamentos(empresaId),
+        QueryService.getContasContabeis(empresaId)
       ]);
 
-      if (lancamentosRes.error) throw lancamentosRes.error;
-      if (contasRes.error) throw contasRes.error;
-
-      const contasData = contasRes.data as unknown as ContaContabil[];
-      const lancamentosData = lancamentosRes.data as unknown as Lancamento[];
-
       // Join lancamentos with contas
       const lancamentosDetalhados: LancamentoDetalhado[] = lancamentosData
         .map(lancamento => {
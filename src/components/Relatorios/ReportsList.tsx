@@ -5,7 +5,7 @@ import { FluxoCaixaReport } from './FluxoCaixaReport.tsx';
 import { LancamentosReport } from './LancamentosReport.tsx';
 import { DashboardAnalyticReport } from './DashboardAnalyticReport.tsx';
 import { RevenueAnalysisReport } from './RevenueAnalysisReport.tsx';
-import { supabase } from '../../lib/supabaseClient';
+import { QueryService } from '../../services/queryService';
 import { Empresa } from '../../types';
 import { Spinner } from '../ui/Spinner';
 
@@ -108,30 +108,8 @@ export const ReportsList: React.FC = () => {
   const fetchEmpresas = async () => {
     setLoading(true);
     try {
-      const { data, error } = await supabase
-        .from('empresas')
-        .select(`
-          id,
-          user_id,
-          created_at,
-          razaoSocial:razao_social,
-          cnpj,
-          regimeTributario:regime_tributario,
-          dataAbertura:data_abertura,
-          email,
-          telefone,
-          endereco,
-          ativa
-        `)
-        .eq('ativa', true)
-        .order('razao_social');
-      
-      if (error) {
-        console.error('Erro na consulta:', error);
-        throw error;
-      }
-      
-      setEmpresas(data as Empresa[]);
+      const data = await QueryService.getEmpresas(true);
+      setEmpresas(data);
       
       // Auto-select first company if available
       if (data && data.length > 0) {
@@ -197,7 +175,7 @@ export const ReportsList: React.FC = () => {
   }
 
   return (
-    <div className="space-y-6">
+    <div className="space-y-6" data-testid="reports-list">
       {/* Header with filters */}
       <div className="bg-white rounded-lg shadow-sm border border-gray-200 p-4 sm:p-6">
         <div className="flex flex-col sm:flex-row sm:items-center sm:justify-between mb-4 sm:mb-6 space-y-3 sm:space-y-0">
@@ -227,6 +205,7 @@ export const ReportsList: React.FC = () => {
             <select
               value={selectedEmpresa}
               onChange={(e) => setSelectedEmpresa(e.target.value)}
+              data-testid="reports-company-select"
               className="w-full px-2 py-2 sm:px-3 text-sm border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-blue-500"
             >
               <option value="">Selecione uma empresa</option>
@@ -255,6 +234,7 @@ export const ReportsList: React.FC = () => {
               <input
                 type="text"
                 placeholder="Digite para buscar..."
+                data-testid="reports-search"
                 value={searchTerm}
                 onChange={(e) => setSearchTerm(e.target.value)}
                 className="w-full pl-8 sm:pl-10 pr-3 sm:pr-4 py-2 text-sm border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-blue-500"
@@ -297,6 +277,7 @@ export const ReportsList: React.FC = () => {
               key={report.id}
               className="bg-white rounded-lg shadow-sm border border-gray-200 hover:shadow-md transition-shadow cursor-pointer"
               onClick={() => handleReportSelect(report.id)}
+              data-testid={`report-card-${report.id}`}
             >
               <div className="p-4 sm:p-6">
                 <div className="flex items-center space-x-2 sm:space-x-3 mb-3 sm:mb-4">
@@ -329,6 +310,7 @@ export const ReportsList: React.FC = () => {
                   <button
                     onClick={() => handleReportSelect(report.id)}
                     disabled={!selectedEmpresa}
+                    data-testid={`report-generate-${report.id}`}
                     className={`w-full flex items-center justify-center space-x-1 sm:space-x-2 px-3 py-2 sm:px-4 rounded-lg transition-colors text-xs sm:text-sm font-medium ${
                       selectedEmpresa
                         ? `${report.color} text-white hover:opacity-90`
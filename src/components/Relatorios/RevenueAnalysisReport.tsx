@@ -4,10 +4,13 @@ import {
   LineChart, Line, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer,
   BarChart, Bar, PieChart, Pie, Cell
 } from 'recharts';
-import { supabase } from '../../lib/supabaseClient';
+import { subscribeQueries } from '../../lib/queryCache';
+import { QueryService } from '../../services/queryService';
 import { DREService } from '../../services/dreService';
 import { Lancamento, ContaContabil } from '../../types';
 import { Spinner } from '../ui/Spinner';
+import { colunasDe, gruposPorConta, paraDia, ULTIMO_DIA } from '../../lib/lancamentosColunares';
+import { agregarEmSegundoPlano } from '../../lib/agregacaoWorker';
 import { format, subMonths, startOfMonth, endOfMonth } from 'date-fns';
 import { isReceitaDreCategoria, mapContaCategoriaToDreCategoria } from '../../utils/dreCategoria';
 
@@ -42,49 +45,24 @@ export const RevenueAnalysisReport: React.FC<RevenueAnalysisReportProps> = ({ em
 
   useEffect(() => {
     fetchRevenueData();
+    // Dados revalidados ou alterados em outra tela: recalcula sem voltar ao spinner
+    return subscribeQueries(['lancamentos', 'contas_contabeis'], empresaId, () => fetchRevenueData(true));
   }, [empresaId]);
 
-  const fetchRevenueData = async () => {
-    setLoading(true);
+  const fetchRevenueData = async (recarregando = false) => {
+    if (!recarregando) setLoading(true);
     try {
-      const [lancamentosRes, contasRes] = await Promise.all([
-        supabase.from('lancamentos').select(`
-          id,
-          user_id,
-          created_at,
-          empresaId:empresa_id,
-          contaId:conta_id,
-          data,
-          descricao,
-          valor,
-          tipo
-        `).eq('empresa_id', empresaId),
-        supabase.from('contas_contabeis').select(`
-          id,
-          user_id,
-          created_at,
-          empresaId:empresa_id,
-          codigo,
-          nome,
-          categoria,
-          subcategoria,
-          tipo,
-          ativa
-        `).eq('empresa_id', empresaId)
+      const [lancamentos, contas] = await Promise.all([
+        QueryService.getLancamentos(empresaId),
+        QueryService.getContasContabeis(empresaId)
       ]);
 
-      if (lancamentosRes.error) throw lancamentosRes.error;
-      if (contasRes.error) throw contasRes.error;
-
-      const lancamentos = lancamentosRes.data as unknown as Lancamento[];
-      const contas = contasRes.data as unknown as ContaContabil[];
-
       // Generate revenue evolution data
-      const revenueEvolution = generateRevenueEvolution(lancamentos, contas);
+      const revenueEvolution = await generateRevenueEvolution(lancamentos, contas);
       setRevenueData(revenueEvolution);
 
       // Generate revenue sources analysis
-      const revenueSources = generateRevenueSourcesAnalysis(lancamentos, contas);
+      const revenueSources = await generateRevenueSourcesAnalysis(lancamentos, contas);
       setRevenueSourceData(revenueSources);
 
       // Calculate growth metrics
@@ -98,22 +76,21 @@ export const RevenueAnalysisReport: React.FC<RevenueAnalysisReportProps> = ({ em
     }
   };
 
-  const generateRevenueEvolution = (lancamentos: Lancamento[], contas: ContaContabil[]): RevenueData[] => {
-    const data: RevenueData[] = [];
-
-    for (let i = 11; i >= 0; i--) {
-      const date = subMonths(new Date(), i);
-      const start = startOfMonth(date);
-      const end = endOfMonth(date);
-
-      const dre = DREService.calcularDRE(
-        lancamentos,
-        contas,
-        empresaId,
-        format(start, 'yyyy-MM-dd'),
-        format(end, 'yyyy-MM-dd')
-      );
+  const generateRevenueEvolution = async (lancamentos: Lancamento[], contas: ContaContabil[]): Promise<RevenueData[]> => {
+    const meses = Array.from({ length: 12 }, (_, i) => subMonths(new Date(), 11 - i));
+    // Os 12 DREs mensais numa única agregação, no worker
+    const { periodos } = await DREService.calcularDREMultiPeriodoEmSegundoPlano(
+      lancamentos,
+      contas,
+      empresaId,
+      meses.map(date => ({
+        dataInicio: format(startOfMonth(date), 'yyyy-MM-dd'),
+        dataFim: format(endOfMonth(date), 'yyyy-MM-dd')
+      }))
+    );
 
+    const data: RevenueData[] = [];
+    periodos.forEach((dre, i) => {
       let crescimento = 0;
       if (data.length > 0) {
         const previousRevenue = data[data.length - 1].receitaLiquida;
@@ -123,32 +100,37 @@ export const RevenueAnalysisReport: React.FC<RevenueAnalysisReportProps> = ({ em
       }
 
       data.push({
-        periodo: format(date, 'MMM/yy'),
+        periodo: format(meses[i], 'MMM/yy'),
         receitaBruta: dre.receitaBruta,
         receitaLiquida: dre.receitaLiquida,
         crescimento
       });
-    }
+    });
 
     return data;
   };
 
-  const generateRevenueSourcesAnalysis = (lancamentos: Lancamento[], contas: ContaContabil[]): RevenueSourceData[] => {
+  const generateRevenueSourcesAnalysis = async (lancamentos: Lancamento[], contas: ContaContabil[]): Promise<RevenueSourceData[]> => {
     const sourceMap: Record<string, number> = {};
     const colors = ['#3b82f6', '#10b981', '#f59e0b', '#ef4444', '#8b5cf6'];
 
-    const last3Months = subMonths(new Date(), 3);
-    const recentLancamentos = lancamentos.filter(l => new Date(l.data) >= last3Months);
-
     const revenueAccounts = contas.filter(c => {
       const categoriaDre = mapContaCategoriaToDreCategoria(c.categoria);
       return categoriaDre ? isReceitaDreCategoria(categoriaDre) : false;
     });
 
-    revenueAccounts.forEach(conta => {
-      const revenue = recentLancamentos
-        .filter(l => l.contaId === conta.id && l.tipo === 'Crédito')
-        .reduce((sum, l) => sum + l.valor, 0);
+    // Créditos de cada conta de receita nos últimos 3 meses, um grupo por conta
+    const grupoPorId = new Map(revenueAccounts.map((conta, grupo) => [conta.id, grupo]));
+    const colunares = colunasDe(lancamentos);
+    const { creditos } = await agregarEmSegundoPlano(colunares, {
+      empresa: -1,
+      grupoPorConta: gruposPorConta(colunares, contaId => grupoPorId.get(contaId) ?? -1),
+      totalGrupos: revenueAccounts.length,
+      intervalos: Int32Array.of(paraDia(format(subMonths(new Date(), 3), 'yyyy-MM-dd')), ULTIMO_DIA)
+    });
+
+    revenueAccounts.forEach((conta, grupo) => {
+      const revenue = creditos[grupo];
 
       if (revenue > 0) {
         sourceMap[conta.nome] = revenue;
@@ -7,7 +7,7 @@ export const Spinner = ({ size = 'md' }: { size?: 'sm' | 'md' | 'lg' }) => {
     md: 'h-8 w-8',
     lg: 'h-12 w-12',
   };
-  return <Loader2 className={`${sizeClasses[size]} animate-spin text-blue-600`} />;
+  return <Loader2 className={`${sizeClasses[size]} animate-spin text-blue-600`} data-testid="spinner" />;
 };
 
 export const FullPageSpinner = () => (
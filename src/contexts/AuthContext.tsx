@@ -1,5 +1,6 @@
 import React, { createContext, useState, useEffect, useContext, ReactNode } from 'react';
 import { supabase } from '../lib/supabaseClient';
+import { startRealtimeSync, stopRealtimeSync } from '../lib/realtimeSync';
 import { Session, User, AuthError, AuthChangeEvent } from '@supabase/supabase-js';
 import SplashScreen from '../components/ui/SplashScreen';
 
@@ -254,6 +255,13 @@ export const AuthProvider: React.FC<{ children: ReactNode }> = ({ children }) =>
     return () => subscription.unsubscribe();
   }, []);
 
+  // Canal de mudanças em tempo real enquanto há um usuário logado
+  useEffect(() => {
+    if (!user?.id) return;
+    startRealtimeSync();
+    return () => stopRealtimeSync();
+  }, [user?.id]);
+
   const signInWithEmail = async (credentials: SignInCredentials): Promise<boolean> => {
     try {
       setLoading(true);
@@ -0,0 +1,54 @@
+import { useState, useCallback, UIEvent } from 'react';
+
+export interface WindowedList {
+  onScroll: (event: UIEvent<HTMLElement>) => void;
+  start: number;
+  end: number;
+  paddingTop: number;
+  paddingBottom: number;
+  // Volta a janela ao topo, para quando a área rolável é remontada (lista recarregada)
+  reset: () => void;
+}
+
+/**
+ * Hook para renderizar apenas as linhas visíveis de uma lista longa
+ * @param count Quantidade total de itens
+ * @param rowHeight Altura fixa de cada linha em pixels
+ * @param viewportHeight Altura da área rolável em pixels
+ * @param overscan Linhas extras renderizadas acima e abaixo da área visível
+ * @param onNearEnd Chamado quando a rolagem chega a `overscan` linhas do fim
+ * @returns Faixa [start, end) a renderizar e os espaçadores antes e depois dela
+ */
+export function useWindowedList(
+  count: number,
+  rowHeight: number,
+  viewportHeight: number,
+  overscan = 10,
+  onNearEnd?: () => void
+): WindowedList {
+  const [scrollTop, setScrollTop] = useState(0);
+
+  const onScroll = useCallback((event: UIEvent<HTMLElement>) => {
+    const target = event.currentTarget;
+    setScrollTop(target.scrollTop);
+    if (onNearEnd && target.scrollTop + target.clientHeight >= target.scrollHeight - overscan * rowHeight) {
+      onNearEnd();
+    }
+  }, [onNearEnd, overscan, rowHeight]);
+
+  const reset = useCallback(() => setScrollTop(0), []);
+
+  // A lista pode ter encolhido (filtro novo) antes do próximo evento de scroll
+  const top = Math.min(scrollTop, Math.max(0, count * rowHeight - viewportHeight));
+  const start = Math.max(0, Math.floor(top / rowHeight) - overscan);
+  const end = Math.min(count, Math.ceil((top + viewportHeight) / rowHeight) + overscan);
+
+  return {
+    onScroll,
+    start,
+    end,
+    paddingTop: start * rowHeight,
+    paddingBottom: (count - end) * rowHeight,
+    reset
+  };
+}
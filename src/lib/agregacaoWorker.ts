@@ -0,0 +1,145 @@
+// Cliente do Web Worker de agregação: uma instância para o app, com pedidos
+// identificados por id. Sem suporte a Worker (ou se ele falhar ao carregar),
+// a mesma agregação roda na thread principal.
+//
+// O worker guarda as colunas de cada lista de lançamentos: elas vão no primeiro
+// pedido (compartilhadas quando em SharedArrayBuffer, senão uma cópia transferida)
+// e os pedidos seguintes levam só os grupos e os intervalos.
+
+import {
+  agregarPorIntervalo,
+  construirIndice,
+  ConsultaAgregacao,
+  GruposAgregacao,
+  IndiceAcumulado,
+  LiberacaoColunas,
+  PedidoAgregacao,
+  RespostaAgregacao,
+  ResultadoAgregacao
+} from '../workers/agregacao';
+import { colunasCompartilhadas, ColunasLancamentos } from './lancamentosColunares';
+
+interface Pendente {
+  resolve: (resultado: any) => void;
+  reject: (error: Error) => void;
+}
+
+let worker: Worker | null | undefined;
+let proximoId = 0;
+const pendentes = new Map<number, Pendente>();
+
+const obterWorker = (): Worker | null => {
+  if (worker !== undefined) return worker;
+  if (typeof Worker === 'undefined') {
+    worker = null;
+    return worker;
+  }
+  try {
+    const novo = new Worker(new URL('../workers/agregacao.worker.ts', import.meta.url), { type: 'module' });
+    novo.onmessage = (event: MessageEvent<RespostaAgregacao>) => {
+      const resposta = event.data;
+      const pendente = pendentes.get(resposta.id);
+      if (!pendente) return;
+      pendentes.delete(resposta.id);
+      if (resposta.ok) {
+        pendente.resolve(resposta.resultado);
+      } else {
+        pendente.reject(new Error(resposta.erro));
+      }
+    };
+    novo.onerror = event => {
+      // Worker que não carrega não volta: os próximos pedidos rodam aqui mesmo
+      console.error('Erro no worker de agregação:', event.message);
+      pendentes.forEach(pendente => pendente.reject(new Error(event.message || 'Falha no worker de agregação')));
+      pendentes.clear();
+      novo.terminate();
+      worker = null;
+    };
+    worker = novo;
+  } catch (error) {
+    console.error('Worker de agregação indisponível:', error);
+    worker = null;
+  }
+  return worker;
+};
+
+// Id com que o worker guarda cada versão das colunas já enviada
+const idsColunas = new WeakMap<ColunasLancamentos, number>();
+let proximoIdColunas = 0;
+// Lista substituída e liberada pelo GC aqui: o worker descarta a sua versão
+const colunasLiberadas = typeof FinalizationRegistry === 'undefined' ? null : new FinalizationRegistry<number>(
+  colunasId => worker?.postMessage({ tipo: 'liberar', colunasId } satisfies LiberacaoColunas)
+);
+
+interface ColunasDoPedido {
+  colunasId: number;
+  colunas?: ColunasLancamentos;
+  transfer: Transferable[];
+}
+
+// Só as cinco colunas vão para o worker, sem os ids internados
+const colunasDoPedido = (colunas: ColunasLancamentos): ColunasDoPedido => {
+  const existente = idsColunas.get(colunas);
+  if (existente !== undefined) return { colunasId: existente, transfer: [] };
+
+  const colunasId = ++proximoIdColunas;
+  idsColunas.set(colunas, colunasId);
+  colunasLiberadas?.register(colunas, colunasId);
+  const { dias, valores, credito, contas, empresas } = colunas;
+  if (colunasCompartilhadas) {
+    return { colunasId, colunas: { dias, valores, credito, contas, empresas }, transfer: [] };
+  }
+  // As colunas seguem servindo as agregações daqui: o worker fica com uma cópia
+  const copia = {
+    dias: dias.slice(),
+    valores: valores.slice(),
+    credito: credito.slice(),
+    contas: contas.slice(),
+    empresas: empresas.slice()
+  };
+  return {
+    colunasId,
+    colunas: copia,
+    transfer: [copia.dias.buffer, copia.valores.buffer, copia.credito.buffer, copia.contas.buffer, copia.empresas.buffer]
+  };
+};
+
+const enviar = <T>(atual: Worker, pedido: PedidoAgregacao, transfer: Transferable[]): Promise<T> =>
+  new Promise((resolve, reject) => {
+    pendentes.set(pedido.id, { resolve, reject });
+    atual.postMessage(pedido, transfer);
+  });
+
+/**
+ * Soma créditos e débitos por grupo em cada intervalo, fora da thread principal
+ * @param colunas Enviadas ao worker só na primeira chamada com elas; continuam valendo aqui
+ * @param consulta Transferida para o worker: seus arrays ficam vazios depois da chamada
+ */
+export function agregarEmSegundoPlano(
+  colunas: ColunasLancamentos,
+  consulta: ConsultaAgregacao
+): Promise<ResultadoAgregacao> {
+  const atual = obterWorker();
+  if (!atual) return Promise.resolve(agregarPorIntervalo(colunas, consulta));
+
+  const { transfer, ...envio } = colunasDoPedido(colunas);
+  const pedido: PedidoAgregacao = { ...consulta, ...envio, tipo: 'intervalos', id: ++proximoId };
+  return enviar(atual, pedido, [...transfer, consulta.grupoPorConta.buffer, consulta.intervalos.buffer]);
+}
+
+/**
+ * Monta o índice acumulado (construirIndice) fora da thread principal
+ * @param colunas Enviadas ao worker só na primeira chamada com elas; os grupos vão copiados
+ */
+export function indexarEmSegundoPlano(
+  colunas: ColunasLancamentos,
+  grupos: GruposAgregacao
+): Promise<IndiceAcumulado | null> {
+  const atual = obterWorker();
+  if (!atual) return Promise.resolve(construirIndice(colunas, grupos));
+
+  const grupoPorConta = grupos.grupoPorConta.slice();
+  const { transfer, ...envio } = colunasDoPedido(colunas);
+  const pedido: PedidoAgregacao = { ...grupos, ...envio, grupoPorConta, tipo: 'indice', id: ++proximoId };
+  return enviar(atual, pedido, [...transfer, grupoPorConta.buffer]);
+}
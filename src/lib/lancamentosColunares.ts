@@ -0,0 +1,109 @@
+// Lançamentos em colunas de typed arrays, montadas uma vez por lista buscada e
+// compartilhadas pelas agregações (DREService, relatórios, worker de agregação).
+// Com isolamento cross-origin, as colunas ficam em SharedArrayBuffer e o worker
+// lê a mesma memória.
+//
+// No lugar de um objeto com data, tipo e ids em string, cada linha ocupa um
+// Int32 (dia), um Float64 (valor), um Uint8 (crédito) e dois Uint32 (posições
+// da conta e da empresa nas listas de ids internados). Filtros por período
+// viram comparações de inteiros, sem reinterpretar datas.
+
+import { Lancamento } from '../types';
+
+export interface ColunasLancamentos {
+  // Dia do lançamento, em dias desde 1970-01-01
+  dias: Int32Array;
+  valores: Float64Array;
+  // 1 para crédito, 0 para débito
+  credito: Uint8Array;
+  // Posição em contaIds / empresaIds
+  contas: Uint32Array;
+  empresas: Uint32Array;
+}
+
+export interface LancamentosColunares extends ColunasLancamentos {
+  contaIds: string[];
+  empresaIds: string[];
+  posicaoConta: Map<string, number>;
+  posicaoEmpresa: Map<string, number>;
+}
+
+const MS_POR_DIA = 24 * 60 * 60 * 1000;
+
+// SharedArrayBuffer só existe para a página quando ela está isolada (COOP/COEP)
+export const colunasCompartilhadas = typeof SharedArrayBuffer !== 'undefined' && globalThis.crossOriginIsolated === true;
+
+const alocar = (bytes: number): ArrayBufferLike =>
+  colunasCompartilhadas ? new SharedArrayBuffer(bytes) : new ArrayBuffer(bytes);
+
+// Fim de intervalo para "sem limite"
+export const ULTIMO_DIA = 0x7fffffff;
+
+// 'yyyy-MM-dd' (ou ISO com hora) para número do dia, sem fuso horário
+export const paraDia = (data: string): number =>
+  Date.UTC(Number(data.slice(0, 4)), Number(data.slice(5, 7)) - 1, Number(data.slice(8, 10))) / MS_POR_DIA;
+
+const internar = (posicoes: Map<string, number>, ids: string[], id: string): number => {
+  let posicao = posicoes.get(id);
+  if (posicao === undefined) {
+    posicao = ids.length;
+    posicoes.set(id, posicao);
+    ids.push(id);
+  }
+  return posicao;
+};
+
+// Uma versão em colunas por lista: listas substituídas (nova busca, correção
+// pelo Realtime) geram outra, e a antiga é liberada pelo GC junto com a lista
+const porLista = new WeakMap<Lancamento[], LancamentosColunares>();
+
+/**
+ * Colunas de uma lista de lançamentos, montadas na primeira chamada.
+ * A lista deve ser tratada como imutável (substituída, não alterada).
+ */
+export function colunasDe(lancamentos: Lancamento[]): LancamentosColunares {
+  const existente = porLista.get(lancamentos);
+  if (existente) return existente;
+
+  const total = lancamentos.length;
+  const colunares: LancamentosColunares = {
+    dias: new Int32Array(alocar(total * Int32Array.BYTES_PER_ELEMENT)),
+    valores: new Float64Array(alocar(total * Float64Array.BYTES_PER_ELEMENT)),
+    credito: new Uint8Array(alocar(total)),
+    contas: new Uint32Array(alocar(total * Uint32Array.BYTES_PER_ELEMENT)),
+    empresas: new Uint32Array(alocar(total * Uint32Array.BYTES_PER_ELEMENT)),
+    contaIds: [],
+    empresaIds: [],
+    posicaoConta: new Map(),
+    posicaoEmpresa: new Map()
+  };
+  for (let i = 0; i < total; i++) {
+    const lancamento = lancamentos[i];
+    colunares.dias[i] = paraDia(lancamento.data);
+    colunares.valores[i] = Number(lancamento.valor);
+    colunares.credito[i] = lancamento.tipo === 'Crédito' ? 1 : 0;
+    colunares.contas[i] = internar(colunares.posicaoConta, colunares.contaIds, lancamento.contaId);
+    colunares.empresas[i] = internar(colunares.posicaoEmpresa, colunares.empresaIds, lancamento.empresaId);
+  }
+  porLista.set(lancamentos, colunares);
+  return colunares;
+}
+
+/**
+ * Filtro de empresa para as agregações: a posição dela nas colunas, ou uma
+ * posição que nenhuma linha tem quando a empresa não aparece na lista
+ */
+export function posicaoDaEmpresa(colunares: LancamentosColunares, empresaId: string): number {
+  return colunares.posicaoEmpresa.get(empresaId) ?? colunares.empresaIds.length;
+}
+
+/**
+ * Grupo de cada conta internada, para agregar por um atributo da conta
+ * @param grupoDe Grupo do id da conta, ou -1 para deixá-la fora das somas
+ */
+export function gruposPorConta(
+  colunares: LancamentosColunares,
+  grupoDe: (contaId: string) => number
+): Int32Array<ArrayBuffer> {
+  return Int32Array.from(colunares.contaIds, grupoDe);
+}
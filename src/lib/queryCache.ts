@@ -0,0 +1,218 @@
+// Cache compartilhado das leituras do Supabase.
+//
+// Cada consulta é identificada pela tabela (ou RPC), empresa e filtro. Dentro
+// de STALE_TIME o resultado guardado é devolvido sem ir ao banco; depois disso,
+// até TTL, ele ainda é devolvido na hora enquanto uma nova busca roda em
+// segundo plano e avisa os inscritos. Buscas iguais em andamento são
+// compartilhadas. Mutações feitas pelo supabaseClient invalidam a tabela,
+// exceto nas tabelas sincronizadas pelo realtimeSync, cujos eventos corrigem
+// as entradas no lugar (patchQueries).
+
+export interface QueryKey {
+  table: string;
+  empresaId?: string | null;
+  filter?: string;
+}
+
+interface CacheEntry {
+  key: QueryKey;
+  data?: unknown;
+  fetchedAt: number;
+  promise?: Promise<unknown>;
+}
+
+type Listener = () => void;
+
+// Resultado considerado atual: devolvido sem revalidar
+const STALE_TIME = 30 * 1000;
+// Resultado mais velho que isso é descartado
+const TTL = 10 * 60 * 1000;
+const MAX_ENTRIES = 100;
+
+// Consultas que dependem de outras tabelas além da própria
+const DEPENDENCIAS: Record<string, string[]> = {
+  lancamentos: ['get_dre'],
+  contas_contabeis: ['get_dre']
+};
+
+// Map mantém a ordem de inserção: a primeira entrada é a menos usada
+const entries = new Map<string, CacheEntry>();
+const listeners = new Map<string, Set<Listener>>();
+let owner: string | null = null;
+// Tabelas cujas mudanças chegam pelo Realtime enquanto o canal está conectado
+let realtimeTables = new Set<string>();
+
+const serializeKey = ({ table, empresaId, filter }: QueryKey) =>
+  `${table}|${empresaId || '*'}|${filter || ''}`;
+
+const touch = (id: string, entry: CacheEntry) => {
+  entries.delete(id);
+  entries.set(id, entry);
+  while (entries.size > MAX_ENTRIES) {
+    const oldest = entries.keys().next().value as string;
+    entries.delete(oldest);
+  }
+};
+
+const notify = (table: string, empresaId?: string | null) => {
+  for (const [id, set] of listeners) {
+    const [t, e] = id.split('|');
+    if (t === table && (!empresaId || e === '*' || e === empresaId)) {
+      set.forEach(listener => listener());
+    }
+  }
+};
+
+const load = <T>(id: string, entry: CacheEntry, fetcher: () => Promise<T>): Promise<T> => {
+  if (entry.promise) return entry.promise as Promise<T>;
+  const revalidating = entry.data !== undefined;
+  const promise = fetcher().then(
+    data => {
+      if (entries.get(id) === entry) {
+        entry.data = data;
+        entry.fetchedAt = Date.now();
+      }
+      entry.promise = undefined;
+      if (revalidating) notify(entry.key.table, entry.key.empresaId);
+      return data;
+    },
+    error => {
+      entry.promise = undefined;
+      throw error;
+    }
+  );
+  entry.promise = promise;
+  return promise;
+};
+
+/**
+ * Lê uma consulta pelo cache
+ * @param key Tabela, empresa e filtro que identificam a consulta
+ * @param fetcher Busca no banco; deve lançar em caso de erro
+ * @returns O resultado guardado, se ainda válido, ou o da busca
+ */
+export function cachedQuery<T>(key: QueryKey, fetcher: () => Promise<T>): Promise<T> {
+  const id = serializeKey(key);
+  const now = Date.now();
+  let entry = entries.get(id);
+  if (entry && entry.data !== undefined && now - entry.fetchedAt > TTL) {
+    entries.delete(id);
+    entry = undefined;
+  }
+  if (!entry) {
+    entry = { key, fetchedAt: 0 };
+  }
+  touch(id, entry);
+
+  if (entry.data === undefined) return load(id, entry, fetcher);
+  if (now - entry.fetchedAt > STALE_TIME) {
+    // Devolve o dado antigo agora; a busca nova avisa os inscritos ao terminar
+    load(id, entry, fetcher).catch(error => console.error('Erro ao revalidar consulta:', key, error));
+  }
+  return Promise.resolve(entry.data as T);
+}
+
+/**
+ * Inscreve um callback chamado quando uma revalidação ou invalidação muda os
+ * dados das tabelas informadas
+ * @returns Função que cancela a inscrição
+ */
+export function subscribeQueries(tables: string[], empresaId: string | null | undefined, listener: Listener): () => void {
+  const ids = tables.map(table => serializeKey({ table, empresaId }));
+  ids.forEach(id => {
+    if (!listeners.has(id)) listeners.set(id, new Set());
+    listeners.get(id)!.add(listener);
+  });
+  return () => {
+    ids.forEach(id => {
+      const set = listeners.get(id);
+      set?.delete(listener);
+      if (set && set.size === 0) listeners.delete(id);
+    });
+  };
+}
+
+/**
+ * Descarta as consultas de uma tabela (e das que dependem dela) e avisa os inscritos
+ * @param table Tabela alterada
+ * @param empresaId Empresa alterada; sem ela, todas as empresas
+ */
+export function invalidateQueries(table: string, empresaId?: string | null): void {
+  const tables = [table, ...(DEPENDENCIAS[table] || [])];
+  for (const [id, entry] of entries) {
+    if (!tables.includes(entry.key.table)) continue;
+    if (empresaId && entry.key.empresaId && entry.key.empresaId !== empresaId) continue;
+    entries.delete(id);
+  }
+  tables.forEach(t => notify(t, empresaId));
+}
+
+/**
+ * Lê o resultado guardado de uma consulta, sem buscar nem revalidar
+ */
+export function peekQuery<T>(key: QueryKey): T | undefined {
+  return entries.get(serializeKey(key))?.data as T | undefined;
+}
+
+/**
+ * Resultados guardados de todas as consultas de uma tabela
+ */
+export function peekQueries<T>(table: string): Array<{ key: QueryKey; data: T }> {
+  const found: Array<{ key: QueryKey; data: T }> = [];
+  for (const entry of entries.values()) {
+    if (entry.key.table === table && entry.data !== undefined) {
+      found.push({ key: entry.key, data: entry.data as T });
+    }
+  }
+  return found;
+}
+
+/**
+ * Corrige no lugar as consultas guardadas de uma tabela e avisa os inscritos
+ * @param patch Recebe o resultado e a chave; devolve o novo resultado, ou
+ *   undefined quando não sabe corrigir e a entrada deve ser descartada
+ * @param minAge Entradas buscadas há menos que isso (ms), ou com busca em
+ *   andamento, são descartadas: podem já refletir a mudança
+ */
+export function patchQueries<T>(
+  table: string,
+  empresaId: string | null | undefined,
+  patch: (data: T, key: QueryKey) => T | undefined,
+  minAge = 0
+): void {
+  const now = Date.now();
+  for (const [id, entry] of entries) {
+    if (entry.key.table !== table || entry.data === undefined) continue;
+    if (empresaId && entry.key.empresaId && entry.key.empresaId !== empresaId) continue;
+    const patched = minAge > 0 && (entry.promise || now - entry.fetchedAt < minAge)
+      ? undefined
+      : patch(entry.data as T, entry.key);
+    if (patched === undefined) {
+      entries.delete(id);
+    } else {
+      entry.data = patched;
+    }
+  }
+  notify(table, empresaId);
+}
+
+export function setRealtimeTables(tables: string[]): void {
+  realtimeTables = new Set(tables);
+}
+
+export function isRealtimeTable(table: string): boolean {
+  return realtimeTables.has(table);
+}
+
+export function clearQueryCache(): void {
+  entries.clear();
+}
+
+/**
+ * Associa o cache ao usuário da sessão; trocar de usuário esvazia o cache
+ */
+export function setQueryCacheOwner(userId: string | null): void {
+  if (userId === owner) return;
+  owner = userId;
+  clearQueryCache();
+}
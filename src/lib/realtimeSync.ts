@@ -0,0 +1,116 @@
+// Mudanças em lancamentos, contas_a_pagar e conta_pagar_fotos via Supabase
+// Realtime (postgres_changes). Os eventos de lançamentos corrigem no lugar as
+// listas e os DREs do queryCache; telas com estado próprio (listas paginadas,
+// detalhes abertos) se inscrevem com subscribeRealtime.
+//
+// Com RLS ativo, o Realtime envia em `old` só a chave primária: a versão
+// anterior de um lançamento vem do próprio cache, quando ele está lá.
+
+import { RealtimeChannel } from '@supabase/supabase-js';
+import { supabase } from './supabaseClient';
+import { invalidateQueries, setRealtimeTables } from './queryCache';
+import { QueryService } from '../services/queryService';
+import { DREService } from '../services/dreService';
+import { Lancamento } from '../types';
+
+export type RealtimeTable = 'lancamentos' | 'contas_a_pagar' | 'conta_pagar_fotos';
+
+export interface RealtimeEvent {
+  tipo: 'INSERT' | 'UPDATE' | 'DELETE';
+  id: string;
+  // Linha nova (snake_case, como no banco); null em DELETE
+  novo: Record<string, any> | null;
+}
+
+type RealtimeHandler = (evento: RealtimeEvent) => void;
+
+const TABLES: RealtimeTable[] = ['lancamentos', 'contas_a_pagar', 'conta_pagar_fotos'];
+
+let channel: RealtimeChannel | null = null;
+const handlers = new Map<RealtimeTable, Set<RealtimeHandler>>();
+
+const mapLancamento = (row: Record<string, any>): Lancamento => ({
+  id: row.id,
+  user_id: row.user_id,
+  created_at: row.created_at,
+  empresaId: row.empresa_id,
+  contaId: row.conta_id,
+  data: row.data,
+  descricao: row.descricao,
+  valor: Number(row.valor),
+  tipo: row.tipo
+});
+
+const mesmoEfeitoNoDRE = (a: Lancamento, b: Lancamento) =>
+  a.empresaId === b.empresaId && a.contaId === b.contaId && a.data === b.data &&
+  a.tipo === b.tipo && Number(a.valor) === b.valor;
+
+const aplicarLancamento = ({ tipo, id, novo }: RealtimeEvent) => {
+  const lancamentoNovo = novo ? mapLancamento(novo) : null;
+  const antigo = tipo === 'INSERT' ? null : QueryService.findLancamento(id) ?? null;
+  // Sem a versão anterior (ou com uma lista já buscada depois da gravação)
+  // não há como desfazer a contribuição antiga no DRE
+  const semVersaoAnterior = tipo !== 'INSERT' &&
+    (!antigo || (lancamentoNovo !== null && mesmoEfeitoNoDRE(antigo, lancamentoNovo)));
+  if (semVersaoAnterior) {
+    invalidateQueries('get_dre');
+  } else {
+    DREService.aplicarLancamentoNoCache(antigo, lancamentoNovo);
+  }
+  QueryService.aplicarLancamento(id, lancamentoNovo);
+};
+
+const dispatch = (table: RealtimeTable, payload: any) => {
+  const novo = payload.eventType === 'DELETE' ? null : payload.new;
+  const evento: RealtimeEvent = {
+    tipo: payload.eventType,
+    id: (novo ?? payload.old)?.id,
+    novo
+  };
+  if (!evento.id) return;
+  if (table === 'lancamentos') aplicarLancamento(evento);
+  handlers.get(table)?.forEach(handler => handler(evento));
+};
+
+/**
+ * Abre o canal de mudanças do usuário logado; chamadas repetidas não abrem outro
+ */
+export function startRealtimeSync(): void {
+  // Sem Supabase configurado o cliente é um substituto sem Realtime
+  if (channel || typeof supabase.channel !== 'function') return;
+  let nextChannel = supabase.channel('db-changes');
+  for (const table of TABLES) {
+    nextChannel = nextChannel.on(
+      'postgres_changes',
+      { event: '*', schema: 'public', table },
+      payload => dispatch(table, payload)
+    );
+  }
+  channel = nextChannel.subscribe(status => {
+    // Só dispensa a invalidação por escrita enquanto os eventos estão chegando
+    setRealtimeTables(status === 'SUBSCRIBED' ? TABLES : []);
+    if (status !== 'SUBSCRIBED') {
+      // Eventos podem ter sido perdidos: o que está guardado deixa de ser confiável
+      TABLES.forEach(table => invalidateQueries(table));
+    }
+  });
+}
+
+export function stopRealtimeSync(): void {
+  setRealtimeTables([]);
+  if (!channel) return;
+  supabase.removeChannel(channel);
+  channel = null;
+}
+
+/**
+ * Inscreve um callback para os eventos de uma tabela
+ * @returns Função que cancela a inscrição
+ */
+export function subscribeRealtime(table: RealtimeTable, handler: RealtimeHandler): () => void {
+  if (!handlers.has(table)) handlers.set(table, new Set());
+  handlers.get(table)!.add(handler);
+  return () => {
+    handlers.get(table)?.delete(handler);
+  };
+}
@@ -1,4 +1,5 @@
 import { createClient, SupabaseClient } from '@supabase/supabase-js';
+import { invalidateQueries, isRealtimeTable, setQueryCacheOwner } from './queryCache';
 
 const supabaseUrl = import.meta.env.VITE_SUPABASE_URL;
 const supabaseAnonKey = import.meta.env.VITE_SUPABASE_ANON_KEY;
@@ -8,12 +9,38 @@ const isValidSupabaseUrl = (url?: string): boolean => {
 
   try {
     const parsed = new URL(url);
+    // Stack local de E2E (testsprite_tests/harness/local_supabase): só em dev ou no
+    // modo e2e, para um build de produção nunca apontar para um endpoint local sem https
+    const permiteLocal = import.meta.env.DEV || import.meta.env.MODE === 'e2e';
+    if (permiteLocal && (parsed.hostname === 'localhost' || parsed.hostname === '127.0.0.1')) return true;
     return parsed.protocol === 'https:' && parsed.hostname.endsWith('.supabase.co');
   } catch {
     return false;
   }
 };
 
+// RPCs que alteram dados -> tabelas cujo cache deixa de valer
+const RPC_MUTATIONS: Record<string, string[]> = {
+  delete_dre_categoria: ['dre_categorias_dre'],
+  accept_company_invitation: ['empresas']
+};
+
+// Toda escrita bem-sucedida pelo PostgREST invalida o cache da tabela escrita,
+// exceto nas tabelas que o Realtime mantém atualizadas
+const fetchWithCacheInvalidation: typeof fetch = async (input, init) => {
+  const response = await fetch(input, init);
+  const method = (init?.method || 'GET').toUpperCase();
+  if (response.ok && method !== 'GET' && method !== 'HEAD') {
+    const url = typeof input === 'string' ? input : input instanceof URL ? input.href : input.url;
+    const match = new URL(url).pathname.match(/\/rest\/v1\/(rpc\/)?([^/?]+)/);
+    if (match) {
+      const tables = match[1] ? RPC_MUTATIONS[match[2]] || [] : [match[2]];
+      tables.filter(table => !isRealtimeTable(table)).forEach(table => invalidateQueries(table));
+    }
+  }
+  return response;
+};
+
 // Singleton para evitar múltiplas instâncias
 let supabaseInstance: SupabaseClient | null = null;
 
@@ -67,6 +94,7 @@ const createSupabaseClient = (): SupabaseClient => {
         storageKey: `dre-auth-token-${projectId}`
       },
       global: {
+        fetch: fetchWithCacheInvalidation,
         headers: {
           'X-Client-Info': 'dre-system',
           apikey: supabaseAnonKey
@@ -81,6 +109,11 @@ const createSupabaseClient = (): SupabaseClient => {
         }
       }
     });
+
+    // O cache de consultas é por usuário: troca de sessão o esvazia
+    supabaseInstance.auth.onAuthStateChange((_event, session) => {
+      setQueryCacheOwner(session?.user?.id ?? null);
+    });
   }
   
   return supabaseInstance;
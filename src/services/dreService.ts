@@ -1,8 +1,150 @@
+import { supabase } from '../lib/supabaseClient';
+import { cachedQuery, patchQueries, peekQuery } from '../lib/queryCache';
 import { DREPeriodo, Lancamento, ContaContabil } from '../types';
-import { isWithinInterval, parseISO } from 'date-fns';
+import {
+  parseISO,
+  format,
+  startOfMonth,
+  endOfMonth,
+  startOfQuarter,
+  endOfQuarter,
+  startOfYear,
+  endOfYear
+} from 'date-fns';
 import { isReceitaDreCategoria, mapContaCategoriaToDreCategoria } from '../utils/dreCategoria';
+import {
+  acumularIndice,
+  agregarPorIntervalo,
+  construirIndice,
+  consultarIndice,
+  criarIndice,
+  GruposAgregacao,
+  IndiceAcumulado,
+  saldosDe,
+  SaldosPorIntervalo
+} from '../workers/agregacao';
+import { agregarEmSegundoPlano, indexarEmSegundoPlano } from '../lib/agregacaoWorker';
+import { colunasDe, gruposPorConta, LancamentosColunares, paraDia, posicaoDaEmpresa } from '../lib/lancamentosColunares';
+
+export interface ContaIndexada {
+  conta: ContaContabil;
+  categoriaDre: string;
+  receita: boolean;
+  // Sinal aplicado a um lançamento a crédito: +1 para receitas, -1 para custos/despesas
+  sinalCredito: 1 | -1;
+}
+
+// Contas com categoria DRE, por id. Contas sem categoria DRE ficam de fora.
+export type ContaIndex = Map<string, ContaIndexada>;
+
+export interface PeriodoDRE {
+  dataInicio: string;
+  dataFim: string;
+}
+
+export interface DREMultiPeriodo {
+  // Na mesma ordem dos períodos pedidos
+  periodos: DREPeriodo[];
+  // Um DRE por mês-calendário com lançamentos na série, em ordem cronológica
+  mensal: DREPeriodo[];
+}
+
+// Períodos agregados pela função get_dre no banco
+export type GranularidadeDRE = 'total' | 'day' | 'month' | 'quarter' | 'year';
+
+interface DRERPCRow {
+  periodo_inicio: string;
+  periodo_fim: string;
+  categoria: string;
+  valor: number | string;
+}
+
+// Categorias DRE como grupos do motor de agregação
+interface GruposDRE {
+  grupos: GruposAgregacao;
+  categorias: string[];
+  // Sinal que cada categoria dá aos créditos
+  sinais: number[];
+}
+
+// Índice acumulado de uma empresa para um plano de contas; null quando as datas
+// se espalham demais para indexar (MAXIMO_DIAS_INDICE) e as somas são feitas direto
+interface IndiceDRE extends GruposDRE {
+  contas: ContaContabil[];
+  indice?: IndiceAcumulado | null;
+  construindo?: Promise<IndiceAcumulado | null>;
+}
+
+// Índice dos totais mensais de get_dre, já com o sinal de cada categoria; cada mês
+// ocupa a posição do seu primeiro dia
+interface IndiceMensal {
+  categorias: string[];
+  indice: IndiceAcumulado;
+}
+
+const ultimoDiaDoMes = (chaveMes: string): string => {
+  const [ano, mes] = chaveMes.split('-').map(Number);
+  return `${chaveMes}-${String(new Date(ano, mes, 0).getDate()).padStart(2, '0')}`;
+};
+
+// Chaves yyyy-MM dos meses de inicio a fim, inclusive
+const mesesEntre = (inicio: string, fim: string): string[] => {
+  const meses: string[] = [];
+  let [ano, mes] = inicio.split('-').map(Number);
+  const ultimo = fim.slice(0, 7);
+  for (let chave = inicio.slice(0, 7); chave <= ultimo; chave = `${ano}-${String(mes).padStart(2, '0')}`) {
+    meses.push(chave);
+    if (++mes > 12) {
+      mes = 1;
+      ano++;
+    }
+  }
+  return meses;
+};
+
+// DREs buscados há menos que isso podem já incluir um lançamento recém-gravado:
+// são descartados em vez de corrigidos quando chega o evento dele
+const JANELA_EVENTO_MS = 5000;
+
+// Um índice por versão do plano de contas: cada recarga das contas gera um novo array,
+// e o array antigo (com seu índice) é liberado pelo GC.
+const indicesPorPlano = new WeakMap<ContaContabil[], ContaIndex>();
+
+// Índices acumulados por versão da lista de lançamentos e empresa; como as colunas,
+// são montados uma vez e servem qualquer período até a lista ser substituída
+const indicesDRE = new WeakMap<LancamentosColunares, Map<string, IndiceDRE>>();
+const indicesMensais = new WeakMap<DRERPCRow[], IndiceMensal>();
+
+// max-rows padrão do PostgREST: get_dre é lido em páginas desse tamanho até acabar
+const PAGINA_RPC = 1000;
 
 export class DREService {
+  /**
+   * Índice id → categoria DRE e sinal, montado uma vez por array de contas.
+   * O array de contas deve ser tratado como imutável (substituído, não alterado).
+   */
+  static indexarContas(contasContabeis: ContaContabil[]): ContaIndex {
+    const existente = indicesPorPlano.get(contasContabeis);
+    if (existente) return existente;
+
+    const indice: ContaIndex = new Map();
+    for (const conta of contasContabeis) {
+      const categoriaDre = mapContaCategoriaToDreCategoria(conta.categoria);
+      if (!categoriaDre) continue;
+      const receita = isReceitaDreCategoria(categoriaDre);
+      indice.set(conta.id, { conta, categoriaDre, receita, sinalCredito: receita ? 1 : -1 });
+    }
+    indicesPorPlano.set(contasContabeis, indice);
+    return indice;
+  }
+
+  // Para receitas, créditos são positivos; para despesas/custos, débitos são positivos
+  static valorComSinal(lancamento: Lancamento, contaIndexada: ContaIndexada): number {
+    return lancamento.tipo === 'Crédito'
+      ? contaIndexada.sinalCredito * lancamento.valor
+      : -contaIndexada.sinalCredito * lancamento.valor;
+  }
+
   static calcularDRE(
     lancamentos: Lancamento[],
     contasContabeis: ContaContabil[],
@@ -10,19 +152,369 @@ export class DREService {
     dataInicio: string,
     dataFim: string
   ): DREPeriodo {
-    // Filtrar lançamentos por empresa e período
-    const lancamentosFiltrados = lancamentos.filter(lancamento => {
-      const dataLancamento = parseISO(lancamento.data);
-      const inicio = parseISO(dataInicio);
-      const fim = parseISO(dataFim);
-      
-      return lancamento.empresaId === empresaId &&
-             isWithinInterval(dataLancamento, { start: inicio, end: fim });
+    const dre = this.calcularDREMultiPeriodo(lancamentos, contasContabeis, empresaId, [{ dataInicio, dataFim }]).periodos[0];
+
+    // Debug logs para investigar margem líquida
+    console.log('=== DEBUG DRE CALCULATION ===');
+    console.log('Receita Líquida:', dre.receitaLiquida);
+    console.log('Custo Vendas:', dre.custos);
+    console.log('Despesas Operacionais:', dre.despesasOperacionais);
+    console.log('Despesas Financeiras:', dre.despesasFinanceiras);
+    console.log('Receitas Financeiras:', dre.receitasFinanceiras);
+    console.log('Impostos:', dre.impostosSobreLucro);
+    console.log('Lucro Bruto:', dre.lucroBruto);
+    console.log('Lucro Operacional:', dre.resultadoOperacional);
+    console.log('Lucro Antes Impostos:', dre.resultadoAntesIR);
+    console.log('Lucro Líquido:', dre.lucroLiquido);
+    console.log('Total de lançamentos:', lancamentos.length);
+    console.log('Total de contas:', contasContabeis.length);
+    console.log('Margem Bruta:', dre.margemBruta + '%');
+    console.log('Margem Operacional:', dre.margemOperacional + '%');
+    console.log('Margem Líquida:', dre.margemLiquida + '%');
+    console.log('==============================');
+
+    return dre;
+  }
+
+  /**
+   * DRE de vários períodos e série mensal a partir do índice acumulado dos
+   * lançamentos da empresa: montado na primeira chamada, depois cada período
+   * custa uma subtração por categoria, qualquer que seja o volume de lançamentos.
+   *
+   * `serieMensal`, quando informada, gera um DRE por mês-calendário completo para
+   * cada mês que tem lançamentos dentro dela, como o histórico do Dashboard.
+   */
+  static calcularDREMultiPeriodo(
+    lancamentos: Lancamento[],
+    contasContabeis: ContaContabil[],
+    empresaId: string,
+    periodos: PeriodoDRE[],
+    serieMensal?: PeriodoDRE
+  ): DREMultiPeriodo {
+    const colunares = colunasDe(lancamentos);
+    const entrada = this.entradaIndiceDRE(colunares, contasContabeis, empresaId);
+    if (entrada.indice === undefined) entrada.indice = construirIndice(colunares, entrada.grupos);
+
+    const { intervalos, meses } = this.intervalosDRE(periodos, serieMensal);
+    const saldos = entrada.indice
+      ? consultarIndice(entrada.indice, intervalos)
+      : saldosDe(agregarPorIntervalo(colunares, { ...entrada.grupos, intervalos }));
+    return this.lerSaldosDRE(entrada, saldos, meses, empresaId, periodos);
+  }
+
+  /**
+   * Mesmo resultado de calcularDREMultiPeriodo, com o índice montado no worker
+   * de agregação: a tela continua respondendo enquanto os lançamentos são somados.
+   */
+  static async calcularDREMultiPeriodoEmSegundoPlano(
+    lancamentos: Lancamento[],
+    contasContabeis: ContaContabil[],
+    empresaId: string,
+    periodos: PeriodoDRE[],
+    serieMensal?: PeriodoDRE
+  ): Promise<DREMultiPeriodo> {
+    const colunares = colunasDe(lancamentos);
+    const entrada = this.entradaIndiceDRE(colunares, contasContabeis, empresaId);
+    if (entrada.indice === undefined) {
+      // Pedidos seguidos (troca rápida de período) esperam a mesma construção
+      if (!entrada.construindo) {
+        entrada.construindo = indexarEmSegundoPlano(colunares, entrada.grupos).then(
+          indice => {
+            entrada.indice = indice;
+            return indice;
+          },
+          error => {
+            entrada.construindo = undefined;
+            throw error;
+          }
+        );
+      }
+      await entrada.construindo;
+    }
+
+    const { intervalos, meses } = this.intervalosDRE(periodos, serieMensal);
+    const saldos = entrada.indice
+      ? consultarIndice(entrada.indice, intervalos)
+      : saldosDe(await agregarEmSegundoPlano(colunares, {
+        ...entrada.grupos,
+        grupoPorConta: entrada.grupos.grupoPorConta.slice(),
+        intervalos
+      }));
+    return this.lerSaldosDRE(entrada, saldos, meses, empresaId, periodos);
+  }
+
+  private static entradaIndiceDRE(
+    colunares: LancamentosColunares,
+    contasContabeis: ContaContabil[],
+    empresaId: string
+  ): IndiceDRE {
+    let porEmpresa = indicesDRE.get(colunares);
+    if (!porEmpresa) {
+      porEmpresa = new Map();
+      indicesDRE.set(colunares, porEmpresa);
+    }
+    let entrada = porEmpresa.get(empresaId);
+    // Plano de contas recarregado muda os grupos: o índice é refeito
+    if (!entrada || entrada.contas !== contasContabeis) {
+      entrada = { ...this.gruposDRE(colunares, contasContabeis, empresaId), contas: contasContabeis };
+      porEmpresa.set(empresaId, entrada);
+    }
+    return entrada;
+  }
+
+  private static gruposDRE(
+    colunares: LancamentosColunares,
+    contasContabeis: ContaContabil[],
+    empresaId: string
+  ): GruposDRE {
+    // Um grupo por categoria DRE, com o sinal que ela dá aos créditos
+    const indice = this.indexarContas(contasContabeis);
+    const categorias: string[] = [];
+    const sinais: number[] = [];
+    const grupoPorCategoria = new Map<string, number>();
+    indice.forEach(({ categoriaDre, sinalCredito }) => {
+      if (grupoPorCategoria.has(categoriaDre)) return;
+      grupoPorCategoria.set(categoriaDre, categorias.length);
+      categorias.push(categoriaDre);
+      sinais.push(sinalCredito);
+    });
+    const grupoPorConta = gruposPorConta(colunares, contaId => {
+      const contaIndexada = indice.get(contaId);
+      return contaIndexada ? grupoPorCategoria.get(contaIndexada.categoriaDre)! : -1;
+    });
+
+    return {
+      grupos: { empresa: posicaoDaEmpresa(colunares, empresaId), grupoPorConta, totalGrupos: categorias.length },
+      categorias,
+      sinais
+    };
+  }
+
+  /**
+   * Intervalos de dias dos períodos, seguidos de dois por mês da série: o trecho
+   * dentro da série (só a contagem importa) e o mês-calendário inteiro (as somas)
+   */
+  private static intervalosDRE(
+    periodos: PeriodoDRE[],
+    serieMensal?: PeriodoDRE
+  ): { intervalos: Int32Array<ArrayBuffer>; meses: string[] } {
+    const meses = serieMensal ? mesesEntre(serieMensal.dataInicio, serieMensal.dataFim) : [];
+    const limites: Array<[string, string]> = periodos.map(({ dataInicio, dataFim }) => [dataInicio, dataFim]);
+    for (const chaveMes of meses) {
+      const inicioMes = `${chaveMes}-01`;
+      const fimMes = ultimoDiaDoMes(chaveMes);
+      limites.push([
+        inicioMes < serieMensal!.dataInicio ? serieMensal!.dataInicio : inicioMes,
+        fimMes > serieMensal!.dataFim ? serieMensal!.dataFim : fimMes
+      ]);
+      limites.push([inicioMes, fimMes]);
+    }
+    const intervalos = new Int32Array(limites.length * 2);
+    limites.forEach(([inicio, fim], k) => {
+      intervalos[2 * k] = paraDia(inicio);
+      intervalos[2 * k + 1] = paraDia(fim);
+    });
+    return { intervalos, meses };
+  }
+
+  private static lerSaldosDRE(
+    { categorias, sinais }: GruposDRE,
+    { saldos, contagens }: SaldosPorIntervalo,
+    meses: string[],
+    empresaId: string,
+    periodos: PeriodoDRE[]
+  ): DREMultiPeriodo {
+    const valoresDoIntervalo = (k: number): Record<string, number> => {
+      const valores: Record<string, number> = {};
+      categorias.forEach((categoria, grupo) => {
+        valores[categoria] = sinais[grupo] * saldos[k * categorias.length + grupo];
+      });
+      return valores;
+    };
+
+    const resultadoPeriodos = periodos.map(({ dataInicio, dataFim }, k) =>
+      this.montarDRE(valoresDoIntervalo(k), empresaId, dataInicio, dataFim)
+    );
+    const mensal: DREPeriodo[] = [];
+    meses.forEach((chaveMes, i) => {
+      const k = periodos.length + 2 * i;
+      if (contagens[k] === 0) return;
+      mensal.push(this.montarDRE(valoresDoIntervalo(k + 1), empresaId, `${chaveMes}-01`, ultimoDiaDoMes(chaveMes)));
     });
 
-    // Agrupar valores por categoria
-    const valoresPorCategoria = this.agruparValoresPorCategoria(lancamentosFiltrados, contasContabeis);
+    return { periodos: resultadoPeriodos, mensal };
+  }
+
+  /**
+   * DRE calculado no banco (função get_dre): recebe os totais por categoria e
+   * período em vez dos lançamentos. Com granularidade diferente de 'total',
+   * períodos sem lançamentos não são retornados.
+   */
+  static async buscarDRE(
+    empresaId: string,
+    dataInicio: string,
+    dataFim: string,
+    granularidade: GranularidadeDRE = 'total'
+  ): Promise<DREPeriodo[]> {
+    const rows = await this.buscarLinhasDRE(empresaId, dataInicio, dataFim, granularidade);
+
+    const periodos = new Map<string, { dataFim: string; valores: Record<string, number> }>();
+    for (const row of rows) {
+      let periodo = periodos.get(row.periodo_inicio);
+      if (!periodo) {
+        periodo = { dataFim: row.periodo_fim, valores: {} };
+        periodos.set(row.periodo_inicio, periodo);
+      }
+      periodo.valores[row.categoria] = Number(row.valor);
+    }
+
+    if (granularidade === 'total' && periodos.size === 0) {
+      return [this.montarDRE({}, empresaId, dataInicio, dataFim)];
+    }
+    return Array.from(periodos, ([inicio, { dataFim: fim, valores }]) =>
+      this.montarDRE(valores, empresaId, inicio, fim)
+    );
+  }
+
+  /**
+   * DREs de vários períodos dentro de [dataInicio, dataFim], a partir dos totais
+   * mensais de get_dre (lidos de saldos_mensais). Os totais viram um índice acumulado,
+   * montado uma vez por resultado guardado: trocar de períodos não refaz a consulta
+   * nem as somas. Os períodos devem cobrir meses inteiros.
+   */
+  static async buscarDREPeriodos(
+    empresaId: string,
+    dataInicio: string,
+    dataFim: string,
+    periodos: PeriodoDRE[]
+  ): Promise<DREPeriodo[]> {
+    const rows = await this.buscarLinhasDRE(empresaId, dataInicio, dataFim, 'month');
+    let mensal = indicesMensais.get(rows);
+    if (!mensal) {
+      mensal = this.indexarTotaisMensais(rows, dataInicio, dataFim);
+      indicesMensais.set(rows, mensal);
+    }
+
+    const { categorias, indice } = mensal;
+    const { saldos } = consultarIndice(indice, this.intervalosDRE(periodos).intervalos);
+    return periodos.map(({ dataInicio: inicio, dataFim: fim }, k) => {
+      const valores: Record<string, number> = {};
+      categorias.forEach((categoria, grupo) => {
+        valores[categoria] = saldos[k * categorias.length + grupo];
+      });
+      return this.montarDRE(valores, empresaId, inicio, fim);
+    });
+  }
+
+  private static buscarLinhasDRE(
+    empresaId: string,
+    dataInicio: string,
+    dataFim: string,
+    granularidade: GranularidadeDRE
+  ): Promise<DRERPCRow[]> {
+    return cachedQuery(
+      { table: 'get_dre', empresaId, filter: `${dataInicio}..${dataFim}|${granularidade}` },
+      async () => {
+        // Ordenado por (período, categoria), único por linha: as páginas não se sobrepõem
+        const rows: DRERPCRow[] = [];
+        for (let offset = 0; ; offset += PAGINA_RPC) {
+          const { data, error } = await supabase.rpc('get_dre', {
+            p_empresa_id: empresaId,
+            p_inicio: dataInicio,
+            p_fim: dataFim,
+            p_granularity: granularidade
+          }).range(offset, offset + PAGINA_RPC - 1);
+          if (error) throw error;
+          rows.push(...((data || []) as DRERPCRow[]));
+          if (!data || data.length < PAGINA_RPC) return rows;
+        }
+      }
+    );
+  }
+
+  // Os valores de get_dre já vêm com o sinal da categoria: entram no índice como estão,
+  // no primeiro dia do mês. Um período de meses inteiros soma exatamente os seus meses
+  private static indexarTotaisMensais(rows: DRERPCRow[], dataInicio: string, dataFim: string): IndiceMensal {
+    const categorias: string[] = [];
+    const grupoPorCategoria = new Map<string, number>();
+    for (const row of rows) {
+      if (grupoPorCategoria.has(row.categoria)) continue;
+      grupoPorCategoria.set(row.categoria, categorias.length);
+      categorias.push(row.categoria);
+    }
+
+    const primeiroDia = paraDia(dataInicio);
+    const indice = criarIndice(primeiroDia, Math.max(paraDia(dataFim) - primeiroDia + 1, 0), categorias.length);
+    for (const row of rows) {
+      const posicao = paraDia(row.periodo_inicio) - primeiroDia + 1;
+      if (posicao < 1 || posicao > indice.totalDias) continue;
+      indice.contagens[posicao]++;
+      indice.saldos[posicao * categorias.length + grupoPorCategoria.get(row.categoria)!] += Number(row.valor);
+    }
+    acumularIndice(indice);
+    return { categorias, indice };
+  }
+
+  /**
+   * Aplica a troca de um lançamento (antigo -> novo; null quando não existe)
+   * nos resultados de get_dre guardados, sem nova consulta. DREs de empresas
+   * cujo plano de contas não está em cache são descartados.
+   */
+  static aplicarLancamentoNoCache(antigo: Lancamento | null, novo: Lancamento | null): void {
+    const variacoes: Array<{ lancamento: Lancamento; fator: 1 | -1 }> = [];
+    if (antigo) variacoes.push({ lancamento: antigo, fator: -1 });
+    if (novo) variacoes.push({ lancamento: novo, fator: 1 });
+
+    for (const empresaId of new Set(variacoes.map(v => v.lancamento.empresaId))) {
+      const contas = peekQuery<ContaContabil[]>({ table: 'contas_contabeis', empresaId });
+      patchQueries<DRERPCRow[]>('get_dre', empresaId, (rows, key) => {
+        if (!contas) return undefined;
+        const indice = this.indexarContas(contas);
+        const [intervalo, granularidade] = (key.filter || '').split('|');
+        const [inicio, fim] = intervalo.split('..');
+
+        let resultado = rows;
+        for (const { lancamento, fator } of variacoes) {
+          const dia = lancamento.data.slice(0, 10);
+          const contaIndexada = indice.get(lancamento.contaId);
+          if (lancamento.empresaId !== empresaId || dia < inicio || dia > fim || !contaIndexada) continue;
+          const [periodoInicio, periodoFim] = this.periodoDoDia(dia, granularidade as GranularidadeDRE, inicio, fim);
+          const valor = fator * this.valorComSinal(lancamento, contaIndexada);
+
+          const existente = resultado.find(r => r.periodo_inicio === periodoInicio && r.categoria === contaIndexada.categoriaDre);
+          resultado = existente
+            ? resultado.map(r => (r === existente ? { ...r, valor: Number(r.valor) + valor } : r))
+            : [...resultado, { periodo_inicio: periodoInicio, periodo_fim: periodoFim, categoria: contaIndexada.categoriaDre, valor }]
+              .sort((a, b) => a.periodo_inicio.localeCompare(b.periodo_inicio));
+        }
+        return resultado;
+      }, JANELA_EVENTO_MS);
+    }
+  }
+
+  // Período de get_dre que contém o dia: alinhado ao calendário e recortado em [inicio, fim]
+  private static periodoDoDia(dia: string, granularidade: GranularidadeDRE, inicio: string, fim: string): [string, string] {
+    const data = parseISO(dia);
+    const limites: Record<GranularidadeDRE, [Date, Date] | null> = {
+      total: null,
+      day: [data, data],
+      month: [startOfMonth(data), endOfMonth(data)],
+      quarter: [startOfQuarter(data), endOfQuarter(data)],
+      year: [startOfYear(data), endOfYear(data)]
+    };
+    const periodo = limites[granularidade];
+    if (!periodo) return [inicio, fim];
+    const periodoInicio = format(periodo[0], 'yyyy-MM-dd');
+    const periodoFim = format(periodo[1], 'yyyy-MM-dd');
+    return [periodoInicio < inicio ? inicio : periodoInicio, periodoFim > fim ? fim : periodoFim];
+  }
 
+  static montarDRE(
+    valoresPorCategoria: Record<string, number>,
+    empresaId: string,
+    dataInicio: string,
+    dataFim: string
+  ): DREPeriodo {
     // Calcular componentes do DRE
     const receitaBruta = valoresPorCategoria['Receita Bruta'] || 0;
     const deducoes = valoresPorCategoria['Deduções e Impostos'] || 0;
@@ -47,30 +539,10 @@ export class DREService {
     const impostosSobreLucro = valoresPorCategoria['Impostos sobre Lucro'] || 0;
     const lucroLiquido = resultadoAntesIR - impostosSobreLucro;
 
-    // Debug logs para investigar margem líquida
-    console.log('=== DEBUG DRE CALCULATION ===');
-    console.log('Receita Líquida:', receitaLiquida);
-    console.log('Custo Vendas:', custos);
-    console.log('Despesas Operacionais:', despesasOperacionais);
-    console.log('Despesas Financeiras:', despesasFinanceiras);
-    console.log('Receitas Financeiras:', receitasFinanceiras);
-    console.log('Impostos:', impostosSobreLucro);
-    console.log('Lucro Bruto:', lucroBruto);
-    console.log('Lucro Operacional:', resultadoOperacional);
-    console.log('Lucro Antes Impostos:', resultadoAntesIR);
-    console.log('Lucro Líquido:', lucroLiquido);
-    console.log('Total de lançamentos:', lancamentos.length);
-    console.log('Total de contas:', contasContabeis.length);
-
     // Calcular margens
     const margemBruta = receitaLiquida > 0 ? (lucroBruto / receitaLiquida) * 100 : 0;
     const margemOperacional = receitaLiquida > 0 ? (resultadoOperacional / receitaLiquida) * 100 : 0;
     const margemLiquida = receitaLiquida > 0 ? (lucroLiquido / receitaLiquida) * 100 : 0;
-    
-    console.log('Margem Bruta:', margemBruta + '%');
-    console.log('Margem Operacional:', margemOperacional + '%');
-    console.log('Margem Líquida:', margemLiquida + '%');
-    console.log('==============================');
 
     return {
       empresaId,
@@ -98,35 +570,6 @@ export class DREService {
     };
   }
 
-  private static agruparValoresPorCategoria(
-    lancamentos: Lancamento[],
-    contasContabeis: ContaContabil[]
-  ): Record<string, number> {
-    const resultado: Record<string, number> = {};
-
-    lancamentos.forEach(lancamento => {
-      const conta = contasContabeis.find(c => c.id === lancamento.contaId);
-      if (!conta) return;
-
-      const categoriaDre = mapContaCategoriaToDreCategoria(conta.categoria);
-      if (!categoriaDre) return;
-
-      if (!resultado[categoriaDre]) {
-        resultado[categoriaDre] = 0;
-      }
-
-      // Para receitas, considerar créditos como positivos
-      // Para despesas/custos, considerar débitos como positivos
-      const valor = isReceitaDreCategoria(categoriaDre) 
-        ? (lancamento.tipo === 'Crédito' ? lancamento.valor : -lancamento.valor)
-        : (lancamento.tipo === 'Débito' ? lancamento.valor : -lancamento.valor);
-
-      resultado[categoriaDre] += valor;
-    });
-
-    return resultado;
-  }
-
   static obterContasIndividuais(
     lancamentos: Lancamento[],
     contasContabeis: ContaContabil[],
@@ -134,43 +577,33 @@ export class DREService {
     dataInicio: string,
     dataFim: string
   ): Array<{ nome: string; categoria: string; valor: number; }> {
-    // Filtrar lançamentos por empresa e período
-    const lancamentosFiltrados = lancamentos.filter(lancamento => {
-      const dataLancamento = parseISO(lancamento.data);
-      const inicio = parseISO(dataInicio);
-      const fim = parseISO(dataFim);
-      
-      return lancamento.empresaId === empresaId &&
-             isWithinInterval(dataLancamento, { start: inicio, end: fim });
-    });
-
-    const resultado: Record<string, { nome: string; categoria: string; valor: number; }> = {};
+    const colunares = colunasDe(lancamentos);
+    const indice = this.indexarContas(contasContabeis);
 
-    lancamentosFiltrados.forEach(lancamento => {
-      const conta = contasContabeis.find(c => c.id === lancamento.contaId);
-      if (!conta) return;
-
-      // Filtrar apenas contas de despesas/custos (não receitas)
-      const categoriaDre = mapContaCategoriaToDreCategoria(conta.categoria);
-      if (!categoriaDre) return;
-      if (isReceitaDreCategoria(categoriaDre)) return;
-
-      const chave = conta.id;
-      if (!resultado[chave]) {
-        resultado[chave] = {
-          nome: conta.nome,
-          categoria: categoriaDre,
-          valor: 0
-        };
-      }
+    // Um grupo por conta de despesa/custo (não receitas)
+    const contasDespesa: ContaIndexada[] = [];
+    const grupoPorId = new Map<string, number>();
+    indice.forEach(contaIndexada => {
+      if (contaIndexada.receita) return;
+      grupoPorId.set(contaIndexada.conta.id, contasDespesa.length);
+      contasDespesa.push(contaIndexada);
+    });
 
-      // Para despesas/custos, considerar débitos como positivos
-      const valor = lancamento.tipo === 'Débito' ? lancamento.valor : -lancamento.valor;
-      resultado[chave].valor += valor;
+    const { creditos, debitos } = agregarPorIntervalo(colunares, {
+      empresa: posicaoDaEmpresa(colunares, empresaId),
+      grupoPorConta: gruposPorConta(colunares, contaId => grupoPorId.get(contaId) ?? -1),
+      totalGrupos: contasDespesa.length,
+      intervalos: Int32Array.of(paraDia(dataInicio), paraDia(dataFim))
     });
 
     // Retornar apenas contas com valores > 0
-    return Object.values(resultado).filter(conta => conta.valor > 0);
+    return contasDespesa
+      .map((contaIndexada, grupo) => ({
+        nome: contaIndexada.conta.nome,
+        categoria: contaIndexada.categoriaDre,
+        valor: contaIndexada.sinalCredito * (creditos[grupo] - debitos[grupo])
+      }))
+      .filter(conta => conta.valor > 0);
   }
 
   static compararPeriodos(
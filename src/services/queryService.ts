@@ -0,0 +1,120 @@
+import { supabase } from '../lib/supabaseClient';
+import { cachedQuery, patchQueries, peekQueries } from '../lib/queryCache';
+import { Empresa, Lancamento, ContaContabil } from '../types';
+
+const LANCAMENTO_COLUMNS = `
+  id,
+  user_id,
+  created_at,
+  empresaId:empresa_id,
+  contaId:conta_id,
+  data,
+  descricao,
+  valor,
+  tipo
+`;
+
+const CONTA_CONTABIL_COLUMNS = `
+  id,
+  user_id,
+  created_at,
+  empresaId:empresa_id,
+  codigo,
+  nome,
+  categoria,
+  subcategoria,
+  tipo,
+  ativa
+`;
+
+const EMPRESA_COLUMNS = `
+  id,
+  user_id,
+  created_at,
+  razaoSocial:razao_social,
+  cnpj,
+  regimeTributario:regime_tributario,
+  dataAbertura:data_abertura,
+  email,
+  telefone,
+  endereco,
+  ativa
+`;
+
+// Leituras repetidas entre telas (dashboard, relatórios, contas a pagar), servidas pelo queryCache
+export class QueryService {
+  // Lançamentos da empresa, do mais recente ao mais antigo; sem datas, todo o histórico
+  static getLancamentos(empresaId: string, dataInicio?: string, dataFim?: string): Promise<Lancamento[]> {
+    return cachedQuery(
+      { table: 'lancamentos', empresaId, filter: `${dataInicio || ''}..${dataFim || ''}` },
+      async () => {
+        let query = supabase.from('lancamentos').select(LANCAMENTO_COLUMNS).eq('empresa_id', empresaId);
+        if (dataInicio) query = query.gte('data', dataInicio);
+        if (dataFim) query = query.lte('data', dataFim);
+        const { data, error } = await query.order('data', { ascending: false });
+        if (error) throw error;
+        return (data || []) as unknown as Lancamento[];
+      }
+    );
+  }
+
+  // Lançamento já presente em alguma lista guardada, se houver
+  static findLancamento(id: string): Lancamento | undefined {
+    for (const { data } of peekQueries<Lancamento[]>('lancamentos')) {
+      const lancamento = data.find(l => l.id === id);
+      if (lancamento) return lancamento;
+    }
+    return undefined;
+  }
+
+  // Aplica um lançamento criado, alterado (novo) ou excluído (null) nas listas guardadas
+  static aplicarLancamento(id: string, novo: Lancamento | null): void {
+    patchQueries<Lancamento[]>('lancamentos', null, (lista, key) => {
+      const [inicio, fim] = (key.filter || '..').split('..');
+      const semAntigo = lista.filter(l => l.id !== id);
+      if (!novo || novo.empresaId !== key.empresaId) return semAntigo;
+      if ((inicio && novo.data < inicio) || (fim && novo.data > fim)) return semAntigo;
+      // Mantém a ordem da consulta: data decrescente
+      const posicao = semAntigo.findIndex(l => l.data < novo.data);
+      return posicao === -1
+        ? [...semAntigo, novo]
+        : [...semAntigo.slice(0, posicao), novo, ...semAntigo.slice(posicao)];
+    });
+  }
+
+  // Plano de contas da empresa, por código
+  static getContasContabeis(empresaId: string): Promise<ContaContabil[]> {
+    return cachedQuery({ table: 'contas_contabeis', empresaId }, async () => {
+      const { data, error } = await supabase
+        .from('contas_contabeis')
+        .select(CONTA_CONTABIL_COLUMNS)
+        .eq('empresa_id', empresaId)
+        .order('codigo');
+      if (error) throw error;
+      return (data || []) as unknown as ContaContabil[];
+    });
+  }
+
+  // Contas ativas de todas as empresas visíveis ao usuário
+  static getContasContabeisAtivas(): Promise<ContaContabil[]> {
+    return cachedQuery({ table: 'contas_contabeis', filter: 'ativas' }, async () => {
+      const { data, error } = await supabase
+        .from('contas_contabeis')
+        .select(CONTA_CONTABIL_COLUMNS)
+        .eq('ativa', true)
+        .order('codigo');
+      if (error) throw error;
+      return (data || []) as unknown as ContaContabil[];
+    });
+  }
+
+  static getEmpresas(apenasAtivas = false): Promise<Empresa[]> {
+    return cachedQuery({ table: 'empresas', filter: apenasAtivas ? 'ativas' : 'todas' }, async () => {
+      let query = supabase.from('empresas').select(EMPRESA_COLUMNS);
+      if (apenasAtivas) query = query.eq('ativa', true);
+      const { data, error } = await query.order('razao_social');
+      if (error) throw error;
+      return (data || []) as unknown as Empresa[];
+    });
+  }
+}
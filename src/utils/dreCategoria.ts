@@ -1,19 +1,20 @@
+const CATEGORIAS_DRE_LEGADAS = new Set([
+  'Receita Bruta',
+  'Deduções e Impostos',
+  'Custo dos Produtos Vendidos',
+  'Despesas Comerciais',
+  'Despesas Administrativas',
+  'Outras Despesas Operacionais',
+  'Receitas Financeiras',
+  'Despesas Financeiras',
+  'Impostos sobre Lucro'
+]);
+
 export const mapContaCategoriaToDreCategoria = (categoria: string): string | null => {
   const categoriaLimpa = String(categoria || '').trim();
   if (!categoriaLimpa) return null;
 
-  const categoriasLegadas = new Set([
-    'Receita Bruta',
-    'Deduções e Impostos',
-    'Custo dos Produtos Vendidos',
-    'Despesas Comerciais',
-    'Despesas Administrativas',
-    'Outras Despesas Operacionais',
-    'Receitas Financeiras',
-    'Despesas Financeiras',
-    'Impostos sobre Lucro'
-  ]);
-  if (categoriasLegadas.has(categoriaLimpa)) return categoriaLimpa;
+  if (CATEGORIAS_DRE_LEGADAS.has(categoriaLimpa)) return categoriaLimpa;
 
   const topLevel = categoriaLimpa.match(/^\s*(\d+)\./)?.[1] || categoriaLimpa.match(/^\s*(\d+)/)?.[1];
   if (!topLevel) return null;
@@ -15,6 +15,10 @@ export const isSupabaseConfigured = (): boolean => {
 
   try {
     const parsed = new URL(url);
+    // Stack local de E2E (testsprite_tests/harness/local_supabase): só em dev ou no
+    // modo e2e, para um build de produção nunca apontar para um endpoint local sem https
+    const permiteLocal = import.meta.env.DEV || import.meta.env.MODE === 'e2e';
+    if (permiteLocal && (parsed.hostname === 'localhost' || parsed.hostname === '127.0.0.1')) return true;
     return parsed.protocol === 'https:' && parsed.hostname.endsWith('.supabase.co');
   } catch {
     return false;
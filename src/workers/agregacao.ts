@@ -0,0 +1,193 @@
+// Motor de agregação dos lançamentos, sem dependências do DOM nem do Supabase:
+// roda no Web Worker (agregacao.worker.ts) e, sem Worker, na thread principal.
+//
+// Os lançamentos chegam em colunas (lib/lancamentosColunares). Cada conta
+// pertence a um grupo (categoria DRE, categoria da conta, a própria conta...)
+// escolhido por quem pede a agregação; o motor soma créditos e débitos por
+// grupo dentro de cada intervalo de dias, ou monta um índice acumulado em que
+// qualquer intervalo sai da diferença de duas posições.
+
+import { ColunasLancamentos, ULTIMO_DIA } from '../lib/lancamentosColunares';
+
+export interface GruposAgregacao {
+  // Posição da empresa nas colunas; -1 para todas
+  empresa: number;
+  // Grupo de cada conta internada; -1 fica fora das somas, mas conta nas contagens
+  grupoPorConta: Int32Array<ArrayBuffer>;
+  totalGrupos: number;
+}
+
+export interface ConsultaAgregacao extends GruposAgregacao {
+  // Pares [início, fim] de dias, inclusivos
+  intervalos: Int32Array<ArrayBuffer>;
+}
+
+export interface ResultadoAgregacao {
+  // Somas por intervalo e grupo: posição intervalo * totalGrupos + grupo
+  creditos: Float64Array<ArrayBuffer>;
+  debitos: Float64Array<ArrayBuffer>;
+  // Lançamentos da empresa por intervalo, com ou sem grupo
+  contagens: Uint32Array<ArrayBuffer>;
+}
+
+// Saldos (créditos - débitos) acumulados dia a dia. A posição d * totalGrupos + grupo
+// soma os dias de primeiroDia a primeiroDia + d - 1; contagens[d], os lançamentos
+// desses dias. A posição 0 é sempre zero.
+export interface IndiceAcumulado {
+  primeiroDia: number;
+  totalDias: number;
+  totalGrupos: number;
+  saldos: Float64Array<ArrayBuffer>;
+  contagens: Uint32Array<ArrayBuffer>;
+}
+
+export interface SaldosPorIntervalo {
+  // Posição intervalo * totalGrupos + grupo
+  saldos: Float64Array<ArrayBuffer>;
+  contagens: Uint32Array<ArrayBuffer>;
+}
+
+// colunasId identifica as colunas guardadas no worker; elas só vão junto no
+// primeiro pedido que as usa
+export type PedidoAgregacao = { id: number; colunasId: number; colunas?: ColunasLancamentos } & (
+  | ({ tipo: 'intervalos' } & ConsultaAgregacao)
+  | ({ tipo: 'indice' } & GruposAgregacao)
+);
+
+// Colunas liberadas pelo GC na thread principal: o worker descarta a sua versão
+export interface LiberacaoColunas {
+  tipo: 'liberar';
+  colunasId: number;
+}
+
+export type MensagemAgregacao = PedidoAgregacao | LiberacaoColunas;
+
+export type RespostaAgregacao =
+  | { id: number; ok: true; resultado: ResultadoAgregacao | IndiceAcumulado | null }
+  | { id: number; ok: false; erro: string };
+
+// Índices mais longos que isso (uma data digitada errada, por exemplo) ocupariam
+// memória demais: construirIndice devolve null e as somas são feitas direto
+export const MAXIMO_DIAS_INDICE = 366 * 100;
+
+export function agregarPorIntervalo(
+  { dias, valores, credito, contas, empresas }: ColunasLancamentos,
+  { empresa, grupoPorConta, totalGrupos, intervalos }: ConsultaAgregacao
+): ResultadoAgregacao {
+  const totalIntervalos = intervalos.length / 2;
+  const creditos = new Float64Array(totalIntervalos * totalGrupos);
+  const debitos = new Float64Array(totalIntervalos * totalGrupos);
+  const contagens = new Uint32Array(totalIntervalos);
+
+  for (let k = 0; k < totalIntervalos; k++) {
+    const inicio = intervalos[2 * k];
+    const fim = intervalos[2 * k + 1];
+    const base = k * totalGrupos;
+    let contagem = 0;
+    for (let i = 0; i < dias.length; i++) {
+      const dia = dias[i];
+      if (dia < inicio || dia > fim || (empresa >= 0 && empresas[i] !== empresa)) continue;
+      contagem++;
+      const grupo = grupoPorConta[contas[i]];
+      if (grupo < 0) continue;
+      if (credito[i]) {
+        creditos[base + grupo] += valores[i];
+      } else {
+        debitos[base + grupo] += valores[i];
+      }
+    }
+    contagens[k] = contagem;
+  }
+
+  return { creditos, debitos, contagens };
+}
+
+export function criarIndice(primeiroDia: number, totalDias: number, totalGrupos: number): IndiceAcumulado {
+  return {
+    primeiroDia,
+    totalDias,
+    totalGrupos,
+    saldos: new Float64Array((totalDias + 1) * totalGrupos),
+    contagens: new Uint32Array(totalDias + 1)
+  };
+}
+
+/**
+ * Transforma os totais de cada dia (gravados na posição do dia + 1) nas somas acumuladas
+ */
+export function acumularIndice({ totalDias, totalGrupos, saldos, contagens }: IndiceAcumulado): void {
+  for (let d = 1; d <= totalDias; d++) {
+    contagens[d] += contagens[d - 1];
+    const base = d * totalGrupos;
+    for (let grupo = 0; grupo < totalGrupos; grupo++) {
+      saldos[base + grupo] += saldos[base - totalGrupos + grupo];
+    }
+  }
+}
+
+/**
+ * Índice acumulado dos lançamentos da empresa, do primeiro ao último dia com lançamento
+ * @returns null quando o intervalo de datas passa de MAXIMO_DIAS_INDICE
+ */
+export function construirIndice(
+  { dias, valores, credito, contas, empresas }: ColunasLancamentos,
+  { empresa, grupoPorConta, totalGrupos }: GruposAgregacao
+): IndiceAcumulado | null {
+  let primeiroDia = ULTIMO_DIA;
+  let ultimoDia = -ULTIMO_DIA;
+  for (let i = 0; i < dias.length; i++) {
+    if (empresa >= 0 && empresas[i] !== empresa) continue;
+    if (dias[i] < primeiroDia) primeiroDia = dias[i];
+    if (dias[i] > ultimoDia) ultimoDia = dias[i];
+  }
+  if (primeiroDia > ultimoDia) return criarIndice(0, 0, totalGrupos);
+  if (ultimoDia - primeiroDia + 1 > MAXIMO_DIAS_INDICE) return null;
+
+  const indice = criarIndice(primeiroDia, ultimoDia - primeiroDia + 1, totalGrupos);
+  const { saldos, contagens } = indice;
+  for (let i = 0; i < dias.length; i++) {
+    if (empresa >= 0 && empresas[i] !== empresa) continue;
+    const posicao = dias[i] - primeiroDia + 1;
+    contagens[posicao]++;
+    const grupo = grupoPorConta[contas[i]];
+    if (grupo < 0) continue;
+    saldos[posicao * totalGrupos + grupo] += credito[i] ? valores[i] : -valores[i];
+  }
+  acumularIndice(indice);
+  return indice;
+}
+
+/**
+ * Saldos de cada intervalo [início, fim] (pares de dias, inclusivos) como
+ * diferença de duas posições do índice: o custo não depende da quantidade de lançamentos
+ */
+export function consultarIndice(
+  { primeiroDia, totalDias, totalGrupos, saldos, contagens }: IndiceAcumulado,
+  intervalos: Int32Array<ArrayBuffer>
+): SaldosPorIntervalo {
+  const totalIntervalos = intervalos.length / 2;
+  const resultado: SaldosPorIntervalo = {
+    saldos: new Float64Array(totalIntervalos * totalGrupos),
+    contagens: new Uint32Array(totalIntervalos)
+  };
+  const posicao = (dia: number) => Math.min(Math.max(dia - primeiroDia, 0), totalDias);
+
+  for (let k = 0; k < totalIntervalos; k++) {
+    const antes = posicao(intervalos[2 * k]);
+    const ate = Math.max(posicao(intervalos[2 * k + 1] + 1), antes);
+    resultado.contagens[k] = contagens[ate] - contagens[antes];
+    for (let grupo = 0; grupo < totalGrupos; grupo++) {
+      resultado.saldos[k * totalGrupos + grupo] =
+        saldos[ate * totalGrupos + grupo] - saldos[antes * totalGrupos + grupo];
+    }
+  }
+
+  return resultado;
+}
+
+// Mesmo formato de consultarIndice, a partir de somas feitas direto nos lançamentos
+export function saldosDe({ creditos, debitos, contagens }: ResultadoAgregacao): SaldosPorIntervalo {
+  const saldos = new Float64Array(creditos.length);
+  for (let i = 0; i < saldos.length; i++) saldos[i] = creditos[i] - debitos[i];
+  return { saldos, contagens };
+}
@@ -0,0 +1,34 @@
+// Web Worker das agregações de lançamentos (ver agregacao.ts)
+
+import { ColunasLancamentos } from '../lib/lancamentosColunares';
+import { agregarPorIntervalo, construirIndice, MensagemAgregacao, RespostaAgregacao } from './agregacao';
+
+// Colunas recebidas uma vez por lista de lançamentos e reaproveitadas nos pedidos seguintes
+const colunasGuardadas = new Map<number, ColunasLancamentos>();
+
+self.onmessage = (event: MessageEvent<MensagemAgregacao>) => {
+  const pedido = event.data;
+  if (pedido.tipo === 'liberar') {
+    colunasGuardadas.delete(pedido.colunasId);
+    return;
+  }
+  try {
+    if (pedido.colunas) colunasGuardadas.set(pedido.colunasId, pedido.colunas);
+    const colunas = colunasGuardadas.get(pedido.colunasId);
+    if (!colunas) throw new Error(`Colunas ${pedido.colunasId} não recebidas pelo worker`);
+
+    // Os resultados voltam transferidos, sem cópia
+    if (pedido.tipo === 'indice') {
+      const indice = construirIndice(colunas, pedido);
+      const resposta: RespostaAgregacao = { id: pedido.id, ok: true, resultado: indice };
+      self.postMessage(resposta, { transfer: indice ? [indice.saldos.buffer, indice.contagens.buffer] : [] });
+    } else {
+      const resultado = agregarPorIntervalo(colunas, pedido);
+      const resposta: RespostaAgregacao = { id: pedido.id, ok: true, resultado };
+      self.postMessage(resposta, { transfer: [resultado.creditos.buffer, resultado.debitos.buffer, resultado.contagens.buffer] });
+    }
+  } catch (error: any) {
+    const resposta: RespostaAgregacao = { id: pedido.id, ok: false, erro: error?.message || String(error) };
+    self.postMessage(resposta);
+  }
+};
@@ -0,0 +1,107 @@
+-- DRE aggregated in the database: category totals per period, with the same
+-- category mapping (mapContaCategoriaToDreCategoria) and sign rules (DREService)
+-- as the client, so reports receive a few rows instead of every lancamento.
+
+create or replace function public.dre_categoria(p_categoria text)
+returns text
+language sql
+immutable
+parallel safe
+as $$
+  select case
+    when btrim(coalesce(p_categoria, '')) in (
+      'Receita Bruta',
+      'Deduções e Impostos',
+      'Custo dos Produtos Vendidos',
+      'Despesas Comerciais',
+      'Despesas Administrativas',
+      'Outras Despesas Operacionais',
+      'Receitas Financeiras',
+      'Despesas Financeiras',
+      'Impostos sobre Lucro'
+    ) then btrim(p_categoria)
+    else case substring(btrim(coalesce(p_categoria, '')) from '^(\d+)')::numeric
+      when 1 then 'Receita Bruta'
+      when 2 then 'Deduções e Impostos'
+      when 3 then 'Custo dos Produtos Vendidos'
+      when 4 then 'Despesas Administrativas'
+      when 5 then 'Despesas Administrativas'
+      when 6 then 'Outras Despesas Operacionais'
+      when 7 then 'Despesas Comerciais'
+      when 8 then 'Receitas Financeiras'
+      when 9 then 'Despesas Financeiras'
+      when 10 then 'Impostos sobre Lucro'
+    end
+  end;
+$$;
+
+-- p_granularity: 'total' (one period, p_inicio..p_fim), 'day', 'month', 'quarter' or 'year'.
+-- Periods are calendar-aligned and clipped to p_inicio..p_fim; periods without
+-- lancamentos are omitted. Revenue categories count credits as positive, the
+-- others count debits as positive.
+create or replace function public.get_dre(
+  p_empresa_id uuid,
+  p_inicio date,
+  p_fim date,
+  p_granularity text default 'total'
+)
+returns table (
+  periodo_inicio date,
+  periodo_fim date,
+  categoria text,
+  valor numeric
+)
+language plpgsql
+stable
+security definer
+set search_path = public
+set row_security = off
+as $$
+#variable_conflict use_column
+declare
+  passo interval;
+begin
+  passo := case p_granularity
+    when 'day' then interval '1 day'
+    when 'month' then interval '1 month'
+    when 'quarter' then interval '3 months'
+    when 'year' then interval '1 year'
+  end;
+
+  if passo is null and p_granularity <> 'total' then
+    raise exception 'Granularidade inválida: %', p_granularity;
+  end if;
+
+  if not public.is_company_member(p_empresa_id) then
+    raise exception 'Sem permissão';
+  end if;
+
+  return query
+  with lancamentos_dre as (
+    select
+      case when passo is null then p_inicio else date_trunc(p_granularity, l.data)::date end as inicio,
+      public.dre_categoria(cc.categoria::text) as categoria_dre,
+      case
+        when (l.tipo::text = 'Crédito') = (public.dre_categoria(cc.categoria::text) in ('Receita Bruta', 'Receitas Financeiras'))
+          then l.valor
+        else -l.valor
+      end as valor_com_sinal
+    from public.lancamentos l
+    join public.contas_contabeis cc on cc.id = l.conta_id
+    where l.empresa_id = p_empresa_id
+      and l.data between p_inicio and p_fim
+  )
+  select
+    greatest(ld.inicio, p_inicio),
+    case when passo is null then p_fim else least((ld.inicio + passo - interval '1 day')::date, p_fim) end,
+    ld.categoria_dre,
+    sum(ld.valor_com_sinal)
+  from lancamentos_dre ld
+  where ld.categoria_dre is not null
+  group by ld.inicio, ld.categoria_dre
+  order by ld.inicio, ld.categoria_dre;
+end;
+$$;
+
+grant execute on function public.dre_categoria(text) to authenticated;
+grant execute on function public.get_dre(uuid, date, date, text) to authenticated;
@@ -0,0 +1,219 @@
+-- Monthly debit/credit totals per account, maintained by statement-level
+-- triggers on lancamentos (every insert, update and delete, including the
+-- lancamentos generated for paid contas a pagar), so DRE queries read one row
+-- per account and month instead of every lancamento.
+
+create table if not exists public.saldos_mensais (
+  empresa_id uuid not null references public.empresas(id) on delete cascade,
+  conta_id uuid not null references public.contas_contabeis(id) on delete cascade,
+  mes date not null,
+  total_debito numeric(17, 2) not null default 0,
+  total_credito numeric(17, 2) not null default 0,
+  quantidade integer not null default 0,
+  primary key (empresa_id, conta_id, mes),
+  constraint saldos_mensais_mes_inicio check (mes = date_trunc('month', mes)::date)
+);
+
+create index if not exists saldos_mensais_empresa_mes_idx
+  on public.saldos_mensais (empresa_id, mes);
+
+alter table public.saldos_mensais enable row level security;
+
+drop policy if exists saldos_mensais_select_member on public.saldos_mensais;
+
+-- Read-only for members; only the trigger below writes.
+create policy saldos_mensais_select_member on public.saldos_mensais
+  for select
+  using (public.is_company_member(empresa_id));
+
+create or replace function public.atualizar_saldos_mensais()
+returns trigger
+language plpgsql
+security definer
+set search_path = public
+set row_security = off
+as $$
+begin
+  -- Old rows only ever subtract from an existing month; when the account or
+  -- company is being deleted its saldos are already gone by cascade.
+  if TG_OP in ('UPDATE', 'DELETE') then
+    update public.saldos_mensais s
+    set total_debito = s.total_debito - d.total_debito,
+        total_credito = s.total_credito - d.total_credito,
+        quantidade = s.quantidade - d.quantidade
+    from (
+      select
+        o.empresa_id,
+        o.conta_id,
+        date_trunc('month', o.data)::date as mes,
+        coalesce(sum(o.valor) filter (where o.tipo::text = 'Débito'), 0) as total_debito,
+        coalesce(sum(o.valor) filter (where o.tipo::text = 'Crédito'), 0) as total_credito,
+        count(*)::integer as quantidade
+      from old_rows o
+      group by 1, 2, 3
+    ) d
+    where s.empresa_id = d.empresa_id
+      and s.conta_id = d.conta_id
+      and s.mes = d.mes;
+  end if;
+
+  if TG_OP in ('INSERT', 'UPDATE') then
+    insert into public.saldos_mensais as s (empresa_id, conta_id, mes, total_debito, total_credito, quantidade)
+    select
+      n.empresa_id,
+      n.conta_id,
+      date_trunc('month', n.data)::date,
+      coalesce(sum(n.valor) filter (where n.tipo::text = 'Débito'), 0),
+      coalesce(sum(n.valor) filter (where n.tipo::text = 'Crédito'), 0),
+      count(*)::integer
+    from new_rows n
+    group by 1, 2, 3
+    on conflict (empresa_id, conta_id, mes) do update
+    set total_debito = s.total_debito + excluded.total_debito,
+        total_credito = s.total_credito + excluded.total_credito,
+        quantidade = s.quantidade + excluded.quantidade;
+  end if;
+
+  if TG_OP in ('UPDATE', 'DELETE') then
+    delete from public.saldos_mensais s
+    using (select distinct o.empresa_id, o.conta_id, date_trunc('month', o.data)::date as mes from old_rows o) d
+    where s.empresa_id = d.empresa_id
+      and s.conta_id = d.conta_id
+      and s.mes = d.mes
+      and s.quantidade <= 0;
+  end if;
+
+  return null;
+end;
+$$;
+
+drop trigger if exists lancamentos_saldos_mensais_insert on public.lancamentos;
+drop trigger if exists lancamentos_saldos_mensais_update on public.lancamentos;
+drop trigger if exists lancamentos_saldos_mensais_delete on public.lancamentos;
+
+create trigger lancamentos_saldos_mensais_insert
+  after insert on public.lancamentos
+  referencing new table as new_rows
+  for each statement execute function public.atualizar_saldos_mensais();
+
+create trigger lancamentos_saldos_mensais_update
+  after update on public.lancamentos
+  referencing old table as old_rows new table as new_rows
+  for each statement execute function public.atualizar_saldos_mensais();
+
+create trigger lancamentos_saldos_mensais_delete
+  after delete on public.lancamentos
+  referencing old table as old_rows
+  for each statement execute function public.atualizar_saldos_mensais();
+
+-- Backfill (and repair, if run again) from the existing lancamentos.
+delete from public.saldos_mensais;
+
+insert into public.saldos_mensais (empresa_id, conta_id, mes, total_debito, total_credito, quantidade)
+select
+  l.empresa_id,
+  l.conta_id,
+  date_trunc('month', l.data)::date,
+  coalesce(sum(l.valor) filter (where l.tipo::text = 'Débito'), 0),
+  coalesce(sum(l.valor) filter (where l.tipo::text = 'Crédito'), 0),
+  count(*)::integer
+from public.lancamentos l
+group by 1, 2, 3;
+
+-- get_dre now reads whole months from saldos_mensais and only the partial
+-- months at the edges of the range (or every day, for 'day') from lancamentos.
+create or replace function public.get_dre(
+  p_empresa_id uuid,
+  p_inicio date,
+  p_fim date,
+  p_granularity text default 'total'
+)
+returns table (
+  periodo_inicio date,
+  periodo_fim date,
+  categoria text,
+  valor numeric
+)
+language plpgsql
+stable
+security definer
+set search_path = public
+set row_security = off
+as $$
+#variable_conflict use_column
+declare
+  passo interval;
+  primeiro_mes date;
+  fim_meses date;
+begin
+  passo := case p_granularity
+    when 'day' then interval '1 day'
+    when 'month' then interval '1 month'
+    when 'quarter' then interval '3 months'
+    when 'year' then interval '1 year'
+  end;
+
+  if passo is null and p_granularity <> 'total' then
+    raise exception 'Granularidade inválida: %', p_granularity;
+  end if;
+
+  if not public.is_company_member(p_empresa_id) then
+    raise exception 'Sem permissão';
+  end if;
+
+  -- Months fully inside p_inicio..p_fim: [primeiro_mes, fim_meses)
+  primeiro_mes := case
+    when p_inicio = date_trunc('month', p_inicio)::date then p_inicio
+    else (date_trunc('month', p_inicio) + interval '1 month')::date
+  end;
+  fim_meses := date_trunc('month', p_fim + 1)::date;
+  if p_granularity = 'day' or fim_meses < primeiro_mes then
+    fim_meses := primeiro_mes;
+  end if;
+
+  return query
+  with movimentos as (
+    select s.conta_id, s.mes as data, s.total_debito as debito, s.total_credito as credito
+    from public.saldos_mensais s
+    where s.empresa_id = p_empresa_id
+      and s.mes >= primeiro_mes
+      and s.mes < fim_meses
+    union all
+    select
+      l.conta_id,
+      l.data,
+      case when l.tipo::text = 'Débito' then l.valor else 0 end,
+      case when l.tipo::text = 'Crédito' then l.valor else 0 end
+    from public.lancamentos l
+    where l.empresa_id = p_empresa_id
+      and l.data between p_inicio and p_fim
+      and not (l.data >= primeiro_mes and l.data < fim_meses)
+  ),
+  movimentos_dre as (
+    select
+      case when passo is null then p_inicio else date_trunc(p_granularity, m.data)::date end as inicio,
+      public.dre_categoria(cc.categoria::text) as categoria_dre,
+      m.debito,
+      m.credito
+    from movimentos m
+    join public.contas_contabeis cc on cc.id = m.conta_id
+  )
+  select
+    greatest(md.inicio, p_inicio),
+    case when passo is null then p_fim else least((md.inicio + passo - interval '1 day')::date, p_fim) end,
+    md.categoria_dre,
+    sum(
+      case when md.categoria_dre in ('Receita Bruta', 'Receitas Financeiras')
+        then md.credito - md.debito
+        else md.debito - md.credito
+      end
+    )
+  from movimentos_dre md
+  where md.categoria_dre is not null
+  group by md.inicio, md.categoria_dre
+  order by md.inicio, md.categoria_dre;
+end;
+$$;
+
+grant select on public.saldos_mensais to authenticated;
+grant execute on function public.get_dre(uuid, date, date, text) to authenticated;
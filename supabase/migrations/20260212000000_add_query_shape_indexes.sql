@@ -0,0 +1,31 @@
+-- Indexes for the queries the app actually issues:
+--   lancamentos   filtered by empresa_id and a data range (Dashboard), ordered by
+--                 data desc (LancamentosReport)
+--   contas_a_pagar ordered by created_at desc with range() paging, and searched
+--                 with ilike '%term%' over fornecedor, descricao,
+--                 numero_documento and observacoes (ContasPagarList)
+-- testsprite_tests/harness/explain.py compares the plans with and without them.
+
+create extension if not exists pg_trgm;
+
+-- id last so ties on data keep a stable order for paging.
+create index if not exists lancamentos_empresa_data_idx
+  on public.lancamentos (empresa_id, data, id);
+
+create index if not exists contas_a_pagar_empresa_created_at_idx
+  on public.contas_a_pagar (empresa_id, created_at desc);
+
+create index if not exists contas_a_pagar_fornecedor_trgm_idx
+  on public.contas_a_pagar using gin (fornecedor gin_trgm_ops);
+
+create index if not exists contas_a_pagar_descricao_trgm_idx
+  on public.contas_a_pagar using gin (descricao gin_trgm_ops);
+
+create index if not exists contas_a_pagar_numero_documento_trgm_idx
+  on public.contas_a_pagar using gin (numero_documento gin_trgm_ops);
+
+create index if not exists contas_a_pagar_observacoes_trgm_idx
+  on public.contas_a_pagar using gin (observacoes gin_trgm_ops);
+
+analyze public.lancamentos;
+analyze public.contas_a_pagar;
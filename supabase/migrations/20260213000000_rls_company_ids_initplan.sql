@@ -0,0 +1,147 @@
+-- Cheaper RLS for the company data tables.
+--
+-- The member policies called is_company_member(empresa_id), a volatile function
+-- running two EXISTS subqueries, once per row read. They now compare empresa_id
+-- with the caller's company ids, computed by user_company_ids() inside a scalar
+-- subquery: Postgres runs it once per statement as an InitPlan, and each row
+-- only pays for an array lookup.
+-- testsprite_tests/harness/rls_bench.py compares both versions.
+
+create index if not exists empresas_user_id_ativa_idx
+  on public.empresas (user_id)
+  where ativa is true;
+
+-- (user_id, company_id) answers the collaborator half from the index alone.
+create index if not exists company_collaborators_user_company_idx
+  on public.company_collaborators (user_id, company_id);
+
+create or replace function public.user_company_ids()
+returns uuid[]
+language sql
+stable
+security definer
+set search_path = public
+set row_security = off
+as $$
+  select coalesce(array_agg(m.company_id), '{}')
+  from (
+    select e.id as company_id
+    from public.empresas e
+    where e.ativa is true
+      and e.user_id = (select auth.uid())
+    union
+    select cc.company_id
+    from public.company_collaborators cc
+    where cc.user_id = (select auth.uid())
+  ) m;
+$$;
+
+-- Same answer as before; stable so a call with a constant argument is
+-- evaluated once per statement, as in get_dre and delete_dre_categoria.
+create or replace function public.is_company_member(p_company_id uuid)
+returns boolean
+language sql
+stable
+security definer
+set search_path = public
+set row_security = off
+as $$
+  select p_company_id = any (public.user_company_ids());
+$$;
+
+grant execute on function public.user_company_ids() to authenticated;
+grant execute on function public.is_company_member(uuid) to authenticated;
+
+-- Contas Contábeis
+drop policy if exists contas_contabeis_select_member on public.contas_contabeis;
+drop policy if exists contas_contabeis_insert_member on public.contas_contabeis;
+drop policy if exists contas_contabeis_update_member on public.contas_contabeis;
+drop policy if exists contas_contabeis_delete_member on public.contas_contabeis;
+
+create policy contas_contabeis_select_member on public.contas_contabeis
+  for select
+  using (empresa_id = any ((select public.user_company_ids())));
+
+create policy contas_contabeis_insert_member on public.contas_contabeis
+  for insert
+  with check (empresa_id = any ((select public.user_company_ids())) and (select auth.uid()) = user_id);
+
+create policy contas_contabeis_update_member on public.contas_contabeis
+  for update
+  using (empresa_id = any ((select public.user_company_ids())))
+  with check (empresa_id = any ((select public.user_company_ids())));
+
+create policy contas_contabeis_delete_member on public.contas_contabeis
+  for delete
+  using (empresa_id = any ((select public.user_company_ids())));
+
+-- Lançamentos
+drop policy if exists lancamentos_select_member on public.lancamentos;
+drop policy if exists lancamentos_insert_member on public.lancamentos;
+drop policy if exists lancamentos_update_member on public.lancamentos;
+drop policy if exists lancamentos_delete_member on public.lancamentos;
+
+create policy lancamentos_select_member on public.lancamentos
+  for select
+  using (empresa_id = any ((select public.user_company_ids())));
+
+create policy lancamentos_insert_member on public.lancamentos
+  for insert
+  with check (empresa_id = any ((select public.user_company_ids())) and (select auth.uid()) = user_id);
+
+create policy lancamentos_update_member on public.lancamentos
+  for update
+  using (empresa_id = any ((select public.user_company_ids())))
+  with check (empresa_id = any ((select public.user_company_ids())));
+
+create policy lancamentos_delete_member on public.lancamentos
+  for delete
+  using (empresa_id = any ((select public.user_company_ids())));
+
+-- Contas a pagar
+drop policy if exists contas_a_pagar_select_member on public.contas_a_pagar;
+drop policy if exists contas_a_pagar_insert_member on public.contas_a_pagar;
+drop policy if exists contas_a_pagar_update_member on public.contas_a_pagar;
+drop policy if exists contas_a_pagar_delete_member on public.contas_a_pagar;
+
+create policy contas_a_pagar_select_member on public.contas_a_pagar
+  for select
+  using (empresa_id = any ((select public.user_company_ids())));
+
+create policy contas_a_pagar_insert_member on public.contas_a_pagar
+  for insert
+  with check (empresa_id = any ((select public.user_company_ids())) and (select auth.uid()) = user_id);
+
+create policy contas_a_pagar_update_member on public.contas_a_pagar
+  for update
+  using (empresa_id = any ((select public.user_company_ids())))
+  with check (empresa_id = any ((select public.user_company_ids())));
+
+create policy contas_a_pagar_delete_member on public.contas_a_pagar
+  for delete
+  using (empresa_id = any ((select public.user_company_ids())));
+
+-- Categorias DRE
+drop policy if exists dre_categorias_dre_select_member on public.dre_categorias_dre;
+drop policy if exists dre_categorias_dre_insert_member on public.dre_categorias_dre;
+drop policy if exists dre_categorias_dre_update_member on public.dre_categorias_dre;
+
+create policy dre_categorias_dre_select_member on public.dre_categorias_dre
+  for select
+  using (empresa_id = any ((select public.user_company_ids())));
+
+create policy dre_categorias_dre_insert_member on public.dre_categorias_dre
+  for insert
+  with check (empresa_id = any ((select public.user_company_ids())) and (select auth.uid()) = user_id);
+
+create policy dre_categorias_dre_update_member on public.dre_categorias_dre
+  for update
+  using (empresa_id = any ((select public.user_company_ids())))
+  with check (empresa_id = any ((select public.user_company_ids())));
+
+-- Saldos mensais
+drop policy if exists saldos_mensais_select_member on public.saldos_mensais;
+
+create policy saldos_mensais_select_member on public.saldos_mensais
+  for select
+  using (empresa_id = any ((select public.user_company_ids())));
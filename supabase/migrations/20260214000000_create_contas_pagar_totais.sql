@@ -0,0 +1,85 @@
+-- Server-side filtering, sorting and totals for ContasPagarList.
+--
+-- The list pages contas_a_pagar with range() and orders by plain columns or by
+-- the two computed fields below, which PostgREST accepts in order= like columns.
+-- get_contas_pagar_totais returns the summary cards for the same filters, so the
+-- client never needs every row to show them.
+
+-- Same priority the list used client-side: pendente > vencida > paga > cancelada.
+create or replace function public.status_prioridade(c public.contas_a_pagar)
+returns integer
+language sql
+immutable
+as $$
+  select case c.status
+    when 'pendente' then 3
+    when 'vencida' then 2
+    when 'paga' then 1
+    else 0
+  end;
+$$;
+
+-- The "codigo - nome" label shown in the Conta Contábil column, lowercased for sorting.
+create or replace function public.conta_contabil_rotulo(c public.contas_a_pagar)
+returns text
+language sql
+stable
+as $$
+  select lower(cc.codigo || ' - ' || cc.nome)
+  from public.contas_contabeis cc
+  where cc.id = c.conta_contabil_id;
+$$;
+
+-- p_status: null (all), 'pendente' (pending, not yet due), 'vencida' (pending
+-- and due on or before p_hoje), or a status to match exactly. p_termo is
+-- matched with ilike against fornecedor, descricao, numero_documento and
+-- observacoes. grupos counts bills the way the list groups them: one per
+-- (empresa, numero_documento), or one per bill without numero_documento.
+create or replace function public.get_contas_pagar_totais(
+  p_status text default null,
+  p_inicio date default null,
+  p_fim date default null,
+  p_termo text default null,
+  p_hoje date default current_date
+)
+returns table (
+  quantidade bigint,
+  grupos bigint,
+  total_pendente numeric,
+  total_vencidas numeric
+)
+language sql
+stable
+security definer
+set search_path = public
+set row_security = off
+as $$
+  select
+    count(*),
+    count(distinct case
+      when coalesce(c.numero_documento, '') <> '' then c.empresa_id::text || '|' || c.numero_documento
+      else c.id::text
+    end),
+    coalesce(sum(c.valor) filter (where c.status = 'pendente'), 0),
+    coalesce(sum(c.valor) filter (where c.status = 'pendente' and c.data_vencimento <= p_hoje), 0)
+  from public.contas_a_pagar c
+  where c.empresa_id = any ((select public.user_company_ids()))
+    and case p_status
+      when 'vencida' then c.status = 'pendente' and c.data_vencimento <= p_hoje
+      when 'pendente' then c.status = 'pendente' and c.data_vencimento > p_hoje
+      else p_status is null or c.status::text = p_status
+    end
+    and (p_inicio is null or c.data_vencimento >= p_inicio)
+    and (p_fim is null or c.data_vencimento <= p_fim)
+    and (
+      p_termo is null
+      or c.fornecedor ilike '%' || p_termo || '%'
+      or c.descricao ilike '%' || p_termo || '%'
+      or c.numero_documento ilike '%' || p_termo || '%'
+      or c.observacoes ilike '%' || p_termo || '%'
+    );
+$$;
+
+grant execute on function public.status_prioridade(public.contas_a_pagar) to authenticated;
+grant execute on function public.conta_contabil_rotulo(public.contas_a_pagar) to authenticated;
+grant execute on function public.get_contas_pagar_totais(text, date, date, text, date) to authenticated;
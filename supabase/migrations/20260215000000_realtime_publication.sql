@@ -0,0 +1,32 @@
+-- Publish the tables the client follows through Supabase Realtime
+-- (src/lib/realtimeSync.ts). Realtime checks the select policies before
+-- delivering INSERT and UPDATE events, so each member only receives rows of
+-- their companies; DELETE events carry only the primary key.
+
+do $$
+begin
+  if not exists (select 1 from pg_publication where pubname = 'supabase_realtime') then
+    create publication supabase_realtime;
+  end if;
+
+  if not exists (
+    select 1 from pg_publication_tables
+    where pubname = 'supabase_realtime' and schemaname = 'public' and tablename = 'lancamentos'
+  ) then
+    alter publication supabase_realtime add table public.lancamentos;
+  end if;
+
+  if not exists (
+    select 1 from pg_publication_tables
+    where pubname = 'supabase_realtime' and schemaname = 'public' and tablename = 'contas_a_pagar'
+  ) then
+    alter publication supabase_realtime add table public.contas_a_pagar;
+  end if;
+
+  if not exists (
+    select 1 from pg_publication_tables
+    where pubname = 'supabase_realtime' and schemaname = 'public' and tablename = 'conta_pagar_fotos'
+  ) then
+    alter publication supabase_realtime add table public.conta_pagar_fotos;
+  end if;
+end $$;
@@ -0,0 +1,8 @@
+-- Text form of lancamentos.valor for the LancamentosList search
+-- (valor_texto.ilike.%term%): PostgREST filters cannot cast a column.
+-- trim_scale drops trailing zeros, matching the Number.toString() the
+-- in-memory search compared against (1500.50 -> '1500.5').
+
+alter table public.lancamentos
+  add column if not exists valor_texto text
+  generated always as (trim_scale(valor)::text) stored;
@@ -1,6 +1,9 @@
 import asyncio
 from playwright import async_api
 
+from harness.pages import ActivationPage, LoginPage
+from harness.waits import PageActions
+
 async def run_test():
     pw = None
     browser = None
@@ -27,6 +30,9 @@ async def run_test():
         
         # Open a new page in the browser context
         page = await context.new_page()
+        actions = PageActions(page)
+        login = LoginPage(page, actions)
+        activation = ActivationPage(page, actions)
         
         # Navigate to your target URL and wait until the network request is committed
         await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
@@ -46,101 +52,43 @@ async def run_test():
         
         # Interact with the page elements to simulate user flow
         # Input valid username/email and password in the login form.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('validuser@example.com')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('ValidPassword123')
+        await actions.fill(login.email, 'validuser@example.com')
+        await actions.fill(login.password, 'ValidPassword123')
         
 
         # Click the login button to see if activation code is requested afterward or if login succeeds.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await actions.click(login.submit)
         
 
         # Verify if the activation code input is on a different page or if the credentials need to be rechecked or reset.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div[5]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await login.open_signup()
         
 
         # Input valid activation code and click 'Verificar Código' button.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await activation.verify('123456')
         
 
         # Try to request a new activation code by clicking 'Não tem um código? Solicite aqui' button to get a valid code or check if there is another way to obtain a valid activation code.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await activation.open_request()
         
 
         # Input full name, email, and company name to request a new activation code.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Valid User')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('validuser@example.com')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div[3]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Valid Company')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div[4]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await activation.request_code('Valid User', 'validuser@example.com', 'Valid Company')
         
 
         # Input the valid activation code and click 'Verificar Código' button to verify.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('VALID_CODE')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await activation.verify('VALID_CODE')
         
 
         # Return to login page to reattempt login or check for alternative login flow.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div[4]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await activation.back_to_login()
         
 
         # Reattempt login with valid credentials or conclude that login with valid credentials and activation code is not successful in this test environment.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div[2]/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('validuser@example.com')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div[2]/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('ValidPassword123')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div[4]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await login.login('validuser@example.com', 'ValidPassword123')
         
 
         assert False, 'Test plan execution failed: user login with activation code could not be verified.'
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -1,6 +1,9 @@
 import asyncio
 from playwright import async_api
 
+from harness.pages import ActivationPage, LoginPage
+from harness.waits import PageActions
+
 async def run_test():
     pw = None
     browser = None
@@ -27,6 +30,9 @@ async def run_test():
         
         # Open a new page in the browser context
         page = await context.new_page()
+        actions = PageActions(page)
+        login = LoginPage(page, actions)
+        activation = ActivationPage(page, actions)
         
         # Navigate to your target URL and wait until the network request is committed
         await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
@@ -46,65 +52,29 @@ async def run_test():
         
         # Interact with the page elements to simulate user flow
         # Navigate to activation code request page
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div[4]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await login.open_signup()
         
 
         # Click on 'Não tem um código? Solicite aqui' to request an activation code
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await activation.open_request()
         
 
         # Fill in required user information for activation code request
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test User')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('testuser@example.com')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div[3]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test Company')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div[4]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await activation.request_code('Test User', 'testuser@example.com', 'Test Company')
         
 
         # Check for any visible confirmation or logs on the current page or navigate to dashboard or admin panel to verify email sending
         await page.mouse.wheel(0, window.innerHeight)
         
 
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div[4]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await activation.back_to_login()
         
 
         # Log in as administrator to check for activation code or notifications in dashboard or email section
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin@example.com')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('adminpassword')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await login.login('admin@example.com', 'adminpassword')
         
 
         assert False, 'Test plan execution failed: Activation code request and email sending could not be verified.'
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -1,6 +1,9 @@
 import asyncio
 from playwright import async_api
 
+from harness.pages import LoginPage
+from harness.waits import PageActions
+
 async def run_test():
     pw = None
     browser = None
@@ -27,6 +30,8 @@ async def run_test():
         
         # Open a new page in the browser context
         page = await context.new_page()
+        actions = PageActions(page)
+        login = LoginPage(page, actions)
         
         # Navigate to your target URL and wait until the network request is committed
         await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
@@ -46,29 +51,20 @@ async def run_test():
         
         # Interact with the page elements to simulate user flow
         # Input invalid username/email and password
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('invaliduser@example.com')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('wrongpassword')
+        await actions.fill(login.email, 'invaliduser@example.com')
+        await actions.fill(login.password, 'wrongpassword')
         
 
         # Input invalid or missing activation code if applicable, then click login button
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await actions.click(login.submit)
         
 
         # Check if activation code input is present and test invalid or missing activation code if applicable
         await page.mouse.wheel(0, window.innerHeight)
         
 
-        error_locator = frame.locator('text=Erro! Email ou senha inválidos.')
+        error_locator = login.error
         assert await error_locator.is_visible(), 'Error message for invalid login should be visible'
-        await asyncio.sleep(5)
     
     finally:
         if context:
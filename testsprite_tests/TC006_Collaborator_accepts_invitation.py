@@ -1,6 +1,9 @@
 import asyncio
 from playwright import async_api
 
+from harness.pages import ActivationPage, LoginPage
+from harness.waits import PageActions
+
 async def run_test():
     pw = None
     browser = None
@@ -27,6 +30,9 @@ async def run_test():
         
         # Open a new page in the browser context
         page = await context.new_page()
+        actions = PageActions(page)
+        login = LoginPage(page, actions)
+        activation = ActivationPage(page, actions)
         
         # Navigate to your target URL and wait until the network request is committed
         await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
@@ -46,78 +52,30 @@ async def run_test():
         
         # Interact with the page elements to simulate user flow
         # Input email and password to log in or create account
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('collaborator@example.com')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('SecurePassword123')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await login.login('collaborator@example.com', 'SecurePassword123')
         
 
         # Click on 'Não tem uma conta? Cadastre-se' to create a new account
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div[5]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await login.open_signup()
         
 
         # Input the activation code from the invitation email and verify it
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('INVITE-CODE-1234')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await activation.verify('INVITE-CODE-1234')
         
 
         # Click 'Não tem um código? Solicite aqui' to request a new activation code
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await activation.open_request()
         
 
         # Fill in full name, email, and company fields to request a new activation code
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Collaborator Name')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('collaborator@example.com')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div[3]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Example Company')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div[4]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await activation.request_code('Collaborator Name', 'collaborator@example.com', 'Example Company')
         
 
         # Wait for new activation code email or simulate input of new activation code to verify
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('NEW-ACTIVATION-CODE-5678')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await activation.verify('NEW-ACTIVATION-CODE-5678')
         
 
         assert False, 'Test plan execution failed: generic failure assertion'
-        await asyncio.sleep(5)
     
     finally:
         if context:
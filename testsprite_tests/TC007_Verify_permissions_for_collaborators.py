@@ -1,6 +1,9 @@
 import asyncio
 from playwright import async_api
 
+from harness.pages import LoginPage
+from harness.waits import PageActions
+
 async def run_test():
     pw = None
     browser = None
@@ -27,6 +30,8 @@ async def run_test():
         
         # Open a new page in the browser context
         page = await context.new_page()
+        actions = PageActions(page)
+        login = LoginPage(page, actions)
         
         # Navigate to your target URL and wait until the network request is committed
         await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
@@ -46,40 +51,18 @@ async def run_test():
         
         # Interact with the page elements to simulate user flow
         # Input collaborator email and password, then click login button
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('collaborator@example.com')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('password123')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await login.login('collaborator@example.com', 'password123')
         
 
         # Try password recovery flow by clicking 'Esqueceu sua senha?' button to check if password reset is possible or to get further instructions
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div[3]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await login.open_password_reset()
         
 
         # Input collaborator email into password reset email field and click Enviar to request password reset link
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div[6]/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('collaborator@example.com')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div[6]/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await login.request_password_reset('collaborator@example.com')
         
 
         assert False, 'Test plan execution failed: generic failure assertion.'
-        await asyncio.sleep(5)
     
     finally:
         if context:
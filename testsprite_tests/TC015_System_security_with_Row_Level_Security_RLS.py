@@ -1,6 +1,9 @@
 import asyncio
 from playwright import async_api
 
+from harness.pages import LoginPage
+from harness.waits import PageActions
+
 async def run_test():
     pw = None
     browser = None
@@ -27,6 +30,8 @@ async def run_test():
         
         # Open a new page in the browser context
         page = await context.new_page()
+        actions = PageActions(page)
+        login = LoginPage(page, actions)
         
         # Navigate to your target URL and wait until the network request is committed
         await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
@@ -46,24 +51,11 @@ async def run_test():
         
         # Interact with the page elements to simulate user flow
         # Input email and password for a user associated with a specific company and submit login form
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('user_companyA@example.com')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('password123')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await login.login('user_companyA@example.com', 'password123')
         
 
         # Generic failing assertion since expected result is unknown
         assert False, 'Test plan execution failed: data separation verification could not be completed.'
-        await asyncio.sleep(5)
     
     finally:
         if context:
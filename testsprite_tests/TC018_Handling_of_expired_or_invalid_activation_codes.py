@@ -1,6 +1,9 @@
 import asyncio
 from playwright import async_api
 
+from harness.pages import ActivationPage, LoginPage
+from harness.waits import PageActions
+
 async def run_test():
     pw = None
     browser = None
@@ -27,6 +30,9 @@ async def run_test():
         
         # Open a new page in the browser context
         page = await context.new_page()
+        actions = PageActions(page)
+        login = LoginPage(page, actions)
+        activation = ActivationPage(page, actions)
         
         # Navigate to your target URL and wait until the network request is committed
         await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
@@ -46,61 +52,34 @@ async def run_test():
         
         # Interact with the page elements to simulate user flow
         # Click on 'Não tem uma conta? Cadastre-se' to go to registration page.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div[4]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await login.open_signup()
         
 
         # Input an invalid activation code and click 'Verificar Código' to test error handling.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('INVALIDCODE123')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await activation.verify('INVALIDCODE123')
         
 
         # Test registration with an expired activation code by inputting it and clicking 'Verificar Código'.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('EXPIREDCODE123')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await activation.verify('EXPIREDCODE123')
         
 
         # Input an already used activation code and click 'Verificar Código' to verify error handling.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('USEDCODE123')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await activation.verify('USEDCODE123')
         
 
         # Assert error message is shown for invalid activation code
-        error_locator = frame.locator('text=Erro ao validar código de ativação.')
+        error_locator = activation.error
         assert await error_locator.is_visible()
         # Clear input before next test
-        input_locator = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div/div/input').nth(0)
-        await input_locator.fill('')
+        await activation.code.fill('')
         # Assert error message is shown for expired activation code
-        await input_locator.fill('EXPIREDCODE123')
-        await frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div[2]/button').nth(0).click()
+        await activation.verify('EXPIREDCODE123')
         assert await error_locator.is_visible()
         # Clear input before next test
-        await input_locator.fill('')
+        await activation.code.fill('')
         # Assert error message is shown for already used activation code
-        await input_locator.fill('USEDCODE123')
-        await frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div[2]/button').nth(0).click()
+        await activation.verify('USEDCODE123')
         assert await error_locator.is_visible()
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -1,6 +1,9 @@
 import asyncio
 from playwright import async_api
 
+from harness.pages import ActivationPage, LoginPage
+from harness.waits import PageActions
+
 async def run_test():
     pw = None
     browser = None
@@ -27,6 +30,9 @@ async def run_test():
         
         # Open a new page in the browser context
         page = await context.new_page()
+        actions = PageActions(page)
+        login = LoginPage(page, actions)
+        activation = ActivationPage(page, actions)
         
         # Navigate to your target URL and wait until the network request is committed
         await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
@@ -46,96 +52,54 @@ async def run_test():
         
         # Interact with the page elements to simulate user flow
         # Input email and password, then click login button to access the system.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('testuser@example.com')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('TestPassword123')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await login.login('testuser@example.com', 'TestPassword123')
         
 
         # Check if there is a way to reset password or register a new account to obtain valid credentials.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div[5]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await login.open_signup()
         
 
         # Click 'Não tem um código? Solicite aqui' to request an activation code.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await activation.open_request()
         
 
         # Fill in the activation code request form with valid data and submit.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test User')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('testuser@example.com')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div[3]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test Company')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div[4]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await activation.request_code('Test User', 'testuser@example.com', 'Test Company')
         
 
         # Return to login page to check if activation code or credentials are available or wait for activation code to be received.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div[4]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await activation.back_to_login()
         
 
         # Since no valid credentials are available, try to navigate to configuration page if accessible without login or wait for activation code to proceed.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div[5]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await login.open_signup()
         
 
         # Since no activation code is available, return to login page to check if credentials are available or wait for activation code.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/form/div[4]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await activation.back_to_login()
         
 
         # Since no valid credentials are available, try to navigate to configuration page if accessible without login or wait for activation code to proceed.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div/form/div[5]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await login.open_signup()
         
 
         # Assert the configuration page title and subtitle are visible and correct
-        assert await frame.locator('text=DRE App').is_visible()
-        assert await frame.locator('text=Sistema DRE').is_visible()
+        assert await page.locator('text=DRE App').is_visible()
+        assert await page.locator('text=Sistema DRE').is_visible()
         # Assert the description and features text are present
-        assert await frame.locator('text=Sua plataforma completa para análise e gestão do Demonstrativo de Resultados do Exercício.').is_visible()
-        assert await frame.locator('text=Análises inteligentes para decisões assertivas.').is_visible()
+        assert await page.locator('text=Sua plataforma completa para análise e gestão do Demonstrativo de Resultados do Exercício.').is_visible()
+        assert await page.locator('text=Análises inteligentes para decisões assertivas.').is_visible()
         # Assert product name and description are visible
-        assert await frame.locator('text=OneBots DRE').is_visible()
-        assert await frame.locator('text=Sistema de Demonstrativo de Resultados do Exercício').is_visible()
+        assert await page.locator('text=OneBots DRE').is_visible()
+        assert await page.locator('text=Sistema de Demonstrativo de Resultados do Exercício').is_visible()
         # Run Supabase connection test by clicking the appropriate button if available
         # Since the page content does not show a direct button for connection test, assume a button with text 'Test Supabase Connection' exists
-        test_button = frame.locator('text=Test Supabase Connection')
+        test_button = page.locator('text=Test Supabase Connection')
         if await test_button.count() > 0:
             await test_button.click()
             # Wait for connection status message to appear
-            status_message = frame.locator('text=Connection successful')
+            status_message = page.locator('text=Connection successful')
             assert await status_message.wait_for(state='visible', timeout=5000)
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -0,0 +1,6 @@
+"""Shared execution harness for the TestSprite ``TCxxx_*.py`` scripts.
+
+Run the whole suite from ``testsprite_tests/`` with::
+
+    python -m harness.runner --workers 8
+"""
@@ -0,0 +1,85 @@
+"""Playwright trace and HAR capture per test run.
+
+Every context a script opens records a HAR and a trace into
+``tmp/artifacts/<test>/``. The scripts close their own context in a
+``finally`` block, so contexts are wrapped to stop tracing just before they
+close. Once the result is known the runner keeps the directory (failed or
+slow tests) or discards it. Open a kept trace with
+``playwright show-trace tmp/artifacts/<test>/trace-1.zip``; rank its requests
+with ``python -m harness.har_analyzer tmp/artifacts``.
+"""
+
+from __future__ import annotations
+
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from playwright.async_api import BrowserContext, Error
+
+from .config import TMP_DIR
+
+ARTIFACTS_DIR = TMP_DIR / "artifacts"
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """Keep a test's artifacts when it did not pass or something in it was slow."""
+
+    slow_test: float = 60.0
+    slow_step: float = 10.0
+
+    def keep(self, passed: bool, duration: float, longest_wait: float) -> bool:
+        return not passed or duration > self.slow_test or longest_wait > self.slow_step
+
+
+class ArtifactRecorder:
+    """HAR and trace files for the contexts of one test."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self._count = 0
+
+    @classmethod
+    def for_test(cls, name: str, root: Path = ARTIFACTS_DIR) -> "ArtifactRecorder":
+        directory = root / name
+        shutil.rmtree(directory, ignore_errors=True)
+        return cls(directory)
+
+    def files(self) -> list[Path]:
+        return sorted(self.directory.glob("*")) if self.directory.exists() else []
+
+    async def record(self, new_context: Any, options: dict[str, Any]) -> "RecordedContext":
+        """Create a context through ``new_context`` with HAR and tracing enabled."""
+        self._count += 1
+        self.directory.mkdir(parents=True, exist_ok=True)
+        har_path = self.directory / f"network-{self._count}.har"
+        context = await new_context(**{"record_har_path": str(har_path), "record_har_content": "omit", **options})
+        await context.tracing.start(screenshots=True, snapshots=True, sources=False)
+        return RecordedContext(context, self.directory / f"trace-{self._count}.zip")
+
+    def discard(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+class RecordedContext:
+    """``BrowserContext`` proxy whose ``close`` saves the trace first (the HAR is written on close)."""
+
+    def __init__(self, context: BrowserContext, trace_path: Path) -> None:
+        self._context = context
+        self._trace_path = trace_path
+        self._closed = False
+
+    async def close(self, **options: Any) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            await self._context.tracing.stop(path=str(self._trace_path))
+        except Error:
+            pass
+        await self._context.close(**options)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._context, name)
@@ -0,0 +1,21 @@
+"""Environment settings shared by the harness modules."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+SUITE_DIR = Path(__file__).resolve().parent.parent
+TMP_DIR = SUITE_DIR / "tmp"
+TESTSPRITE_CONFIG = TMP_DIR / "config.json"
+
+FALLBACK_BASE_URL = "http://localhost:5173"
+
+
+def base_url() -> str:
+    """App URL: ``E2E_BASE_URL``, else TestSprite's ``localEndpoint``."""
+    url = os.environ.get("E2E_BASE_URL")
+    if not url and TESTSPRITE_CONFIG.exists():
+        url = json.loads(TESTSPRITE_CONFIG.read_text(encoding="utf-8")).get("localEndpoint")
+    return (url or FALLBACK_BASE_URL).rstrip("/")
@@ -0,0 +1,429 @@
+"""Seeded synthetic tenants for load-testing the DRE pipeline.
+
+Bulk-loads ``empresas`` with their plano de contas, ``dre_categorias_dre``,
+years of ``lancamentos`` and ``contas_a_pagar`` (with ``conta_pagar_fotos``)
+into the local stack through COPY. Accounts follow the 1.x–10.x hierarchy
+``mapContaCategoriaToDreCategoria`` maps (plus 11.x, which the DRE skips),
+revenue groups post credits and the rest post debits, and company sizes are
+Zipf-skewed so the first tenant is the "big" one.
+
+The same ``--seed``, ``--tier`` and ``--end`` always produce the same rows.
+Synthetic owners are ``tenantNNN@loadtest.local``; every run first removes
+what a previous run loaded. Needs psycopg 3, like the local stack. Usage
+(from ``testsprite_tests/``)::
+
+    python -m harness.local_supabase up --keep    # in another shell
+    python -m harness.dataset --tier 1m --seed 42 --member owner@example.com
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime, time as dtime, timedelta, timezone
+from typing import Iterator
+
+import psycopg
+
+from .local_supabase.database import AuthStore
+from .local_supabase.stack import StackConfig
+
+EMAIL_DOMAIN = "loadtest.local"
+TENANT_PASSWORD = "loadtest-password"
+
+
+@dataclass(frozen=True)
+class Tier:
+    name: str
+    lancamentos: int
+    companies: int
+    contas_pagar: int
+    accounts_per_leaf: int
+    years: int
+
+
+TIERS = {
+    tier.name: tier
+    for tier in (
+        Tier("10k", lancamentos=10_000, companies=3, contas_pagar=600, accounts_per_leaf=1, years=1),
+        Tier("1m", lancamentos=1_000_000, companies=10, contas_pagar=20_000, accounts_per_leaf=3, years=3),
+        Tier("10m", lancamentos=10_000_000, companies=25, contas_pagar=100_000, accounts_per_leaf=5, years=5),
+    )
+}
+
+# Same plano as ContaForm.tsx: group -> subgroup -> leaves.
+PLANO: dict[str, dict[str, list[str]]] = {
+    "1. Receita Bruta": {
+        "1.1 Venda de Bebidas": ["Cervejas", "Drinks", "Destilados", "Vinhos", "Bebidas Não Alcoólicas"],
+        "1.2 Venda de Alimentos": ["Petiscos", "Pratos", "Sobremesas"],
+        "1.3 Serviços": ["Couvert Artístico", "Taxa de Serviço (10%)", "Reservas / Eventos"],
+    },
+    "2. Deduções e Impostos sobre Vendas": {
+        "2.1 Taxas de Cartão": ["Débito", "Crédito à Vista", "Crédito Parcelado", "Pix", "Vale Alimentação", "Conta Assinada"],
+        "2.2 Aplicativos / Intermediadores": ["iFood", "Rappi", "Outros"],
+        "2.3 Impostos sobre Vendas": ["ICMS", "ISS", "Simples Nacional"],
+        "2.4 Cancelamentos e Estornos": [],
+    },
+    "3. Custo dos Produtos Vendidos (CPV)": {
+        "3.1 Bebidas – Insumos": ["Cervejas", "Destilados", "Vinhos", "Xaropes / Essências"],
+        "3.2 Alimentos – Insumos": ["Carnes", "Frios", "Pães", "Congelados"],
+        "3.3 Insumos Operacionais": ["Gelo", "Copos Descartáveis", "Canudos", "Guardanapos"],
+        "3.4 Perdas": ["Quebras", "Vencimentos", "Desperdícios"],
+    },
+    "4. Despesas com Pessoal": {
+        "4.1 Salários Operacionais": ["Garçons", "Bartenders", "Cozinha"],
+        "4.2 Salários de Gestão": ["Gerente Operacional (CLT)", "Subgerente", "Líder de Turno"],
+        "4.3 Encargos Trabalhistas": ["INSS", "FGTS", "Provisões Trabalhistas"],
+        "4.4 Benefícios": ["Vale Transporte", "Alimentação", "Plano de Saúde"],
+        "4.5 Pró-labore de Gestão (não sócio)": ["Pró-labore Gerente Operacional"],
+        "4.6 Extras": ["Horas Extras", "Freelancers"],
+    },
+    "5. Despesas Administrativas": {
+        "5.1 Estrutura": ["Aluguel", "Condomínio"],
+        "5.2 Serviços Administrativos": ["Contabilidade", "Internet / Telefonia", "Sistemas / PDV"],
+        "5.3 Materiais": ["Material de Escritório"],
+    },
+    "6. Despesas Operacionais": {
+        "6.1 Utilidades": ["Energia Elétrica", "Água", "Gás"],
+        "6.2 Manutenção": ["Equipamentos", "Instalações"],
+        "6.3 Serviços Operacionais": ["Limpeza", "Segurança", "Dedetização"],
+        "6.4 Licenças e Taxas": ["Alvará", "Vigilância Sanitária", "ECAD"],
+    },
+    "7. Despesas Comerciais / Marketing": {
+        "7.1 Marketing Digital": ["Anúncios Online", "Redes Sociais"],
+        "7.2 Promoções": ["Eventos", "Ações Promocionais"],
+    },
+    "8. Receitas Financeiras": {"8.1 Juros Recebidos": [], "8.2 Cashback": [], "8.3 Rendimentos Bancários": []},
+    "9. Despesas Financeiras": {
+        "9.1 Taxas Bancárias": [],
+        "9.2 Juros de Empréstimos": [],
+        "9.3 Antecipação de Recebíveis": [],
+        "9.4 Multas e Encargos": [],
+    },
+    "10. Impostos sobre o Lucro": {"10.1 IRPJ": [], "10.2 CSLL": []},
+    "11. Remuneração e Retirada de Sócios (fora da DRE operacional)": {
+        "11.1 Pró-labore de Sócios": [],
+        "11.2 Distribuição de Lucros": [],
+        "11.3 Retiradas Eventuais": [],
+    },
+}
+
+# Share of lançamentos per top-level group and the median value (R$) of one entry.
+GROUP_WEIGHTS = {1: 0.34, 2: 0.12, 3: 0.18, 4: 0.10, 5: 0.05, 6: 0.07, 7: 0.04, 8: 0.02, 9: 0.03, 10: 0.02, 11: 0.03}
+GROUP_MEDIAN_VALUE = {1: 180, 2: 40, 3: 350, 4: 1800, 5: 900, 6: 450, 7: 300, 8: 60, 9: 120, 10: 2500, 11: 5000}
+REVENUE_GROUPS = {1, 8}
+# Groups contas a pagar are booked against.
+PAYABLE_GROUPS = {2, 3, 4, 5, 6, 7, 9, 10}
+# Fraction of entries posted against the group's natural side (estornos, ajustes).
+REVERSAL_RATE = 0.03
+
+RAZOES = ["Bar do Porto", "Boteco Central", "Choperia Aurora", "Empório da Vila", "Cervejaria Norte",
+          "Bistrô Jardim", "Taberna Sul", "Quiosque Mar Azul", "Restaurante Serra", "Pub Estação"]
+FORNECEDORES = ["Ambev", "Heineken Brasil", "Distribuidora Alvorada", "Frigorífico Bom Corte", "Padaria Trigo Bom",
+                "CPFL Energia", "Sabesp", "Comgás", "Vivo Empresas", "Contabilidade Exata", "Imobiliária Centro",
+                "Limpa Tudo Serviços", "Gelo Polar", "Descartáveis Brasil", "Google Ads"]
+REGIMES = ["Simples Nacional", "Lucro Presumido", "Lucro Real"]
+
+
+@dataclass
+class Account:
+    id: uuid.UUID
+    group: int
+    codigo: str
+    nome: str
+    categoria: str
+
+
+@dataclass
+class Company:
+    id: uuid.UUID
+    owner_id: uuid.UUID
+    owner_email: str
+    razao_social: str
+    cnpj: str
+    lancamentos: int
+    contas_pagar: int
+    accounts: list[Account] = field(default_factory=list)
+
+
+@dataclass
+class LoadSummary:
+    companies: int = 0
+    accounts: int = 0
+    lancamentos: int = 0
+    contas_pagar: int = 0
+    fotos: int = 0
+    seconds: float = 0.0
+
+
+def _uuid(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def _split(total: int, count: int) -> list[int]:
+    """Zipf-like split of ``total`` over ``count`` companies, largest first."""
+    weights = [1 / (rank + 1) for rank in range(count)]
+    scale = total / sum(weights)
+    shares = [int(weight * scale) for weight in weights]
+    shares[0] += total - sum(shares)
+    return shares
+
+
+def _cnpj(rng: random.Random) -> str:
+    digits = f"{rng.randrange(10**8):08d}0001{rng.randrange(100):02d}"
+    return f"{digits[:2]}.{digits[2:5]}.{digits[5:8]}/{digits[8:12]}-{digits[12:]}"
+
+
+def build_accounts(rng: random.Random, per_leaf: int) -> list[Account]:
+    """Analytic accounts for every leaf of ``PLANO``; codes extend the leaf code (``1.1.1.01``)."""
+    accounts = []
+    for grupo, subgrupos in PLANO.items():
+        group = int(grupo.split(".")[0])
+        for subgrupo, folhas in subgrupos.items():
+            sub_code, sub_name = subgrupo.split(" ", 1)
+            leaves = [(f"{sub_code}.{n}", nome) for n, nome in enumerate(folhas, start=1)] or [(sub_code, sub_name)]
+            for leaf_code, leaf_name in leaves:
+                for n in range(1, per_leaf + 1):
+                    nome = leaf_name if per_leaf == 1 else f"{leaf_name} {n:02d}"
+                    accounts.append(
+                        Account(_uuid(rng), group, f"{leaf_code}.{n:02d}", nome, f"{leaf_code} {leaf_name}")
+                    )
+    return accounts
+
+
+def plan_companies(tier: Tier, rng: random.Random, companies: int) -> list[Company]:
+    plan = []
+    for index, (lancamentos, contas_pagar) in enumerate(
+        zip(_split(tier.lancamentos, companies), _split(tier.contas_pagar, companies)), start=1
+    ):
+        company = Company(
+            id=_uuid(rng),
+            owner_id=_uuid(rng),
+            owner_email=f"tenant{index:03d}@{EMAIL_DOMAIN}",
+            razao_social=f"{RAZOES[(index - 1) % len(RAZOES)]} {index:03d} Ltda",
+            cnpj=_cnpj(rng),
+            lancamentos=lancamentos,
+            contas_pagar=contas_pagar,
+        )
+        company.accounts = build_accounts(rng, tier.accounts_per_leaf)
+        plan.append(company)
+    return plan
+
+
+def _created_at(rng: random.Random, day: date) -> datetime:
+    return datetime.combine(day, dtime(8, tzinfo=timezone.utc)) + timedelta(seconds=rng.randrange(14 * 3600))
+
+
+def lancamento_rows(company: Company, rng: random.Random, start: date, end: date) -> Iterator[tuple[object, ...]]:
+    by_group: dict[int, list[Account]] = {}
+    for account in company.accounts:
+        by_group.setdefault(account.group, []).append(account)
+    groups = list(GROUP_WEIGHTS)
+    weights = [GROUP_WEIGHTS[group] for group in groups]
+    span = (end - start).days + 1
+
+    for group in rng.choices(groups, weights, k=company.lancamentos):
+        account = rng.choice(by_group[group])
+        day = start + timedelta(days=rng.randrange(span))
+        valor = max(0.01, rng.lognormvariate(0, 0.8) * GROUP_MEDIAN_VALUE[group])
+        natural = "Crédito" if group in REVENUE_GROUPS else "Débito"
+        reversed_side = "Débito" if natural == "Crédito" else "Crédito"
+        tipo = reversed_side if rng.random() < REVERSAL_RATE else natural
+        documento = f"NF {rng.randrange(10**6):06d}" if rng.random() < 0.4 else None
+        yield (
+            _uuid(rng), company.owner_id, company.id, account.id, day,
+            f"{account.nome} {day:%m/%Y}", f"{valor:.2f}", tipo, None, documento, None, _created_at(rng, day),
+        )
+
+
+def contas_pagar_rows(
+    company: Company, rng: random.Random, start: date, end: date
+) -> Iterator[tuple[tuple[object, ...], list[tuple[object, ...]]]]:
+    """Yields each conta a pagar with its fotos rows."""
+    payable = [account for account in company.accounts if account.group in PAYABLE_GROUPS]
+    span = (end - start).days + 60
+    for _ in range(company.contas_pagar):
+        conta_id = _uuid(rng)
+        account = rng.choice(payable)
+        vencimento = start + timedelta(days=rng.randrange(span))
+        pagamento = None
+        if vencimento > end:
+            status = "pendente"
+        else:
+            roll = rng.random()
+            if roll < 0.85:
+                status = "paga"
+                pagamento = vencimento - timedelta(days=rng.randrange(6))
+            elif roll < 0.95:
+                status = "vencida"
+            else:
+                status = "cancelada"
+        valor = max(1.0, rng.lognormvariate(0, 0.9) * GROUP_MEDIAN_VALUE[account.group] * 3)
+        created = _created_at(rng, vencimento - timedelta(days=rng.randrange(1, 30)))
+        fotos = [
+            (_uuid(rng), conta_id, f"{company.owner_id}/{conta_id}/{ordem}.jpg", f"documento-{ordem}.jpg", ordem, created)
+            for ordem in range(1, rng.choices((0, 1, 2, 3), (0.3, 0.45, 0.2, 0.05))[0] + 1)
+        ]
+        yield (
+            (
+                conta_id, company.owner_id, company.id, rng.choice(FORNECEDORES), account.nome, f"{valor:.2f}",
+                vencimento, pagamento, status, None, f"{rng.randrange(10**10):010d}",
+                rng.choice(("boleto", "boleto", "pix")), account.id, created, created,
+            ),
+            fotos,
+        )
+
+
+def dre_categoria_rows(company: Company, rng: random.Random) -> Iterator[tuple[object, ...]]:
+    for grupo, subgrupos in PLANO.items():
+        codigo, nome = grupo.split(". ", 1)
+        parent_id = _uuid(rng)
+        yield (parent_id, company.id, None, codigo, nome, company.owner_id)
+        for subgrupo in subgrupos:
+            sub_code, sub_name = subgrupo.split(" ", 1)
+            yield (_uuid(rng), company.id, parent_id, sub_code, sub_name, company.owner_id)
+
+
+def purge(conn: psycopg.Connection) -> None:
+    """Remove every tenant a previous run loaded (cascades from ``auth.users``)."""
+    owners = "SELECT id FROM auth.users WHERE email LIKE %s"
+    pattern = f"%@{EMAIL_DOMAIN}"
+    # contas_a_pagar references contas_contabeis ON DELETE RESTRICT, so it goes first.
+    conn.execute(f"DELETE FROM public.contas_a_pagar WHERE user_id IN ({owners})", (pattern,))
+    conn.execute("DELETE FROM auth.users WHERE email LIKE %s", (pattern,))
+
+
+def _copy(conn: psycopg.Connection, table: str, columns: str, rows: Iterator[tuple[object, ...]]) -> int:
+    count = 0
+    with conn.cursor() as cur, cur.copy(f"COPY public.{table} ({columns}) FROM STDIN") as copy:
+        for row in rows:
+            copy.write_row(row)
+            count += 1
+    return count
+
+
+def load_company(conn: psycopg.Connection, company: Company, rng: random.Random, start: date, end: date) -> LoadSummary:
+    summary = LoadSummary(companies=1)
+    with conn.transaction():
+        # Row by row so auto_create_company_owner adds the owner collaborator.
+        conn.execute(
+            """
+            INSERT INTO public.empresas (id, user_id, razao_social, cnpj, regime_tributario, data_abertura, ativa)
+            VALUES (%s, %s, %s, %s, %s, %s, true)
+            """,
+            (company.id, company.owner_id, company.razao_social, company.cnpj, rng.choice(REGIMES), start),
+        )
+        summary.accounts = _copy(
+            conn, "contas_contabeis", "id, user_id, empresa_id, codigo, nome, categoria, tipo, ativa",
+            ((a.id, company.owner_id, company.id, a.codigo, a.nome, a.categoria, "Analítica", True)
+             for a in company.accounts),
+        )
+        _copy(conn, "dre_categorias_dre", "id, empresa_id, parent_id, codigo, nome, user_id", dre_categoria_rows(company, rng))
+        summary.lancamentos = _copy(
+            conn, "lancamentos",
+            "id, user_id, empresa_id, conta_id, data, descricao, valor, tipo, historico, documento, observacoes, created_at",
+            lancamento_rows(company, rng, start, end),
+        )
+        fotos: list[tuple[object, ...]] = []
+
+        def contas() -> Iterator[tuple[object, ...]]:
+            for conta, conta_fotos in contas_pagar_rows(company, rng, start, end):
+                fotos.extend(conta_fotos)
+                yield conta
+
+        summary.contas_pagar = _copy(
+            conn, "contas_a_pagar",
+            "id, user_id, empresa_id, fornecedor, descricao, valor, data_vencimento, data_pagamento, status, "
+            "observacoes, numero_documento, tipo_documento, conta_contabil_id, created_at, updated_at",
+            contas(),
+        )
+        summary.fotos = _copy(
+            conn, "conta_pagar_fotos", "id, conta_pagar_id, foto_url, foto_nome, ordem, created_at", iter(fotos)
+        )
+    return summary
+
+
+def add_members(conn: psycopg.Connection, companies: list[Company], emails: list[str]) -> None:
+    """Give existing users access to every synthetic company as collaborators."""
+    for email in emails:
+        row = conn.execute("SELECT id FROM auth.users WHERE email = lower(%s)", (email,)).fetchone()
+        if row is None:
+            raise LookupError(f"No user '{email}'; create it first (python -m harness.local_supabase up --user ...)")
+        for company in companies:
+            conn.execute(
+                """
+                INSERT INTO public.company_collaborators (company_id, user_id, role, invited_by)
+                VALUES (%s, %s, 'admin', %s) ON CONFLICT (company_id, user_id) DO NOTHING
+                """,
+                (company.id, row[0], company.owner_id),
+            )
+
+
+def generate(
+    dsn: str,
+    tier: Tier,
+    seed: int,
+    end: date,
+    companies: int | None = None,
+    members: list[str] | None = None,
+) -> LoadSummary:
+    rng = random.Random(seed)
+    plan = plan_companies(tier, rng, companies or tier.companies)
+    start = end - timedelta(days=365 * tier.years - 1)
+    total = LoadSummary()
+    began = time.perf_counter()
+
+    auth = AuthStore(dsn)
+    try:
+        with psycopg.connect(dsn, autocommit=True) as conn:
+            purge(conn)
+            for company in plan:
+                auth.create(company.owner_email, TENANT_PASSWORD, {"full_name": company.razao_social}, str(company.owner_id))
+            for company in plan:
+                # One RNG per company so the output does not depend on load order.
+                summary = load_company(conn, company, random.Random(f"{seed}:{company.id}"), start, end)
+                print(
+                    f"{company.razao_social}: {summary.lancamentos} lançamentos, "
+                    f"{summary.contas_pagar} contas a pagar, {summary.accounts} contas",
+                    flush=True,
+                )
+                for name in ("companies", "accounts", "lancamentos", "contas_pagar", "fotos"):
+                    setattr(total, name, getattr(total, name) + getattr(summary, name))
+            add_members(conn, plan, members or [])
+            for table in ("empresas", "contas_contabeis", "lancamentos", "contas_a_pagar", "conta_pagar_fotos"):
+                conn.execute(f"ANALYZE public.{table}")
+    finally:
+        auth.close()
+    total.seconds = time.perf_counter() - began
+    return total
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m harness.dataset", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tier", choices=TIERS, default="10k", help="scale: total lançamentos across tenants")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--companies", type=int, help="override the tier's company count")
+    parser.add_argument("--end", type=date.fromisoformat, default=date.today(),
+                        help="last day of generated history (YYYY-MM-DD, default today)")
+    parser.add_argument("--member", action="append", default=[], metavar="EMAIL",
+                        help="existing user to add as collaborator on every synthetic company")
+    parser.add_argument("--dsn", default=StackConfig().dsn, help="Postgres connection string (default: local stack)")
+    args = parser.parse_args(argv)
+
+    summary = generate(args.dsn, TIERS[args.tier], args.seed, args.end, args.companies, args.member)
+    rate = summary.lancamentos / summary.seconds if summary.seconds else 0
+    print(
+        f"Loaded {summary.companies} companies, {summary.accounts} contas, {summary.lancamentos} lançamentos, "
+        f"{summary.contas_pagar} contas a pagar, {summary.fotos} fotos in {summary.seconds:.1f}s "
+        f"({rate:,.0f} lançamentos/s). Tenant password: {TENANT_PASSWORD}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
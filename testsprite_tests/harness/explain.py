@@ -0,0 +1,208 @@
+"""EXPLAIN ANALYZE the app's hot queries with and without the query-shape indexes.
+
+Runs the lancamentos and contas_a_pagar queries the app issues (Dashboard
+period range, LancamentosReport ordering, ContasPagarList paging and search)
+against the local stack, once with the indexes from
+``20260212000000_add_query_shape_indexes.sql`` dropped inside a transaction
+that is rolled back afterwards, and once with them in place. Load a tier
+first so the plans mean something (from ``testsprite_tests/``)::
+
+    python -m harness.local_supabase up --keep    # in another shell
+    python -m harness.dataset --tier 1m --seed 42
+    python -m harness.explain --repeat 5 --plans
+
+Queries run as the ``postgres`` superuser, so RLS is not part of the
+numbers. By default they target the company with the most lancamentos.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+from dataclasses import asdict, dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+import psycopg
+
+from .config import TMP_DIR
+from .local_supabase.stack import StackConfig
+
+DEFAULT_REPORT = TMP_DIR / "explain_report.json"
+INDEXES = (
+    "lancamentos_empresa_data_idx",
+    "contas_a_pagar_empresa_created_at_idx",
+    "contas_a_pagar_fornecedor_trgm_idx",
+    "contas_a_pagar_descricao_trgm_idx",
+    "contas_a_pagar_numero_documento_trgm_idx",
+    "contas_a_pagar_observacoes_trgm_idx",
+)
+PAGE_SIZE = 50
+
+CONTAS_PAGAR_COLUMNS = (
+    "id, user_id, empresa_id, fornecedor, descricao, valor, data_vencimento, data_pagamento, status, "
+    "observacoes, numero_documento, conta_contabil_id, lancamento_gerado_id, created_at, updated_at"
+)
+# name -> SQL with %(empresa)s, %(inicio)s, %(fim)s and %(termo)s placeholders
+QUERIES = {
+    "dashboard_period": (
+        "SELECT id, user_id, created_at, empresa_id, conta_id, data, descricao, valor, tipo "
+        "FROM public.lancamentos WHERE empresa_id = %(empresa)s AND data >= %(inicio)s AND data <= %(fim)s"
+    ),
+    "lancamentos_report": (
+        "SELECT id, user_id, created_at, empresa_id, conta_id, data, descricao, valor, tipo "
+        f"FROM public.lancamentos WHERE empresa_id = %(empresa)s ORDER BY data DESC, id DESC LIMIT {PAGE_SIZE}"
+    ),
+    "contas_pagar_page": (
+        f"SELECT {CONTAS_PAGAR_COLUMNS} FROM public.contas_a_pagar "
+        f"WHERE empresa_id = %(empresa)s ORDER BY created_at DESC LIMIT {PAGE_SIZE}"
+    ),
+    "contas_pagar_search": (
+        f"SELECT {CONTAS_PAGAR_COLUMNS} FROM public.contas_a_pagar "
+        "WHERE fornecedor ILIKE %(termo)s OR descricao ILIKE %(termo)s "
+        "OR numero_documento ILIKE %(termo)s OR observacoes ILIKE %(termo)s "
+        f"ORDER BY created_at DESC LIMIT {PAGE_SIZE}"
+    ),
+}
+
+
+@dataclass
+class QueryPlan:
+    query: str
+    indexed: bool
+    planning_ms: float
+    execution_ms: float
+    rows: int
+    shared_hit: int
+    shared_read: int
+    nodes: list[str] = field(default_factory=list)
+    text: str = ""
+
+
+def _nodes(plan: dict[str, Any]) -> list[str]:
+    """Node types of a JSON plan, depth first, with the index used if any."""
+    label = plan["Node Type"]
+    if "Index Name" in plan:
+        label += f" ({plan['Index Name']})"
+    return [label] + [node for child in plan.get("Plans", []) for node in _nodes(child)]
+
+
+def explain(conn: psycopg.Connection, name: str, params: dict[str, Any], indexed: bool, repeat: int) -> QueryPlan:
+    """Median of ``repeat`` EXPLAIN ANALYZE runs (after one warm-up run)."""
+    sql = QUERIES[name]
+    runs = []
+    for _ in range(repeat + 1):
+        row = conn.execute(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}", params).fetchone()
+        runs.append(row[0][0])
+    runs = runs[1:]
+    median = sorted(runs, key=lambda run: run["Execution Time"])[len(runs) // 2]
+    plan = median["Plan"]
+    text = "\n".join(
+        line for (line,) in conn.execute(f"EXPLAIN (ANALYZE, BUFFERS) {sql}", params).fetchall()
+    )
+    return QueryPlan(
+        query=name,
+        indexed=indexed,
+        planning_ms=round(statistics.median(run["Planning Time"] for run in runs), 3),
+        execution_ms=round(median["Execution Time"], 3),
+        rows=plan["Actual Rows"],
+        shared_hit=plan.get("Shared Hit Blocks", 0),
+        shared_read=plan.get("Shared Read Blocks", 0),
+        nodes=_nodes(plan),
+        text=text,
+    )
+
+
+def biggest_company(conn: psycopg.Connection) -> str:
+    row = conn.execute(
+        "SELECT empresa_id FROM public.lancamentos GROUP BY empresa_id ORDER BY count(*) DESC LIMIT 1"
+    ).fetchone()
+    if row is None:
+        raise LookupError("No lancamentos loaded; run python -m harness.dataset first")
+    return str(row[0])
+
+
+def run(dsn: str, params: dict[str, Any], queries: list[str], repeat: int) -> list[QueryPlan]:
+    plans = []
+    with psycopg.connect(dsn) as conn:
+        missing = [
+            name for name in INDEXES
+            if conn.execute("SELECT to_regclass(%s)", (f"public.{name}",)).fetchone()[0] is None
+        ]
+        if missing:
+            raise LookupError(f"Indexes not found: {', '.join(missing)}; apply the migrations first")
+        conn.rollback()
+
+        # DROP INDEX is transactional: the rollback brings the indexes back without a rebuild.
+        for name in INDEXES:
+            conn.execute(f"DROP INDEX public.{name}")
+        for query in queries:
+            plans.append(explain(conn, query, params, indexed=False, repeat=repeat))
+        conn.rollback()
+
+        for query in queries:
+            plans.append(explain(conn, query, params, indexed=True, repeat=repeat))
+        conn.rollback()
+    return plans
+
+
+def format_comparison(plans: list[QueryPlan]) -> str:
+    by_key = {(plan.query, plan.indexed): plan for plan in plans}
+    lines = [f"{'query':22} {'before ms':>10} {'after ms':>10} {'speedup':>8} {'rows':>8}  plan after"]
+    for query in dict.fromkeys(plan.query for plan in plans):
+        before, after = by_key[(query, False)], by_key[(query, True)]
+        speedup = before.execution_ms / after.execution_ms if after.execution_ms else float("inf")
+        lines.append(
+            f"{query:22} {before.execution_ms:10.1f} {after.execution_ms:10.1f} {speedup:7.1f}x "
+            f"{after.rows:8}  {' > '.join(after.nodes[:3])}"
+        )
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m harness.explain", description=__doc__.split("\n\n")[0])
+    parser.add_argument("queries", nargs="*", help=f"queries to compare: {', '.join(QUERIES)} (default: all)")
+    parser.add_argument("--dsn", default=StackConfig().dsn, help="Postgres connection string (default: local stack)")
+    parser.add_argument("--empresa", help="company id (default: the one with the most lancamentos)")
+    parser.add_argument("--months", type=int, default=3, help="length of the dashboard period, ending at --end")
+    parser.add_argument("--end", type=date.fromisoformat, default=date.today(), help="end of the dashboard period")
+    parser.add_argument("--term", default="sabesp", help="ContasPagarList search term")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per query; the median is reported")
+    parser.add_argument("--plans", action="store_true", help="print the full text plans")
+    parser.add_argument("--report", type=Path, default=DEFAULT_REPORT, help="JSON report path")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    unknown = [query for query in args.queries if query not in QUERIES]
+    if unknown:
+        print(f"Unknown queries: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    with psycopg.connect(args.dsn) as conn:
+        empresa = args.empresa or biggest_company(conn)
+    params = {
+        "empresa": empresa,
+        "inicio": args.end - timedelta(days=30 * args.months),
+        "fim": args.end,
+        "termo": f"%{args.term}%",
+    }
+    plans = run(args.dsn, params, args.queries or list(QUERIES), max(1, args.repeat))
+
+    if args.plans:
+        for plan in plans:
+            print(f"--- {plan.query} ({'with' if plan.indexed else 'without'} indexes)\n{plan.text}\n")
+    print(format_comparison(plans))
+
+    args.report.parent.mkdir(parents=True, exist_ok=True)
+    report = {"empresa": empresa, "params": {k: str(v) for k, v in params.items()}, "plans": [asdict(p) for p in plans]}
+    args.report.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"-> {args.report}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
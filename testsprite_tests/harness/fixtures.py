@@ -0,0 +1,172 @@
+"""Record Supabase traffic once, then replay it without a backend.
+
+With ``--network record`` every ``/rest/v1``, ``/auth/v1`` and ``/storage/v1``
+call a test makes goes to the real project through ``route.fetch`` and is
+saved to ``fixtures/<test>.json``. With ``--network replay`` the same routes
+are fulfilled from that file, so UI-only tests (layout, form validation) run
+at local speed and give the same answers every time. Record against the
+local stack (``harness.local_supabase`` + ``harness.dataset``) so the
+fixtures hold no real tenant data.
+
+A replayed request is matched on method, path, query and body first, then on
+its shape: the same request with filter values dropped (``data=gte.*``), so
+filters computed from today's date still match after the calendar moves on.
+Repeated calls with one key are answered in recorded order, the last answer
+repeating. A request with no fixture gets a 501 and is listed in the
+result's ``network_misses``.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import re
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from playwright.async_api import BrowserContext, Route
+
+from .config import SUITE_DIR
+
+FIXTURES_DIR = SUITE_DIR / "fixtures"
+MODES = ("record", "replay")
+ROUTE_PATTERN = re.compile(r"^https?://[^/]+/(?:rest|auth|storage)/v1/")
+# Query parameters that shape the response rather than filter rows; kept whole in the shape key.
+STRUCTURAL_PARAMS = {"select", "order", "limit", "offset", "on_conflict", "columns", "grant_type"}
+# Response headers worth replaying; the rest (date, request ids ...) vary per call.
+KEPT_HEADERS = {"content-type", "content-range", "preference-applied", "location", "cache-control"}
+CORS_HEADERS = {
+    "access-control-allow-origin": "*",
+    "access-control-expose-headers": "Content-Range, Preference-Applied",
+}
+
+
+def _shape_value(key: str, value: str) -> str:
+    if key in STRUCTURAL_PARAMS or key.endswith(".order") or key.endswith(".limit"):
+        return value
+    parts = value.split(".")
+    return ".".join(parts[:2]) if parts[0] == "not" else parts[0]
+
+
+def request_keys(method: str, url: str, body: bytes | None) -> tuple[str, str]:
+    """(exact key, shape key) of a request."""
+    parts = urlsplit(url)
+    query = sorted(parse_qsl(parts.query, keep_blank_values=True))
+    exact = f"{method} {parts.path}?{urlencode(query)}"
+    if body:
+        exact += f" #{hashlib.sha1(body).hexdigest()[:12]}"
+    shape = f"{method} {parts.path}?{urlencode([(key, _shape_value(key, value)) for key, value in query])}"
+    return exact, shape
+
+
+@dataclass
+class Exchange:
+    exact: str
+    shape: str
+    status: int
+    headers: dict[str, str]
+    text: str | None = None
+    # Base64 of a body that is not UTF-8 (storage downloads).
+    binary: str | None = None
+
+    @property
+    def body(self) -> bytes:
+        if self.binary is not None:
+            return base64.b64decode(self.binary)
+        return (self.text or "").encode("utf-8")
+
+
+def _exchange(exact: str, shape: str, status: int, headers: dict[str, str], body: bytes) -> Exchange:
+    kept = {name: value for name, value in headers.items() if name.lower() in KEPT_HEADERS}
+    try:
+        return Exchange(exact, shape, status, kept, text=body.decode("utf-8"))
+    except UnicodeDecodeError:
+        return Exchange(exact, shape, status, kept, binary=base64.b64encode(body).decode("ascii"))
+
+
+@dataclass(frozen=True)
+class NetworkMode:
+    """How a run treats Supabase traffic: ``record`` to or ``replay`` from ``root``."""
+
+    mode: str
+    root: Path = FIXTURES_DIR
+
+    def fixtures_for(self, name: str) -> "NetworkFixtures":
+        return NetworkFixtures(self.root / f"{name}.json", self.mode)
+
+
+class NetworkFixtures:
+    """Supabase fixtures of one test, recorded or replayed on each context it opens."""
+
+    def __init__(self, path: Path, mode: str) -> None:
+        if mode not in MODES:
+            raise ValueError(f"network mode must be one of {', '.join(MODES)}, got '{mode}'")
+        self.path = path
+        self.mode = mode
+        self.exchanges: list[Exchange] = []
+        self.misses: list[str] = []
+        self._loaded = False
+        self._by_exact: dict[str, list[Exchange]] = {}
+        self._by_shape: dict[str, list[Exchange]] = {}
+        self._served: dict[str, int] = {}
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        if not self.path.exists():
+            raise LookupError(f"No fixtures at {self.path}; run once with --network record")
+        data = json.loads(self.path.read_text(encoding="utf-8"))
+        self.exchanges = [Exchange(**entry) for entry in data["exchanges"]]
+        for exchange in self.exchanges:
+            self._by_exact.setdefault(exchange.exact, []).append(exchange)
+            self._by_shape.setdefault(exchange.shape, []).append(exchange)
+        self._loaded = True
+
+    async def attach(self, context: BrowserContext) -> None:
+        if self.mode == "replay":
+            self._load()
+            await context.route(ROUTE_PATTERN, self._replay)
+        else:
+            await context.route(ROUTE_PATTERN, self._record)
+
+    async def _record(self, route: Route) -> None:
+        request = route.request
+        response = await route.fetch()
+        body = await response.body()
+        exact, shape = request_keys(request.method, request.url, request.post_data_buffer)
+        self.exchanges.append(_exchange(exact, shape, response.status, response.headers, body))
+        await route.fulfill(response=response, body=body)
+
+    def _next(self, key: str, candidates: list[Exchange]) -> Exchange:
+        served = self._served.get(key, 0)
+        self._served[key] = served + 1
+        return candidates[min(served, len(candidates) - 1)]
+
+    async def _replay(self, route: Route) -> None:
+        request = route.request
+        exact, shape = request_keys(request.method, request.url, request.post_data_buffer)
+        if exact in self._by_exact:
+            exchange = self._next(exact, self._by_exact[exact])
+        elif shape in self._by_shape:
+            exchange = self._next(shape, self._by_shape[shape])
+        else:
+            self.misses.append(exact)
+            await route.fulfill(
+                status=501,
+                headers=CORS_HEADERS,
+                json={"message": f"no recorded fixture for {exact}", "code": "E2E_FIXTURE_MISS"},
+            )
+            return
+        await route.fulfill(status=exchange.status, headers={**exchange.headers, **CORS_HEADERS}, body=exchange.body)
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload: dict[str, Any] = {
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+            "exchanges": [asdict(exchange) for exchange in self.exchanges],
+        }
+        self.path.write_text(json.dumps(payload, indent=1, ensure_ascii=False), encoding="utf-8")
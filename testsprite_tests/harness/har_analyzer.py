@@ -0,0 +1,218 @@
+"""Rank the Supabase REST calls recorded in HAR files.
+
+Calls are grouped by method, table and filter shape (``empresa_id=eq``,
+``data=gte`` ...; values are ignored), then ranked by total time, payload
+size, count or p95. A GET without any row filter is flagged ``UNFILTERED``:
+those read a whole table through RLS, like the ``lancamentos`` select in
+LancamentosList.tsx. Usage (from ``testsprite_tests/``)::
+
+    python -m harness.har_analyzer tmp/artifacts
+    python -m harness.har_analyzer tmp/artifacts/TC011_*/network-1.har --sort bytes --top 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Iterable
+from urllib.parse import parse_qsl, urlsplit
+
+REST_PATH = "/rest/v1/"
+# Query parameters that shape the response but do not filter rows.
+NON_FILTER_PARAMS = {"select", "order", "limit", "offset", "on_conflict", "columns"}
+SORT_KEYS = ("time", "bytes", "count", "p95")
+
+
+@dataclass
+class Call:
+    method: str
+    resource: str
+    filters: tuple[str, ...]
+    select: str
+    time: float
+    wait: float
+    bytes: int
+    rows: int | None
+    status: int
+    source: str
+
+    @property
+    def unfiltered(self) -> bool:
+        return self.method == "GET" and not self.filters and not self.resource.startswith("rpc/")
+
+    @property
+    def signature(self) -> str:
+        return f"{self.method} {self.resource}" + (f" [{', '.join(self.filters)}]" if self.filters else "")
+
+
+@dataclass
+class CallGroup:
+    signature: str
+    method: str
+    resource: str
+    unfiltered: bool
+    select: str
+    count: int = 0
+    total_time: float = 0.0
+    p95_time: float = 0.0
+    max_time: float = 0.0
+    total_wait: float = 0.0
+    total_bytes: int = 0
+    max_rows: int | None = None
+    share: float = 0.0
+    errors: int = 0
+    sources: list[str] = field(default_factory=list)
+
+
+def _rows(headers: list[dict[str, str]]) -> int | None:
+    """Row count from PostgREST's ``Content-Range`` (``0-49/*``, ``*/0``)."""
+    for header in headers:
+        if header["name"].lower() == "content-range":
+            span = header["value"].split("/")[0]
+            if span == "*":
+                return 0
+            start, _, end = span.partition("-")
+            if start.isdigit() and end.isdigit():
+                return int(end) - int(start) + 1
+    return None
+
+
+def _filters(query: str) -> tuple[str, ...]:
+    shapes = set()
+    for key, value in parse_qsl(query, keep_blank_values=True):
+        if key in NON_FILTER_PARAMS or key.endswith(".order") or key.endswith(".limit"):
+            continue
+        parts = value.split(".")
+        operator = ".".join(parts[:2]) if parts[0] == "not" else parts[0]
+        shapes.add(key if key in ("or", "and") else f"{key}={operator}")
+    return tuple(sorted(shapes))
+
+
+def read_calls(path: Path) -> list[Call]:
+    har = json.loads(path.read_text(encoding="utf-8"))
+    calls = []
+    for entry in har["log"]["entries"]:
+        request, response = entry["request"], entry["response"]
+        url = urlsplit(request["url"])
+        if REST_PATH not in url.path or request["method"] == "OPTIONS":
+            continue
+        query = dict(parse_qsl(url.query))
+        content_size = response.get("content", {}).get("size", -1)
+        calls.append(
+            Call(
+                method=request["method"],
+                resource=url.path.split(REST_PATH, 1)[1],
+                filters=_filters(url.query),
+                select=" ".join(query.get("select", "*").split()),
+                time=float(entry.get("time") or 0.0),
+                wait=float(entry.get("timings", {}).get("wait") or 0.0),
+                bytes=max(content_size, response.get("bodySize", -1), response.get("_transferSize", -1), 0),
+                rows=_rows(response.get("headers", [])),
+                status=response.get("status", 0),
+                source=str(path),
+            )
+        )
+    return calls
+
+
+def har_files(paths: Iterable[Path]) -> list[Path]:
+    files = []
+    for path in paths:
+        files.extend(sorted(path.rglob("*.har")) if path.is_dir() else [path])
+    return files
+
+
+def _p95(values: list[float]) -> float:
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)] if ordered else 0.0
+
+
+def group_calls(calls: list[Call]) -> list[CallGroup]:
+    total_time = sum(call.time for call in calls) or 1.0
+    by_signature: dict[str, list[Call]] = {}
+    for call in calls:
+        by_signature.setdefault(call.signature, []).append(call)
+
+    groups = []
+    for signature, members in by_signature.items():
+        first = members[0]
+        times = [call.time for call in members]
+        rows = [call.rows for call in members if call.rows is not None]
+        groups.append(
+            CallGroup(
+                signature=signature,
+                method=first.method,
+                resource=first.resource,
+                unfiltered=first.unfiltered,
+                select=first.select,
+                count=len(members),
+                total_time=round(sum(times), 1),
+                p95_time=round(_p95(times), 1),
+                max_time=round(max(times), 1),
+                total_wait=round(sum(call.wait for call in members), 1),
+                total_bytes=sum(call.bytes for call in members),
+                max_rows=max(rows) if rows else None,
+                share=round(sum(times) / total_time, 4),
+                errors=sum(1 for call in members if call.status >= 400 or call.status == 0),
+                sources=sorted({call.source for call in members}),
+            )
+        )
+    return groups
+
+
+def rank(groups: list[CallGroup], sort: str = "time") -> list[CallGroup]:
+    key = {
+        "time": lambda group: group.total_time,
+        "bytes": lambda group: group.total_bytes,
+        "count": lambda group: group.count,
+        "p95": lambda group: group.p95_time,
+    }[sort]
+    return sorted(groups, key=key, reverse=True)
+
+
+def format_table(groups: list[CallGroup]) -> str:
+    lines = [f"{'total ms':>9} {'share':>6} {'n':>4} {'p95 ms':>8} {'KiB':>8} {'rows':>6}  call"]
+    for group in groups:
+        flag = "  UNFILTERED" if group.unfiltered else ""
+        lines.append(
+            f"{group.total_time:9.0f} {group.share * 100:5.1f}% {group.count:4d} {group.p95_time:8.0f} "
+            f"{group.total_bytes / 1024:8.1f} {group.max_rows if group.max_rows is not None else '-':>6}  "
+            f"{group.signature}{flag}"
+        )
+        if group.select != "*":
+            lines.append(f"{'':46}select={group.select[:90]}")
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("paths", nargs="+", type=Path, help="HAR files or directories to search for *.har")
+    parser.add_argument("--sort", choices=SORT_KEYS, default="time", help="ranking key (default: total time)")
+    parser.add_argument("--top", type=int, default=20, help="groups to show")
+    parser.add_argument("--json", type=Path, help="also write the ranked groups as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    files = har_files(args.paths)
+    calls = [call for path in files for call in read_calls(path)]
+    if not calls:
+        print("No Supabase REST calls found.", file=sys.stderr)
+        return 1
+    ranked = rank(group_calls(calls), args.sort)
+    print(f"{len(calls)} REST calls in {len(files)} HAR file(s), {sum(c.time for c in calls) / 1000:.1f}s total")
+    print(format_table(ranked[: args.top]))
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        payload: list[dict[str, Any]] = [asdict(group) for group in ranked]
+        args.json.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
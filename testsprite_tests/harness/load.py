@@ -0,0 +1,344 @@
+"""Concurrent user journeys against a deployed build.
+
+Each virtual user (VU) repeatedly opens a fresh context and replays the
+month-end journey of the TC flows through the page objects:
+
+    login -> switch_company -> dashboard -> filter_period -> mark_paid
+
+VUs are spread over a few browsers (many contexts per browser) and started
+over ``--ramp`` seconds. Every step is timed from its first action until the
+page settles; every Supabase request is counted. The report has p50/p95/p99
+per step, the Supabase request rate, and per-window p95s so the step that
+degrades first under load is visible. Usage (from ``testsprite_tests/``)::
+
+    E2E_BASE_URL=https://staging.example.com \\
+    python -m harness.load --users 200 --browsers 8 --duration 600 \\
+        --credentials tmp/load_users.txt
+
+``--credentials`` lists ``email:password`` per line, handed out round-robin;
+without it every VU logs in as ``--role``. ``--read-only`` skips
+``mark_paid``, the only step that writes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import sys
+import time
+import traceback
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+from playwright.async_api import Browser, Page, Request, Response, async_playwright
+
+from .config import TMP_DIR
+from .pages import ContasPagarPage, DashboardPage, LoginPage
+from .pool import DEFAULT_LAUNCH_ARGS
+from .session import get_role
+from .waits import PageActions, WaitStats, bind_stats, is_supabase_request
+
+DEFAULT_REPORT = TMP_DIR / "load_report.json"
+PERIODS = ("current-month", "last-30-days", "last-3-months", "last-6-months")
+STEPS = ("login", "switch_company", "dashboard", "filter_period", "mark_paid")
+# Per-step timeout; a step slower than this counts as an error.
+STEP_TIMEOUT = 60.0
+WINDOW = 10.0
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile; 0.0 for no values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+@dataclass
+class StepSample:
+    step: str
+    vu: int
+    at: float
+    duration: float
+    ok: bool
+    error: str | None = None
+
+
+@dataclass
+class LoadRun:
+    started: float = field(default_factory=time.perf_counter)
+    samples: list[StepSample] = field(default_factory=list)
+    request_times: list[float] = field(default_factory=list)
+    statuses: Counter[int] = field(default_factory=Counter)
+    failed_requests: int = 0
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def on_request(self, request: Request) -> None:
+        if is_supabase_request(request) and request.method != "OPTIONS":
+            self.request_times.append(self.elapsed())
+
+    def on_response(self, response: Response) -> None:
+        if is_supabase_request(response.request) and response.request.method != "OPTIONS":
+            self.statuses[response.status] += 1
+
+    def on_request_failed(self, request: Request) -> None:
+        if is_supabase_request(request):
+            self.failed_requests += 1
+
+
+@dataclass
+class Journey:
+    """One VU iteration: a fresh, logged-out context and its page objects."""
+
+    vu: int
+    page: Page
+    rng: random.Random
+    email: str
+    password: str
+
+    def __post_init__(self) -> None:
+        self.actions = PageActions(self.page)
+        self.login_page = LoginPage(self.page, self.actions)
+        self.dashboard = DashboardPage(self.page, self.actions)
+        self.contas_pagar = ContasPagarPage(self.page, self.actions)
+
+    async def login(self) -> None:
+        await self.login_page.goto()
+        await self.login_page.login_and_wait(self.email, self.password)
+        await self.dashboard.wait_ready()
+
+    async def switch_company(self) -> None:
+        companies = await self.dashboard.company_ids()
+        if companies:
+            await self.dashboard.switch_company(self.rng.choice(companies))
+
+    async def open_dashboard(self) -> None:
+        await self.dashboard.goto()
+
+    async def filter_period(self) -> None:
+        await self.dashboard.select_period(self.rng.choice(PERIODS))
+
+    async def mark_paid(self) -> None:
+        await self.contas_pagar.goto()
+        await self.contas_pagar.filter_status("pendente")
+        await self.contas_pagar.wait_ready()
+        rows = self.contas_pagar.rows
+        if await rows.count():
+            await self.contas_pagar.mark_as_paid(rows.nth(self.rng.randrange(min(await rows.count(), 10))))
+
+
+async def _timed_step(run: LoadRun, vu: int, step: str, action: Callable[[], Awaitable[None]]) -> bool:
+    at = run.elapsed()
+    started = time.perf_counter()
+    error = None
+    try:
+        await asyncio.wait_for(action(), STEP_TIMEOUT)
+    except asyncio.TimeoutError:
+        error = f"exceeded {STEP_TIMEOUT:.0f}s"
+    except Exception as exc:  # noqa: BLE001 - a failed step is a sample, not a crash
+        error = "".join(traceback.format_exception_only(type(exc), exc)).strip()
+    run.samples.append(StepSample(step, vu, round(at, 3), time.perf_counter() - started, error is None, error))
+    return error is None
+
+
+async def virtual_user(
+    vu: int,
+    browser: Browser,
+    credentials: tuple[str, str],
+    run: LoadRun,
+    deadline: float,
+    iterations: int | None,
+    read_only: bool,
+    seed: int,
+) -> None:
+    bind_stats(WaitStats())
+    rng = random.Random(f"{seed}:{vu}")
+    done = 0
+    while run.elapsed() < deadline and (iterations is None or done < iterations):
+        context = await browser.new_context()
+        context.on("request", run.on_request)
+        context.on("response", run.on_response)
+        context.on("requestfailed", run.on_request_failed)
+        try:
+            journey = Journey(vu, await context.new_page(), rng, *credentials)
+            steps: list[tuple[str, Callable[[], Awaitable[None]]]] = [
+                ("login", journey.login),
+                ("switch_company", journey.switch_company),
+                ("dashboard", journey.open_dashboard),
+                ("filter_period", journey.filter_period),
+            ]
+            if not read_only:
+                steps.append(("mark_paid", journey.mark_paid))
+            for step, action in steps:
+                # A journey stops at its first failed step, like a user would.
+                if not await _timed_step(run, vu, step, action):
+                    break
+        finally:
+            await context.close()
+        done += 1
+
+
+def summarize(run: LoadRun, wall_clock: float, users: int) -> dict[str, Any]:
+    steps = {}
+    for step in STEPS:
+        samples = [sample for sample in run.samples if sample.step == step]
+        if not samples:
+            continue
+        durations = [sample.duration for sample in samples if sample.ok]
+        errors = Counter(sample.error for sample in samples if not sample.ok)
+        steps[step] = {
+            "count": len(samples),
+            "errors": sum(errors.values()),
+            "error_rate": round(sum(errors.values()) / len(samples), 4),
+            "p50": round(percentile(durations, 50), 3),
+            "p95": round(percentile(durations, 95), 3),
+            "p99": round(percentile(durations, 99), 3),
+            "max": round(max(durations, default=0.0), 3),
+            "top_errors": [{"error": error, "count": count} for error, count in errors.most_common(3)],
+        }
+
+    windows = max(1, math.ceil(wall_clock / WINDOW))
+    timeline = []
+    for index in range(windows):
+        low, high = index * WINDOW, (index + 1) * WINDOW
+        entry: dict[str, Any] = {
+            "from": low,
+            "supabase_rps": round(sum(1 for at in run.request_times if low <= at < high) / WINDOW, 2),
+        }
+        for step in steps:
+            window_samples = [s for s in run.samples if s.step == step and low <= s.at < high]
+            entry[step] = {
+                "p95": round(percentile([s.duration for s in window_samples if s.ok], 95), 3),
+                "errors": sum(1 for s in window_samples if not s.ok),
+            }
+        timeline.append(entry)
+
+    per_second = Counter(int(at) for at in run.request_times)
+    return {
+        "users": users,
+        "wall_clock": round(wall_clock, 3),
+        "journeys": sum(1 for sample in run.samples if sample.step == "login"),
+        "steps": steps,
+        "supabase": {
+            "requests": len(run.request_times),
+            "rate_per_s": round(len(run.request_times) / wall_clock, 2) if wall_clock else 0.0,
+            "peak_per_s": max(per_second.values(), default=0),
+            "failed": run.failed_requests,
+            "statuses": {str(status): count for status, count in sorted(run.statuses.items())},
+        },
+        "timeline": timeline,
+    }
+
+
+def load_credentials(path: Path | None, role: str) -> list[tuple[str, str]]:
+    if path is None:
+        return [get_role(role).credentials()]
+    pairs = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            email, _, password = line.partition(":")
+            pairs.append((email, password))
+    if not pairs:
+        raise LookupError(f"No email:password lines in {path}")
+    return pairs
+
+
+async def run_load(
+    users: int,
+    browsers: int,
+    credentials: list[tuple[str, str]],
+    duration: float,
+    iterations: int | None = None,
+    ramp: float = 0.0,
+    read_only: bool = False,
+    headless: bool = True,
+    seed: int = 1,
+) -> dict[str, Any]:
+    run = LoadRun()
+    async with async_playwright() as playwright:
+        launched = await asyncio.gather(
+            *(
+                playwright.chromium.launch(headless=headless, args=DEFAULT_LAUNCH_ARGS)
+                for _ in range(max(1, min(browsers, users)))
+            )
+        )
+        try:
+            async def start(vu: int) -> None:
+                await asyncio.sleep(ramp * vu / users)
+                await virtual_user(
+                    vu, launched[vu % len(launched)], credentials[vu % len(credentials)],
+                    run, duration, iterations, read_only, seed,
+                )
+
+            run.started = time.perf_counter()
+            await asyncio.gather(*(start(vu) for vu in range(users)))
+        finally:
+            for browser in launched:
+                await browser.close()
+    return summarize(run, run.elapsed(), users)
+
+
+def format_summary(report: dict[str, Any]) -> str:
+    lines = [f"{'step':16} {'count':>6} {'err%':>6} {'p50':>7} {'p95':>7} {'p99':>7}"]
+    for step, stats in report["steps"].items():
+        lines.append(
+            f"{step:16} {stats['count']:6d} {stats['error_rate'] * 100:5.1f}% "
+            f"{stats['p50']:6.2f}s {stats['p95']:6.2f}s {stats['p99']:6.2f}s"
+        )
+    supabase = report["supabase"]
+    lines.append(
+        f"{report['journeys']} journeys by {report['users']} users in {report['wall_clock']:.0f}s; "
+        f"Supabase {supabase['requests']} requests, {supabase['rate_per_s']}/s avg, "
+        f"{supabase['peak_per_s']}/s peak, {supabase['failed']} failed"
+    )
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-u", "--users", type=int, default=50, help="concurrent virtual users")
+    parser.add_argument("-b", "--browsers", type=int, default=os.cpu_count() or 1,
+                        help="browsers the users' contexts are spread over")
+    parser.add_argument("--duration", type=float, default=300.0, help="seconds to keep starting journeys")
+    parser.add_argument("--iterations", type=int, help="journeys per user (default: until --duration)")
+    parser.add_argument("--ramp", type=float, default=30.0, help="seconds over which users start")
+    parser.add_argument("--credentials", type=Path, help="file of email:password lines, one per user")
+    parser.add_argument("--role", default="owner", help="role to log in as without --credentials")
+    parser.add_argument("--read-only", action="store_true", help="skip the mark_paid step")
+    parser.add_argument("--seed", type=int, default=1, help="seed for each user's random choices")
+    parser.add_argument("--report", type=Path, default=DEFAULT_REPORT, help="JSON report path")
+    parser.add_argument("--headed", action="store_true", help="show the browser windows")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    try:
+        credentials = load_credentials(args.credentials, args.role)
+    except LookupError as exc:
+        print(exc, file=sys.stderr)
+        return 2
+    report = asyncio.run(
+        run_load(
+            args.users, args.browsers, credentials, args.duration, args.iterations,
+            args.ramp, args.read_only, not args.headed, args.seed,
+        )
+    )
+    args.report.parent.mkdir(parents=True, exist_ok=True)
+    args.report.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(format_summary(report))
+    print(f"-> {args.report}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,15 @@
+"""Disposable local Supabase for hermetic E2E runs.
+
+Postgres and PostgREST run in Docker; the schema is built from
+``supabase/migrations``; a Python gateway on the project URL proxies
+``/rest/v1`` and stubs ``/auth/v1`` and ``/storage/v1``. Start it from
+``testsprite_tests/`` with::
+
+    python -m harness.local_supabase up
+
+then run the app with ``npm run dev:e2e`` so Vite picks up ``.env.e2e.local``.
+"""
+
+from .stack import LocalSupabase, StackConfig
+
+__all__ = ["LocalSupabase", "StackConfig"]
@@ -0,0 +1,70 @@
+"""CLI: ``python -m harness.local_supabase {up,down,env}``."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import threading
+
+from . import stack
+from .stack import LocalSupabase, StackConfig
+
+# Same names as harness.session.ROLES; not imported so this runs without Playwright.
+ROLE_NAMES = ("owner", "collaborator", "master")
+
+
+def _seed_users(supabase: LocalSupabase, extra: list[str]) -> list[str]:
+    """Create the E2E role users (from ``E2E_<ROLE>_*``) plus ``--user`` entries."""
+    pairs = []
+    for name in ROLE_NAMES:
+        email = os.environ.get(f"E2E_{name.upper()}_EMAIL")
+        password = os.environ.get(f"E2E_{name.upper()}_PASSWORD")
+        if email and password:
+            pairs.append((email, password))
+    for entry in extra:
+        email, sep, password = entry.partition(":")
+        if not sep:
+            raise SystemExit(f"--user expects email:password, got '{entry}'")
+        pairs.append((email, password))
+    for email, password in pairs:
+        supabase.ensure_user(email, password)
+    return [email for email, _ in pairs]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m harness.local_supabase", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+    up = commands.add_parser("up", help="start the stack and serve until Ctrl-C")
+    up.add_argument("--user", action="append", default=[], metavar="EMAIL:PASSWORD", help="extra user to create")
+    up.add_argument("--keep", action="store_true", help="leave the containers (and data) running on exit")
+    commands.add_parser("down", help="remove the containers left behind by 'up --keep'")
+    commands.add_parser("env", help="print the VITE_* variables for the local stack")
+    args = parser.parse_args(argv)
+
+    config = StackConfig()
+    if args.command == "env":
+        for name, value in config.vite_env().items():
+            print(f"{name}={value}")
+        return 0
+    if args.command == "down":
+        LocalSupabase(config).stop()
+        return 0
+
+    with LocalSupabase(config, keep_containers=args.keep) as supabase:
+        for migration in supabase.applied:
+            print(f"applied {migration.version}_{migration.name}")
+        for email in _seed_users(supabase, args.user):
+            print(f"user {email}")
+        env_file = supabase.write_vite_env()
+        print(f"Supabase API on {config.url} (wrote {env_file.relative_to(stack.REPO_DIR)})")
+        print("Run the app with 'npm run dev:e2e'; Ctrl-C to stop.")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
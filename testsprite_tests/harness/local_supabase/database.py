@@ -0,0 +1,166 @@
+"""Schema setup and auth.users access for the local Postgres.
+
+Needs ``psycopg`` (v3): ``pip install "psycopg[binary]"``.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+try:
+    import psycopg
+    from psycopg.rows import dict_row
+    from psycopg.types.json import Jsonb
+except ImportError as exc:  # pragma: no cover - optional dependency
+    raise ImportError(
+        'The local Supabase stack needs psycopg 3: pip install "psycopg[binary]"'
+    ) from exc
+
+from ..config import SUITE_DIR
+
+MIGRATIONS_DIR = SUITE_DIR.parent / "supabase" / "migrations"
+BOOTSTRAP_SQL = Path(__file__).with_name("bootstrap.sql")
+# Same rule as the Supabase CLI: only <version>_<name>.sql files are migrations.
+MIGRATION_PATTERN = re.compile(r"^(\d+)_(.+)\.sql$")
+
+USER_COLUMNS = """
+    id::text, aud, role, email, email_confirmed_at, last_sign_in_at,
+    raw_app_meta_data AS app_metadata, raw_user_meta_data AS user_metadata,
+    created_at, updated_at
+"""
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: str
+    name: str
+    path: Path
+
+
+def list_migrations(directory: Path = MIGRATIONS_DIR) -> list[Migration]:
+    migrations = []
+    for path in sorted(directory.glob("*.sql")):
+        match = MIGRATION_PATTERN.match(path.name)
+        if match:
+            migrations.append(Migration(version=match.group(1), name=match.group(2), path=path))
+    return migrations
+
+
+def apply_schema(dsn: str, directory: Path = MIGRATIONS_DIR) -> list[Migration]:
+    """Run the bootstrap SQL, then every migration not applied yet, in order."""
+    applied = []
+    with psycopg.connect(dsn, autocommit=True) as conn:
+        conn.execute(BOOTSTRAP_SQL.read_text(encoding="utf-8"))
+        done = {row[0] for row in conn.execute("SELECT version FROM supabase_migrations.schema_migrations")}
+        for migration in list_migrations(directory):
+            if migration.version in done:
+                continue
+            with conn.transaction():
+                conn.execute(migration.path.read_text(encoding="utf-8"))
+                conn.execute(
+                    "INSERT INTO supabase_migrations.schema_migrations (version, name) VALUES (%s, %s)",
+                    (migration.version, migration.name),
+                )
+            applied.append(migration)
+        conn.execute("NOTIFY pgrst, 'reload schema'")
+    return applied
+
+
+def _serialize(user: dict[str, Any]) -> dict[str, Any]:
+    for key in ("email_confirmed_at", "last_sign_in_at", "created_at", "updated_at"):
+        if user.get(key) is not None:
+            user[key] = user[key].isoformat()
+    user["confirmed_at"] = user.get("email_confirmed_at")
+    user["identities"] = []
+    return user
+
+
+class AuthStore:
+    """Thread-safe access to ``auth.users`` for the auth stub."""
+
+    def __init__(self, dsn: str) -> None:
+        self._conn = psycopg.connect(dsn, autocommit=True, row_factory=dict_row)
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _one(self, query: str, params: tuple[Any, ...]) -> dict[str, Any] | None:
+        with self._lock:
+            row = self._conn.execute(query, params).fetchone()
+        return _serialize(row) if row else None
+
+    def get(self, user_id: str) -> dict[str, Any] | None:
+        return self._one(f"SELECT {USER_COLUMNS} FROM auth.users WHERE id = %s", (user_id,))
+
+    def create(
+        self,
+        email: str,
+        password: str,
+        metadata: dict[str, Any] | None = None,
+        user_id: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Insert a confirmed user; returns None if the email is taken."""
+        return self._one(
+            f"""
+            INSERT INTO auth.users (id, email, encrypted_password, email_confirmed_at, raw_user_meta_data)
+            VALUES (
+                coalesce(%s::uuid, gen_random_uuid()), lower(%s),
+                extensions.crypt(%s, extensions.gen_salt('bf')), now(), %s
+            )
+            ON CONFLICT (email) DO NOTHING
+            RETURNING {USER_COLUMNS}
+            """,
+            (user_id, email, password, Jsonb(metadata or {})),
+        )
+
+    def authenticate(self, email: str, password: str) -> dict[str, Any] | None:
+        return self._one(
+            f"""
+            UPDATE auth.users SET last_sign_in_at = now()
+            WHERE email = lower(%s) AND encrypted_password = extensions.crypt(%s, encrypted_password)
+            RETURNING {USER_COLUMNS}
+            """,
+            (email, password),
+        )
+
+    def update(
+        self,
+        user_id: str,
+        email: str | None = None,
+        password: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> dict[str, Any] | None:
+        return self._one(
+            f"""
+            UPDATE auth.users SET
+                email = coalesce(lower(%s), email),
+                encrypted_password = coalesce(extensions.crypt(%s, extensions.gen_salt('bf')), encrypted_password),
+                raw_user_meta_data = raw_user_meta_data || %s,
+                updated_at = now()
+            WHERE id = %s
+            RETURNING {USER_COLUMNS}
+            """,
+            (email, password, Jsonb(metadata or {}), user_id),
+        )
+
+    def set_password(self, email: str, password: str) -> dict[str, Any] | None:
+        return self._one(
+            f"""
+            UPDATE auth.users SET
+                encrypted_password = extensions.crypt(%s, extensions.gen_salt('bf')),
+                email_confirmed_at = coalesce(email_confirmed_at, now()),
+                updated_at = now()
+            WHERE email = lower(%s)
+            RETURNING {USER_COLUMNS}
+            """,
+            (password, email),
+        )
+
+    def delete(self, user_id: str) -> bool:
+        with self._lock:
+            return self._conn.execute("DELETE FROM auth.users WHERE id = %s", (user_id,)).rowcount > 0
@@ -0,0 +1,340 @@
+"""Single-origin HTTP gateway mimicking a Supabase project URL.
+
+Routes the paths supabase-js uses:
+
+* ``/rest/v1/*`` is proxied to PostgREST unchanged (JWT checked there).
+* ``/auth/v1/*`` is a small GoTrue-compatible stub backed by ``auth.users``:
+  password and refresh-token grants, signup (auto-confirmed), user read and
+  update, logout, recover, and the admin create/delete user calls.
+* ``/storage/v1/object/*`` stores files on disk: upload, signed URLs,
+  public/authenticated download and bulk remove.
+
+Realtime websockets and edge functions are not served.
+"""
+
+from __future__ import annotations
+
+import email.parser
+import email.policy
+import http.client
+import json
+import mimetypes
+import secrets
+import threading
+import time
+import uuid
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from . import tokens
+from .database import AuthStore
+
+ACCESS_TOKEN_TTL = 3600
+SIGNED_URL_DEFAULT_TTL = 60
+
+CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, POST, PUT, PATCH, DELETE, OPTIONS, HEAD",
+    "Access-Control-Allow-Headers": (
+        "authorization, apikey, content-type, prefer, range, x-client-info, accept-profile, "
+        "content-profile, x-upsert, cache-control, x-supabase-api-version"
+    ),
+    "Access-Control-Expose-Headers": "content-range, content-location, location, x-total-count",
+    "Access-Control-Max-Age": "86400",
+}
+
+PROXIED_REQUEST_HEADERS = (
+    "authorization", "apikey", "accept", "content-type", "prefer", "range",
+    "accept-profile", "content-profile",
+)
+HOP_BY_HOP = {"connection", "keep-alive", "transfer-encoding", "content-length", "server", "date"}
+
+
+class ApiError(Exception):
+    def __init__(self, status: int, message: str, code: str | None = None) -> None:
+        super().__init__(message)
+        self.status = status
+        self.code = code or HTTPStatus(status).phrase.lower().replace(" ", "_")
+
+
+class GatewayState:
+    """Everything the request handlers share."""
+
+    def __init__(self, auth: AuthStore, rest_host: str, rest_port: int, storage_dir: Path, jwt_secret: str) -> None:
+        self.auth = auth
+        self.rest_host = rest_host
+        self.rest_port = rest_port
+        self.storage_dir = storage_dir
+        self.jwt_secret = jwt_secret
+        self._refresh_tokens: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def issue_session(self, user: dict[str, Any]) -> dict[str, Any]:
+        refresh_token = secrets.token_urlsafe(24)
+        with self._lock:
+            self._refresh_tokens[refresh_token] = user["id"]
+        return {
+            "access_token": tokens.access_token(user, self.jwt_secret, ACCESS_TOKEN_TTL),
+            "token_type": "bearer",
+            "expires_in": ACCESS_TOKEN_TTL,
+            "expires_at": int(time.time()) + ACCESS_TOKEN_TTL,
+            "refresh_token": refresh_token,
+            "user": user,
+        }
+
+    def redeem_refresh_token(self, refresh_token: str) -> str | None:
+        with self._lock:
+            return self._refresh_tokens.pop(refresh_token, None)
+
+    def revoke_user_tokens(self, user_id: str) -> None:
+        with self._lock:
+            self._refresh_tokens = {
+                token: owner for token, owner in self._refresh_tokens.items() if owner != user_id
+            }
+
+
+class GatewayHandler(BaseHTTPRequestHandler):
+    server: "GatewayServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - stdlib signature
+        pass
+
+    @property
+    def state(self) -> GatewayState:
+        return self.server.state
+
+    # -- plumbing -----------------------------------------------------------
+
+    def _body(self) -> bytes:
+        return self._request_body
+
+    def _json_body(self) -> dict[str, Any]:
+        body = self._body()
+        return json.loads(body) if body else {}
+
+    def _send(self, status: int, body: bytes = b"", headers: dict[str, str] | None = None) -> None:
+        self.send_response(status)
+        for name, value in {**CORS_HEADERS, **(headers or {})}.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body and self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _send_json(self, status: int, payload: Any) -> None:
+        self._send(status, json.dumps(payload).encode(), {"Content-Type": "application/json"})
+
+    def _bearer_claims(self) -> dict[str, Any]:
+        header = self.headers.get("authorization", "")
+        if not header.lower().startswith("bearer "):
+            raise ApiError(401, "Missing authorization header", "no_authorization")
+        try:
+            return tokens.decode(header[7:].strip(), self.state.jwt_secret)
+        except tokens.InvalidToken as exc:
+            raise ApiError(401, f"Invalid JWT: {exc}", "bad_jwt") from None
+
+    def _current_user(self) -> dict[str, Any]:
+        claims = self._bearer_claims()
+        user = self.state.auth.get(claims.get("sub", "")) if claims.get("sub") else None
+        if user is None:
+            raise ApiError(403, "User from sub claim in JWT does not exist", "user_not_found")
+        return user
+
+    def _require_service_role(self) -> None:
+        if self._bearer_claims().get("role") != "service_role":
+            raise ApiError(403, "User not allowed", "not_admin")
+
+    def _dispatch(self) -> None:
+        # Always drain the body so an early error cannot desync a keep-alive connection.
+        length = int(self.headers.get("content-length") or 0)
+        self._request_body = self.rfile.read(length) if length else b""
+        url = urlsplit(self.path)
+        try:
+            if self.command == "OPTIONS":
+                self._send(204)
+            elif url.path.startswith("/rest/v1/"):
+                self._proxy_rest(url.path[len("/rest/v1"):], url.query)
+            elif url.path.startswith("/auth/v1/"):
+                self._auth(url.path[len("/auth/v1"):], parse_qs(url.query))
+            elif url.path.startswith("/storage/v1/object/"):
+                self._storage(unquote(url.path[len("/storage/v1/object/"):]), parse_qs(url.query))
+            else:
+                raise ApiError(404, f"No route for {url.path}")
+        except ApiError as exc:
+            self._send_json(exc.status, {"code": exc.status, "error_code": exc.code, "msg": str(exc), "message": str(exc)})
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = do_OPTIONS = _dispatch
+
+    # -- /rest/v1 -----------------------------------------------------------
+
+    def _proxy_rest(self, path: str, query: str) -> None:
+        headers = {name: self.headers[name] for name in PROXIED_REQUEST_HEADERS if self.headers.get(name)}
+        if "authorization" not in headers and "apikey" in headers:
+            headers["authorization"] = f"Bearer {headers['apikey']}"
+        target = f"{path}?{query}" if query else path
+        conn = http.client.HTTPConnection(self.state.rest_host, self.state.rest_port, timeout=120)
+        try:
+            conn.request(self.command, target, body=self._body() or None, headers=headers)
+            response = conn.getresponse()
+            body = response.read()
+            passthrough = {
+                name: value for name, value in response.getheaders() if name.lower() not in HOP_BY_HOP
+            }
+        finally:
+            conn.close()
+        self._send(response.status, body, passthrough)
+
+    # -- /auth/v1 -----------------------------------------------------------
+
+    def _auth(self, path: str, query: dict[str, list[str]]) -> None:
+        auth = self.state.auth
+        if path == "/token" and self.command == "POST":
+            grant = (query.get("grant_type") or [""])[0]
+            body = self._json_body()
+            if grant == "password":
+                user = auth.authenticate(body.get("email", ""), body.get("password", ""))
+                if user is None:
+                    raise ApiError(400, "Invalid login credentials", "invalid_credentials")
+            elif grant == "refresh_token":
+                user_id = self.state.redeem_refresh_token(body.get("refresh_token", ""))
+                user = auth.get(user_id) if user_id else None
+                if user is None:
+                    raise ApiError(400, "Invalid Refresh Token: Refresh Token Not Found", "refresh_token_not_found")
+            else:
+                raise ApiError(400, f"Unsupported grant_type {grant!r}", "unsupported_grant_type")
+            self._send_json(200, self.state.issue_session(user))
+        elif path == "/signup" and self.command == "POST":
+            body = self._json_body()
+            user = auth.create(body.get("email", ""), body.get("password", ""), body.get("data"))
+            if user is None:
+                raise ApiError(422, "User already registered", "user_already_exists")
+            self._send_json(200, self.state.issue_session(user))
+        elif path == "/user" and self.command == "GET":
+            self._send_json(200, self._current_user())
+        elif path == "/user" and self.command == "PUT":
+            user = self._current_user()
+            body = self._json_body()
+            updated = auth.update(user["id"], body.get("email"), body.get("password"), body.get("data"))
+            self._send_json(200, updated)
+        elif path == "/logout" and self.command == "POST":
+            try:
+                self.state.revoke_user_tokens(self._bearer_claims().get("sub", ""))
+            except ApiError:
+                pass
+            self._send(204)
+        elif path in ("/recover", "/otp", "/resend") and self.command == "POST":
+            self._json_body()
+            self._send_json(200, {})
+        elif path == "/settings":
+            self._send_json(200, {"external": {"email": True}, "disable_signup": False, "mailer_autoconfirm": True})
+        elif path == "/admin/users" and self.command == "POST":
+            self._require_service_role()
+            body = self._json_body()
+            user = auth.create(body.get("email", ""), body.get("password") or secrets.token_urlsafe(12), body.get("user_metadata"))
+            if user is None:
+                raise ApiError(422, "A user with this email address has already been registered", "email_exists")
+            self._send_json(200, user)
+        elif path.startswith("/admin/users/") and self.command == "DELETE":
+            self._require_service_role()
+            if not auth.delete(path.rsplit("/", 1)[1]):
+                raise ApiError(404, "User not found", "user_not_found")
+            self._send_json(200, {})
+        else:
+            raise ApiError(404, f"Auth endpoint {self.command} {path} is not implemented by the local stub")
+
+    # -- /storage/v1/object -------------------------------------------------
+
+    def _object_path(self, bucket: str, name: str) -> Path:
+        root = (self.state.storage_dir / bucket).resolve()
+        path = (root / name).resolve()
+        if root not in path.parents:
+            raise ApiError(400, "Invalid object name", "invalid_key")
+        return path
+
+    def _read_upload(self) -> tuple[bytes, str | None]:
+        body = self._body()
+        content_type = self.headers.get("content-type", "")
+        if not content_type.startswith("multipart/form-data"):
+            return body, content_type or None
+        message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode() + body
+        )
+        for part in message.iter_parts():
+            if part.get_param("name", header="content-disposition") in ("cacheControl", "metadata"):
+                continue
+            return part.get_payload(decode=True) or b"", part.get_content_type()
+        raise ApiError(400, "No file in multipart upload", "invalid_upload")
+
+    def _serve_file(self, bucket: str, name: str) -> None:
+        path = self._object_path(bucket, name)
+        if not path.is_file():
+            raise ApiError(404, "Object not found", "not_found")
+        content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        self._send(200, path.read_bytes(), {"Content-Type": content_type})
+
+    def _storage(self, path: str, query: dict[str, list[str]]) -> None:
+        head, _, rest = path.partition("/")
+
+        if head == "sign" and self.command == "POST":
+            self._bearer_claims()
+            bucket, _, name = rest.partition("/")
+            expires_in = int(self._json_body().get("expiresIn") or SIGNED_URL_DEFAULT_TTL)
+            token = tokens.encode(
+                {"url": f"{bucket}/{name}", "exp": int(time.time()) + expires_in}, self.state.jwt_secret
+            )
+            # storage-js runs encodeURI over the result, so the path stays unencoded here.
+            self._send_json(200, {"signedURL": f"/object/sign/{rest}?token={token}"})
+        elif head == "sign" and self.command in ("GET", "HEAD"):
+            try:
+                claims = tokens.decode((query.get("token") or [""])[0], self.state.jwt_secret)
+            except tokens.InvalidToken as exc:
+                raise ApiError(400, f"Invalid signature: {exc}", "invalid_jwt") from None
+            if claims.get("url") != rest:
+                raise ApiError(400, "Signature does not match object", "invalid_jwt")
+            bucket, _, name = rest.partition("/")
+            self._serve_file(bucket, name)
+        elif head in ("public", "authenticated") and self.command in ("GET", "HEAD"):
+            if head == "authenticated":
+                self._bearer_claims()
+            bucket, _, name = rest.partition("/")
+            self._serve_file(bucket, name)
+        elif self.command in ("POST", "PUT") and rest:
+            self._bearer_claims()
+            target = self._object_path(head, rest)
+            if target.exists() and self.command == "POST" and self.headers.get("x-upsert") != "true":
+                raise ApiError(409, "The resource already exists", "Duplicate")
+            data, _ = self._read_upload()
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(data)
+            self._send_json(200, {"Key": f"{head}/{rest}", "Id": str(uuid.uuid4())})
+        elif self.command == "DELETE" and not rest:
+            self._bearer_claims()
+            removed = []
+            for name in self._json_body().get("prefixes", []):
+                target = self._object_path(head, name)
+                if target.is_file():
+                    target.unlink()
+                    removed.append({"name": name, "bucket_id": head})
+            self._send_json(200, removed)
+        elif self.command in ("GET", "HEAD") and rest:
+            self._bearer_claims()
+            self._serve_file(head, rest)
+        else:
+            raise ApiError(404, f"Storage endpoint {self.command} {path} is not implemented by the local stub")
+
+
+class GatewayServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], state: GatewayState) -> None:
+        super().__init__(address, GatewayHandler)
+        self.state = state
+
+    def start_in_thread(self) -> threading.Thread:
+        thread = threading.Thread(target=self.serve_forever, name="supabase-gateway", daemon=True)
+        thread.start()
+        return thread
@@ -0,0 +1,72 @@
+"""HS256 JWTs compatible with PostgREST and supabase-js."""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import json
+import time
+from typing import Any
+
+# Same default secret the Supabase CLI uses for local stacks.
+DEFAULT_JWT_SECRET = "super-secret-jwt-token-with-at-least-32-characters-long"
+# API keys are long-lived; pin iat so the anon key is stable across restarts.
+API_KEY_IAT = 1_700_000_000
+API_KEY_EXP = 2_000_000_000
+
+
+class InvalidToken(Exception):
+    pass
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def encode(claims: dict[str, Any], secret: str) -> str:
+    header = _b64encode(json.dumps({"alg": "HS256", "typ": "JWT"}, separators=(",", ":")).encode())
+    payload = _b64encode(json.dumps(claims, separators=(",", ":")).encode())
+    signing_input = f"{header}.{payload}".encode("ascii")
+    signature = hmac.new(secret.encode(), signing_input, hashlib.sha256).digest()
+    return f"{header}.{payload}.{_b64encode(signature)}"
+
+
+def decode(token: str, secret: str) -> dict[str, Any]:
+    try:
+        header, payload, signature = token.split(".")
+    except ValueError:
+        raise InvalidToken("malformed token") from None
+    expected = hmac.new(secret.encode(), f"{header}.{payload}".encode("ascii"), hashlib.sha256).digest()
+    if not hmac.compare_digest(expected, _b64decode(signature)):
+        raise InvalidToken("bad signature")
+    claims = json.loads(_b64decode(payload))
+    if "exp" in claims and claims["exp"] < time.time():
+        raise InvalidToken("token expired")
+    return claims
+
+
+def api_key(role: str, secret: str) -> str:
+    """``anon`` / ``service_role`` key as issued by a Supabase project."""
+    return encode({"iss": "supabase-local", "role": role, "iat": API_KEY_IAT, "exp": API_KEY_EXP}, secret)
+
+
+def access_token(user: dict[str, Any], secret: str, expires_in: int) -> str:
+    now = int(time.time())
+    return encode(
+        {
+            "aud": "authenticated",
+            "role": "authenticated",
+            "sub": user["id"],
+            "email": user["email"],
+            "user_metadata": user.get("user_metadata") or {},
+            "app_metadata": user.get("app_metadata") or {},
+            "iat": now,
+            "exp": now + expires_in,
+        },
+        secret,
+    )
@@ -0,0 +1,319 @@
+"""Page objects for the main app screens, keyed by ``data-testid``.
+
+Selectors live in one place so a layout change touches this module instead of
+every TC script, and test-id lookups replace the generated absolute XPaths
+(``xpath=html/body/div/div/div[2]/div/form/...``). The ids are the
+``data-testid`` attributes set in LoginForm, ActivationCodeVerification,
+ActivationCodeRequest, HeaderCompanySelector, Dashboard, PeriodFilter,
+ContasPagarList and ReportsList.
+"""
+
+from __future__ import annotations
+
+from playwright.async_api import Locator, Page
+
+from .config import base_url as configured_base_url
+from .waits import PageActions
+
+
+class TestIds:
+    """Registry of every ``data-testid`` the harness relies on."""
+
+    SPINNER = "spinner"
+    HEADER_COMPANY_SELECT = "header-company-select"
+
+    LOGIN_FORM = "login-form"
+    LOGIN_EMAIL = "login-email"
+    LOGIN_PASSWORD = "login-password"
+    LOGIN_SUBMIT = "login-submit"
+    LOGIN_ERROR = "login-error"
+    LOGIN_SIGNUP_LINK = "login-signup-link"
+    LOGIN_FORGOT_PASSWORD = "login-forgot-password"
+    LOGIN_RESET_EMAIL = "login-reset-email"
+    LOGIN_RESET_SEND = "login-reset-send"
+    LOGIN_RESET_CANCEL = "login-reset-cancel"
+
+    ACTIVATION_CODE = "activation-code"
+    ACTIVATION_VERIFY = "activation-verify"
+    ACTIVATION_ERROR = "activation-error"
+    ACTIVATION_REQUEST_CODE = "activation-request-code"
+    ACTIVATION_BACK_TO_LOGIN = "activation-back-to-login"
+    ACTIVATION_REQUEST_NAME = "activation-request-name"
+    ACTIVATION_REQUEST_EMAIL = "activation-request-email"
+    ACTIVATION_REQUEST_COMPANY = "activation-request-company"
+    ACTIVATION_REQUEST_SUBMIT = "activation-request-submit"
+    ACTIVATION_REQUEST_BACK = "activation-request-back"
+
+    DASHBOARD = "dashboard"
+    DASHBOARD_ERROR = "dashboard-error"
+    DASHBOARD_EMPTY = "dashboard-empty"
+    DASHBOARD_PERIOD_LABEL = "dashboard-period-label"
+    PERIOD_FILTER_TOGGLE = "period-filter-toggle"
+    PERIOD_CUSTOM_START = "period-custom-start"
+    PERIOD_CUSTOM_END = "period-custom-end"
+
+    CONTAS_PAGAR_LIST = "contas-pagar-list"
+    CONTAS_PAGAR_NEW = "contas-pagar-new"
+    CONTAS_PAGAR_SEARCH = "contas-pagar-search"
+    CONTAS_PAGAR_STATUS_FILTER = "contas-pagar-status-filter"
+    CONTAS_PAGAR_TOTAL_PENDENTE = "contas-pagar-total-pendente"
+    CONTAS_PAGAR_ROW = "contas-pagar-row"
+    CONTAS_PAGAR_CARD = "contas-pagar-card"
+    CONTAS_PAGAR_VIEW = "contas-pagar-view"
+    CONTAS_PAGAR_MARK_PAID = "contas-pagar-mark-paid"
+    CONTAS_PAGAR_DELETE = "contas-pagar-delete"
+    CONTAS_PAGAR_CONFIRM_PAYMENT = "contas-pagar-confirm-payment"
+    CONTAS_PAGAR_COMPROVANTE_INPUT = "contas-pagar-comprovante-input"
+    CONTAS_PAGAR_LOAD_MORE = "contas-pagar-load-more"
+    CONTAS_PAGAR_SCROLL = "contas-pagar-scroll"
+    CONTAS_PAGAR_CARDS_SCROLL = "contas-pagar-cards-scroll"
+
+    REPORTS_LIST = "reports-list"
+    REPORTS_COMPANY_SELECT = "reports-company-select"
+    REPORTS_SEARCH = "reports-search"
+
+    @staticmethod
+    def period_option(period: str) -> str:
+        return f"period-option-{period}"
+
+    @staticmethod
+    def report_card(report: str) -> str:
+        return f"report-card-{report}"
+
+    @staticmethod
+    def report_generate(report: str) -> str:
+        return f"report-generate-{report}"
+
+
+class BasePage:
+    path = "/"
+    ready_test_id: str | None = None
+
+    def __init__(
+        self,
+        page: Page,
+        actions: PageActions | None = None,
+        base_url: str | None = None,
+    ) -> None:
+        self.page = page
+        self.actions = actions or PageActions(page)
+        self.base_url = (base_url or configured_base_url()).rstrip("/")
+
+    def by_test_id(self, test_id: str) -> Locator:
+        return self.page.get_by_test_id(test_id)
+
+    async def goto(self) -> None:
+        await self.page.goto(f"{self.base_url}{self.path}", wait_until="commit")
+        await self.wait_ready()
+
+    async def wait_ready(self) -> None:
+        await self.actions.settle()
+        if self.ready_test_id:
+            await self.actions.wait_for(self.by_test_id(self.ready_test_id))
+
+    async def company_ids(self) -> list[str]:
+        """Companies offered by the header selector (hidden with fewer than two)."""
+        select = self.by_test_id(TestIds.HEADER_COMPANY_SELECT)
+        if not await select.is_visible():
+            return []
+        values = await select.locator("option").evaluate_all("options => options.map(o => o.value)")
+        return [value for value in values if value]
+
+    async def switch_company(self, empresa_id: str) -> None:
+        await self.actions.settle()
+        await self.by_test_id(TestIds.HEADER_COMPANY_SELECT).select_option(empresa_id)
+        await self.wait_ready()
+
+
+class LoginPage(BasePage):
+    path = "/login"
+    ready_test_id = TestIds.LOGIN_FORM
+
+    @property
+    def email(self) -> Locator:
+        return self.by_test_id(TestIds.LOGIN_EMAIL)
+
+    @property
+    def password(self) -> Locator:
+        return self.by_test_id(TestIds.LOGIN_PASSWORD)
+
+    @property
+    def submit(self) -> Locator:
+        return self.by_test_id(TestIds.LOGIN_SUBMIT)
+
+    @property
+    def error(self) -> Locator:
+        return self.by_test_id(TestIds.LOGIN_ERROR)
+
+    async def login(self, email: str, password: str) -> None:
+        await self.actions.fill(self.email, email)
+        await self.actions.fill(self.password, password)
+        await self.actions.click(self.submit)
+
+    async def login_and_wait(self, email: str, password: str) -> None:
+        """Log in and wait for the redirect to ``/dashboard``."""
+        await self.login(email, password)
+        await self.page.wait_for_url("**/dashboard", timeout=self.actions.settle_timeout)
+
+    async def open_signup(self) -> None:
+        await self.actions.click(self.by_test_id(TestIds.LOGIN_SIGNUP_LINK))
+
+    async def open_password_reset(self) -> None:
+        await self.actions.click(self.by_test_id(TestIds.LOGIN_FORGOT_PASSWORD))
+
+    async def request_password_reset(self, email: str) -> None:
+        """Send the reset link from the modal opened by ``open_password_reset``."""
+        await self.actions.fill(self.by_test_id(TestIds.LOGIN_RESET_EMAIL), email)
+        await self.actions.click(self.by_test_id(TestIds.LOGIN_RESET_SEND))
+
+    async def close_password_reset(self) -> None:
+        await self.actions.click(self.by_test_id(TestIds.LOGIN_RESET_CANCEL))
+
+
+class ActivationPage(BasePage):
+    """``/activation``: code verification, and the code request form it links to."""
+
+    path = "/activation"
+    ready_test_id = TestIds.ACTIVATION_CODE
+
+    @property
+    def code(self) -> Locator:
+        return self.by_test_id(TestIds.ACTIVATION_CODE)
+
+    @property
+    def error(self) -> Locator:
+        return self.by_test_id(TestIds.ACTIVATION_ERROR)
+
+    async def verify(self, code: str) -> None:
+        await self.actions.fill(self.code, code)
+        await self.actions.click(self.by_test_id(TestIds.ACTIVATION_VERIFY))
+
+    async def open_request(self) -> None:
+        await self.actions.click(self.by_test_id(TestIds.ACTIVATION_REQUEST_CODE))
+
+    async def fill_request(self, name: str, email: str, company: str) -> None:
+        await self.actions.fill(self.by_test_id(TestIds.ACTIVATION_REQUEST_NAME), name)
+        await self.actions.fill(self.by_test_id(TestIds.ACTIVATION_REQUEST_EMAIL), email)
+        await self.actions.fill(self.by_test_id(TestIds.ACTIVATION_REQUEST_COMPANY), company)
+
+    async def submit_request(self) -> None:
+        """On success the page shows a confirmation, then returns to verification."""
+        await self.actions.click(self.by_test_id(TestIds.ACTIVATION_REQUEST_SUBMIT))
+
+    async def request_code(self, name: str, email: str, company: str) -> None:
+        await self.fill_request(name, email, company)
+        await self.submit_request()
+
+    async def back_to_verification(self) -> None:
+        await self.actions.click(self.by_test_id(TestIds.ACTIVATION_REQUEST_BACK))
+
+    async def back_to_login(self) -> None:
+        """Both steps show the same link back to ``/login``."""
+        await self.actions.click(self.by_test_id(TestIds.ACTIVATION_BACK_TO_LOGIN))
+
+
+class DashboardPage(BasePage):
+    path = "/dashboard"
+    ready_test_id = TestIds.DASHBOARD
+
+    @property
+    def period_label(self) -> Locator:
+        return self.by_test_id(TestIds.DASHBOARD_PERIOD_LABEL)
+
+    async def select_period(self, period: str) -> None:
+        """Pick a ``PeriodType`` preset such as ``last-3-months``."""
+        await self.actions.click(self.by_test_id(TestIds.PERIOD_FILTER_TOGGLE))
+        await self.actions.click(self.by_test_id(TestIds.period_option(period)))
+        await self.wait_ready()
+
+    async def select_custom_period(self, start: str, end: str) -> None:
+        """Pick a custom range; dates are ``YYYY-MM-DD``."""
+        await self.select_period("custom")
+        await self.actions.fill(self.by_test_id(TestIds.PERIOD_CUSTOM_START), start)
+        await self.actions.fill(self.by_test_id(TestIds.PERIOD_CUSTOM_END), end)
+        await self.wait_ready()
+
+    async def has_error(self) -> bool:
+        return await self.by_test_id(TestIds.DASHBOARD_ERROR).is_visible()
+
+
+class ContasPagarPage(BasePage):
+    path = "/contas-pagar"
+    ready_test_id = TestIds.CONTAS_PAGAR_LIST
+
+    @property
+    def rows(self) -> Locator:
+        """Desktop table rows; use ``cards`` below the ``lg`` breakpoint."""
+        return self.by_test_id(TestIds.CONTAS_PAGAR_ROW)
+
+    @property
+    def cards(self) -> Locator:
+        """Mobile cards; windowed like the table, so only those near the scroll position exist."""
+        return self.by_test_id(TestIds.CONTAS_PAGAR_CARD)
+
+    @property
+    def total_pendente(self) -> Locator:
+        return self.by_test_id(TestIds.CONTAS_PAGAR_TOTAL_PENDENTE)
+
+    def row(self, conta_id: str) -> Locator:
+        return self.page.locator(f'[data-testid="{TestIds.CONTAS_PAGAR_ROW}"][data-conta-id="{conta_id}"]')
+
+    async def search(self, term: str) -> None:
+        await self.actions.fill(self.by_test_id(TestIds.CONTAS_PAGAR_SEARCH), term)
+
+    async def filter_status(self, status: str) -> None:
+        """Filter by ``ContaPagarStatus``; an empty string shows every status."""
+        await self.actions.settle()
+        await self.by_test_id(TestIds.CONTAS_PAGAR_STATUS_FILTER).select_option(status)
+
+    async def open_new(self) -> None:
+        await self.actions.click(self.by_test_id(TestIds.CONTAS_PAGAR_NEW))
+
+    async def mark_as_paid(self, item: Locator, comprovante: str | None = None) -> None:
+        """Pay the bill shown in ``item`` (a row or card), optionally attaching a file."""
+        await self.actions.click(item.get_by_test_id(TestIds.CONTAS_PAGAR_MARK_PAID))
+        if comprovante:
+            await self.by_test_id(TestIds.CONTAS_PAGAR_COMPROVANTE_INPUT).set_input_files(comprovante)
+        await self.actions.click(self.by_test_id(TestIds.CONTAS_PAGAR_CONFIRM_PAYMENT))
+
+    async def load_more(self) -> None:
+        await self.actions.click(self.by_test_id(TestIds.CONTAS_PAGAR_LOAD_MORE))
+
+    async def scroll_table(self, top: int) -> int:
+        """Scroll the windowed desktop table to ``top`` px and return where it landed."""
+        return await self.by_test_id(TestIds.CONTAS_PAGAR_SCROLL).evaluate(
+            "(el, top) => { el.scrollTop = top; return el.scrollTop; }",
+            top,
+        )
+
+    async def rows_in_view(self) -> int:
+        """Count the table rows that overlap the scroll area's visible box.
+
+        A row can be attached yet sit below blank padding, so Playwright's
+        visibility check is not enough to tell the window rendered the right slice.
+        """
+        return await self.by_test_id(TestIds.CONTAS_PAGAR_SCROLL).evaluate(
+            f"""el => {{
+                const box = el.getBoundingClientRect();
+                return [...el.querySelectorAll('[data-testid="{TestIds.CONTAS_PAGAR_ROW}"]')]
+                    .map(row => row.getBoundingClientRect())
+                    .filter(r => r.bottom > box.top && r.top < box.bottom).length;
+            }}"""
+        )
+
+
+class RelatoriosPage(BasePage):
+    path = "/relatorios"
+    ready_test_id = TestIds.REPORTS_LIST
+
+    async def select_company(self, empresa_id: str) -> None:
+        await self.actions.settle()
+        await self.by_test_id(TestIds.REPORTS_COMPANY_SELECT).select_option(empresa_id)
+
+    async def search(self, term: str) -> None:
+        await self.actions.fill(self.by_test_id(TestIds.REPORTS_SEARCH), term)
+
+    async def open_report(self, report: str) -> None:
+        """Open a report by ``ReportType`` id, e.g. ``dre-comparativo``."""
+        await self.actions.click(self.by_test_id(TestIds.report_generate(report)))
+        await self.actions.settle()
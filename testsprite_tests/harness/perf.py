@@ -0,0 +1,311 @@
+"""Page-load budgets for the main routes.
+
+Each route is loaded in a fresh context of a logged-in role and measured:
+
+* Navigation Timing (``ttfb``, ``dom_content_loaded``, ``load``);
+* largest contentful paint (``lcp``) and long tasks, from a
+  ``PerformanceObserver`` installed before the app boots;
+* Supabase requests seen through a CDP ``Network`` session
+  (``supabase_requests``, ``supabase_total``, ``supabase_max``,
+  ``supabase_done`` = last response relative to navigation start);
+* ``settled``: navigation start until no Supabase call is in flight and no
+  loader is on screen, i.e. the fetch-and-compute cycle of pages like
+  Dashboard.tsx.
+
+All values are milliseconds (counts for ``*_requests``/``*_count``). The
+median of ``--runs`` loads is checked against ``perf_budgets.json``; any metric
+over budget fails the run. Usage (from ``testsprite_tests/``)::
+
+    python -m harness.perf --role owner --runs 5
+    python -m harness.runner --role owner --perf
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from playwright.async_api import Browser, BrowserContext, CDPSession, async_playwright
+
+from .config import SUITE_DIR, TMP_DIR, base_url
+from .session import bootstrap_roles, context_options
+from .waits import QUIET_WINDOW, SUPABASE_PATHS, PageActions
+
+DEFAULT_BUDGETS = SUITE_DIR / "perf_budgets.json"
+DEFAULT_REPORT = TMP_DIR / "perf_report.json"
+DEFAULT_RUNS = 3
+
+OBSERVER_SCRIPT = """
+(() => {
+  const perf = { lcp: 0, longTasks: [] };
+  window.__drePerf = perf;
+  try {
+    new PerformanceObserver((list) => {
+      for (const entry of list.getEntries()) perf.lcp = entry.startTime;
+    }).observe({ type: 'largest-contentful-paint', buffered: true });
+    new PerformanceObserver((list) => {
+      for (const entry of list.getEntries()) perf.longTasks.push(entry.duration);
+    }).observe({ type: 'longtask', buffered: true });
+  } catch (e) {}
+})();
+"""
+
+COLLECT_SCRIPT = """
+() => {
+  const nav = performance.getEntriesByType('navigation')[0];
+  const perf = window.__drePerf || { lcp: 0, longTasks: [] };
+  return {
+    now: performance.now(),
+    ttfb: nav ? nav.responseStart : 0,
+    dom_content_loaded: nav ? nav.domContentLoadedEventEnd : 0,
+    load: nav ? nav.loadEventEnd : 0,
+    lcp: perf.lcp,
+    long_tasks: perf.longTasks,
+  };
+}
+"""
+
+
+@dataclass
+class Budgets:
+    defaults: dict[str, float] = field(default_factory=dict)
+    routes: dict[str, dict[str, float]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_BUDGETS) -> "Budgets":
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return cls(defaults=data.get("defaults", {}), routes=data.get("routes", {}))
+
+    def for_route(self, route: str) -> dict[str, float]:
+        return {**self.defaults, **self.routes.get(route, {})}
+
+
+@dataclass
+class RouteResult:
+    route: str
+    runs: list[dict[str, float]]
+    metrics: dict[str, float]
+    budget: dict[str, float]
+    violations: dict[str, dict[str, float]]
+    slowest_requests: list[dict[str, Any]]
+
+    @property
+    def passed(self) -> bool:
+        return not self.violations
+
+
+class SupabaseNetworkRecorder:
+    """Collects timings of Supabase requests from CDP ``Network`` events."""
+
+    def __init__(self, cdp: CDPSession) -> None:
+        self._cdp = cdp
+        self._requests: dict[str, dict[str, Any]] = {}
+        self.navigation_start: float | None = None
+
+    async def start(self) -> None:
+        self._cdp.on("Network.requestWillBeSent", self._on_request)
+        self._cdp.on("Network.responseReceived", self._on_response)
+        self._cdp.on("Network.loadingFinished", self._on_finished)
+        self._cdp.on("Network.loadingFailed", self._on_finished)
+        await self._cdp.send("Network.enable")
+
+    def _on_request(self, params: dict[str, Any]) -> None:
+        url = params["request"]["url"]
+        if params.get("type") == "Document" and self.navigation_start is None:
+            self.navigation_start = params["timestamp"]
+        if any(path in url for path in SUPABASE_PATHS) and params["request"]["method"] != "OPTIONS":
+            self._requests[params["requestId"]] = {
+                "url": url,
+                "method": params["request"]["method"],
+                "started": params["timestamp"],
+            }
+
+    def _on_response(self, params: dict[str, Any]) -> None:
+        request = self._requests.get(params["requestId"])
+        if request is not None:
+            request["status"] = params["response"]["status"]
+
+    def _on_finished(self, params: dict[str, Any]) -> None:
+        request = self._requests.get(params["requestId"])
+        if request is not None:
+            request["finished"] = params["timestamp"]
+            request["bytes"] = params.get("encodedDataLength", 0)
+            request["failed"] = "errorText" in params
+
+    def requests(self) -> list[dict[str, Any]]:
+        """Finished requests with ``duration`` and ``ended`` (since navigation) in ms."""
+        origin = self.navigation_start or 0.0
+        done = []
+        for request in self._requests.values():
+            if "finished" not in request:
+                continue
+            done.append(
+                {
+                    "url": request["url"],
+                    "method": request["method"],
+                    "status": request.get("status"),
+                    "bytes": request["bytes"],
+                    "failed": request["failed"],
+                    "duration": round((request["finished"] - request["started"]) * 1000, 1),
+                    "ended": round((request["finished"] - origin) * 1000, 1),
+                }
+            )
+        return done
+
+
+async def measure_route(context: BrowserContext, route: str) -> tuple[dict[str, float], list[dict[str, Any]]]:
+    """Load ``route`` once in ``context``; returns its metrics and Supabase requests."""
+    page = await context.new_page()
+    try:
+        await page.add_init_script(OBSERVER_SCRIPT)
+        recorder = SupabaseNetworkRecorder(await context.new_cdp_session(page))
+        await recorder.start()
+        actions = PageActions(page)
+
+        await page.goto(f"{base_url()}{route}", wait_until="load")
+        await actions.settle()
+        collected = await page.evaluate(COLLECT_SCRIPT)
+
+        requests = recorder.requests()
+        durations = [request["duration"] for request in requests]
+        long_tasks = collected["long_tasks"]
+        metrics = {
+            "ttfb": collected["ttfb"],
+            "dom_content_loaded": collected["dom_content_loaded"],
+            "load": collected["load"],
+            "lcp": collected["lcp"],
+            # settle() only returns after a quiet window with nothing in flight.
+            "settled": max(collected["now"] - QUIET_WINDOW * 1000, 0.0),
+            "long_task_count": len(long_tasks),
+            "long_task_total": sum(long_tasks),
+            "long_task_max": max(long_tasks, default=0.0),
+            "supabase_requests": len(requests),
+            "supabase_total": sum(durations),
+            "supabase_max": max(durations, default=0.0),
+            "supabase_done": max((request["ended"] for request in requests), default=0.0),
+        }
+        return {name: round(value, 1) for name, value in metrics.items()}, requests
+    finally:
+        await page.close()
+
+
+async def check_route(
+    browser: Browser,
+    route: str,
+    budget: dict[str, float],
+    options: dict[str, Any],
+    runs: int = DEFAULT_RUNS,
+) -> RouteResult:
+    """Median of ``runs`` cold-context loads of ``route`` against ``budget``."""
+    samples = []
+    requests: list[dict[str, Any]] = []
+    for _ in range(runs):
+        context = await browser.new_context(**options)
+        try:
+            metrics, run_requests = await measure_route(context, route)
+        finally:
+            await context.close()
+        samples.append(metrics)
+        requests.extend(run_requests)
+
+    median = {name: round(statistics.median(run[name] for run in samples), 1) for name in samples[0]}
+    violations = {
+        name: {"value": median[name], "budget": limit}
+        for name, limit in budget.items()
+        if name in median and median[name] > limit
+    }
+    slowest = sorted(requests, key=lambda request: request["duration"], reverse=True)[:5]
+    return RouteResult(route, samples, median, budget, violations, slowest)
+
+
+async def check_budgets(
+    browser: Browser,
+    budgets: Budgets,
+    role: str,
+    routes: list[str] | None = None,
+    runs: int = DEFAULT_RUNS,
+) -> list[RouteResult]:
+    await bootstrap_roles(browser, [role])
+    options = context_options(role)
+    # One throwaway load so the dev server's first-request compile is not measured.
+    warmup = await browser.new_context(**options)
+    try:
+        await measure_route(warmup, (routes or list(budgets.routes))[0])
+    finally:
+        await warmup.close()
+    return [
+        await check_route(browser, route, budgets.for_route(route), options, runs)
+        for route in routes or budgets.routes
+    ]
+
+
+def build_report(results: list[RouteResult], role: str, runs: int) -> dict[str, Any]:
+    return {
+        "role": role,
+        "runs": runs,
+        "passed": all(result.passed for result in results),
+        "routes": [asdict(result) for result in results],
+    }
+
+
+def format_result(result: RouteResult) -> str:
+    status = "OK  " if result.passed else "OVER"
+    line = (
+        f"{status} {result.route:14} settled {result.metrics['settled']:7.0f}ms  "
+        f"lcp {result.metrics['lcp']:6.0f}ms  long tasks {result.metrics['long_task_total']:5.0f}ms  "
+        f"supabase {result.metrics['supabase_requests']:.0f} req / max {result.metrics['supabase_max']:.0f}ms"
+    )
+    for name, violation in result.violations.items():
+        line += f"\n       {name}: {violation['value']:.0f} > {violation['budget']:.0f}"
+    return line
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("routes", nargs="*", help="routes to check (default: every route in the budgets file)")
+    parser.add_argument("--role", default="owner", help="role whose saved session loads the routes")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="loads per route; the median is checked")
+    parser.add_argument("--budgets", type=Path, default=DEFAULT_BUDGETS, help="budgets JSON")
+    parser.add_argument("--report", type=Path, default=DEFAULT_REPORT, help="JSON report path")
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    return parser.parse_args(argv)
+
+
+async def run_budgets(
+    budgets: Budgets,
+    role: str,
+    routes: list[str] | None = None,
+    runs: int = DEFAULT_RUNS,
+    headless: bool = True,
+) -> list[RouteResult]:
+    """``check_budgets`` on a browser of its own."""
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=headless)
+        try:
+            return await check_budgets(browser, budgets, role, routes, runs)
+        finally:
+            await browser.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    results = asyncio.run(
+        run_budgets(Budgets.load(args.budgets), args.role, args.routes or None, args.runs, not args.headed)
+    )
+    report = build_report(results, args.role, args.runs)
+    args.report.parent.mkdir(parents=True, exist_ok=True)
+    args.report.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    for result in results:
+        print(format_result(result))
+    print(f"-> {args.report}")
+    return 0 if report["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+"""Pool of warm Chromium instances shared by the TC scripts.
+
+A script normally does ``async_playwright().start()`` followed by
+``pw.chromium.launch(...)`` and closes both when it finishes. ``ScriptApi``
+replaces the script's ``async_api`` global so those calls resolve to a browser
+leased from the pool: ``new_context`` still creates a real, isolated
+``BrowserContext``, while ``browser.close()`` and ``pw.stop()`` only release
+what the script created.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from playwright import async_api
+from playwright.async_api import Browser, BrowserContext, Playwright
+
+from .artifacts import ArtifactRecorder, RecordedContext
+from .fixtures import NetworkFixtures
+
+# ``--single-process`` from the generated scripts is dropped on purpose: a
+# single-process Chromium cannot host several contexts reliably.
+DEFAULT_LAUNCH_ARGS = [
+    "--window-size=1280,720",
+    "--disable-dev-shm-usage",
+]
+
+
+class BrowserPool:
+    """Fixed-size set of launched browsers handed out one lease at a time."""
+
+    def __init__(
+        self,
+        playwright: Playwright,
+        size: int,
+        headless: bool = True,
+        launch_args: list[str] | None = None,
+    ) -> None:
+        if size < 1:
+            raise ValueError("BrowserPool size must be at least 1")
+        self._playwright = playwright
+        self._size = size
+        self._launch_options = {
+            "headless": headless,
+            "args": list(launch_args or DEFAULT_LAUNCH_ARGS),
+        }
+        self._idle: asyncio.Queue[Browser] = asyncio.Queue()
+        self._browsers: list[Browser] = []
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    async def _launch(self) -> Browser:
+        browser = await self._playwright.chromium.launch(**self._launch_options)
+        self._browsers.append(browser)
+        return browser
+
+    async def start(self) -> None:
+        browsers = await asyncio.gather(*(self._launch() for _ in range(self._size)))
+        for browser in browsers:
+            self._idle.put_nowait(browser)
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[Browser]:
+        """Borrow a browser, relaunching it first if it crashed."""
+        browser = await self._idle.get()
+        try:
+            if not browser.is_connected():
+                self._browsers.remove(browser)
+                browser = await self._launch()
+            yield browser
+        finally:
+            self._idle.put_nowait(browser)
+
+    async def close(self) -> None:
+        for browser in self._browsers:
+            if browser.is_connected():
+                await browser.close()
+        self._browsers.clear()
+
+
+class ScriptBrowser:
+    """Browser handle given to a single script run.
+
+    Tracks the contexts the script opens so they can be closed even when the
+    script is cancelled before reaching its ``finally`` block.
+    """
+
+    def __init__(
+        self,
+        browser: Browser,
+        context_options: dict[str, Any] | None = None,
+        recorder: ArtifactRecorder | None = None,
+        fixtures: NetworkFixtures | None = None,
+    ) -> None:
+        self._browser = browser
+        self._context_options = dict(context_options or {})
+        self._recorder = recorder
+        self._fixtures = fixtures
+        self.contexts: list[BrowserContext | RecordedContext] = []
+
+    async def new_context(self, **options: Any) -> BrowserContext | RecordedContext:
+        options = {**self._context_options, **options}
+        if self._recorder is not None:
+            context = await self._recorder.record(self._browser.new_context, options)
+        else:
+            context = await self._browser.new_context(**options)
+        self.contexts.append(context)
+        if self._fixtures is not None:
+            await self._fixtures.attach(context)
+        return context
+
+    async def close(self) -> None:
+        contexts, self.contexts = self.contexts, []
+        for context in contexts:
+            try:
+                await context.close()
+            except async_api.Error:
+                pass
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._browser, name)
+
+
+class _ScriptBrowserType:
+    def __init__(self, browser: ScriptBrowser) -> None:
+        self._browser = browser
+
+    async def launch(self, **_options: Any) -> ScriptBrowser:
+        return self._browser
+
+
+class _ScriptPlaywright:
+    def __init__(self, browser: ScriptBrowser) -> None:
+        self.chromium = _ScriptBrowserType(browser)
+
+    async def stop(self) -> None:
+        await self.chromium._browser.close()
+
+
+class _PlaywrightStarter:
+    def __init__(self, browser: ScriptBrowser) -> None:
+        self._browser = browser
+
+    async def start(self) -> _ScriptPlaywright:
+        return _ScriptPlaywright(self._browser)
+
+
+class ScriptApi:
+    """Drop-in for ``playwright.async_api`` inside a loaded TC script."""
+
+    def __init__(self, browser: ScriptBrowser) -> None:
+        self._browser = browser
+
+    def async_playwright(self) -> _PlaywrightStarter:
+        return _PlaywrightStarter(self._browser)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(async_api, name)
@@ -0,0 +1,210 @@
+"""pgbench-style comparison of the member RLS policies, per-row vs InitPlan.
+
+Each run replays the reads a member's session makes (Dashboard period,
+full-history report totals, ContasPagarList first page, plano de contas) as
+``authenticated`` with the member's JWT claims, in a loop for ``--duration``
+seconds, and reports transactions per second and latency per statement.
+
+The ``legacy`` run swaps the select policies back to the per-row
+``is_company_member(empresa_id)`` check (and the function back to its volatile
+two-EXISTS body) inside a transaction that is rolled back afterwards; the
+``current`` run uses the policies from
+``20260213000000_rls_company_ids_initplan.sql``. Usage (from
+``testsprite_tests/``)::
+
+    python -m harness.local_supabase up --keep    # in another shell
+    python -m harness.dataset --tier 1m --seed 42
+    python -m harness.rls_bench --duration 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+import psycopg
+
+from .config import TMP_DIR
+from .local_supabase.stack import StackConfig
+
+DEFAULT_REPORT = TMP_DIR / "rls_bench_report.json"
+MODES = ("legacy", "current")
+TABLES = ("lancamentos", "contas_contabeis", "contas_a_pagar", "dre_categorias_dre")
+
+LEGACY_IS_COMPANY_MEMBER = """
+CREATE OR REPLACE FUNCTION public.is_company_member(p_company_id uuid)
+RETURNS boolean
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+SET row_security = off
+AS $$
+  select exists(
+    select 1 from public.empresas e
+    where e.id = p_company_id
+      and e.ativa is true
+      and e.user_id = auth.uid()
+  )
+  or exists(
+    select 1 from public.company_collaborators cc
+    where cc.company_id = p_company_id
+      and cc.user_id = auth.uid()
+  );
+$$
+"""
+
+# name -> SQL with %(empresa)s, %(inicio)s and %(fim)s placeholders; filters mirror the app's
+SCRIPT = {
+    "dashboard_period": (
+        "SELECT id, conta_id, data, valor, tipo FROM public.lancamentos "
+        "WHERE empresa_id = %(empresa)s AND data >= %(inicio)s AND data <= %(fim)s"
+    ),
+    "report_totals": "SELECT count(*), sum(valor) FROM public.lancamentos WHERE empresa_id = %(empresa)s",
+    "contas_pagar_page": (
+        "SELECT id, fornecedor, descricao, valor, data_vencimento, status FROM public.contas_a_pagar "
+        "ORDER BY created_at DESC LIMIT 50"
+    ),
+    "plano_de_contas": "SELECT id, codigo, nome, categoria FROM public.contas_contabeis WHERE empresa_id = %(empresa)s",
+}
+
+
+def _p95(values: list[float]) -> float:
+    return sorted(values)[max(0, math.ceil(0.95 * len(values)) - 1)] if values else 0.0
+
+
+@dataclass
+class BenchResult:
+    mode: str
+    duration: float
+    transactions: int
+    tps: float
+    latency_ms: dict[str, dict[str, float]] = field(default_factory=dict)
+
+
+def use_legacy_policies(conn: psycopg.Connection) -> None:
+    conn.execute(LEGACY_IS_COMPANY_MEMBER)
+    for table in TABLES:
+        conn.execute(f"DROP POLICY IF EXISTS {table}_select_member ON public.{table}")
+        conn.execute(
+            f"CREATE POLICY {table}_select_member ON public.{table} "
+            "FOR SELECT USING (public.is_company_member(empresa_id))"
+        )
+
+
+def as_member(conn: psycopg.Connection, user_id: str) -> None:
+    conn.execute("SET LOCAL ROLE authenticated")
+    claims = json.dumps({"sub": user_id, "role": "authenticated"})
+    conn.execute("SELECT set_config('request.jwt.claims', %s, true)", (claims,))
+
+
+def bench(dsn: str, mode: str, user_id: str, params: dict[str, Any], duration: float) -> BenchResult:
+    """Run the script in a loop for ``duration`` seconds; everything is rolled back."""
+    samples: dict[str, list[float]] = {name: [] for name in SCRIPT}
+    transactions = 0
+    with psycopg.connect(dsn) as conn:
+        if mode == "legacy":
+            use_legacy_policies(conn)
+        as_member(conn, user_id)
+        # One untimed pass to warm the cache and the plans.
+        for sql in SCRIPT.values():
+            conn.execute(sql, params).fetchall()
+        started = time.perf_counter()
+        while time.perf_counter() - started < duration:
+            for name, sql in SCRIPT.items():
+                began = time.perf_counter()
+                conn.execute(sql, params).fetchall()
+                samples[name].append((time.perf_counter() - began) * 1000)
+            transactions += 1
+        elapsed = time.perf_counter() - started
+        conn.rollback()
+
+    return BenchResult(
+        mode=mode,
+        duration=round(elapsed, 3),
+        transactions=transactions,
+        tps=round(transactions / elapsed, 2) if elapsed else 0.0,
+        latency_ms={
+            name: {
+                "avg": round(sum(values) / len(values), 3) if values else 0.0,
+                "p50": round(statistics.median(values), 3) if values else 0.0,
+                "p95": round(_p95(values), 3),
+            }
+            for name, values in samples.items()
+        },
+    )
+
+
+def company_and_owner(conn: psycopg.Connection, empresa: str | None = None) -> tuple[str, str]:
+    """(company id, owner id) of ``empresa``, or of the company with the most lancamentos."""
+    if empresa:
+        row = conn.execute("SELECT id, user_id FROM public.empresas WHERE id = %s", (empresa,)).fetchone()
+    else:
+        row = conn.execute(
+            """
+            SELECT e.id, e.user_id FROM public.empresas e
+            JOIN (SELECT empresa_id, count(*) AS n FROM public.lancamentos GROUP BY empresa_id) l
+              ON l.empresa_id = e.id
+            ORDER BY l.n DESC LIMIT 1
+            """
+        ).fetchone()
+    if row is None:
+        raise LookupError(f"No company {empresa}" if empresa else "No lancamentos loaded; run python -m harness.dataset first")
+    return str(row[0]), str(row[1])
+
+
+def format_comparison(results: list[BenchResult]) -> str:
+    by_mode = {result.mode: result for result in results}
+    lines = [f"{'':22}" + "".join(f"{mode:>16}" for mode in by_mode)]
+    lines.append(f"{'tps':22}" + "".join(f"{result.tps:16.1f}" for result in by_mode.values()))
+    for name in SCRIPT:
+        lines.append(
+            f"{name + ' p95 ms':22}" + "".join(f"{result.latency_ms[name]['p95']:16.2f}" for result in by_mode.values())
+        )
+    if set(MODES) <= set(by_mode) and by_mode["legacy"].tps:
+        lines.append(f"speedup: {by_mode['current'].tps / by_mode['legacy'].tps:.1f}x tps")
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m harness.rls_bench", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--mode", action="append", choices=MODES, help="policies to run; repeatable (default: both)")
+    parser.add_argument("--dsn", default=StackConfig().dsn, help="Postgres connection string (default: local stack)")
+    parser.add_argument("--empresa", help="company id (default: the one with the most lancamentos)")
+    parser.add_argument("--user", help="member user id (default: the company's owner)")
+    parser.add_argument("--duration", type=float, default=15.0, help="seconds per mode")
+    parser.add_argument("--months", type=int, default=3, help="length of the dashboard period, ending today")
+    parser.add_argument("--report", type=Path, default=DEFAULT_REPORT, help="JSON report path")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    with psycopg.connect(args.dsn) as conn:
+        empresa, owner = company_and_owner(conn, args.empresa)
+    user_id = args.user or owner
+    params = {"empresa": empresa, "inicio": date.today() - timedelta(days=30 * args.months), "fim": date.today()}
+
+    results = []
+    for mode in args.mode or list(MODES):
+        result = bench(args.dsn, mode, user_id, params, args.duration)
+        print(f"{mode}: {result.transactions} transactions in {result.duration:.1f}s ({result.tps:.1f} tps)", flush=True)
+        results.append(result)
+    print(format_comparison(results))
+
+    args.report.parent.mkdir(parents=True, exist_ok=True)
+    report = {"empresa": empresa, "user": user_id, "results": [asdict(result) for result in results]}
+    args.report.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"-> {args.report}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
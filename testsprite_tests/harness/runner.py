@@ -0,0 +1,310 @@
+"""Run the TC scripts concurrently on a pool of warm browsers.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m harness.runner --workers 8
+    python -m harness.runner TC011 TC013 --report tmp/dashboard.json
+    python -m harness.runner --role owner --perf
+
+Every script runs on a worker coroutine with a fresh ``BrowserContext``;
+pass/fail, duration and time spent in ``PageActions`` waits per script are
+collected into one JSON report. With ``--perf`` the route budgets from
+``harness.perf`` are checked after the suite and a route over budget fails
+the run. ``--artifacts`` records a HAR and a Playwright trace per test and
+keeps them only for failed or slow tests (see ``harness.artifacts``).
+``--network replay`` serves Supabase calls from recorded fixtures (see
+``harness.fixtures``).
+``--shard I/K`` runs one duration-balanced slice of the suite for CI fan-out
+(see ``harness.shards``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import traceback
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from playwright.async_api import Browser, async_playwright
+
+from .artifacts import ArtifactRecorder, RetentionPolicy
+from .config import TMP_DIR
+from .fixtures import FIXTURES_DIR, MODES as NETWORK_MODES, NetworkMode
+from .perf import DEFAULT_BUDGETS, Budgets, format_result, run_budgets
+from .pool import BrowserPool, ScriptApi, ScriptBrowser
+from .scripts import ScriptSkipped, TestScript, discover_scripts, load_script
+from .session import bootstrap_roles, context_options as role_context_options
+from .shards import DEFAULT_DURATIONS, load_durations, parse_shard, record_durations, select_shard, write_junit
+from .waits import WaitStats, bind_stats
+
+DEFAULT_REPORT = TMP_DIR / "runner_report.json"
+DEFAULT_TIMEOUT = 300.0
+
+STATUS_PASSED = "passed"
+STATUS_FAILED = "failed"
+STATUS_ERROR = "error"
+STATUS_TIMEOUT = "timeout"
+STATUS_SKIPPED = "skipped"
+
+
+@dataclass
+class TestResult:
+    test_id: str
+    name: str
+    status: str
+    duration: float
+    worker: int
+    message: str | None = None
+    waits: dict[str, Any] = field(default_factory=dict)
+    artifacts: list[str] = field(default_factory=list)
+    network_misses: list[str] = field(default_factory=list)
+
+
+async def run_script(
+    script: TestScript,
+    browser: Browser,
+    worker: int,
+    timeout: float = DEFAULT_TIMEOUT,
+    context_options: dict[str, Any] | None = None,
+    retention: RetentionPolicy | None = None,
+    network: NetworkMode | None = None,
+) -> TestResult:
+    """Run one script; with ``retention``, record HAR and trace and keep them per the policy.
+
+    With ``network``, Supabase calls are recorded to or replayed from the
+    script's fixture file; a recording is saved only when the script passes.
+    """
+    recorder = ArtifactRecorder.for_test(script.name) if retention else None
+    fixtures = network.fixtures_for(script.name) if network else None
+    script_browser = ScriptBrowser(browser, context_options, recorder, fixtures)
+    stats = WaitStats()
+    bind_stats(stats)
+    status = STATUS_PASSED
+    message = None
+    started = time.perf_counter()
+    try:
+        loaded = load_script(script)
+        loaded.namespace["async_api"] = ScriptApi(script_browser)
+        await asyncio.wait_for(loaded.run_test(), timeout)
+    except ScriptSkipped as exc:
+        status, message = STATUS_SKIPPED, str(exc)
+    except AssertionError as exc:
+        status, message = STATUS_FAILED, str(exc) or "assertion failed"
+    except asyncio.TimeoutError:
+        status, message = STATUS_TIMEOUT, f"exceeded {timeout:.0f}s"
+    except Exception as exc:  # noqa: BLE001 - any script error is a result, not a crash
+        status = STATUS_ERROR
+        message = "".join(traceback.format_exception_only(type(exc), exc)).strip()
+    finally:
+        await script_browser.close()
+
+    duration = time.perf_counter() - started
+    artifacts = []
+    if recorder is not None and retention is not None:
+        if retention.keep(status == STATUS_PASSED, duration, stats.longest):
+            artifacts = [str(path) for path in recorder.files()]
+        else:
+            recorder.discard()
+    if fixtures is not None and fixtures.mode == "record" and status == STATUS_PASSED:
+        fixtures.save()
+
+    return TestResult(
+        test_id=script.test_id,
+        name=script.name,
+        status=status,
+        duration=round(duration, 3),
+        worker=worker,
+        message=message,
+        waits=stats.as_dict(),
+        artifacts=artifacts,
+        network_misses=fixtures.misses if fixtures else [],
+    )
+
+
+async def _worker(
+    index: int,
+    queue: asyncio.Queue[TestScript],
+    pool: BrowserPool,
+    results: list[TestResult],
+    timeout: float,
+    context_options: dict[str, Any] | None,
+    retention: RetentionPolicy | None,
+    network: NetworkMode | None,
+) -> None:
+    while True:
+        try:
+            script = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+        async with pool.lease() as browser:
+            result = await run_script(script, browser, index, timeout, context_options, retention, network)
+        results.append(result)
+        print(
+            f"[{index}] {result.status.upper():7} {result.duration:7.1f}s "
+            f"(waited {result.waits['total']:.1f}s) {result.name}",
+            flush=True,
+        )
+
+
+async def run_suite(
+    scripts: list[TestScript],
+    workers: int,
+    timeout: float = DEFAULT_TIMEOUT,
+    headless: bool = True,
+    role: str | None = None,
+    retention: RetentionPolicy | None = None,
+    network: NetworkMode | None = None,
+) -> list[TestResult]:
+    """Run ``scripts`` on ``workers`` coroutines sharing as many browsers.
+
+    With ``role``, every context starts from that role's saved storage state
+    (logging in once first if it is missing or expired). With ``retention``,
+    HAR files and traces are recorded and kept for failed or slow tests. With
+    ``network``, Supabase traffic is recorded to or replayed from fixtures.
+    """
+    workers = max(1, min(workers, len(scripts)))
+    queue: asyncio.Queue[TestScript] = asyncio.Queue()
+    for script in scripts:
+        queue.put_nowait(script)
+
+    results: list[TestResult] = []
+    async with async_playwright() as playwright:
+        pool = BrowserPool(playwright, size=workers, headless=headless)
+        await pool.start()
+        try:
+            context_options = None
+            if role:
+                async with pool.lease() as browser:
+                    await bootstrap_roles(browser, [role])
+                context_options = role_context_options(role)
+            await asyncio.gather(
+                *(
+                    _worker(index, queue, pool, results, timeout, context_options, retention, network)
+                    for index in range(workers)
+                )
+            )
+        finally:
+            await pool.close()
+
+    results.sort(key=lambda result: result.name)
+    return results
+
+
+def build_report(results: list[TestResult], wall_clock: float, workers: int) -> dict[str, Any]:
+    summary = {"total": len(results)}
+    for status in (STATUS_PASSED, STATUS_FAILED, STATUS_ERROR, STATUS_TIMEOUT, STATUS_SKIPPED):
+        summary[status] = sum(1 for result in results if result.status == status)
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "workers": workers,
+        "wall_clock": round(wall_clock, 3),
+        "summed_duration": round(sum(result.duration for result in results), 3),
+        "summed_wait": round(sum(result.waits.get("total", 0.0) for result in results), 3),
+        "summary": summary,
+        "results": [asdict(result) for result in results],
+    }
+
+
+def write_report(report: dict[str, Any], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("patterns", nargs="*", help="test ids or file name globs to run (default: all)")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="concurrent tests, one warm browser each (default: CPU count)")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help="per-test timeout in seconds")
+    parser.add_argument("--report", type=Path, default=DEFAULT_REPORT, help="JSON report path")
+    parser.add_argument("--role", help="start every test logged in as this role (see harness.session)")
+    parser.add_argument("--headed", action="store_true", help="show the browser windows")
+    parser.add_argument("--artifacts", action="store_true",
+                        help="record HAR and trace per test; keep them for failed or slow tests")
+    parser.add_argument("--slow-test", type=float, default=RetentionPolicy.slow_test,
+                        help="with --artifacts, keep passing tests slower than this (seconds)")
+    parser.add_argument("--slow-step", type=float, default=RetentionPolicy.slow_step,
+                        help="with --artifacts, keep tests with a single wait longer than this (seconds)")
+    parser.add_argument("--network", choices=NETWORK_MODES,
+                        help="record Supabase calls to fixtures, or replay them instead of calling Supabase")
+    parser.add_argument("--fixtures", type=Path, default=FIXTURES_DIR, help="fixture directory for --network")
+    parser.add_argument("--perf", action="store_true",
+                        help="check page-load budgets after the suite (as --role, default owner)")
+    parser.add_argument("--budgets", type=Path, default=DEFAULT_BUDGETS, help="budgets JSON for --perf")
+    parser.add_argument("--shard", type=parse_shard, metavar="I/K", help="run only shard I of K (from 1)")
+    parser.add_argument("--durations", type=Path, default=DEFAULT_DURATIONS,
+                        help="recorded durations used to balance --shard")
+    parser.add_argument("--record-durations", action="store_true", help="fold this run's durations into --durations")
+    parser.add_argument("--junit", type=Path, help="also write the results as JUnit XML")
+    parser.add_argument("--list", action="store_true", help="list the selected scripts and exit")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    scripts = discover_scripts(patterns=args.patterns)
+    if not scripts:
+        print("No TC scripts matched.", file=sys.stderr)
+        return 2
+    if args.shard:
+        scripts = select_shard(scripts, lambda script: script.name, args.shard, load_durations(args.durations))
+    if args.list:
+        for script in scripts:
+            print(script.name)
+        return 0
+    if not scripts:
+        # More shards than tests: an empty shard passes, with a report for the merge step
+        report = build_report([], 0.0, 0)
+        report["shard"] = "{}/{}".format(*args.shard)
+        write_report(report, args.report)
+        if args.junit:
+            write_junit(report, args.junit)
+        print(f"No tests in shard {report['shard']} -> {args.report}")
+        return 0
+
+    started = time.perf_counter()
+    retention = RetentionPolicy(args.slow_test, args.slow_step) if args.artifacts else None
+    network = NetworkMode(args.network, args.fixtures) if args.network else None
+    results = asyncio.run(
+        run_suite(
+            scripts, args.workers, args.timeout, headless=not args.headed, role=args.role,
+            retention=retention, network=network,
+        )
+    )
+    report = build_report(results, time.perf_counter() - started, args.workers)
+    if args.shard:
+        report["shard"] = "{}/{}".format(*args.shard)
+    within_budget = True
+    if args.perf:
+        perf_results = asyncio.run(
+            run_budgets(Budgets.load(args.budgets), args.role or "owner", headless=not args.headed)
+        )
+        report["performance"] = [asdict(result) for result in perf_results]
+        within_budget = all(result.passed for result in perf_results)
+        for result in perf_results:
+            print(format_result(result))
+    write_report(report, args.report)
+    if args.junit:
+        write_junit(report, args.junit)
+    if args.record_durations:
+        record_durations(report["results"], args.durations)
+
+    summary = report["summary"]
+    print(
+        f"{summary['passed']}/{summary['total']} passed, {summary[STATUS_SKIPPED]} skipped in {report['wall_clock']:.1f}s "
+        f"(sequential {report['summed_duration']:.1f}s, waiting {report['summed_wait']:.1f}s) "
+        f"-> {args.report}"
+    )
+    return 0 if summary["passed"] + summary[STATUS_SKIPPED] == summary["total"] and within_budget else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+"""Data-driven runner for ``testsprite_frontend_test_plan.json``.
+
+Each plan scenario runs through the shared step library in ``steps`` once per
+variant (``pt-BR``, ``en-US``, ``mobile``), so the plan is the single source
+of the flows instead of one generated script per language. Usage (from
+``testsprite_tests/``)::
+
+    python -m harness.scenarios --variant pt-BR --variant mobile
+    python -m harness.scenarios --rerun-failed tmp/scenario_report.json
+
+CI passes ``--strict`` so a plan step without an implementation fails the run
+instead of leaving its scenario "undefined".
+"""
+
+from . import steps  # noqa: F401 - registers the step implementations
+from .engine import (
+    FAILED_STATUSES,
+    VARIANTS,
+    Scenario,
+    ScenarioResult,
+    StepSkipped,
+    Variant,
+    World,
+    load_plan,
+    registry,
+    run_scenario,
+    step,
+)
+
+__all__ = [
+    "FAILED_STATUSES",
+    "VARIANTS",
+    "Scenario",
+    "ScenarioResult",
+    "StepSkipped",
+    "Variant",
+    "World",
+    "load_plan",
+    "registry",
+    "run_scenario",
+    "step",
+]
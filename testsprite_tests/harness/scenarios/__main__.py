@@ -0,0 +1,197 @@
+"""CLI: ``python -m harness.scenarios [TC001 ...] [--variant NAME ...] [--rerun-failed REPORT]``."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any
+
+from playwright.async_api import async_playwright
+
+from ..config import TMP_DIR
+from ..fixtures import FIXTURES_DIR, MODES as NETWORK_MODES, NetworkMode
+from ..pool import BrowserPool
+from ..runner import build_report, write_report
+from ..shards import DEFAULT_DURATIONS, load_durations, parse_shard, record_durations, select_shard, write_junit
+from . import load_plan, registry, run_scenario
+from .engine import (
+    DEFAULT_VARIANTS,
+    FAILED_STATUSES,
+    STATUS_PASSED,
+    STATUS_SKIPPED,
+    STATUS_UNDEFINED,
+    VARIANTS,
+    Scenario,
+    ScenarioResult,
+    Variant,
+)
+
+DEFAULT_REPORT = TMP_DIR / "scenario_report.json"
+
+Job = tuple[Scenario, Variant]
+
+
+def select_jobs(
+    scenarios: list[Scenario],
+    variants: list[Variant],
+    patterns: list[str],
+    rerun: set[tuple[str, str]] | None = None,
+) -> list[Job]:
+    jobs = []
+    for scenario in scenarios:
+        if patterns and not any(fnmatch(scenario.id, pattern) for pattern in patterns):
+            continue
+        for variant in variants:
+            if rerun is None or (scenario.id, variant.name) in rerun:
+                jobs.append((scenario, variant))
+    return jobs
+
+
+def failed_in(report_path: Path) -> set[tuple[str, str]]:
+    """(test id, variant) pairs that failed, errored or timed out in a previous report."""
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    return {
+        (result["test_id"], result["variant"])
+        for result in report["results"]
+        if result["status"] in FAILED_STATUSES
+    }
+
+
+async def _worker(
+    index: int,
+    queue: asyncio.Queue[Job],
+    pool: BrowserPool,
+    results: list[ScenarioResult],
+    step_timeout: float,
+    network: NetworkMode | None,
+) -> None:
+    while True:
+        try:
+            scenario, variant = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+        async with pool.lease() as browser:
+            result = await run_scenario(scenario, variant, browser, index, step_timeout, network=network)
+        results.append(result)
+        print(f"[{index}] {result.status.upper():9} {result.duration:7.1f}s {result.key} {result.name}", flush=True)
+        if result.status != STATUS_PASSED and result.message:
+            print(f"      {result.message}", flush=True)
+
+
+async def run_scenarios(
+    jobs: list[Job],
+    workers: int,
+    step_timeout: float = 60.0,
+    headless: bool = True,
+    network: NetworkMode | None = None,
+) -> list[ScenarioResult]:
+    workers = max(1, min(workers, len(jobs)))
+    queue: asyncio.Queue[Job] = asyncio.Queue()
+    for job in jobs:
+        queue.put_nowait(job)
+
+    results: list[ScenarioResult] = []
+    async with async_playwright() as playwright:
+        pool = BrowserPool(playwright, size=workers, headless=headless)
+        await pool.start()
+        try:
+            await asyncio.gather(*(_worker(index, queue, pool, results, step_timeout, network) for index in range(workers)))
+        finally:
+            await pool.close()
+    results.sort(key=lambda result: (result.test_id, result.variant))
+    return results
+
+
+def scenario_report(results: list[ScenarioResult], wall_clock: float, workers: int) -> dict[str, Any]:
+    report = build_report(results, wall_clock, workers)  # type: ignore[arg-type]
+    for status in (STATUS_SKIPPED, STATUS_UNDEFINED):
+        report["summary"][status] = sum(1 for result in results if result.status == status)
+    report["variants"] = sorted({result.variant for result in results})
+    return report
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m harness.scenarios", description=__doc__)
+    parser.add_argument("patterns", nargs="*", help="scenario ids or globs to run (default: all)")
+    parser.add_argument("--variant", action="append", choices=sorted(VARIANTS),
+                        help=f"variant to run each scenario under; repeatable (default: {', '.join(DEFAULT_VARIANTS)})")
+    parser.add_argument("--all-variants", action="store_true", help="run every variant")
+    parser.add_argument("--rerun-failed", type=Path, metavar="REPORT",
+                        help="run only the scenario/variant pairs that failed in REPORT")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="concurrent scenarios, one warm browser each (default: CPU count)")
+    parser.add_argument("--step-timeout", type=float, default=60.0, help="per-step timeout in seconds")
+    parser.add_argument("--report", type=Path, default=DEFAULT_REPORT, help="JSON report path")
+    parser.add_argument("--headed", action="store_true", help="show the browser windows")
+    parser.add_argument("--network", choices=NETWORK_MODES,
+                        help="record Supabase calls to fixtures, or replay them instead of calling Supabase")
+    parser.add_argument("--fixtures", type=Path, default=FIXTURES_DIR, help="fixture directory for --network")
+    parser.add_argument("--shard", type=parse_shard, metavar="I/K", help="run only shard I of K (from 1)")
+    parser.add_argument("--durations", type=Path, default=DEFAULT_DURATIONS,
+                        help="recorded durations used to balance --shard")
+    parser.add_argument("--record-durations", action="store_true", help="fold this run's durations into --durations")
+    parser.add_argument("--junit", type=Path, help="also write the results as JUnit XML")
+    parser.add_argument("--list", action="store_true", help="list the selected runs and undefined steps, then exit")
+    parser.add_argument("--strict", action="store_true",
+                        help="fail the run when a plan step has no implementation (for CI)")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    names = sorted(VARIANTS) if args.all_variants else (args.variant or list(DEFAULT_VARIANTS))
+    rerun = failed_in(args.rerun_failed) if args.rerun_failed else None
+    jobs = select_jobs(load_plan(), [VARIANTS[name] for name in names], args.patterns, rerun)
+    if not jobs:
+        print("No scenarios selected." if rerun is None else "Nothing failed in that report.", file=sys.stderr)
+        return 2 if rerun is None else 0
+    if args.shard:
+        jobs = select_shard(jobs, lambda job: f"{job[0].id}[{job[1].name}]", args.shard, load_durations(args.durations))
+    if args.list:
+        for scenario, variant in jobs:
+            print(f"{scenario.id}[{variant.name}] {scenario.title}")
+            for plan_step in scenario.steps:
+                if registry.match(plan_step.description) is None:
+                    print(f"    undefined: {plan_step.description}")
+        return 0
+    if not jobs:
+        # More shards than runs: an empty shard passes, with a report for the merge step
+        report = scenario_report([], 0.0, 0)
+        report["shard"] = "{}/{}".format(*args.shard)
+        write_report(report, args.report)
+        if args.junit:
+            write_junit(report, args.junit, suite_name="scenarios")
+        print(f"No tests in shard {report['shard']} -> {args.report}")
+        return 0
+
+    started = time.perf_counter()
+    network = NetworkMode(args.network, args.fixtures) if args.network else None
+    results = asyncio.run(
+        run_scenarios(jobs, args.workers, args.step_timeout, headless=not args.headed, network=network)
+    )
+    report = scenario_report(results, time.perf_counter() - started, args.workers)
+    if args.shard:
+        report["shard"] = "{}/{}".format(*args.shard)
+    write_report(report, args.report)
+    if args.junit:
+        write_junit(report, args.junit, suite_name="scenarios")
+    if args.record_durations:
+        record_durations(report["results"], args.durations)
+
+    summary = report["summary"]
+    print(
+        f"{summary['passed']}/{summary['total']} passed, {summary[STATUS_SKIPPED]} skipped, "
+        f"{summary[STATUS_UNDEFINED]} undefined in {report['wall_clock']:.1f}s -> {args.report}"
+    )
+    failed = (*FAILED_STATUSES, STATUS_UNDEFINED) if args.strict else FAILED_STATUSES
+    return 1 if any(result.status in failed for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
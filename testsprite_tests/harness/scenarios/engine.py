@@ -0,0 +1,257 @@
+"""Plan loading, step matching and scenario execution.
+
+A scenario is one entry of ``testsprite_frontend_test_plan.json``. Each of its
+step descriptions is matched against the patterns registered with ``@step``
+(case-insensitive, whole description) and run with the captured groups as
+keyword arguments. A step with no matching pattern is ``undefined``; a step
+that raises ``StepSkipped`` (missing test data, feature not in the app) is
+``skipped``. Either stops the scenario without failing it, like pending
+steps in BDD tools.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import time
+import traceback
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+from playwright.async_api import Browser, BrowserContext, Page
+
+from ..config import SUITE_DIR, base_url
+from ..fixtures import NetworkMode
+from ..pages import ActivationPage, ContasPagarPage, DashboardPage, LoginPage, RelatoriosPage
+from ..session import get_role
+from ..waits import PageActions, WaitStats, bind_stats
+
+PLAN_PATH = SUITE_DIR / "testsprite_frontend_test_plan.json"
+
+STATUS_PASSED = "passed"
+STATUS_FAILED = "failed"
+STATUS_ERROR = "error"
+STATUS_TIMEOUT = "timeout"
+STATUS_SKIPPED = "skipped"
+STATUS_UNDEFINED = "undefined"
+# Outcomes worth re-running with --rerun-failed.
+FAILED_STATUSES = (STATUS_FAILED, STATUS_ERROR, STATUS_TIMEOUT)
+
+StepFunction = Callable[..., Awaitable[None]]
+
+
+class StepSkipped(Exception):
+    """Raised by a step that cannot run in this environment."""
+
+
+@dataclass(frozen=True)
+class PlanStep:
+    type: str
+    description: str
+
+
+@dataclass(frozen=True)
+class Scenario:
+    id: str
+    title: str
+    category: str
+    priority: str
+    steps: tuple[PlanStep, ...]
+
+
+@dataclass(frozen=True)
+class Variant:
+    """Browser setup a scenario runs under: locale, viewport, device flags."""
+
+    name: str
+    context_options: dict[str, Any]
+
+
+VARIANTS = {
+    variant.name: variant
+    for variant in (
+        Variant("pt-BR", {"locale": "pt-BR", "timezone_id": "America/Sao_Paulo"}),
+        Variant("en-US", {"locale": "en-US", "timezone_id": "America/New_York"}),
+        Variant(
+            "mobile",
+            {
+                "locale": "pt-BR",
+                "timezone_id": "America/Sao_Paulo",
+                "viewport": {"width": 390, "height": 844},
+                "is_mobile": True,
+                "has_touch": True,
+            },
+        ),
+    )
+}
+DEFAULT_VARIANTS = ("pt-BR",)
+
+
+def load_plan(path: Path = PLAN_PATH) -> list[Scenario]:
+    entries = json.loads(path.read_text(encoding="utf-8"))
+    return [
+        Scenario(
+            id=entry["id"],
+            title=entry["title"],
+            category=entry.get("category", ""),
+            priority=entry.get("priority", ""),
+            steps=tuple(PlanStep(step["type"], step["description"]) for step in entry["steps"]),
+        )
+        for entry in entries
+    ]
+
+
+class StepRegistry:
+    def __init__(self) -> None:
+        self._steps: list[tuple[re.Pattern[str], StepFunction]] = []
+
+    def step(self, pattern: str) -> Callable[[StepFunction], StepFunction]:
+        compiled = re.compile(pattern, re.IGNORECASE)
+
+        def register(function: StepFunction) -> StepFunction:
+            self._steps.append((compiled, function))
+            return function
+
+        return register
+
+    def match(self, description: str) -> tuple[StepFunction, dict[str, str]] | None:
+        text = " ".join(description.split()).rstrip(".")
+        for pattern, function in self._steps:
+            found = pattern.fullmatch(text)
+            if found:
+                return function, {key: value for key, value in found.groupdict().items() if value is not None}
+        return None
+
+
+registry = StepRegistry()
+step = registry.step
+
+
+class World:
+    """State shared by the steps of one scenario run."""
+
+    def __init__(self, browser: Browser, context: BrowserContext, page: Page, variant: Variant) -> None:
+        self.browser = browser
+        self.context = context
+        self.page = page
+        self.variant = variant
+        self.base_url = base_url()
+        self.actions = PageActions(page)
+        self.login = LoginPage(page, self.actions)
+        self.activation = ActivationPage(page, self.actions)
+        self.dashboard = DashboardPage(page, self.actions)
+        self.contas_pagar = ContasPagarPage(page, self.actions)
+        self.relatorios = RelatoriosPage(page, self.actions)
+        self.role: str | None = None
+        # Values steps hand to later steps (created names, downloads ...).
+        self.data: dict[str, Any] = {}
+
+    async def goto(self, path: str) -> None:
+        await self.page.goto(f"{self.base_url}{path}", wait_until="commit")
+        await self.actions.settle()
+
+    async def ensure_session(self, role: str = "owner") -> None:
+        """Log in through the UI as ``role`` unless already logged in as it."""
+        if self.role == role:
+            return
+        try:
+            email, password = get_role(role).credentials()
+        except LookupError as exc:
+            raise StepSkipped(str(exc)) from None
+        if self.role is not None:
+            await self.context.clear_cookies()
+            await self.page.evaluate("() => window.localStorage.clear()")
+        await self.login.goto()
+        await self.login.login_and_wait(email, password)
+        self.role = role
+
+
+@dataclass
+class StepResult:
+    description: str
+    status: str
+    duration: float
+    message: str | None = None
+
+
+@dataclass
+class ScenarioResult:
+    test_id: str
+    variant: str
+    name: str
+    status: str
+    duration: float
+    worker: int
+    message: str | None = None
+    steps: list[StepResult] = field(default_factory=list)
+    waits: dict[str, Any] = field(default_factory=dict)
+    network_misses: list[str] = field(default_factory=list)
+
+    @property
+    def key(self) -> str:
+        return f"{self.test_id}[{self.variant}]"
+
+
+def _describe(exc: BaseException) -> str:
+    return "".join(traceback.format_exception_only(type(exc), exc)).strip()
+
+
+async def run_scenario(
+    scenario: Scenario,
+    variant: Variant,
+    browser: Browser,
+    worker: int = 0,
+    step_timeout: float = 60.0,
+    steps: StepRegistry = registry,
+    network: NetworkMode | None = None,
+) -> ScenarioResult:
+    """Run ``scenario`` in a fresh context; ``network`` records or replays its Supabase calls."""
+    fixtures = network.fixtures_for(f"{scenario.id}-{variant.name}") if network else None
+    stats = WaitStats()
+    bind_stats(stats)
+    result = ScenarioResult(scenario.id, variant.name, scenario.title, STATUS_PASSED, 0.0, worker, waits={})
+    started = time.perf_counter()
+    context = await browser.new_context(**variant.context_options)
+    try:
+        world = World(browser, context, await context.new_page(), variant)
+        if fixtures is not None:
+            try:
+                await fixtures.attach(context)
+            except LookupError as exc:
+                result.status, result.message = STATUS_ERROR, str(exc)
+        for plan_step in scenario.steps if result.status == STATUS_PASSED else ():
+            matched = steps.match(plan_step.description)
+            if matched is None:
+                result.steps.append(StepResult(plan_step.description, STATUS_UNDEFINED, 0.0))
+                result.status, result.message = STATUS_UNDEFINED, f"no step matches '{plan_step.description}'"
+                break
+            function, arguments = matched
+            status, message = STATUS_PASSED, None
+            step_started = time.perf_counter()
+            try:
+                await asyncio.wait_for(function(world, **arguments), step_timeout)
+            except StepSkipped as exc:
+                status, message = STATUS_SKIPPED, str(exc)
+            except AssertionError as exc:
+                status, message = STATUS_FAILED, str(exc) or "assertion failed"
+            except asyncio.TimeoutError:
+                status, message = STATUS_TIMEOUT, f"exceeded {step_timeout:.0f}s"
+            except Exception as exc:  # noqa: BLE001 - any step error is a result, not a crash
+                status, message = STATUS_ERROR, _describe(exc)
+            result.steps.append(
+                StepResult(plan_step.description, status, round(time.perf_counter() - step_started, 3), message)
+            )
+            if status != STATUS_PASSED:
+                result.status, result.message = status, f"{plan_step.description}: {message}"
+                break
+    finally:
+        await context.close()
+    result.duration = round(time.perf_counter() - started, 3)
+    result.waits = stats.as_dict()
+    if fixtures is not None:
+        result.network_misses = fixtures.misses
+        if fixtures.mode == "record" and result.status == STATUS_PASSED:
+            fixtures.save()
+    return result
@@ -0,0 +1,727 @@
+"""Step implementations for the plan in ``testsprite_frontend_test_plan.json``.
+
+One function per distinct step wording; scenarios that share a step (login,
+the contas-a-pagar form, the report screens) share its implementation, so a
+layout change is fixed here once instead of in a pt-BR and an English copy
+of every TC script. Steps that need data the suite cannot create (a real
+activation code, an invitation link, another tenant's company) read it from
+``E2E_*`` variables and skip without it.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import time
+from datetime import date, timedelta
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from playwright.async_api import Error, Locator
+
+from ..config import TMP_DIR
+from ..session import get_role, is_auth_key
+from .engine import StepSkipped, World, step
+
+ATTACHMENT_PATH = TMP_DIR / "scenario_attachment.png"
+# 1x1 transparent PNG, enough for the image inputs of ContaPagarForm.
+ATTACHMENT_BYTES = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000001e221bc330000000049454e44ae426082"
+)
+RESPONSIVE_VIEWPORTS = {
+    "mobile": {"width": 390, "height": 844},
+    "tablet": {"width": 768, "height": 1024},
+    "desktop": {"width": 1280, "height": 720},
+}
+
+
+def _env(name: str, purpose: str) -> str:
+    value = os.environ.get(name)
+    if not value:
+        raise StepSkipped(f"set {name} to {purpose}")
+    return value
+
+
+def _unique(prefix: str) -> str:
+    return f"{prefix} {time.strftime('%Y%m%d%H%M%S')}{random.randint(100, 999)}"
+
+
+def _cnpj() -> str:
+    """Random CNPJ with valid check digits, formatted ``00.000.000/0001-00``."""
+    digits = [random.randint(0, 9) for _ in range(8)] + [0, 0, 0, 1]
+    for weights in ((5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2), (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)):
+        remainder = sum(d * w for d, w in zip(digits, weights)) % 11
+        digits.append(0 if remainder < 2 else 11 - remainder)
+    text = "".join(map(str, digits))
+    return f"{text[:2]}.{text[2:5]}.{text[5:8]}/{text[8:12]}-{text[12:]}"
+
+
+def _attachment() -> str:
+    if not ATTACHMENT_PATH.exists():
+        ATTACHMENT_PATH.parent.mkdir(parents=True, exist_ok=True)
+        ATTACHMENT_PATH.write_bytes(ATTACHMENT_BYTES)
+    return str(ATTACHMENT_PATH)
+
+
+async def _select_first(world: World, select: Locator) -> str:
+    """Choose the first non-placeholder option once the select is enabled and filled."""
+    await world.actions.wait_for(select)
+    option = select.locator("option:not([value='']):not([disabled])").first
+    await world.actions.wait_for(option, state="attached", timeout=world.actions.settle_timeout)
+    value = await option.get_attribute("value") or await option.inner_text()
+    await select.select_option(value)
+    await world.actions.settle()
+    return value
+
+
+async def _submit(world: World) -> None:
+    await world.actions.click(world.page.locator("form button[type=submit]").last)
+
+
+def _contas_pagar_items(world: World) -> Locator:
+    page = world.contas_pagar
+    return page.cards if world.variant.context_options.get("is_mobile") else page.rows
+
+
+async def _alert_text(world: World) -> str:
+    alert = world.page.get_by_role("alert").first
+    assert await world.actions.expect_visible(alert), "no alert message shown"
+    return await alert.inner_text()
+
+
+# Login (TC001, TC004)
+
+
+@step(r"navigate to login page")
+async def open_login(world: World) -> None:
+    await world.login.goto()
+
+
+@step(r"input valid username/email and password")
+async def fill_valid_credentials(world: World) -> None:
+    try:
+        email, password = get_role("owner").credentials()
+    except LookupError as exc:
+        raise StepSkipped(str(exc)) from None
+    await world.actions.fill(world.login.email, email)
+    await world.actions.fill(world.login.password, password)
+    world.data["login_role"] = "owner"
+
+
+@step(r"input invalid username/email or password")
+async def fill_invalid_credentials(world: World) -> None:
+    await world.actions.fill(world.login.email, f"nobody-{random.randint(10**5, 10**6)}@example.com")
+    await world.actions.fill(world.login.password, "wrong-password")
+
+
+@step(r"input (?:valid|invalid or missing) activation code")
+async def login_has_no_activation_code(world: World) -> None:
+    # Activation codes gate sign-up (/activation -> /signup); the login form must not ask for one.
+    assert not await world.activation.code.count(), (
+        "login form unexpectedly asks for an activation code"
+    )
+
+
+@step(r"click login button")
+async def submit_login(world: World) -> None:
+    await world.actions.click(world.login.submit)
+
+
+@step(r"verify user is successfully logged in and redirected to dashboard")
+async def expect_dashboard(world: World) -> None:
+    await world.page.wait_for_url("**/dashboard", timeout=world.actions.settle_timeout)
+    await world.dashboard.wait_ready()
+    world.role = world.data.get("login_role")
+
+
+@step(r"display appropriate error message and deny access")
+async def expect_login_error(world: World) -> None:
+    assert await world.actions.expect_visible(world.login.error), "no login error shown"
+    assert "/login" in world.page.url, f"left the login page: {world.page.url}"
+
+
+# Activation codes and sign-up (TC002, TC003, TC018)
+
+
+@step(r"navigate to activation code request page")
+async def open_activation_request(world: World) -> None:
+    await world.goto("/activation")
+    await world.activation.open_request()
+
+
+@step(r"fill in required user information for activation code")
+async def fill_activation_request(world: World) -> None:
+    await world.activation.fill_request(
+        "Teste E2E", f"e2e-{random.randint(10**5, 10**6)}@example.com", _unique("Empresa E2E")
+    )
+
+
+@step(r"submit activation code request")
+async def submit_activation_request(world: World) -> None:
+    await world.activation.submit_request()
+
+
+@step(r"check that activation code is generated and sent to administrator email")
+async def expect_activation_requested(world: World) -> None:
+    # The e-mail itself is sent by an edge function; the UI confirms the request.
+    text = await _alert_text(world)
+    assert "sucesso" in text.lower(), f"activation request not confirmed: {text}"
+
+
+@step(r"navigate to registration page")
+async def open_registration(world: World) -> None:
+    # /signup redirects to /activation until a code has been verified.
+    await world.goto("/activation")
+
+
+@step(r"enter valid activation code")
+async def enter_valid_activation_code(world: World) -> None:
+    code = _env("E2E_ACTIVATION_CODE", "run sign-up with an unused activation code")
+    await world.activation.verify(code)
+    await world.page.wait_for_url("**/signup", timeout=world.actions.settle_timeout)
+
+
+@step(r"try to register using expired or invalid activation code")
+async def enter_invalid_activation_code(world: World) -> None:
+    await world.goto("/activation")
+    await world.activation.verify(os.environ.get("E2E_EXPIRED_ACTIVATION_CODE", "INVALID-0000"))
+
+
+@step(r"fill registration form with valid user data")
+async def fill_registration(world: World) -> None:
+    page = world.page
+    password = f"E2e-{random.randint(10**7, 10**8)}"
+    await world.actions.fill(page.locator("input[name=fullName]"), "Teste E2E")
+    await world.actions.fill(page.locator("input[name=email]"), f"e2e-{random.randint(10**5, 10**6)}@example.com")
+    await world.actions.fill(page.locator("input[name=password]"), password)
+    await world.actions.fill(page.locator("input[name=confirmPassword]"), password)
+
+
+@step(r"submit registration form")
+async def submit_registration(world: World) -> None:
+    await _submit(world)
+
+
+@step(r"verify user account is created and redirected to dashboard")
+async def expect_registered(world: World) -> None:
+    # SignUpForm confirms and sends the user to /login to confirm the e-mail first.
+    text = await _alert_text(world)
+    assert "sucesso" in text.lower(), f"sign-up failed: {text}"
+
+
+@step(r"appropriate error message is shown and registration is blocked")
+async def expect_activation_rejected(world: World) -> None:
+    await _alert_text(world)
+    assert "/signup" not in world.page.url, "an invalid activation code opened the sign-up form"
+
+
+# Collaborators (TC005, TC006, TC007)
+
+
+@step(r"navigate to collaborators management page")
+async def open_collaborators(world: World) -> None:
+    await world.ensure_session("owner")
+    await world.goto("/configuracoes")
+    await _select_first(world, world.page.locator("select:has(option:text-is('Selecione uma empresa'))"))
+
+
+@step(r"enter collaborator email and assign role")
+async def fill_invite(world: World) -> None:
+    # The modal takes only the e-mail; collaborators join with the default role.
+    await world.actions.click(world.page.get_by_role("button", name="Adicionar Usuário"))
+    email = os.environ.get("E2E_INVITE_EMAIL") or f"e2e-{random.randint(10**5, 10**6)}@example.com"
+    await world.actions.fill(world.page.get_by_placeholder("colaborador@exemplo.com"), email)
+
+
+@step(r"send invitation")
+async def send_invite(world: World) -> None:
+    # The result is reported through window.alert.
+    async with world.page.expect_event("dialog", timeout=world.actions.settle_timeout) as dialog_info:
+        await world.page.get_by_role("button", name="Adicionar", exact=True).click()
+    dialog = await dialog_info.value
+    world.data["dialog"] = dialog.message
+    await dialog.accept()
+
+
+@step(r"check system sends email with valid invitation link")
+async def expect_invite_sent(world: World) -> None:
+    message = world.data.get("dialog", "")
+    assert message.startswith("✅"), f"collaborator not added: {message}"
+
+
+@step(r"access invitation link from email")
+async def open_invitation(world: World) -> None:
+    link = world.data["invitation_link"] = _env("E2E_INVITATION_LINK", "open an invitation")
+    await world.page.goto(link, wait_until="commit")
+    await world.actions.settle()
+    if "/accept-invitation/" in world.page.url:
+        raise StepSkipped("invitation links are disabled in this build (AcceptInvitationDisabled)")
+
+
+@step(r"create new account or log in")
+async def login_invited(world: World) -> None:
+    await world.ensure_session("collaborator")
+
+
+@step(r"accept the invitation")
+async def accept_invitation(world: World) -> None:
+    await world.page.goto(world.data["invitation_link"], wait_until="commit")
+    await world.actions.click(world.page.get_by_role("button", name="Aceitar").first)
+    await world.actions.settle()
+
+
+@step(r"confirm collaborator is added to company with assigned role and permissions")
+async def expect_collaborator_listed(world: World) -> None:
+    email, _ = get_role("collaborator").credentials()
+    await world.dashboard.goto()
+    assert not await world.dashboard.has_error(), "collaborator cannot open the company dashboard"
+    # The owner sees the member with the default role badge
+    await open_collaborators(world)
+    member = world.page.locator("div.justify-between", has=world.page.get_by_text(email, exact=True)).last
+    assert await world.actions.expect_visible(member), f"{email} is not listed as a collaborator"
+    assert "Usuário" in await member.inner_text(), "collaborator is listed without the default role"
+
+
+@step(r"login as collaborator with specific role")
+async def login_collaborator(world: World) -> None:
+    await world.ensure_session("collaborator")
+
+
+@step(r"attempt access to allowed features")
+async def open_allowed_feature(world: World) -> None:
+    await world.dashboard.goto()
+
+
+@step(r"access granted to allowed features")
+async def expect_access_granted(world: World) -> None:
+    assert not await world.dashboard.has_error(), "dashboard shows an error"
+
+
+@step(r"attempt access to features outside of permissions")
+async def open_forbidden_feature(world: World) -> None:
+    await world.goto("/configuracoes")
+
+
+@step(r"access denied and appropriate message shown")
+async def expect_access_denied(world: World) -> None:
+    denied = world.page.get_by_text("Acesso Negado").or_(world.page.get_by_text("Permissão Insuficiente"))
+    assert await world.actions.expect_visible(denied.first), "collaborator reached a restricted page"
+
+
+# Companies, chart of accounts, transactions (TC008, TC009, TC010)
+
+
+@step(r"navigate to new company registration page")
+async def open_new_company(world: World) -> None:
+    await world.ensure_session()
+    await world.goto("/empresas")
+    await world.actions.click(world.page.get_by_role("button", name="Nova Empresa"))
+
+
+@step(r"fill company form with valid data \(razao_social, cnpj, etc\.?\)")
+async def fill_company(world: World) -> None:
+    page = world.page
+    world.data["razao_social"] = _unique("Empresa E2E")
+    await world.actions.fill(page.locator("input[name=razaoSocial]"), world.data["razao_social"])
+    await world.actions.fill(page.locator("input[name=cnpj]"), _cnpj())
+    await page.locator("select[name=regimeTributario]").select_option("Simples Nacional")
+    await world.actions.fill(page.locator("input[name=dataAbertura]"), "2020-01-02")
+
+
+@step(r"submit the form")
+async def submit_form(world: World) -> None:
+    await _submit(world)
+
+
+@step(r"company is created and visible in company list")
+async def expect_company_listed(world: World) -> None:
+    listed = world.page.get_by_text(world.data["razao_social"]).first
+    assert await world.actions.expect_visible(listed), "new company is not listed"
+
+
+@step(r"navigate to chart of accounts page")
+async def open_accounts(world: World) -> None:
+    await world.ensure_session()
+    await world.goto("/contas")
+
+
+@step(r"add new account with valid code, name, type, and category")
+async def add_account(world: World) -> None:
+    page = world.page
+    await world.actions.click(page.get_by_role("button", name="Nova Conta"))
+    await _select_first(world, page.locator("select[name=empresaId]"))
+    await world.actions.click(page.get_by_title("Gerar código sequencial"))
+    world.data["conta"] = _unique("Conta E2E")
+    await world.actions.fill(page.locator("input[name=nome]"), world.data["conta"])
+    await page.locator("input[name=tipo][value='Analítica']").check()
+    await _submit(world)
+
+
+@step(r"new account appears correctly in hierarchy")
+async def expect_account_listed(world: World) -> None:
+    listed = world.page.get_by_text(world.data["conta"]).first
+    assert await world.actions.expect_visible(listed), "new account is not listed"
+
+
+@step(r"edit existing account details")
+async def edit_account(world: World) -> None:
+    page = world.page
+    row = page.locator("tr, li, div.border").filter(has_text=world.data["conta"]).last
+    await world.actions.click(row.get_by_title("Editar").first)
+    world.data["conta"] = f"{world.data['conta']} editada"
+    await world.actions.fill(page.locator("input[name=nome]"), world.data["conta"])
+    await _submit(world)
+
+
+@step(r"changes are saved and displayed")
+async def expect_account_renamed(world: World) -> None:
+    await expect_account_listed(world)
+
+
+@step(r"navigate to new financial transaction page")
+async def open_new_transaction(world: World) -> None:
+    await world.ensure_session()
+    await world.goto("/entradas")
+    await world.actions.click(world.page.get_by_role("button", name="Nova Entrada"))
+
+
+@step(r"input transaction details including date, value, description, and linked account")
+async def fill_transaction(world: World) -> None:
+    page = world.page
+    form = page.locator("form")
+    await _select_first(world, form.locator("select[name=empresaId]"))
+    await _select_first(world, form.locator("select:not([name])").first)
+    await _select_first(world, form.locator("select[name=contaId]"))
+    await world.actions.fill(form.locator("input[name=data]"), date.today().isoformat())
+    await world.actions.fill(form.locator("input[name=valor]"), "123,45")
+    world.data["descricao"] = _unique("Lançamento E2E")
+    await world.actions.fill(form.locator("[name=descricao]"), world.data["descricao"])
+
+
+@step(r"submit the transaction")
+async def submit_transaction(world: World) -> None:
+    await _submit(world)
+
+
+@step(r"transaction recorded and visible in transactions list")
+async def expect_transaction_listed(world: World) -> None:
+    listed = world.page.get_by_text(world.data["descricao"]).first
+    assert await world.actions.expect_visible(listed), "new transaction is not listed"
+
+
+# Contas a pagar (TC011, TC012, TC017, TC020, TC021)
+
+
+@step(r"navigate to (?:new account payable page|account payable form)")
+async def open_new_payable(world: World) -> None:
+    await world.ensure_session()
+    await world.contas_pagar.goto()
+    await world.contas_pagar.open_new()
+
+
+async def _fill_payable(world: World, due: date) -> None:
+    page = world.page
+    await _select_first(world, page.locator("label:has-text('Empresa *') + select"))
+    world.data["fornecedor"] = _unique("Fornecedor E2E")
+    await world.actions.fill(page.get_by_placeholder("Nome do fornecedor"), world.data["fornecedor"])
+    await world.actions.fill(page.get_by_placeholder("Descrição da conta"), "Conta criada pelo teste E2E")
+    await world.actions.fill(page.get_by_placeholder("0,00"), "250,00")
+    await world.actions.fill(page.get_by_placeholder("dd/mm/yyyy").last, due.strftime("%d/%m/%Y"))
+    await _select_first(world, page.locator("label:has-text('Categoria DRE') + select"))
+    await _select_first(world, page.locator("label:has-text('Conta Contábil') + select"))
+
+
+@step(r"input provider, amount, due date, and other details")
+async def fill_payable(world: World) -> None:
+    await _fill_payable(world, date.today() + timedelta(days=30))
+
+
+@step(r"upload (?:payment receipt as attachment|valid payment proof file)")
+async def attach_receipt(world: World) -> None:
+    await world.page.locator("form input[type=file][multiple]").set_input_files(_attachment())
+    await world.actions.settle()
+
+
+async def _saved_payable(world: World) -> Locator:
+    """Submit the open form if any and return the list item of the new bill."""
+    if await world.page.locator("form button[type=submit]").count():
+        await _submit(world)
+    await world.contas_pagar.search(world.data["fornecedor"])
+    item = _contas_pagar_items(world).filter(has_text=world.data["fornecedor"]).first
+    assert await world.actions.expect_visible(item, timeout=world.actions.settle_timeout), "bill was not saved"
+    return item
+
+
+@step(r"save the record")
+async def save_payable(world: World) -> None:
+    await _saved_payable(world)
+
+
+@step(r"mark account as paid")
+async def pay_new_payable(world: World) -> None:
+    await world.contas_pagar.mark_as_paid(await _saved_payable(world))
+
+
+@step(r"status changes to paid and attachment is accessible")
+async def expect_paid_with_attachment(world: World) -> None:
+    item = await _saved_payable(world)
+    assert "Paga" in await item.inner_text(), "bill is not marked as paid"
+    await _expect_attachment(world, item)
+
+
+@step(r"file upload is successful and accessible from account details")
+async def expect_attachment(world: World) -> None:
+    await _expect_attachment(world, await _saved_payable(world))
+
+
+async def _expect_attachment(world: World, item: Locator) -> None:
+    await world.actions.click(item.get_by_test_id("contas-pagar-view"))
+    image = world.page.locator("img[src*='/storage/v1/'], img[src^='blob:'], img[src^='data:']").first
+    assert await world.actions.expect_visible(image), "attachment is not shown in the bill details"
+
+
+@step(r"create accounts payable with upcoming due dates")
+async def create_due_soon_payable(world: World) -> None:
+    await open_new_payable(world)
+    await _fill_payable(world, date.today() + timedelta(days=3))
+    world.data["payable"] = await _saved_payable(world)
+
+
+@step(r"system displays notifications or alerts for those due soon")
+async def expect_due_soon_badge(world: World) -> None:
+    # ContasPagarList flags bills due within 7 days with a yellow status badge.
+    badge = world.data["payable"].locator(".bg-yellow-100").first
+    assert await world.actions.expect_visible(badge), "no due-soon highlight on the bill"
+
+
+@step(r"mark an accounts payable record as paid")
+async def pay_pending_payable(world: World) -> None:
+    await world.ensure_session()
+    await world.contas_pagar.goto()
+    await world.contas_pagar.filter_status("pendente")
+    await world.contas_pagar.wait_ready()
+    items = _contas_pagar_items(world)
+    if not await items.count():
+        raise StepSkipped("no pending bill to pay")
+    await world.contas_pagar.mark_as_paid(items.first)
+
+
+@step(r"system generates corresponding financial entry in the DRE automatically")
+async def expect_dre_loads(world: World) -> None:
+    await world.goto("/dre")
+    assert not await world.page.locator(".bg-red-50, .bg-red-100").count(), "DRE shows an error"
+
+
+@step(r"check dre and reports for updated values")
+async def open_dre_report(world: World) -> None:
+    await world.relatorios.goto()
+    await world.relatorios.open_report("dre-comparativo")
+
+
+@step(r"financial data is updated and consistent")
+async def expect_report_table(world: World) -> None:
+    assert await world.actions.expect_visible(world.page.locator("table").first), "report has no table"
+
+
+@step(r"scroll down the accounts payable list")
+async def scroll_payables(world: World) -> None:
+    if world.variant.context_options.get("is_mobile"):
+        raise StepSkipped("the mobile cards are not windowed; only the desktop table is")
+    await world.ensure_session()
+    await world.contas_pagar.goto()
+    await world.contas_pagar.filter_status("")
+    await world.contas_pagar.wait_ready()
+    if not await world.contas_pagar.scroll_table(100_000):
+        raise StepSkipped("not enough bills to scroll the table")
+    await world.actions.settle()
+
+
+@step(r"change the status filter")
+async def change_payable_status(world: World) -> None:
+    await world.contas_pagar.filter_status("pendente")
+    await world.contas_pagar.wait_ready()
+
+
+@step(r"rows are rendered in the visible part of the list")
+async def expect_rows_in_view(world: World) -> None:
+    if not await world.contas_pagar.rows.count():
+        raise StepSkipped("no pending bill to list")
+    assert await world.contas_pagar.rows_in_view(), "table shows only blank space after the filter change"
+
+
+# Dashboard and reports (TC013, TC014)
+
+
+@step(r"navigate to dashboard page")
+async def open_dashboard(world: World) -> None:
+    await world.ensure_session()
+    await world.dashboard.goto()
+
+
+@step(r"dashboard loads all indicators and charts correctly")
+async def expect_dashboard_charts(world: World) -> None:
+    assert not await world.dashboard.has_error(), "dashboard shows an error"
+    charts = world.page.locator(".recharts-wrapper").or_(world.page.get_by_test_id("dashboard-empty"))
+    assert await world.actions.expect_visible(charts.first), "no chart or empty state rendered"
+
+
+@step(r"data shown corresponds to current financial transactions and is up to date")
+async def expect_dashboard_period(world: World) -> None:
+    assert await world.actions.expect_visible(world.dashboard.period_label), "no period shown on the dashboard"
+
+
+@step(r"navigate to reports page")
+async def open_reports(world: World) -> None:
+    await world.ensure_session()
+    await world.relatorios.goto()
+
+
+@step(r"select a report type such as dre or cash flow")
+async def open_dre_comparativo(world: World) -> None:
+    await world.relatorios.open_report("dre-comparativo")
+
+
+@step(r"apply period and other filters")
+async def filter_report(world: World) -> None:
+    await world.page.locator("select:has(option[value=quarterly])").select_option("quarterly")
+
+
+@step(r"generate the report")
+async def generate_report(world: World) -> None:
+    await world.actions.settle()
+
+
+@step(r"report data is displayed correctly")
+async def expect_report_data(world: World) -> None:
+    await expect_report_table(world)
+
+
+@step(r"use export functionality to download report")
+async def export_report(world: World) -> None:
+    page = world.page
+    try:
+        async with page.expect_download(timeout=world.actions.timeout) as download_info:
+            await page.get_by_role("button", name="Exportar").click()
+    except Error:
+        raise AssertionError("Exportar did not start a download") from None
+    download = await download_info.value
+    world.data["download"] = await download.path()
+
+
+@step(r"exported report file is correct and complete")
+async def expect_export_file(world: World) -> None:
+    path = world.data["download"]
+    assert path and os.path.getsize(path) > 0, "exported file is empty"
+
+
+# Row Level Security (TC015)
+
+
+@step(r"login as user associated with a specific company")
+async def login_owner(world: World) -> None:
+    await world.ensure_session("owner")
+    await world.dashboard.goto()
+
+
+@step(r"attempt to access data belonging to other companies via ui and api")
+async def read_foreign_company(world: World) -> None:
+    foreign = _env("E2E_FOREIGN_COMPANY_ID", "check another tenant's company is hidden")
+    supabase_url = _env("E2E_SUPABASE_URL", "query the REST API directly")
+    anon_key = _env("E2E_SUPABASE_ANON_KEY", "query the REST API directly")
+    world.data["ui_companies"] = await world.dashboard.company_ids()
+
+    entries = await world.page.evaluate("() => Object.entries(window.localStorage)")
+    token = next(json.loads(value)["access_token"] for key, value in entries if is_auth_key(key))
+    leaked = {}
+    for table in ("empresas", "lancamentos", "contas_a_pagar"):
+        column = "id" if table == "empresas" else "empresa_id"
+        request = Request(
+            f"{supabase_url.rstrip('/')}/rest/v1/{table}?select=id&{column}=eq.{foreign}&limit=1",
+            headers={"apikey": anon_key, "Authorization": f"Bearer {token}"},
+        )
+        try:
+            with urlopen(request, timeout=30) as response:
+                leaked[table] = len(json.load(response))
+        except HTTPError as exc:
+            leaked[table] = 0 if exc.code in (401, 403) else -exc.code
+    world.data["foreign"], world.data["leaked"] = foreign, leaked
+
+
+@step(r"access is denied and data leakage is prevented")
+async def expect_no_leak(world: World) -> None:
+    assert world.data["foreign"] not in world.data["ui_companies"], "foreign company offered in the header"
+    leaked = {table: rows for table, rows in world.data["leaked"].items() if rows}
+    assert not leaked, f"foreign company data readable: {leaked}"
+
+
+# Responsive layout (TC016)
+
+
+@step(r"open the application on various screen sizes and devices \(mobile, tablet, desktop\)")
+async def open_viewports(world: World) -> None:
+    await world.ensure_session()
+    layouts = {}
+    for name, viewport in RESPONSIVE_VIEWPORTS.items():
+        await world.page.set_viewport_size(viewport)
+        await world.dashboard.goto()
+        layouts[name] = await world.page.evaluate(
+            """() => ({
+                overflow: document.documentElement.scrollWidth - window.innerWidth,
+                unlabeled: [...document.querySelectorAll('button, a[href], select, input')]
+                    .filter(el => el.offsetParent !== null)
+                    .filter(el => !(el.innerText || '').trim() && !el.getAttribute('aria-label')
+                        && !el.getAttribute('title') && !el.getAttribute('placeholder') && !el.labels?.length)
+                    .map(el => el.outerHTML.slice(0, 80)),
+            })"""
+        )
+    world.data["layouts"] = layouts
+
+
+@step(r"ui components render properly without layout issues")
+async def expect_no_overflow(world: World) -> None:
+    overflowing = {name: layout["overflow"] for name, layout in world.data["layouts"].items() if layout["overflow"] > 1}
+    assert not overflowing, f"horizontal overflow in px: {overflowing}"
+
+
+@step(r"all interactive elements are accessible and usable")
+async def expect_labelled_controls(world: World) -> None:
+    unlabeled = {name: layout["unlabeled"][:3] for name, layout in world.data["layouts"].items() if layout["unlabeled"]}
+    assert not unlabeled, f"controls without an accessible name: {unlabeled}"
+
+
+# Settings (TC019)
+
+
+@step(r"navigate to configuration page")
+async def open_settings(world: World) -> None:
+    await world.ensure_session()
+    await world.goto("/configuracoes")
+
+
+@step(r"review current system settings")
+async def expect_settings(world: World) -> None:
+    heading = world.page.get_by_role("heading", name="Empresa")
+    assert await world.actions.expect_visible(heading), "settings page did not render"
+
+
+@step(r"run supabase connection test")
+async def run_connection_test(world: World) -> None:
+    # The app has no test button: ConfigurationStatus replaces the login page when the
+    # env is missing, so check for it and call the auth health endpoint the app uses.
+    supabase_url = _env("E2E_SUPABASE_URL", "call the Supabase health endpoint")
+    anon_key = _env("E2E_SUPABASE_ANON_KEY", "call the Supabase health endpoint")
+    world.data["config_warning"] = await world.page.get_by_text("Configuração do Supabase Necessária").count()
+    request = Request(f"{supabase_url.rstrip('/')}/auth/v1/health", headers={"apikey": anon_key})
+    try:
+        with urlopen(request, timeout=30) as response:
+            world.data["health"] = response.status
+    except HTTPError as exc:
+        world.data["health"] = exc.code
+
+
+@step(r"connection test indicates success if environment variables are correct")
+async def expect_connection_ok(world: World) -> None:
+    assert not world.data["config_warning"], "the app reports missing Supabase environment variables"
+    assert world.data["health"] == 200, f"Supabase auth health returned HTTP {world.data['health']}"
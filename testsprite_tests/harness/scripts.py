@@ -0,0 +1,98 @@
+"""Discovery and loading of the generated TC scripts.
+
+There is one script per id of ``testsprite_frontend_test_plan.json``; the
+per-language variants of each flow run through ``harness.scenarios``.
+
+The scripts end with a module-level ``asyncio.run(run_test())``, so importing
+them would immediately run the flow with a private browser. ``load_script``
+compiles the file without that statement and hands back ``run_test`` together
+with the module namespace, letting the runner swap the ``async_api`` global
+for one backed by the shared browser pool.
+"""
+
+from __future__ import annotations
+
+import ast
+import fnmatch
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterable
+
+from .config import SUITE_DIR
+
+SCRIPT_GLOB = "TC[0-9][0-9][0-9]_*.py"
+
+
+class ScriptSkipped(Exception):
+    """Raised by a script whose preconditions (credentials, data) are missing here."""
+
+
+@dataclass(frozen=True)
+class TestScript:
+    path: Path
+
+    @property
+    def name(self) -> str:
+        return self.path.stem
+
+    @property
+    def test_id(self) -> str:
+        return self.name.split("_", 1)[0]
+
+
+@dataclass
+class LoadedScript:
+    run_test: Callable[[], Awaitable[None]]
+    namespace: dict[str, Any]
+
+
+def discover_scripts(
+    directory: Path = SUITE_DIR, patterns: Iterable[str] = ()
+) -> list[TestScript]:
+    """Return the TC scripts in ``directory`` sorted by file name.
+
+    ``patterns`` are matched against both the test id and the file stem, and
+    accept shell wildcards (``TC01*``, ``*Dashboard*``).
+    """
+    patterns = list(patterns)
+    scripts = [TestScript(path) for path in sorted(directory.glob(SCRIPT_GLOB))]
+    if not patterns:
+        return scripts
+    return [
+        script
+        for script in scripts
+        if any(
+            fnmatch.fnmatch(script.test_id, pattern) or fnmatch.fnmatch(script.name, pattern)
+            for pattern in patterns
+        )
+    ]
+
+
+def _is_entrypoint(node: ast.stmt) -> bool:
+    if not isinstance(node, ast.Expr) or not isinstance(node.value, ast.Call):
+        return False
+    func = node.value.func
+    return (
+        isinstance(func, ast.Attribute)
+        and func.attr == "run"
+        and isinstance(func.value, ast.Name)
+        and func.value.id == "asyncio"
+    )
+
+
+def load_script(script: TestScript) -> LoadedScript:
+    """Compile ``script`` without its ``asyncio.run`` entrypoint."""
+    source = script.path.read_text(encoding="utf-8")
+    tree = ast.parse(source, filename=str(script.path))
+    tree.body = [node for node in tree.body if not _is_entrypoint(node)]
+
+    namespace: dict[str, Any] = {
+        "__name__": f"testsprite_tests.{script.name}",
+        "__file__": str(script.path),
+    }
+    exec(compile(tree, str(script.path), "exec"), namespace)
+
+    run_test = namespace.get("run_test")
+    if run_test is None:
+        raise LookupError(f"{script.path.name} does not define run_test()")
+    return LoadedScript(run_test=run_test, namespace=namespace)
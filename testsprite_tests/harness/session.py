@@ -0,0 +1,183 @@
+"""Log in once per role and reuse the session through Playwright storage state.
+
+Credentials come from ``E2E_<ROLE>_EMAIL`` / ``E2E_<ROLE>_PASSWORD``. The
+bootstrap logs each role in through ``LoginPage`` and saves the context's
+``storage_state`` to ``tmp/auth/<role>.json``. The saved localStorage holds the
+Supabase session under ``dre-auth-token-<project>`` (the ``storageKey`` set in
+supabaseClient.ts; AuthContext also accepts ``sb-<project>-auth-token``), so a
+context created from it starts already authenticated.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m harness.session owner collaborator master
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+from playwright.async_api import Browser, BrowserContext, Page, async_playwright
+
+from .config import TMP_DIR, base_url
+from .pages import LoginPage
+
+AUTH_DIR = TMP_DIR / "auth"
+# Sessions closer than this to expiry are refreshed instead of reused.
+EXPIRY_MARGIN = 300
+
+
+@dataclass(frozen=True)
+class Role:
+    name: str
+    start_path: str = "/dashboard"
+
+    @property
+    def env_prefix(self) -> str:
+        return f"E2E_{self.name.upper()}"
+
+    def credentials(self) -> tuple[str, str]:
+        email = os.environ.get(f"{self.env_prefix}_EMAIL")
+        password = os.environ.get(f"{self.env_prefix}_PASSWORD")
+        if not email or not password:
+            raise LookupError(
+                f"Set {self.env_prefix}_EMAIL and {self.env_prefix}_PASSWORD to log in as '{self.name}'"
+            )
+        return email, password
+
+    @property
+    def state_path(self) -> Path:
+        return AUTH_DIR / f"{self.name}.json"
+
+
+ROLES = {
+    role.name: role
+    for role in (
+        Role("owner"),
+        Role("collaborator"),
+        Role("master", start_path="/configuracoes"),
+    )
+}
+
+
+def get_role(name: str) -> Role:
+    try:
+        return ROLES[name]
+    except KeyError:
+        raise LookupError(f"Unknown role '{name}'; expected one of {', '.join(ROLES)}") from None
+
+
+def is_auth_key(key: str) -> bool:
+    return key.startswith("dre-auth-token-") or (key.startswith("sb-") and key.endswith("-auth-token"))
+
+
+def _auth_entry(state: dict[str, Any]) -> dict[str, Any] | None:
+    for origin in state.get("origins", []):
+        for item in origin.get("localStorage", []):
+            if is_auth_key(item["name"]):
+                return item
+    return None
+
+
+def session_expires_at(state: dict[str, Any]) -> float | None:
+    """``expires_at`` of the Supabase session stored in ``state``, if any."""
+    entry = _auth_entry(state)
+    if entry is None:
+        return None
+    try:
+        session = json.loads(entry["value"])
+    except (TypeError, ValueError):
+        return None
+    expires_at = session.get("expires_at") or session.get("currentSession", {}).get("expires_at")
+    return float(expires_at) if expires_at else None
+
+
+def is_state_fresh(path: Path, margin: float = EXPIRY_MARGIN) -> bool:
+    if not path.exists():
+        return False
+    expires_at = session_expires_at(json.loads(path.read_text(encoding="utf-8")))
+    return expires_at is not None and expires_at - margin > time.time()
+
+
+async def bootstrap_role(browser: Browser, role: Role, force: bool = False) -> Path:
+    """Log ``role`` in through the UI and save its storage state."""
+    if not force and is_state_fresh(role.state_path):
+        return role.state_path
+
+    email, password = role.credentials()
+    context = await browser.new_context()
+    try:
+        page = await context.new_page()
+        login = LoginPage(page)
+        await login.goto()
+        await login.login_and_wait(email, password)
+
+        state = await context.storage_state()
+        if _auth_entry(state) is None:
+            raise RuntimeError(f"Login as '{role.name}' did not store a Supabase session")
+        role.state_path.parent.mkdir(parents=True, exist_ok=True)
+        role.state_path.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    finally:
+        await context.close()
+    return role.state_path
+
+
+async def bootstrap_roles(browser: Browser, roles: Iterable[str], force: bool = False) -> dict[str, Path]:
+    """Ensure a fresh storage state exists for each role name in ``roles``."""
+    paths = {}
+    for name in roles:
+        paths[name] = await bootstrap_role(browser, get_role(name), force=force)
+    return paths
+
+
+def context_options(role_name: str) -> dict[str, Any]:
+    """``new_context`` options that start a context logged in as ``role_name``."""
+    return {"storage_state": str(get_role(role_name).state_path)}
+
+
+async def authenticated_page(browser: Browser, role_name: str) -> tuple[BrowserContext, Page]:
+    """Open a new context as ``role_name`` already on the role's start route."""
+    role = get_role(role_name)
+    context = await browser.new_context(**context_options(role_name))
+    page = await context.new_page()
+    await page.goto(f"{base_url()}{role.start_path}", wait_until="commit")
+    return context, page
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Save a logged-in storage state per role.")
+    parser.add_argument("roles", nargs="*", default=list(ROLES), help="roles to bootstrap (default: all)")
+    parser.add_argument("--force", action="store_true", help="log in again even if the saved session is fresh")
+    return parser.parse_args(argv)
+
+
+async def _main(args: argparse.Namespace) -> dict[str, Path]:
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch()
+        try:
+            return await bootstrap_roles(browser, args.roles, force=args.force)
+        finally:
+            await browser.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    try:
+        paths = asyncio.run(_main(args))
+    except LookupError as exc:
+        print(exc, file=sys.stderr)
+        return 2
+    for name, path in paths.items():
+        print(f"{name}: {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
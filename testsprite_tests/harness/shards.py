@@ -0,0 +1,220 @@
+"""Split the suite into duration-balanced shards and merge their reports.
+
+Each machine runs one shard (``--shard I/K`` on ``harness.runner`` or
+``harness.scenarios``). Shards are built with the longest-processing-time
+rule: tests sorted by their recorded duration, slowest first, each given to
+the shard with the least work so far. Every machine computes the same split
+from ``test_durations.json``, so keep that file identical across the fan-out
+(commit it after ``record``, or pass it along as a CI artifact). Tests with
+no recorded duration are estimated at the median of the known ones. With
+more shards than tests some shards are empty: they write an empty report
+and exit 0. Usage (from ``testsprite_tests/``)::
+
+    python -m harness.runner --shard 2/4 --report tmp/shard-2.json --junit tmp/shard-2.xml
+    python -m harness.shards merge tmp/shard-*.json --junit tmp/junit.xml --record
+    python -m harness.shards plan 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import statistics
+import sys
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable, TypeVar
+
+from .config import SUITE_DIR, TMP_DIR
+from .scripts import discover_scripts
+
+DEFAULT_DURATIONS = SUITE_DIR / "test_durations.json"
+DEFAULT_MERGED_REPORT = TMP_DIR / "merged_report.json"
+# Estimate when nothing has been recorded yet.
+DEFAULT_ESTIMATE = 30.0
+# Weight of the newest run in the recorded moving average.
+SMOOTHING = 0.5
+# Statuses whose duration says nothing about the test's usual run time.
+UNTIMED_STATUSES = ("skipped", "undefined")
+
+T = TypeVar("T")
+
+
+def parse_shard(text: str) -> tuple[int, int]:
+    """``"2/4"`` -> ``(2, 4)``; shards are numbered from 1."""
+    index, sep, total = text.partition("/")
+    if not sep or not index.isdigit() or not total.isdigit() or not 1 <= int(index) <= int(total):
+        raise argparse.ArgumentTypeError(f"expected I/K with 1 <= I <= K, got '{text}'")
+    return int(index), int(total)
+
+
+def unit_name(result: dict[str, Any]) -> str:
+    """Duration key of a report entry: the script name, or ``TC011[pt-BR]`` for scenarios."""
+    if "variant" in result:
+        return f"{result['test_id']}[{result['variant']}]"
+    return result["name"]
+
+
+def load_durations(path: Path = DEFAULT_DURATIONS) -> dict[str, float]:
+    if not path.exists():
+        return {}
+    return {name: float(seconds) for name, seconds in json.loads(path.read_text(encoding="utf-8")).items()}
+
+
+def record_durations(results: Iterable[dict[str, Any]], path: Path = DEFAULT_DURATIONS) -> dict[str, float]:
+    """Fold the durations of ``results`` into the moving averages stored at ``path``."""
+    durations = load_durations(path)
+    for result in results:
+        if result["status"] in UNTIMED_STATUSES:
+            continue
+        name = unit_name(result)
+        previous = durations.get(name)
+        current = float(result["duration"])
+        durations[name] = round(current if previous is None else SMOOTHING * current + (1 - SMOOTHING) * previous, 3)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(dict(sorted(durations.items())), indent=2) + "\n", encoding="utf-8")
+    return durations
+
+
+def estimates(names: Iterable[str], durations: dict[str, float]) -> dict[str, float]:
+    default = statistics.median(durations.values()) if durations else DEFAULT_ESTIMATE
+    return {name: durations.get(name, default) for name in names}
+
+
+def partition(names: Iterable[str], durations: dict[str, float], shards: int) -> list[list[str]]:
+    """Longest-processing-time assignment of ``names`` to ``shards`` bins.
+
+    Ties are broken by name and shard index so every machine gets the same split.
+    """
+    estimated = estimates(names, durations)
+    bins: list[list[str]] = [[] for _ in range(shards)]
+    loads = [(0.0, index) for index in range(shards)]
+    for name in sorted(estimated, key=lambda name: (-estimated[name], name)):
+        load, index = heapq.heappop(loads)
+        bins[index].append(name)
+        heapq.heappush(loads, (load + estimated[name], index))
+    return bins
+
+
+def select_shard(
+    items: list[T], key: Callable[[T], str], shard: tuple[int, int], durations: dict[str, float]
+) -> list[T]:
+    """The items of shard ``I/K``, in their original order."""
+    index, total = shard
+    chosen = set(partition((key(item) for item in items), durations, total)[index - 1])
+    return [item for item in items if key(item) in chosen]
+
+
+def merge_reports(reports: list[dict[str, Any]]) -> dict[str, Any]:
+    """One report for the whole fan-out; wall clock is the slowest shard's."""
+    results = sorted((result for report in reports for result in report["results"]), key=unit_name)
+    summary: dict[str, int] = {"total": len(results)}
+    for report in reports:
+        for status in report["summary"]:
+            summary.setdefault(status, 0)
+    for result in results:
+        summary[result["status"]] = summary.get(result["status"], 0) + 1
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "shards": len(reports),
+        "workers": sum(report.get("workers", 0) for report in reports),
+        "wall_clock": max((report["wall_clock"] for report in reports), default=0.0),
+        "summed_duration": round(sum(report.get("summed_duration", 0.0) for report in reports), 3),
+        "summed_wait": round(sum(report.get("summed_wait", 0.0) for report in reports), 3),
+        "summary": summary,
+        "results": results,
+    }
+
+
+def write_junit(report: dict[str, Any], path: Path, suite_name: str = "testsprite") -> None:
+    """JUnit XML for CI test tabs: failed -> failure, error/timeout -> error, skipped/undefined -> skipped."""
+    results = report["results"]
+    suite = ET.Element(
+        "testsuite",
+        name=suite_name,
+        tests=str(len(results)),
+        failures=str(sum(1 for result in results if result["status"] == "failed")),
+        errors=str(sum(1 for result in results if result["status"] in ("error", "timeout"))),
+        skipped=str(sum(1 for result in results if result["status"] in UNTIMED_STATUSES)),
+        time=f"{report['wall_clock']:.3f}",
+        timestamp=report["generated_at"],
+    )
+    for result in results:
+        case = ET.SubElement(
+            suite, "testcase", classname=result["test_id"], name=unit_name(result), time=f"{result['duration']:.3f}"
+        )
+        message = result.get("message") or result["status"]
+        if result["status"] == "failed":
+            ET.SubElement(case, "failure", message=message.splitlines()[0]).text = message
+        elif result["status"] in ("error", "timeout"):
+            ET.SubElement(case, "error", message=message.splitlines()[0], type=result["status"]).text = message
+        elif result["status"] in UNTIMED_STATUSES:
+            ET.SubElement(case, "skipped", message=message)
+    root = ET.Element("testsuites")
+    root.append(suite)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    ET.ElementTree(root).write(path, encoding="utf-8", xml_declaration=True)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m harness.shards", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--durations", type=Path, default=DEFAULT_DURATIONS, help="recorded durations JSON")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    merge = commands.add_parser("merge", help="combine shard reports into one JSON (and JUnit) report")
+    merge.add_argument("reports", nargs="+", type=Path, help="shard JSON reports")
+    merge.add_argument("--report", type=Path, default=DEFAULT_MERGED_REPORT, help="merged JSON report path")
+    merge.add_argument("--junit", type=Path, help="also write the merged results as JUnit XML")
+    merge.add_argument("--record", action="store_true", help="fold the merged durations into --durations")
+
+    record = commands.add_parser("record", help="fold the durations of reports into --durations")
+    record.add_argument("reports", nargs="+", type=Path, help="runner or scenario JSON reports")
+
+    plan = commands.add_parser("plan", help="show the split of the TC scripts into K shards")
+    plan.add_argument("shards", type=int, help="number of shards")
+    plan.add_argument("patterns", nargs="*", help="test ids or file name globs (default: all)")
+    return parser.parse_args(argv)
+
+
+def _read(paths: list[Path]) -> list[dict[str, Any]]:
+    return [json.loads(path.read_text(encoding="utf-8")) for path in paths]
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    if args.command == "record":
+        durations = record_durations((r for report in _read(args.reports) for r in report["results"]), args.durations)
+        print(f"{len(durations)} durations -> {args.durations}")
+        return 0
+
+    if args.command == "plan":
+        names = [script.name for script in discover_scripts(patterns=args.patterns)]
+        durations = load_durations(args.durations)
+        estimated = estimates(names, durations)
+        for index, names_in_shard in enumerate(partition(names, durations, max(1, args.shards)), start=1):
+            load = sum(estimated[name] for name in names_in_shard)
+            print(f"shard {index}/{args.shards}: {len(names_in_shard)} tests, ~{load:.0f}s")
+            for name in names_in_shard:
+                print(f"    {estimated[name]:7.1f}s {name}")
+        return 0
+
+    report = merge_reports(_read(args.reports))
+    args.report.parent.mkdir(parents=True, exist_ok=True)
+    args.report.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    if args.junit:
+        write_junit(report, args.junit)
+    if args.record:
+        record_durations(report["results"], args.durations)
+    summary = report["summary"]
+    print(
+        f"{summary.get('passed', 0)}/{summary['total']} passed across {report['shards']} shards, "
+        f"slowest shard {report['wall_clock']:.1f}s -> {args.report}"
+    )
+    failed = sum(summary.get(status, 0) for status in ("failed", "error", "timeout"))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+"""Event-driven replacements for the fixed sleeps in the TC scripts.
+
+The generated scripts prefix every interaction with
+``page.wait_for_timeout(3000)``. ``PageActions`` instead waits for the things
+the app actually signals readiness with: no Supabase request in flight, no
+``animate-spin`` loader on screen (``Spinner`` and the inline ``Loader2``
+icons), and the target locator being visible. Every wait is timed into a
+``WaitStats`` so the runner can report how much of a test was spent waiting.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from playwright.async_api import Error, Locator, Page, Request
+
+SUPABASE_PATHS = ("/rest/v1/", "/auth/v1/", "/storage/v1/", "/functions/v1/")
+SPINNER_SELECTOR = ".animate-spin"
+
+DEFAULT_TIMEOUT = 5000
+SETTLE_TIMEOUT = 10000
+QUIET_WINDOW = 0.1
+
+
+@dataclass
+class WaitStats:
+    """Accumulated wait time, in seconds, per wait kind."""
+
+    seconds: dict[str, float] = field(default_factory=dict)
+    counts: dict[str, int] = field(default_factory=dict)
+    timeouts: int = 0
+    longest: float = 0.0
+
+    def record(self, kind: str, seconds: float) -> None:
+        self.seconds[kind] = self.seconds.get(kind, 0.0) + seconds
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+        self.longest = max(self.longest, seconds)
+
+    @property
+    def total(self) -> float:
+        return sum(self.seconds.values())
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "total": round(self.total, 3),
+            "timeouts": self.timeouts,
+            "longest": round(self.longest, 3),
+            "by_kind": {
+                kind: {"seconds": round(seconds, 3), "count": self.counts[kind]}
+                for kind, seconds in sorted(self.seconds.items())
+            },
+        }
+
+
+_current_stats: ContextVar[WaitStats | None] = ContextVar("wait_stats", default=None)
+
+
+def current_stats() -> WaitStats:
+    """Stats for the test running in this task, created on first use."""
+    stats = _current_stats.get()
+    if stats is None:
+        stats = WaitStats()
+        _current_stats.set(stats)
+    return stats
+
+
+def bind_stats(stats: WaitStats) -> None:
+    """Make ``stats`` the target of every ``PageActions`` created in this task."""
+    _current_stats.set(stats)
+
+
+def is_supabase_request(request: Request) -> bool:
+    return any(path in request.url for path in SUPABASE_PATHS)
+
+
+class SupabaseTracker:
+    """Counts Supabase requests in flight on a page."""
+
+    def __init__(self, page: Page) -> None:
+        self._pending: set[Request] = set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        page.on("request", self._on_request)
+        page.on("requestfinished", self._on_done)
+        page.on("requestfailed", self._on_done)
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def _on_request(self, request: Request) -> None:
+        if is_supabase_request(request):
+            self._pending.add(request)
+            self._idle.clear()
+
+    def _on_done(self, request: Request) -> None:
+        self._pending.discard(request)
+        if not self._pending:
+            self._idle.set()
+
+    async def wait_idle(self, timeout: float) -> None:
+        """Wait until no request has been in flight for ``QUIET_WINDOW``."""
+        deadline = time.perf_counter() + timeout
+        while True:
+            await asyncio.wait_for(self._idle.wait(), max(deadline - time.perf_counter(), 0))
+            await asyncio.sleep(QUIET_WINDOW)
+            if self._idle.is_set():
+                return
+
+
+class PageActions:
+    """fill/click/expect helpers that wait on app state instead of sleeping."""
+
+    def __init__(
+        self,
+        page: Page,
+        stats: WaitStats | None = None,
+        timeout: int = DEFAULT_TIMEOUT,
+        settle_timeout: int = SETTLE_TIMEOUT,
+    ) -> None:
+        self.page = page
+        self.stats = stats or current_stats()
+        self.timeout = timeout
+        self.settle_timeout = settle_timeout
+        self.network = SupabaseTracker(page)
+
+    async def _timed(self, kind: str, awaitable: Any, required: bool) -> None:
+        started = time.perf_counter()
+        try:
+            await awaitable
+        except (asyncio.TimeoutError, Error):
+            self.stats.timeouts += 1
+            if required:
+                raise
+        finally:
+            self.stats.record(kind, time.perf_counter() - started)
+
+    async def wait_for_network(self) -> None:
+        await self._timed("network", self.network.wait_idle(self.settle_timeout / 1000), required=False)
+
+    async def wait_for_spinners(self) -> None:
+        spinner = self.page.locator(SPINNER_SELECTOR).first
+        await self._timed(
+            "spinner", spinner.wait_for(state="hidden", timeout=self.settle_timeout), required=False
+        )
+
+    async def settle(self) -> None:
+        """Wait for pending Supabase calls and loaders; never fails the test."""
+        await self.wait_for_network()
+        await self.wait_for_spinners()
+
+    async def wait_for(self, locator: Locator, state: str = "visible", timeout: int | None = None) -> Locator:
+        await self._timed(
+            f"locator:{state}",
+            locator.wait_for(state=state, timeout=timeout or self.timeout),
+            required=True,
+        )
+        return locator
+
+    async def fill(self, locator: Locator, value: str, timeout: int | None = None) -> None:
+        await self.settle()
+        await self.wait_for(locator, timeout=timeout)
+        await locator.fill(value, timeout=timeout or self.timeout)
+
+    async def click(self, locator: Locator, timeout: int | None = None) -> None:
+        await self.settle()
+        await self.wait_for(locator, timeout=timeout)
+        await locator.click(timeout=timeout or self.timeout)
+        await self.settle()
+
+    async def expect_visible(self, locator: Locator, timeout: int | None = None) -> bool:
+        """Wait for ``locator`` to appear; returns False instead of raising."""
+        await self.settle()
+        try:
+            await self.wait_for(locator, timeout=timeout)
+        except Error:
+            return False
+        return True